@@ -0,0 +1,75 @@
+"""
+Binance USDT-M futures execution client that places orders through execution.order_scheduler
+Market and limit orders submitted in the same event-loop tick, from any strategy, go out as one
+batchOrders request within the scheduler's rate budget, queued rather than rejected when it runs
+out. Other order types, cancels and queries use the inherited per-request REST calls, and order
+updates and fills still come from the user data stream.
+"""
+
+from nautilus_trader.adapters.binance.common.enums import BinanceTimeInForce
+from nautilus_trader.adapters.binance.common.symbol import BinanceSymbol
+from nautilus_trader.adapters.binance.futures.execution import BinanceFuturesExecutionClient
+from nautilus_trader.adapters.binance.http.error import BinanceClientError
+
+from execution.order_scheduler import VenueOrderError
+from telemetry.metrics import REGISTRY
+
+
+class ScheduledBinanceFuturesExecutionClient(BinanceFuturesExecutionClient):
+    def __init__(self, scheduler, **kwargs):
+        super().__init__(**kwargs)
+        self.scheduler = scheduler
+
+        labels = {"client": self.id.value}
+        self.queue_depth = REGISTRY.gauge("order_scheduler_queue_depth", "Orders waiting for the rate budget", labels)
+        self.max_queue_depth = REGISTRY.gauge("order_scheduler_max_queue_depth", "Deepest queue so far", labels)
+        self.budget_waits = REGISTRY.gauge("order_scheduler_budget_waits", "Drains paused for the budget", labels)
+        self.throttled = REGISTRY.gauge("order_scheduler_throttled_responses", "418/429 answers", labels)
+
+    def _order_params(self, order, position_side, **params):
+        """POST /fapi/v1/order params, also the shape of a batchOrders entry"""
+        params.update(
+            symbol=BinanceSymbol(order.instrument_id.symbol.value),
+            side=self._enum_parser.parse_internal_order_side(order.side).value,
+            type=self._enum_parser.parse_internal_order_type(order).value,
+            quantity=str(order.quantity),
+            reduceOnly=self._determine_reduce_only_str(order),
+            positionSide=position_side.value if position_side is not None else None,
+            newClientOrderId=order.client_order_id.value,
+        )
+        return {key: value for key, value in params.items() if value is not None}
+
+    async def _place(self, params):
+        """Queue one order; venue rejections are raised as BinanceClientError
+
+        The inherited submit path retries and rejects BinanceErrors only. Transport failures
+        propagate and leave the order SUBMITTED for the exec engine's in-flight check to resolve
+        """
+        future = self.scheduler.submit(params)
+        self._update_metrics()
+        try:
+            await future
+        except VenueOrderError as e:
+            raise BinanceClientError(400, {'code': e.code, 'msg': e.msg}, {}) from e
+        finally:
+            self._update_metrics()
+
+    def _update_metrics(self):
+        metrics = self.scheduler.metrics()
+        self.queue_depth.set(metrics['queue_depth'])
+        self.max_queue_depth.set(metrics['max_queue_depth'])
+        self.budget_waits.set(metrics['budget_waits'])
+        self.throttled.set(metrics['throttled_responses'])
+
+    async def _submit_market_order(self, order, position_side, price_match):
+        await self._place(self._order_params(order, position_side))
+
+    async def _submit_limit_order(self, order, position_side, price_match):
+        time_in_force = BinanceTimeInForce.GTX if order.is_post_only else self._determine_time_in_force(order)
+        await self._place(self._order_params(
+            order, position_side,
+            timeInForce=time_in_force.value,
+            goodTillDate=self._determine_good_till_date(order, time_in_force),
+            price=None if price_match else str(order.price),
+            priceMatch=price_match,
+        ))
@@ -0,0 +1,69 @@
+"""
+Execution client factory for TradingNode (node.add_exec_client_factory("BINANCE", ...))
+Builds ScheduledBinanceFuturesExecutionClient on the HTTP client and instrument provider that
+Nautilus' own Binance factories share, plus an OrderScheduler signing with the same credentials.
+"""
+
+from nautilus_trader.adapters.binance.common.credentials import get_api_key, get_api_secret
+from nautilus_trader.adapters.binance.common.enums import BinanceKeyType
+from nautilus_trader.adapters.binance.common.urls import get_ws_base_url
+from nautilus_trader.adapters.binance.factories import (
+    get_cached_binance_futures_instrument_provider,
+    get_cached_binance_http_client,
+)
+from nautilus_trader.live.factories import LiveExecClientFactory
+
+from adapters.binance.execution import ScheduledBinanceFuturesExecutionClient
+from execution.order_scheduler import BinanceFuturesRestTransport, OrderScheduler
+from execution.rate_budget import BinanceRateBudget
+
+
+def create_order_budget():
+    """20% headroom below the venue limits for the client's own cancels, queries and listen key"""
+    return BinanceRateBudget(weight_per_minute=1920, orders_per_10s=240, orders_per_minute=960)
+
+
+class ScheduledBinanceLiveExecClientFactory(LiveExecClientFactory):
+    @staticmethod
+    def create(loop, name, config, msgbus, cache, clock):
+        if not config.account_type.is_futures:
+            raise ValueError(f"Order scheduling needs a futures account, got {config.account_type}")
+        if config.key_type != BinanceKeyType.HMAC:
+            raise ValueError(f"Order scheduling signs with HMAC keys only, got {config.key_type}")
+
+        client = get_cached_binance_http_client(  # Same arguments as Nautilus' factories: same cached client
+            clock=clock,
+            account_type=config.account_type,
+            api_key=config.api_key,
+            api_secret=config.api_secret,
+            key_type=config.key_type,
+            base_url=config.base_url_http,
+            is_testnet=config.testnet,
+            is_us=config.us,
+        )
+        provider = get_cached_binance_futures_instrument_provider(
+            client=client,
+            clock=clock,
+            account_type=config.account_type,
+            config=config.instrument_provider,
+            venue=config.venue,
+        )
+        transport = BinanceFuturesRestTransport(
+            client.base_url,
+            config.api_key or get_api_key(config.account_type, config.testnet),
+            config.api_secret or get_api_secret(config.account_type, config.testnet),
+            recv_window=config.recv_window_ms,
+        )
+        return ScheduledBinanceFuturesExecutionClient(
+            scheduler=OrderScheduler(transport, create_order_budget()),
+            loop=loop,
+            client=client,
+            msgbus=msgbus,
+            cache=cache,
+            clock=clock,
+            instrument_provider=provider,
+            base_url_ws=config.base_url_ws or get_ws_base_url(config.account_type, config.testnet, config.us),
+            account_type=config.account_type,
+            name=name,
+            config=config,
+        )
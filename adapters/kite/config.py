@@ -0,0 +1,26 @@
+"""
+Kite data / execution client configs, the counterparts of BinanceDataClientConfig and
+BinanceExecClientConfig in config/live/binance_live.py
+Credentials left as None are read from KITE_API_KEY / KITE_ACCESS_TOKEN by the factories.
+"""
+
+from nautilus_trader.config import LiveDataClientConfig, LiveExecClientConfig
+
+
+class KiteDataClientConfig(LiveDataClientConfig, frozen=True):
+    api_key: str | None = None
+    access_token: str | None = None
+    base_url_http: str | None = None  # Default https://api.kite.trade; sandbox.kite_stub for tests
+    base_url_ws: str | None = None  # Default wss://ws.kite.trade
+    quote_mode: str = "full"  # Ticker mode for quote subscriptions (full carries the 5-level depth)
+    trade_mode: str = "quote"  # Ticker mode for trade-only subscriptions
+
+
+class KiteExecClientConfig(LiveExecClientConfig, frozen=True):
+    api_key: str | None = None
+    access_token: str | None = None
+    base_url_http: str | None = None
+    base_url_ws: str | None = None  # Order postbacks arrive on the ticker connection
+    account_id: str = "KITE-001"
+    product: str = "MIS"  # MIS intraday, CNC delivery, NRML F&O
+    variety: str = "regular"
@@ -0,0 +1,140 @@
+"""
+Kite market data client
+Quote ticks come from the best level of full-mode depth, trade ticks from increases in the
+cumulative day volume (Kite does not stream individual trades). Each binary message is decoded
+once into KiteTicks columns; the per-row loop below only builds the Nautilus objects.
+"""
+
+from nautilus_trader.live.data_client import LiveMarketDataClient
+from nautilus_trader.model.data import QuoteTick, TradeTick
+from nautilus_trader.model.enums import AggressorSide
+from nautilus_trader.model.identifiers import ClientId, TradeId
+from nautilus_trader.model.objects import Quantity
+
+from adapters.kite.decoder import FULL_LENGTH, KiteTickDecoder
+from adapters.kite.http import KITE_WS_URL
+from adapters.kite.providers import KITE_VENUE
+from adapters.kite.websocket import KiteTickerClient
+
+
+class KiteDataClient(LiveMarketDataClient):
+    def __init__(self, loop, client, msgbus, cache, clock, instrument_provider, config, name=None):
+        super().__init__(
+            loop=loop,
+            client_id=ClientId(name or KITE_VENUE.value),
+            venue=KITE_VENUE,
+            msgbus=msgbus,
+            cache=cache,
+            clock=clock,
+            instrument_provider=instrument_provider,
+            config=config,
+        )
+        self._http = client
+        self._config = config
+        self._decoder = KiteTickDecoder()
+        self._ticker = KiteTickerClient(
+            config.base_url_ws or KITE_WS_URL, client.api_key, client.access_token,
+            on_binary=self._on_binary, logger=self._log,
+        )
+        self._quote_tokens = set()
+        self._trade_tokens = set()
+        self._last_volume = {}  # token -> cumulative day volume at the last tick
+
+    async def _connect(self):
+        await self._instrument_provider.initialize()
+        for instrument in self._instrument_provider.list_all():
+            self._handle_data(instrument)
+        await self._ticker.connect()
+        self._log.info(f"Kite ticker connected, {self._instrument_provider.count} instruments")
+
+    async def _disconnect(self):
+        await self._ticker.close()
+        d = self._decoder
+        self._log.info(f"Kite ticker closed: {d.frames} frames, {d.packets} ticks "
+                       f"({d.vectorized_frames} vectorized), {self._ticker.reconnects} reconnects")
+
+    def _token(self, instrument_id):
+        token = self._instrument_provider.token_by_id.get(instrument_id)
+        if token is None:
+            self._log.error(f"No Kite instrument_token for {instrument_id}, load it in the provider first")
+        return token
+
+    async def _resubscribe(self, token):
+        if token in self._quote_tokens:
+            await self._ticker.subscribe([token], self._config.quote_mode)
+        elif token in self._trade_tokens:
+            await self._ticker.subscribe([token], self._config.trade_mode)
+        else:
+            await self._ticker.unsubscribe([token])
+            self._last_volume.pop(token, None)
+
+    async def _subscribe_quote_ticks(self, command):
+        token = self._token(command.instrument_id)
+        if token is not None:
+            self._quote_tokens.add(token)
+            await self._resubscribe(token)
+
+    async def _subscribe_trade_ticks(self, command):
+        token = self._token(command.instrument_id)
+        if token is not None:
+            self._trade_tokens.add(token)
+            await self._resubscribe(token)
+
+    async def _unsubscribe_quote_ticks(self, command):
+        token = self._token(command.instrument_id)
+        if token is not None:
+            self._quote_tokens.discard(token)
+            await self._resubscribe(token)
+
+    async def _unsubscribe_trade_ticks(self, command):
+        token = self._token(command.instrument_id)
+        if token is not None:
+            self._trade_tokens.discard(token)
+            await self._resubscribe(token)
+
+    def _on_binary(self, payload):
+        n = self._decoder.decode(payload)
+        if not n:
+            return
+        t = self._decoder.ticks
+        ts_init = self._clock.timestamp_ns()
+        id_by_token = self._instrument_provider.id_by_token
+        quote_tokens, trade_tokens, last_volume = self._quote_tokens, self._trade_tokens, self._last_volume
+
+        columns = (t.token[:n].tolist(), t.mode[:n].tolist(), t.ltp[:n].tolist(), t.last_qty[:n].tolist(),
+                   t.volume[:n].tolist(), t.last_trade_time[:n].tolist(), t.exchange_ts[:n].tolist())
+        for i, (token, mode, ltp, last_qty, volume, trade_time, exchange_ts) in enumerate(zip(*columns)):
+            instrument_id = id_by_token.get(token)
+            if instrument_id is None:
+                continue
+            instrument = self._cache.instrument(instrument_id)
+            if instrument is None:
+                continue
+            ts_event = exchange_ts * 1_000_000_000 if exchange_ts else ts_init
+
+            if token in quote_tokens and mode == FULL_LENGTH:
+                bid_qty, ask_qty = int(t.bid_qty[i, 0]), int(t.ask_qty[i, 0])
+                if bid_qty > 0 and ask_qty > 0:
+                    self._handle_data(QuoteTick(
+                        instrument_id=instrument_id,
+                        bid_price=instrument.make_price(float(t.bid_price[i, 0])),
+                        ask_price=instrument.make_price(float(t.ask_price[i, 0])),
+                        bid_size=Quantity(bid_qty, instrument.size_precision),
+                        ask_size=Quantity(ask_qty, instrument.size_precision),
+                        ts_event=ts_event,
+                        ts_init=ts_init,
+                    ))
+
+            if token in trade_tokens and volume:
+                previous = last_volume.get(token)
+                last_volume[token] = volume
+                if previous is not None and volume > previous and last_qty > 0:
+                    self._handle_data(TradeTick(
+                        instrument_id=instrument_id,
+                        price=instrument.make_price(ltp),
+                        size=Quantity(last_qty, instrument.size_precision),
+                        aggressor_side=AggressorSide.NO_AGGRESSOR,
+                        trade_id=TradeId(f"{token}-{volume}"),
+                        ts_event=trade_time * 1_000_000_000 if trade_time else ts_event,
+                        ts_init=ts_init,
+                    ))
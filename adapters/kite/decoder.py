@@ -0,0 +1,340 @@
+"""
+Kite Connect v3 binary tick decoding
+A WebSocket binary message is a frame of packets: a big-endian uint16 packet count, then per
+packet a uint16 length and the packet itself. The length identifies the mode (8 LTP, 44 quote,
+184 full; 28/32 for indices); every field is a big-endian int32, prices in paise (or the
+segment's own divisor). A 1-byte message is a heartbeat.
+
+KiteTickDecoder writes ticks into a reused columnar KiteTicks buffer. When every packet of a
+frame has the same length (one mode per connection, the usual case) the frame is read through
+a single strided NumPy structured view over the caller's buffer: no copy of the packets, no
+per-tick objects or dicts. Mixed-mode frames gather each mode's packets with one indexing
+operation, and frames of a few packets use struct.unpack_from per packet. pack_frame() / pack_*() build frames for the stub server and benchmarks.
+"""
+
+import struct
+
+import numpy as np
+
+
+# Packet lengths by mode
+LTP_LENGTH = 8
+INDEX_QUOTE_LENGTH = 28
+INDEX_FULL_LENGTH = 32
+QUOTE_LENGTH = 44
+FULL_LENGTH = 184
+
+MODE_LTP = 'ltp'
+MODE_QUOTE = 'quote'
+MODE_FULL = 'full'
+
+DEPTH_LEVELS = 5
+
+# Exchange segment = instrument_token & 0xFF
+SEGMENT_NSE = 1
+SEGMENT_NFO = 2
+SEGMENT_CDS = 3
+SEGMENT_BSE = 4
+SEGMENT_BFO = 5
+SEGMENT_BCD = 6
+SEGMENT_MCX = 7
+SEGMENT_MCXSX = 8
+SEGMENT_INDICES = 9
+
+# Price divisor per segment: paise, except the currency segments
+DIVISORS = np.full(256, 100.0)
+DIVISORS[SEGMENT_CDS] = 10_000_000.0
+DIVISORS[SEGMENT_BCD] = 10_000.0
+
+_INT = '>i4'
+DEPTH_DTYPE = np.dtype([('qty', _INT), ('price', _INT), ('orders', '>i2'), ('_pad', 'V2')])
+LTP_DTYPE = np.dtype([('token', _INT), ('ltp', _INT)])
+QUOTE_FIELDS = [('token', _INT), ('ltp', _INT), ('last_qty', _INT), ('avg_price', _INT), ('volume', _INT),
+                ('buy_qty', _INT), ('sell_qty', _INT), ('open', _INT), ('high', _INT), ('low', _INT),
+                ('close', _INT)]
+QUOTE_DTYPE = np.dtype(QUOTE_FIELDS)
+FULL_DTYPE = np.dtype(QUOTE_FIELDS + [
+    ('last_trade_time', _INT), ('oi', _INT), ('oi_day_high', _INT), ('oi_day_low', _INT), ('exchange_ts', _INT),
+    ('depth', DEPTH_DTYPE, (2 * DEPTH_LEVELS,)),  # 5 bids then 5 asks
+])
+INDEX_FIELDS = [('token', _INT), ('ltp', _INT), ('high', _INT), ('low', _INT), ('open', _INT), ('close', _INT),
+                ('change', _INT)]
+INDEX_QUOTE_DTYPE = np.dtype(INDEX_FIELDS)
+INDEX_FULL_DTYPE = np.dtype(INDEX_FIELDS + [('exchange_ts', _INT)])
+
+DTYPES = {
+    LTP_LENGTH: LTP_DTYPE,
+    INDEX_QUOTE_LENGTH: INDEX_QUOTE_DTYPE,
+    INDEX_FULL_LENGTH: INDEX_FULL_DTYPE,
+    QUOTE_LENGTH: QUOTE_DTYPE,
+    FULL_LENGTH: FULL_DTYPE,
+}
+assert all(dtype.itemsize == length for length, dtype in DTYPES.items())
+
+_U16 = struct.Struct('>H')
+_LTP = struct.Struct('>2i')
+_QUOTE = struct.Struct('>11i')
+_FULL = struct.Struct('>16i' + 'iih2x' * 2 * DEPTH_LEVELS)
+_INDEX_QUOTE = struct.Struct('>7i')
+_INDEX_FULL = struct.Struct('>8i')
+
+SMALL_FRAME = 4  # Up to this many packets the per-packet path beats the fixed cost of the vectorized one
+
+PRICE_COLUMNS = ('ltp', 'avg_price', 'open', 'high', 'low', 'close', 'change')
+INT_COLUMNS = ('last_qty', 'volume', 'buy_qty', 'sell_qty', 'last_trade_time', 'oi', 'exchange_ts')
+
+
+class KiteTicks:
+    """Columnar tick buffer reused across frames; rows [0, count) hold the last decoded frame
+
+    Prices are float64 in rupees (segment divisor applied), fields a packet's mode does not
+    carry are 0 (mode is the packet length). Depth columns are (capacity, 5), best level first.
+    """
+
+    __slots__ = ('capacity', 'count', 'token', 'mode', *PRICE_COLUMNS, *INT_COLUMNS,
+                 'bid_price', 'bid_qty', 'bid_orders', 'ask_price', 'ask_qty', 'ask_orders')
+
+    def __init__(self, capacity=512):
+        self.capacity = 0
+        self.count = 0
+        self._allocate(capacity)
+
+    def _allocate(self, capacity):
+        self.capacity = int(capacity)
+        self.token = np.zeros(self.capacity, dtype=np.int64)
+        self.mode = np.zeros(self.capacity, dtype=np.int16)
+        for name in PRICE_COLUMNS:
+            setattr(self, name, np.zeros(self.capacity))
+        for name in INT_COLUMNS:
+            setattr(self, name, np.zeros(self.capacity, dtype=np.int64))
+        shape = (self.capacity, DEPTH_LEVELS)
+        self.bid_price, self.ask_price = np.zeros(shape), np.zeros(shape)
+        self.bid_qty, self.ask_qty = np.zeros(shape, dtype=np.int64), np.zeros(shape, dtype=np.int64)
+        self.bid_orders, self.ask_orders = np.zeros(shape, dtype=np.int32), np.zeros(shape, dtype=np.int32)
+
+    def reserve(self, n):
+        """Grow (never shrink) to hold n rows; only a frame larger than any before allocates"""
+        if n > self.capacity:
+            self._allocate(max(n, 2 * self.capacity))
+
+
+class KiteTickDecoder:
+    """Frame -> KiteTicks; decode() returns the number of ticks (0 for heartbeats)"""
+
+    def __init__(self, capacity=512):
+        self.ticks = KiteTicks(capacity)
+        # Metrics
+        self.frames = 0
+        self.heartbeats = 0
+        self.packets = 0
+        self.vectorized_frames = 0
+        self.unknown_packets = 0
+        self.truncated_frames = 0
+
+    def decode(self, frame):
+        """frame: bytes, bytearray or memoryview of one binary WebSocket message"""
+        view = memoryview(frame)
+        size = len(view)
+        if size < 2:
+            self.heartbeats += 1
+            self.ticks.count = 0
+            return 0
+        (n,) = _U16.unpack_from(view, 0)
+        self.frames += 1
+        self.ticks.reserve(n)
+        if n > SMALL_FRAME and size >= 4:
+            (length,) = _U16.unpack_from(view, 2)
+            stride = length + 2
+            if size == 2 + n * stride and length in DTYPES:
+                lengths = np.ndarray((n,), dtype='>u2', buffer=view, offset=2, strides=(stride,))
+                if n == 1 or (lengths == length).all():
+                    packets = np.ndarray((n,), dtype=DTYPES[length], buffer=view, offset=4, strides=(stride,))
+                    self._fill(packets, length)
+                    self.ticks.count = n
+                    self.vectorized_frames += 1
+                    self.packets += n
+                    return n
+            return self._decode_mixed(view, n)
+        return self._decode_packets(view, n)
+
+    def packets_view(self, frame):
+        """Zero-copy structured view of a single-mode frame, or None if its packets differ in length"""
+        view = memoryview(frame)
+        if len(view) < 4:
+            return None
+        (n,) = _U16.unpack_from(view, 0)
+        (length,) = _U16.unpack_from(view, 2)
+        stride = length + 2
+        if len(view) != 2 + n * stride or length not in DTYPES:
+            return None
+        lengths = np.ndarray((n,), dtype='>u2', buffer=view, offset=2, strides=(stride,))
+        if not (lengths == length).all():
+            return None
+        return np.ndarray((n,), dtype=DTYPES[length], buffer=view, offset=4, strides=(stride,))
+
+    def _fill(self, packets, length, start=0):
+        """Rows [start, start + len(packets)) from a structured view; each assignment converts endianness
+        and type in one pass"""
+        t = self.ticks
+        rows = slice(start, start + len(packets))
+        token = t.token[rows]
+        token[:] = packets['token']
+        t.mode[rows] = length
+        divisor = DIVISORS[token & 0xFF]
+        names = packets.dtype.names
+        for name in PRICE_COLUMNS:
+            column = getattr(t, name)[rows]
+            if name in names:
+                np.divide(packets[name], divisor, out=column)
+            else:
+                column.fill(0.0)
+        for name in INT_COLUMNS:
+            column = getattr(t, name)[rows]
+            if name in names:
+                column[:] = packets[name]
+            else:
+                column.fill(0)
+        if length == FULL_LENGTH:
+            depth = packets['depth']
+            divisor = divisor[:, None]
+            np.divide(depth['price'][:, :DEPTH_LEVELS], divisor, out=t.bid_price[rows])
+            np.divide(depth['price'][:, DEPTH_LEVELS:], divisor, out=t.ask_price[rows])
+            t.bid_qty[rows] = depth['qty'][:, :DEPTH_LEVELS]
+            t.ask_qty[rows] = depth['qty'][:, DEPTH_LEVELS:]
+            t.bid_orders[rows] = depth['orders'][:, :DEPTH_LEVELS]
+            t.ask_orders[rows] = depth['orders'][:, DEPTH_LEVELS:]
+        else:
+            for column in (t.bid_price, t.ask_price, t.bid_qty, t.ask_qty, t.bid_orders, t.ask_orders):
+                column[rows] = 0
+
+    def _decode_mixed(self, view, n):
+        """Larger mixed-mode frame: packet offsets from the headers, then one gather per mode through a
+        byte-strided structured view; rows come out grouped by mode"""
+        size = len(view)
+        offsets = {}
+        offset = 2
+        for _ in range(n):
+            if offset + 2 > size:
+                self.truncated_frames += 1
+                break
+            (length,) = _U16.unpack_from(view, offset)
+            offset += 2
+            if offset + length > size:
+                self.truncated_frames += 1
+                break  # Truncated frame: keep the complete packets
+            if length in DTYPES:
+                offsets.setdefault(length, []).append(offset)
+            else:
+                self.unknown_packets += 1
+            offset += length
+        start = 0
+        for length, group in offsets.items():
+            # One structured item at every byte offset; indexing it with the packet offsets copies just those
+            sliding = np.ndarray((size - length + 1,), dtype=DTYPES[length], buffer=view, offset=0, strides=(1,))
+            self._fill(sliding[np.array(group)], length, start)
+            start += len(group)
+        self.ticks.count = start
+        self.packets += start
+        return start
+
+    def _decode_packets(self, view, n):
+        """Small frame: one struct.unpack_from per packet, written straight into the columns"""
+        t = self.ticks
+        token_c, mode_c, ltp_c, avg_c, change_c = t.token, t.mode, t.ltp, t.avg_price, t.change
+        open_c, high_c, low_c, close_c = t.open, t.high, t.low, t.close
+        last_qty_c, volume_c, buy_c, sell_c = t.last_qty, t.volume, t.buy_qty, t.sell_qty
+        trade_time_c, oi_c, ts_c = t.last_trade_time, t.oi, t.exchange_ts
+        bid_px, bid_qty, bid_orders = t.bid_price, t.bid_qty, t.bid_orders
+        ask_px, ask_qty, ask_orders = t.ask_price, t.ask_qty, t.ask_orders
+        divisors = DIVISORS
+
+        size = len(view)
+        offset = 2
+        row = 0
+        for _ in range(n):
+            if offset + 2 > size:
+                self.truncated_frames += 1
+                break
+            (length,) = _U16.unpack_from(view, offset)
+            offset += 2
+            if offset + length > size:
+                self.truncated_frames += 1
+                break  # Truncated frame: keep the complete packets
+            if length == FULL_LENGTH or length == QUOTE_LENGTH:
+                v = (_FULL if length == FULL_LENGTH else _QUOTE).unpack_from(view, offset)
+                d = float(divisors[v[0] & 0xFF])
+                token_c[row], ltp_c[row], last_qty_c[row], avg_c[row] = v[0], v[1] / d, v[2], v[3] / d
+                volume_c[row], buy_c[row], sell_c[row] = v[4], v[5], v[6]
+                open_c[row], high_c[row], low_c[row], close_c[row] = v[7] / d, v[8] / d, v[9] / d, v[10] / d
+                change_c[row] = 0.0
+                if length == FULL_LENGTH:
+                    trade_time_c[row], oi_c[row], ts_c[row] = v[11], v[12], v[15]
+                    bid_qty[row], ask_qty[row] = v[16:31:3], v[31:46:3]
+                    bid_px[row] = [price / d for price in v[17:32:3]]
+                    ask_px[row] = [price / d for price in v[32:47:3]]
+                    bid_orders[row], ask_orders[row] = v[18:33:3], v[33:48:3]
+                else:
+                    trade_time_c[row] = oi_c[row] = ts_c[row] = 0
+                    bid_px[row] = bid_qty[row] = bid_orders[row] = ask_px[row] = ask_qty[row] = ask_orders[row] = 0
+            elif length == LTP_LENGTH or length == INDEX_QUOTE_LENGTH or length == INDEX_FULL_LENGTH:
+                if length == LTP_LENGTH:
+                    token, ltp = _LTP.unpack_from(view, offset)
+                    v = (token, ltp, 0, 0, 0, 0, 0, 0)
+                else:
+                    v = (_INDEX_FULL if length == INDEX_FULL_LENGTH else _INDEX_QUOTE).unpack_from(view, offset)
+                d = float(divisors[v[0] & 0xFF])
+                token_c[row], ltp_c[row], high_c[row], low_c[row] = v[0], v[1] / d, v[2] / d, v[3] / d
+                open_c[row], close_c[row], change_c[row] = v[4] / d, v[5] / d, v[6] / d
+                ts_c[row] = v[7] if length == INDEX_FULL_LENGTH else 0
+                avg_c[row] = 0.0
+                last_qty_c[row] = volume_c[row] = buy_c[row] = sell_c[row] = trade_time_c[row] = oi_c[row] = 0
+                bid_px[row] = bid_qty[row] = bid_orders[row] = ask_px[row] = ask_qty[row] = ask_orders[row] = 0
+            else:
+                self.unknown_packets += 1
+                offset += length
+                continue
+            mode_c[row] = length
+            offset += length
+            row += 1
+        t.count = row
+        self.packets += row
+        return row
+
+
+# -- Encoding (stub server, benchmarks) -------------------------------------------------------
+
+def _paise(price, token):
+    return int(round(price * DIVISORS[token & 0xFF]))
+
+
+def pack_ltp(token, ltp):
+    return _LTP.pack(token, _paise(ltp, token))
+
+
+def pack_quote(token, ltp, last_qty, avg_price, volume, buy_qty, sell_qty, open_, high, low, close):
+    p = lambda price: _paise(price, token)  # noqa: E731
+    return _QUOTE.pack(token, p(ltp), last_qty, p(avg_price), volume, buy_qty, sell_qty, p(open_), p(high), p(low),
+                       p(close))
+
+
+def pack_full(token, ltp, last_qty, avg_price, volume, buy_qty, sell_qty, open_, high, low, close,
+              last_trade_time, oi, oi_day_high, oi_day_low, exchange_ts, bids, asks):
+    """bids / asks: 5 (qty, price, orders) levels each, best first"""
+    depth = []
+    for qty, price, orders in list(bids) + list(asks):
+        depth += (qty, _paise(price, token), orders)
+    return (pack_quote(token, ltp, last_qty, avg_price, volume, buy_qty, sell_qty, open_, high, low, close)
+            + struct.pack('>5i', last_trade_time, oi, oi_day_high, oi_day_low, exchange_ts)
+            + struct.pack('>' + 'iih2x' * 2 * DEPTH_LEVELS, *depth))
+
+
+def pack_frame(packets):
+    """Binary message from packed packets"""
+    parts = [_U16.pack(len(packets))]
+    for packet in packets:
+        parts.append(_U16.pack(len(packet)))
+        parts.append(packet)
+    return b''.join(parts)
+
+
+HEARTBEAT = b'\x00'
@@ -0,0 +1,226 @@
+"""
+Kite execution client
+Orders go out over REST (POST /orders/<variety>); their lifecycle comes back as order
+postbacks on a ticker WebSocket with no subscriptions. Postbacks carry cumulative filled
+quantity and average price, turned into incremental fills here.
+"""
+
+from nautilus_trader.live.execution_client import LiveExecutionClient
+from nautilus_trader.model.currencies import INR
+from nautilus_trader.model.enums import AccountType, LiquiditySide, OmsType, OrderSide, OrderType, TimeInForce
+from nautilus_trader.model.identifiers import AccountId, ClientId, TradeId, VenueOrderId
+from nautilus_trader.model.objects import AccountBalance, Money, Quantity
+
+from adapters.kite.http import KITE_WS_URL, KiteApiError
+from adapters.kite.providers import KITE_VENUE, kite_symbol
+from adapters.kite.websocket import KiteTickerClient
+
+
+ORDER_TYPES = {OrderType.MARKET: 'MARKET', OrderType.LIMIT: 'LIMIT'}
+VALIDITY = {TimeInForce.DAY: 'DAY', TimeInForce.GTC: 'DAY', TimeInForce.IOC: 'IOC'}
+
+
+class KiteExecutionClient(LiveExecutionClient):
+    def __init__(self, loop, client, msgbus, cache, clock, instrument_provider, config, name=None):
+        super().__init__(
+            loop=loop,
+            client_id=ClientId(name or KITE_VENUE.value),
+            venue=KITE_VENUE,
+            oms_type=OmsType.NETTING,
+            account_type=AccountType.MARGIN,
+            base_currency=INR,
+            instrument_provider=instrument_provider,
+            msgbus=msgbus,
+            cache=cache,
+            clock=clock,
+            config=config,
+        )
+        self._http = client
+        self._config = config
+        self._set_account_id(AccountId(config.account_id))
+        self._postbacks = KiteTickerClient(
+            config.base_url_ws or KITE_WS_URL, client.api_key, client.access_token,
+            on_binary=lambda payload: None, on_text=self._on_text, logger=self._log,
+        )
+        self._client_order_ids = {}  # Venue order_id -> ClientOrderId
+        self._filled = {}  # Venue order_id -> (cumulative qty, average price) already reported
+        self._accepted = set()
+        self._early = {}  # Venue order_id -> postbacks that arrived before place_order() returned
+
+    async def _connect(self):
+        await self._instrument_provider.initialize()
+        await self._update_account_state()
+        await self._postbacks.connect()
+
+    async def _disconnect(self):
+        await self._postbacks.close()
+
+    async def _update_account_state(self):
+        margins = await self._http.margins()
+        net = float(margins.get('net', 0.0))
+        used = float(margins.get('utilised', {}).get('debits', 0.0))
+        self.generate_account_state(
+            balances=[AccountBalance(Money(net + used, INR), Money(used, INR), Money(net, INR))],
+            margins=[],
+            reported=True,
+            ts_event=self._clock.timestamp_ns(),
+        )
+
+    # -- Commands ------------------------------------------------------------------------------
+
+    async def _submit_order(self, command):
+        order = command.order
+        ts = self._clock.timestamp_ns()
+        self.generate_order_submitted(order.strategy_id, order.instrument_id, order.client_order_id, ts)
+        if order.order_type not in ORDER_TYPES or order.time_in_force not in VALIDITY:
+            self.generate_order_rejected(
+                order.strategy_id, order.instrument_id, order.client_order_id,
+                f"Unsupported on Kite: {order.order_type.name} {order.time_in_force.name}", ts,
+            )
+            return
+
+        exchange, tradingsymbol = kite_symbol(order.instrument_id)
+        params = {
+            'exchange': exchange,
+            'tradingsymbol': tradingsymbol,
+            'transaction_type': 'BUY' if order.side == OrderSide.BUY else 'SELL',
+            'order_type': ORDER_TYPES[order.order_type],
+            'quantity': int(order.quantity.as_double()),
+            'product': self._config.product,
+            'validity': VALIDITY[order.time_in_force],
+            'tag': order.client_order_id.value[-20:],  # Kite tags are limited to 20 characters
+        }
+        if order.order_type == OrderType.LIMIT:
+            params['price'] = str(order.price)
+        try:
+            order_id = await self._http.place_order(self._config.variety, **params)
+        except KiteApiError as e:
+            if e.status < 500:
+                self.generate_order_rejected(order.strategy_id, order.instrument_id, order.client_order_id,
+                                             e.message, self._clock.timestamp_ns())
+                return
+            order_id = await self._find_order(params['tag'], e)
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            # Timeout, dropped connection or unreadable response: the order may still have been placed
+            order_id = await self._find_order(params['tag'], e)
+        if order_id is None:
+            self.generate_order_rejected(order.strategy_id, order.instrument_id, order.client_order_id,
+                                         "Placement failed and no order with its tag exists at the venue",
+                                         self._clock.timestamp_ns())
+            return
+        self._client_order_ids[order_id] = order.client_order_id
+        for message in self._early.pop(order_id, ()):
+            self._on_text(message)
+
+    async def _find_order(self, tag, error):
+        """Venue order_id of today's order with this tag after a placement with an unknown outcome"""
+        self._log.warning(f"Order placement outcome unknown ({type(error).__name__}: {error}), looking up tag {tag}")
+        try:
+            orders = await self._http.orders()
+        except (KiteApiError, OSError, ValueError) as e:
+            self._log.error(f"Order lookup failed ({type(e).__name__}: {e}): check the order book for tag {tag}")
+            return None
+        for venue_order in orders or ():
+            if venue_order.get('tag') == tag:
+                return str(venue_order['order_id'])
+        return None
+
+    async def _cancel_order(self, command):
+        order = self._cache.order(command.client_order_id)
+        if order is None or order.venue_order_id is None:
+            self._log.error(f"Cannot cancel {command.client_order_id}: no venue order ID yet")
+            return
+        try:
+            await self._http.cancel_order(order.venue_order_id.value, self._config.variety)
+        except KiteApiError as e:
+            self.generate_order_cancel_rejected(order.strategy_id, order.instrument_id, order.client_order_id,
+                                                order.venue_order_id, e.message, self._clock.timestamp_ns())
+
+    async def _cancel_all_orders(self, command):
+        for order in self._cache.orders_open(venue=KITE_VENUE, instrument_id=command.instrument_id):
+            if order.venue_order_id is not None:
+                try:
+                    await self._http.cancel_order(order.venue_order_id.value, self._config.variety)
+                except KiteApiError as e:
+                    self._log.warning(f"Cancel of {order.client_order_id} failed: {e}")
+
+    # -- Reconciliation (not provided by this adapter yet: orders are tracked from postbacks) --
+
+    async def generate_order_status_report(self, command):
+        return None
+
+    async def generate_order_status_reports(self, command):
+        return []
+
+    async def generate_fill_reports(self, command):
+        return []
+
+    async def generate_position_status_reports(self, command):
+        return []
+
+    # -- Postbacks -----------------------------------------------------------------------------
+
+    def _on_text(self, message):
+        if message.get('type') != 'order':
+            if message.get('type') == 'error':
+                self._log.error(f"Kite error: {message.get('data')}")
+            return
+        data = message['data']
+        order_id = str(data['order_id'])
+        client_order_id = self._client_order_ids.get(order_id)
+        if client_order_id is None:
+            # Our own order whose REST response is still in flight, or one placed elsewhere
+            if len(self._early) >= 1000:
+                self._early.pop(next(iter(self._early)))
+            self._early.setdefault(order_id, []).append(message)
+            return
+        order = self._cache.order(client_order_id)
+        if order is None:
+            return
+
+        ts = self._clock.timestamp_ns()
+        status = data.get('status')
+        venue_order_id = VenueOrderId(order_id)
+        if status == 'REJECTED':
+            if order_id not in self._accepted:
+                self.generate_order_rejected(order.strategy_id, order.instrument_id, client_order_id,
+                                             data.get('status_message') or 'rejected', ts)
+            self._forget(order_id)
+            return
+        if order_id not in self._accepted:
+            self._accepted.add(order_id)
+            self.generate_order_accepted(order.strategy_id, order.instrument_id, client_order_id, venue_order_id, ts)
+
+        filled = int(data.get('filled_quantity') or 0)
+        average = float(data.get('average_price') or 0.0)
+        previous_qty, previous_avg = self._filled.get(order_id, (0, 0.0))
+        if filled > previous_qty:
+            last_qty = filled - previous_qty
+            last_px = (average * filled - previous_avg * previous_qty) / last_qty
+            self._filled[order_id] = (filled, average)
+            instrument = self._cache.instrument(order.instrument_id)
+            self.generate_order_filled(
+                strategy_id=order.strategy_id,
+                instrument_id=order.instrument_id,
+                client_order_id=client_order_id,
+                venue_order_id=venue_order_id,
+                venue_position_id=None,
+                trade_id=TradeId(f"{order_id}-{filled}"),
+                order_side=order.side,
+                order_type=order.order_type,
+                last_qty=Quantity(last_qty, instrument.size_precision),
+                last_px=instrument.make_price(last_px),
+                quote_currency=INR,
+                commission=Money(0, INR),  # Kite charges are settled at end of day, not per fill
+                liquidity_side=LiquiditySide.TAKER if order.order_type == OrderType.MARKET else LiquiditySide.MAKER,
+                ts_event=ts,
+            )
+        if status == 'CANCELLED':
+            self.generate_order_canceled(order.strategy_id, order.instrument_id, client_order_id, venue_order_id, ts)
+        if status in ('COMPLETE', 'CANCELLED'):
+            self._forget(order_id)
+
+    def _forget(self, order_id):
+        self._client_order_ids.pop(order_id, None)
+        self._filled.pop(order_id, None)
+        self._accepted.discard(order_id)
@@ -0,0 +1,50 @@
+"""
+Kite client factories for TradingNode (node.add_data_client_factory("KITE", ...))
+One KiteHttpClient and one instrument provider are shared by the data and execution clients.
+"""
+
+import os
+
+from nautilus_trader.live.factories import LiveDataClientFactory, LiveExecClientFactory
+
+from adapters.kite.data import KiteDataClient
+from adapters.kite.execution import KiteExecutionClient
+from adapters.kite.http import KITE_API_URL, KiteHttpClient
+from adapters.kite.providers import KiteInstrumentProvider
+
+
+_SHARED = {}
+
+
+def get_cached_kite_http_client(api_key=None, access_token=None, base_url=None):
+    api_key = api_key or os.environ.get('KITE_API_KEY')
+    access_token = access_token or os.environ.get('KITE_ACCESS_TOKEN')
+    if not api_key or not access_token:
+        raise ValueError("Kite credentials missing: set api_key/access_token or KITE_API_KEY/KITE_ACCESS_TOKEN")
+    key = ('http', api_key, access_token, base_url or KITE_API_URL)
+    if key not in _SHARED:
+        _SHARED[key] = KiteHttpClient(api_key, access_token, base_url or KITE_API_URL)
+    return _SHARED[key]
+
+
+def get_cached_kite_instrument_provider(client, config):
+    key = ('provider', id(client), config)
+    if key not in _SHARED:
+        _SHARED[key] = KiteInstrumentProvider(client, config)
+    return _SHARED[key]
+
+
+class KiteLiveDataClientFactory(LiveDataClientFactory):
+    @staticmethod
+    def create(loop, name, config, msgbus, cache, clock):
+        client = get_cached_kite_http_client(config.api_key, config.access_token, config.base_url_http)
+        provider = get_cached_kite_instrument_provider(client, config.instrument_provider)
+        return KiteDataClient(loop, client, msgbus, cache, clock, provider, config, name)
+
+
+class KiteLiveExecClientFactory(LiveExecClientFactory):
+    @staticmethod
+    def create(loop, name, config, msgbus, cache, clock):
+        client = get_cached_kite_http_client(config.api_key, config.access_token, config.base_url_http)
+        provider = get_cached_kite_instrument_provider(client, config.instrument_provider)
+        return KiteExecutionClient(loop, client, msgbus, cache, clock, provider, config, name)
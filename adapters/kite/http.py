@@ -0,0 +1,99 @@
+"""
+Kite Connect v3 REST client: instruments dump, orders, margins
+Same shape as execution.order_scheduler.BinanceFuturesRestTransport: blocking urllib calls run
+in the default executor so the event loop never waits on the network.
+"""
+
+import asyncio
+import json
+import urllib.error
+import urllib.parse
+import urllib.request
+
+
+KITE_API_URL = "https://api.kite.trade"
+KITE_WS_URL = "wss://ws.kite.trade"
+
+
+class KiteApiError(Exception):
+    """Error response from the Kite API ({"status": "error", "error_type", "message"})"""
+
+    def __init__(self, status, error_type, message):
+        super().__init__(f"{status} {error_type}: {message}")
+        self.status = status
+        self.error_type = error_type
+        self.message = message
+
+
+class KiteHttpClient:
+    def __init__(self, api_key, access_token, base_url=KITE_API_URL, timeout=10.0):
+        self.base_url = base_url.rstrip('/')
+        self.api_key = api_key
+        self.access_token = access_token
+        self.timeout = timeout
+
+    def _request(self, method, path, params=None, raw=False):
+        """Response data; KiteApiError when Kite answers with an error, OSError (timeouts, URLError)
+        or ValueError (unreadable 200 body) when the outcome is unknown"""
+        data = None
+        url = f"{self.base_url}{path}"
+        if params and method in ('POST', 'PUT'):
+            data = urllib.parse.urlencode(params).encode()
+        elif params:
+            url = f"{url}?{urllib.parse.urlencode(params)}"
+        request = urllib.request.Request(url, data=data, method=method, headers={
+            'X-Kite-Version': '3',
+            'Authorization': f"token {self.api_key}:{self.access_token}",
+            'Content-Type': 'application/x-www-form-urlencoded',
+        })
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                body = response.read()
+                status = response.status
+        except urllib.error.HTTPError as e:
+            body = e.read()
+            status = e.code
+        if raw and status == 200:
+            return body
+        if status != 200:
+            # Error bodies from a proxy or gateway are not always Kite's JSON
+            try:
+                payload = json.loads(body) if body else {}
+            except ValueError:
+                payload = {}
+            if not isinstance(payload, dict):
+                payload = {}
+            raise KiteApiError(status, payload.get('error_type', 'Error'),
+                               payload.get('message', body[:200].decode(errors='replace') or f"HTTP {status}"))
+        payload = json.loads(body) if body else {}  # ValueError for a garbled 200: the outcome is unknown
+        if payload.get('status') == 'error':
+            raise KiteApiError(status, payload.get('error_type', 'Error'), payload.get('message', ''))
+        return payload.get('data')
+
+    async def request(self, method, path, params=None, raw=False):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._request, method, path, params, raw)
+
+    async def instruments(self, exchange=None):
+        """Instrument dump as CSV bytes (all exchanges, or one)"""
+        return await self.request('GET', f"/instruments/{exchange}" if exchange else "/instruments", raw=True)
+
+    async def place_order(self, variety='regular', **params):
+        """-> venue order_id"""
+        data = await self.request('POST', f"/orders/{variety}", params)
+        return str(data['order_id'])
+
+    async def cancel_order(self, order_id, variety='regular'):
+        return await self.request('DELETE', f"/orders/{variety}/{order_id}")
+
+    async def modify_order(self, order_id, variety='regular', **params):
+        return await self.request('PUT', f"/orders/{variety}/{order_id}", params)
+
+    async def orders(self):
+        return await self.request('GET', "/orders")
+
+    async def order_trades(self, order_id):
+        return await self.request('GET', f"/orders/{order_id}/trades")
+
+    async def margins(self, segment='equity'):
+        return await self.request('GET', f"/user/margins/{segment}")
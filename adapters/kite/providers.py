@@ -0,0 +1,88 @@
+"""
+Kite instrument provider, from the daily instruments CSV dump
+Instrument IDs are "<tradingsymbol>-<exchange>.KITE" (e.g. INFY-NSE.KITE); the provider also
+keeps the instrument_token mapping the ticker and order APIs need.
+"""
+
+import csv
+import io
+import time
+
+from nautilus_trader.common.providers import InstrumentProvider
+from nautilus_trader.model.currencies import INR
+from nautilus_trader.model.identifiers import InstrumentId, Symbol, Venue
+from nautilus_trader.model.instruments import Equity
+from nautilus_trader.model.objects import Price, Quantity
+
+
+KITE_VENUE = Venue("KITE")
+
+
+def kite_instrument_id(exchange, tradingsymbol):
+    return InstrumentId(Symbol(f"{tradingsymbol}-{exchange}"), KITE_VENUE)
+
+
+def kite_symbol(instrument_id):
+    """InstrumentId -> (exchange, tradingsymbol)"""
+    tradingsymbol, _, exchange = instrument_id.symbol.value.rpartition('-')
+    return exchange, tradingsymbol
+
+
+def _precision(tick_size):
+    text = f"{tick_size:.8f}".rstrip('0')
+    return len(text.partition('.')[2])
+
+
+class KiteInstrumentProvider(InstrumentProvider):
+    """Equities (instrument_type EQ) from the instruments dump; other types are skipped"""
+
+    def __init__(self, client, config=None):
+        super().__init__(config=config)
+        self._client = client
+        self.token_by_id = {}
+        self.id_by_token = {}
+        self.skipped = 0
+
+    async def load_all_async(self, filters=None):
+        exchanges = (filters or {}).get('exchanges') or [None]
+        for exchange in exchanges:
+            self.load_csv(await self._client.instruments(exchange))
+
+    async def load_ids_async(self, instrument_ids, filters=None):
+        wanted = {InstrumentId.from_str(str(i)) for i in instrument_ids}
+        for exchange in sorted({kite_symbol(i)[0] for i in wanted}):
+            self.load_csv(await self._client.instruments(exchange), wanted)
+        missing = wanted - set(self.token_by_id)
+        if missing:
+            self._log.warning(f"Instruments not in the Kite dump: {sorted(map(str, missing))}")
+
+    async def load_async(self, instrument_id, filters=None):
+        await self.load_ids_async([instrument_id], filters)
+
+    def load_csv(self, data, wanted=None):
+        """Parse an instruments dump (bytes or str); only `wanted` IDs if given"""
+        text = data.decode() if isinstance(data, bytes) else data
+        ts = time.time_ns()
+        for row in csv.DictReader(io.StringIO(text)):
+            instrument_id = kite_instrument_id(row['exchange'], row['tradingsymbol'])
+            if wanted is not None and instrument_id not in wanted:
+                continue
+            if row['instrument_type'] != 'EQ':
+                self.skipped += 1
+                continue
+            tick_size = float(row['tick_size'] or 0.05)
+            precision = _precision(tick_size)
+            instrument = Equity(
+                instrument_id=instrument_id,
+                raw_symbol=Symbol(row['tradingsymbol']),
+                currency=INR,
+                price_precision=precision,
+                price_increment=Price(tick_size, precision),
+                lot_size=Quantity.from_int(int(row['lot_size'] or 1)),
+                ts_event=ts,
+                ts_init=ts,
+            )
+            self.add(instrument)
+            token = int(row['instrument_token'])
+            self.token_by_id[instrument_id] = token
+            self.id_by_token[token] = instrument_id
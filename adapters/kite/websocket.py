@@ -0,0 +1,236 @@
+"""
+Kite ticker WebSocket client
+Dependency-free RFC 6455 client side (masked text frames out, binary/text frames in) on asyncio
+streams, with reconnect and resubscribe. Binary messages go to on_binary as one bytes object
+straight off the socket, which KiteTickDecoder reads in place; text messages (order postbacks,
+errors) go to on_text as parsed JSON.
+"""
+
+import asyncio
+import base64
+import json
+import os
+import ssl
+import struct
+import urllib.parse
+
+
+OP_TEXT = 0x1
+OP_BINARY = 0x2
+OP_CLOSE = 0x8
+OP_PING = 0x9
+OP_PONG = 0xA
+
+
+def encode_client_frame(payload, opcode=OP_TEXT):
+    """Client frames are always masked"""
+    if isinstance(payload, str):
+        payload = payload.encode()
+    length = len(payload)
+    if length < 126:
+        header = struct.pack('!BB', 0x80 | opcode, 0x80 | length)
+    elif length < 1 << 16:
+        header = struct.pack('!BBH', 0x80 | opcode, 0x80 | 126, length)
+    else:
+        header = struct.pack('!BBQ', 0x80 | opcode, 0x80 | 127, length)
+    mask = os.urandom(4)
+    # XOR through int.from_bytes: one pass in C instead of a Python loop per byte
+    key = int.from_bytes((mask * (length // 4 + 1))[:length], 'big') if length else 0
+    masked = (int.from_bytes(payload, 'big') ^ key).to_bytes(length, 'big') if length else b''
+    return header + mask + masked
+
+
+async def read_message(reader):
+    """One (possibly fragmented) server message -> (opcode, payload bytes); server frames are unmasked"""
+    message_opcode = None
+    parts = []
+    while True:
+        b1, b2 = await reader.readexactly(2)
+        fin = b1 & 0x80
+        opcode = b1 & 0x0F
+        length = b2 & 0x7F
+        if length == 126:
+            (length,) = struct.unpack('!H', await reader.readexactly(2))
+        elif length == 127:
+            (length,) = struct.unpack('!Q', await reader.readexactly(8))
+        payload = await reader.readexactly(length)
+        if opcode >= OP_CLOSE:
+            return opcode, payload
+        if message_opcode is None:
+            message_opcode = opcode
+        if fin and not parts:
+            return message_opcode, payload  # Unfragmented: no join
+        parts.append(payload)
+        if fin:
+            return message_opcode, b''.join(parts)
+
+
+class KiteTickerClient:
+    """Subscriptions by instrument token and mode; reconnects with exponential backoff"""
+
+    def __init__(self, url, api_key, access_token, on_binary, on_text=None, on_reconnect=None,
+                 max_backoff=30.0, logger=None):
+        self.url = url
+        self.api_key = api_key
+        self.access_token = access_token
+        self.on_binary = on_binary
+        self.on_text = on_text
+        self.on_reconnect = on_reconnect
+        self.max_backoff = max_backoff
+        self.log = logger
+
+        self.modes = {}  # token -> mode, replayed after a reconnect
+        self._reader = None
+        self._writer = None
+        self._task = None
+        self._connected = asyncio.Event()
+        self._closing = False
+
+        # Metrics
+        self.messages = 0
+        self.bytes_received = 0
+        self.reconnects = 0
+        self.callback_errors = 0
+
+    @property
+    def is_connected(self):
+        return self._connected.is_set()
+
+    async def connect(self, timeout=10.0):
+        self._closing = False
+        self._task = asyncio.get_running_loop().create_task(self._run())
+        await asyncio.wait_for(self._connected.wait(), timeout)
+
+    async def close(self):
+        self._closing = True
+        if self._writer is not None:
+            try:
+                self._writer.write(encode_client_frame(struct.pack('!H', 1000), OP_CLOSE))
+                await self._writer.drain()
+            except ConnectionError:
+                pass
+            self._writer.close()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._connected.clear()
+
+    async def subscribe(self, tokens, mode='full'):
+        tokens = [int(token) for token in tokens]
+        for token in tokens:
+            self.modes[token] = mode
+        if self.is_connected:
+            await self._send_subscriptions(tokens, mode)
+
+    async def unsubscribe(self, tokens):
+        tokens = [int(token) for token in tokens if int(token) in self.modes]
+        for token in tokens:
+            del self.modes[token]
+        if self.is_connected and tokens:
+            await self._send({'a': 'unsubscribe', 'v': tokens})
+
+    async def _send_subscriptions(self, tokens, mode):
+        await self._send({'a': 'subscribe', 'v': tokens})
+        await self._send({'a': 'mode', 'v': [mode, tokens]})
+
+    async def _send(self, message):
+        self._writer.write(encode_client_frame(json.dumps(message, separators=(',', ':'))))
+        await self._writer.drain()
+
+    async def _open(self):
+        url = urllib.parse.urlparse(self.url)
+        secure = url.scheme == 'wss'
+        port = url.port or (443 if secure else 80)
+        reader, writer = await asyncio.open_connection(
+            url.hostname, port, ssl=ssl.create_default_context() if secure else None,
+            limit=1 << 20,  # Full-mode frames for thousands of tokens run to hundreds of KB
+        )
+        query = urllib.parse.urlencode({'api_key': self.api_key, 'access_token': self.access_token})
+        path = f"{url.path or '/'}?{url.query + '&' if url.query else ''}{query}"
+        key = base64.b64encode(os.urandom(16)).decode()
+        writer.write(
+            f"GET {path} HTTP/1.1\r\n"
+            f"Host: {url.hostname}:{port}\r\n"
+            "Upgrade: websocket\r\n"
+            "Connection: Upgrade\r\n"
+            f"Sec-WebSocket-Key: {key}\r\n"
+            "Sec-WebSocket-Version: 13\r\n"
+            "X-Kite-Version: 3\r\n\r\n".encode()
+        )
+        await writer.drain()
+        status = await reader.readline()
+        while (await reader.readline()) not in (b'\r\n', b'\n', b''):
+            pass
+        if b' 101 ' not in status:
+            writer.close()
+            raise ConnectionError(f"WebSocket handshake failed: {status.decode().strip()}")
+        return reader, writer
+
+    async def _run(self):
+        backoff = 0.5
+        first = True
+        while not self._closing:
+            try:
+                self._reader, self._writer = await self._open()
+            except (OSError, ConnectionError) as e:
+                if self.log:
+                    self.log.warning(f"Kite ticker connect failed ({e}), retrying in {backoff:.1f}s")
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, self.max_backoff)
+                continue
+
+            backoff = 0.5
+            # Replay subscriptions, grouped by mode
+            by_mode = {}
+            for token, mode in self.modes.items():
+                by_mode.setdefault(mode, []).append(token)
+            for mode, tokens in by_mode.items():
+                await self._send_subscriptions(tokens, mode)
+            self._connected.set()
+            if not first:
+                self.reconnects += 1
+                if self.on_reconnect is not None:
+                    self.on_reconnect()
+            first = False
+
+            try:
+                await self._receive()
+            except (asyncio.IncompleteReadError, OSError) as e:  # ConnectionError is an OSError
+                if self.log and not self._closing:
+                    self.log.warning(f"Kite ticker disconnected ({type(e).__name__}), reconnecting")
+            finally:
+                self._connected.clear()
+                self._writer.close()
+
+    def _callback_failed(self, kind, error):
+        """A bad message or handler bug drops that message, never the connection"""
+        self.callback_errors += 1
+        if self.log:
+            self.log.error(f"Kite ticker {kind} message handler failed: {type(error).__name__}: {error}")
+
+    async def _receive(self):
+        reader, writer = self._reader, self._writer
+        on_binary, on_text = self.on_binary, self.on_text
+        while True:
+            opcode, payload = await read_message(reader)
+            if opcode == OP_BINARY:
+                self.messages += 1
+                self.bytes_received += len(payload)
+                try:
+                    on_binary(payload)
+                except Exception as e:
+                    self._callback_failed('binary', e)
+            elif opcode == OP_TEXT:
+                self.messages += 1
+                if on_text is not None:
+                    try:
+                        on_text(json.loads(payload))
+                    except Exception as e:
+                        self._callback_failed('text', e)
+            elif opcode == OP_PING:
+                writer.write(encode_client_frame(payload, OP_PONG))
+            elif opcode == OP_CLOSE:
+                raise ConnectionError("closed by server")
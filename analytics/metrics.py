@@ -0,0 +1,143 @@
+"""
+Batch performance metrics over many equity curves at once
+Every function takes a 2-D array (runs x time, a 1-D curve is treated as one run) and returns
+one value per run, so optimizer / Monte Carlo / walk-forward outputs are scored in NumPy
+without per-run pandas objects. Annualisation assumes a 24/7 market (365 days a year).
+"""
+
+import numpy as np
+import pandas as pd
+
+
+YEAR = pd.Timedelta(days=365)
+
+
+def periods_per_year(freq):
+    """Bars per year for a bar interval like '1min', '1h' or '1D' on a 24/7 market"""
+    return YEAR / pd.Timedelta(freq)
+
+
+def _as_2d(values):
+    values = np.asarray(values, dtype=np.float64)
+    return values[np.newaxis, :] if values.ndim == 1 else values
+
+
+def simple_returns(equity):
+    equity = _as_2d(equity)
+    return np.diff(equity, axis=1) / equity[:, :-1]
+
+
+def sharpe_ratio(equity, periods, risk_free=0.0):
+    r = simple_returns(equity) - risk_free / periods
+    std = r.std(axis=1, ddof=1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.where(std > 0, r.mean(axis=1) / std * np.sqrt(periods), 0.0)
+
+
+def sortino_ratio(equity, periods, risk_free=0.0):
+    """Mean excess return over downside deviation (root mean square of the negative returns)"""
+    r = simple_returns(equity) - risk_free / periods
+    downside = np.sqrt(np.mean(np.minimum(r, 0.0) ** 2, axis=1))
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.where(downside > 0, r.mean(axis=1) / downside * np.sqrt(periods), 0.0)
+
+
+def drawdowns(equity):
+    """Fractional drawdown from the running peak, same shape as the input"""
+    equity = _as_2d(equity)
+    peak = np.maximum.accumulate(equity, axis=1)
+    return (equity - peak) / peak
+
+
+def max_drawdown(equity):
+    """(deepest drawdown, longest time under water in bars) per run"""
+    equity = _as_2d(equity)
+    depth = drawdowns(equity).min(axis=1)
+
+    # Bars since the last running peak; its maximum is the longest drawdown
+    steps = np.arange(equity.shape[1])
+    at_peak = equity >= np.maximum.accumulate(equity, axis=1)
+    last_peak = np.maximum.accumulate(np.where(at_peak, steps, 0), axis=1)
+    duration = (steps - last_peak).max(axis=1)
+    return depth, duration
+
+
+def annualized_return(equity, periods):
+    equity = _as_2d(equity)
+    years = (equity.shape[1] - 1) / periods
+    if years <= 0:
+        return np.zeros(len(equity))
+    total = equity[:, -1] / equity[:, 0]
+    return np.where(total > 0, np.abs(total) ** (1 / years) - 1, -1.0)
+
+
+def calmar_ratio(equity, periods):
+    depth, _ = max_drawdown(equity)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.where(depth < 0, annualized_return(equity, periods) / -depth, 0.0)
+
+
+def turnover(exposure, equity, periods):
+    """Annualized traded notional over average equity; exposure is net notional per bar"""
+    exposure = _as_2d(exposure)
+    equity = _as_2d(equity)
+    traded = np.abs(np.diff(exposure, axis=1)).sum(axis=1)
+    years = max(exposure.shape[1] - 1, 1) / periods
+    return traded / equity.mean(axis=1) / years
+
+
+def trade_stats(pnl):
+    """Per-run trade statistics; pnl is runs x trades, NaN-padded where runs have fewer trades"""
+    pnl = _as_2d(pnl)
+    valid = ~np.isnan(pnl)
+    wins = np.where(valid & (pnl > 0), pnl, 0.0)
+    losses = np.where(valid & (pnl <= 0), pnl, 0.0)
+    n = valid.sum(axis=1)
+    n_wins = (valid & (pnl > 0)).sum(axis=1)
+    n_losses = n - n_wins
+    gross_win = wins.sum(axis=1)
+    gross_loss = -losses.sum(axis=1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return {
+            'trades': n,
+            'win_rate': np.where(n > 0, n_wins / n, 0.0),
+            'avg_trade': np.where(n > 0, (gross_win - gross_loss) / n, 0.0),
+            'avg_win': np.where(n_wins > 0, gross_win / n_wins, 0.0),
+            'avg_loss': np.where(n_losses > 0, -gross_loss / n_losses, 0.0),
+            'profit_factor': np.where(gross_loss > 0, gross_win / gross_loss, np.where(gross_win > 0, np.inf, 0.0)),
+        }
+
+
+def pad_trades(pnl_per_run):
+    """List of per-run PnL sequences -> NaN-padded runs x trades array for trade_stats()"""
+    width = max((len(p) for p in pnl_per_run), default=0)
+    out = np.full((len(pnl_per_run), width), np.nan)
+    for i, p in enumerate(pnl_per_run):
+        out[i, :len(p)] = p
+    return out
+
+
+def batch_metrics(equity, freq='1D', exposure=None, trade_pnl=None, risk_free=0.0):
+    """All metrics for runs x time equity sampled every `freq`; returns {name: array per run}"""
+    periods = periods_per_year(freq)
+    depth, duration = max_drawdown(equity)
+    metrics = {
+        'total_return': _as_2d(equity)[:, -1] / _as_2d(equity)[:, 0] - 1,
+        'annualized_return': annualized_return(equity, periods),
+        'sharpe_ratio': sharpe_ratio(equity, periods, risk_free),
+        'sortino_ratio': sortino_ratio(equity, periods, risk_free),
+        'max_drawdown': depth,
+        'max_drawdown_bars': duration,
+        'max_drawdown_days': duration * (pd.Timedelta(freq) / pd.Timedelta(days=1)),
+        'calmar_ratio': calmar_ratio(equity, periods),
+    }
+    if exposure is not None:
+        metrics['turnover'] = turnover(exposure, equity, periods)
+    if trade_pnl is not None:
+        metrics.update(trade_stats(trade_pnl))
+    return metrics
+
+
+def metrics_frame(metrics, index=None):
+    """batch_metrics() output as a DataFrame, one row per run"""
+    return pd.DataFrame(metrics, index=index)
@@ -0,0 +1,304 @@
+"""
+Cross-engine replication: simplified backtester vs PairsTradingStrategy on the BacktestEngine
+Both run on the same bars; trade logs and realized-PnL curves are aligned by timestamp with
+vectorized joins, and the first divergence is reported with the state of both engines around it
+
+    python -m analytics.replication --seeds 1-8 --days 90 --workers 4
+    python -m analytics.replication --seeds 7 --start-days 0,30,60 --days 90
+"""
+
+import argparse
+import contextlib
+import glob
+import io
+import json
+import os
+import shutil
+import tempfile
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from storage.arena import DataArena, attach
+
+
+CONFIG = {
+    'lookback_period': 60,
+    'rolling_window': 20,
+    'z_entry_threshold': 2.0,
+    'z_exit_threshold': 0.5,
+    'z_stop_loss': 3.0,
+    'position_size_usd': 1000.0,
+}
+
+TRADE_COLUMNS = ['entry_time', 'exit_time', 'side', 'pnl']
+
+
+def simplified_state(btc_close, eth_close, hedge_ratio, lookback, window):
+    """Spread and z-score per bar exactly as SimplifiedPairsBacktest computes them, in one pass"""
+    spread = np.full(len(btc_close), np.nan)
+    spread[lookback:] = np.log(btc_close[lookback:]) - hedge_ratio * np.log(eth_close[lookback:])
+    rolling = pd.Series(spread[lookback:]).rolling(window)
+    mean = rolling.mean().to_numpy()
+    std = rolling.std(ddof=0).to_numpy()
+    z = np.full(len(btc_close), np.nan)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        z[lookback:] = np.where(std > 0, (spread[lookback:] - mean) / std, 0.0)
+    z[lookback:][np.isnan(mean)] = 0.0  # Returns 0 until the window is full
+    return spread, z
+
+
+def run_simplified(btc_df, eth_df, config):
+    from run_backtest import SimplifiedPairsBacktest
+
+    backtest = SimplifiedPairsBacktest(config)
+    with contextlib.redirect_stdout(io.StringIO()):
+        results = backtest.run_backtest(btc_df, eth_df)
+    trades = pd.DataFrame(backtest.trades, columns=TRADE_COLUMNS + ['exit_reason', 'z_score'])
+    return results, trades[TRADE_COLUMNS + ['exit_reason']]
+
+
+def run_engine(instruments, bars, config):
+    from run_engine_backtest import BASE_STRATEGY_CONFIG, PairsEngineRunner
+    from storage.columnar import read_columnar
+
+    decision_dir = tempfile.mkdtemp(prefix="replication_")
+    try:
+        runner = PairsEngineRunner(instruments, bars)
+        summary = runner.run({**config, 'decision_log_dir': decision_dir}, keep_reports=True)
+        runner.dispose()
+        paths = sorted(glob.glob(os.path.join(decision_dir, "decisions-*.arrow")))
+        decisions = read_columnar(paths[-1]).to_pandas() if paths else pd.DataFrame()
+    finally:
+        shutil.rmtree(decision_dir, ignore_errors=True)
+
+    positions = summary.pop('positions_report')
+    if positions is None or positions.empty:
+        return summary, pd.DataFrame(columns=TRADE_COLUMNS), decisions
+    positions = positions.assign(pnl=positions['realized_pnl'].astype(str).str.split().str[0].astype(float))
+    leg_a = positions[positions['instrument_id'] == BASE_STRATEGY_CONFIG['instrument_id_a']]
+    side = leg_a.set_index('ts_opened')['entry'].astype(str).map({'BUY': 'long', 'SELL': 'short'})
+    trades = positions.groupby('ts_opened').agg(exit_time=('ts_closed', 'max'), pnl=('pnl', 'sum'))
+    trades['side'] = side
+    trades = trades.reset_index().rename(columns={'ts_opened': 'entry_time'})
+    return summary, trades[TRADE_COLUMNS], decisions
+
+
+def _to_ns(values):
+    return pd.to_datetime(values, utc=True).astype('int64').to_numpy()
+
+
+def align_trades(simplified, engine):
+    """Outer join of both trade logs on entry time (by occurrence); first row that differs"""
+    logs = []
+    for df in (simplified, engine):
+        df = df.assign(entry_ns=_to_ns(df['entry_time']), exit_ns=_to_ns(df['exit_time']))
+        df['occurrence'] = df.groupby('entry_ns').cumcount()
+        logs.append(df[['entry_ns', 'occurrence', 'exit_ns', 'side', 'pnl']])
+    merged = logs[0].merge(logs[1], on=['entry_ns', 'occurrence'], how='outer',
+                           suffixes=('_simplified', '_engine'), indicator=True).sort_values('entry_ns')
+    differs = ((merged['_merge'] != 'both')
+               | (merged['side_simplified'] != merged['side_engine'])
+               | (merged['exit_ns_simplified'] != merged['exit_ns_engine']))
+    return merged, differs.to_numpy()
+
+
+def align_equity(simplified, engine, tolerance):
+    """Cumulative realized PnL of both engines on the union of their exit times (as-of joins)"""
+    curves = []
+    for name, df in (('simplified', simplified), ('engine', engine)):
+        curve = pd.DataFrame({'ts': _to_ns(df['exit_time']), name: df['pnl'].to_numpy(dtype=float)})
+        curve = curve.groupby('ts', as_index=False).sum()
+        curve[name] = curve[name].cumsum()
+        curves.append(curve)
+    timeline = pd.DataFrame({'ts': np.union1d(curves[0]['ts'], curves[1]['ts'])})
+    for curve in curves:
+        timeline = pd.merge_asof(timeline, curve, on='ts', direction='backward')
+    timeline = timeline.fillna(0.0)
+    diff = (timeline['simplified'] - timeline['engine']).abs().to_numpy()
+    breach = np.flatnonzero(diff > tolerance)
+    return {
+        'points': len(timeline),
+        'max_abs_diff': float(diff.max()) if len(diff) else 0.0,
+        'final_simplified': float(timeline['simplified'].iloc[-1]) if len(timeline) else 0.0,
+        'final_engine': float(timeline['engine'].iloc[-1]) if len(timeline) else 0.0,
+        'first_breach': (pd.Timestamp(int(timeline['ts'].iloc[breach[0]]), tz='UTC').isoformat()
+                         if len(breach) else None),
+    }
+
+
+def state_around(ts_ns, index_ns, btc_close, eth_close, simplified_z, decisions, context_bars):
+    """Prices and both engines' z-score/decision for the bars around a timestamp"""
+    i = int(np.searchsorted(index_ns, ts_ns))
+    lo, hi = max(0, i - context_bars), min(len(index_ns), i + context_bars + 1)
+    state = pd.DataFrame({
+        'ts_event': index_ns[lo:hi],
+        'btc_close': btc_close[lo:hi],
+        'eth_close': eth_close[lo:hi],
+        'simplified_z': simplified_z[lo:hi],
+    })
+    if not decisions.empty:
+        # One evaluation per leg bar: keep the last per timestamp
+        last = decisions.drop_duplicates('ts_event', keep='last')[['ts_event', 'z_score', 'action', 'in_position']]
+        state = state.merge(last.rename(columns={'z_score': 'engine_z', 'action': 'engine_action'}),
+                            on='ts_event', how='left')
+    state['ts_event'] = pd.to_datetime(state['ts_event'], utc=True).astype(str)
+    return state.replace({np.nan: None}).to_dict('records')
+
+
+def replicate(seed, days=90, start_day=0, config=None, equity_tolerance=5.0, context_bars=3, frames=None):
+    """Run both engines on one synthetic dataset and compare them
+
+    frames: the seed's (BTC, ETH) frames when the caller already has them (possibly longer than
+    start_day + days, e.g. read-only views from a data arena); generated here otherwise.
+    """
+    from run_engine_backtest import frames_to_bars, synthetic_frames, synthetic_instruments
+
+    config = dict(config or CONFIG)
+    t0 = time.perf_counter()
+    if frames is None:
+        instruments, frames = synthetic_frames(start_day + days, seed)
+    else:
+        instruments = synthetic_instruments()
+    frames = [df.iloc[start_day * 1440:(start_day + days) * 1440] for df in frames]
+    btc_df, eth_df = (df.rename_axis('timestamp').reset_index() for df in frames)
+
+    simplified_results, simplified_trades = run_simplified(btc_df, eth_df, config)
+    engine_summary, engine_trades, decisions = run_engine(instruments, frames_to_bars(instruments, frames), config)
+
+    merged, differs = align_trades(simplified_trades, engine_trades)
+    report = {
+        'seed': seed,
+        'start_day': start_day,
+        'days': days,
+        'simplified_trades': len(simplified_trades),
+        'engine_trades': len(engine_trades),
+        'matched_trades': int((~differs).sum()),
+        'simplified_pnl': simplified_results['total_pnl'],
+        'engine_pnl': engine_summary['total_pnl'],
+        'equity': align_equity(simplified_trades, engine_trades, equity_tolerance),
+        'first_divergence': None,
+    }
+
+    if differs.any():
+        row = merged.iloc[int(np.argmax(differs))]
+        index_ns = frames[0].index.asi8
+        btc_close = frames[0]['close'].to_numpy()
+        eth_close = frames[1]['close'].to_numpy()
+        lookback = 60 * 1440  # Hard-coded in SimplifiedPairsBacktest
+        hedge_ratio = simplified_results['hedge_ratio']
+        _, simplified_z = simplified_state(btc_close, eth_close, hedge_ratio, lookback, 20 * 1440)
+
+        def leg(suffix):
+            if pd.isna(row[f'side_{suffix}']):
+                return None
+            return {'side': row[f'side_{suffix}'],
+                    'exit_time': pd.Timestamp(int(row[f'exit_ns_{suffix}']), tz='UTC').isoformat(),
+                    'pnl': float(row[f'pnl_{suffix}'])}
+
+        report['first_divergence'] = {
+            'entry_time': pd.Timestamp(int(row['entry_ns']), tz='UTC').isoformat(),
+            'simplified': leg('simplified'),
+            'engine': leg('engine'),
+            'simplified_hedge_ratio': hedge_ratio,
+            'engine_hedge_ratio': float(decisions['hedge_ratio'].iloc[0]) if not decisions.empty else None,
+            'state': state_around(int(row['entry_ns']), index_ns, btc_close, eth_close, simplified_z,
+                                  decisions, context_bars),
+        }
+    report['seconds'] = round(time.perf_counter() - t0, 2)
+    return report
+
+
+def _replicate_or_error(seed, days, start_day, config, equity_tolerance, frames):
+    """replicate(), or an error row for the report: one failing run must not abort the sweep"""
+    t0 = time.perf_counter()
+    try:
+        return replicate(seed, days, start_day, config, equity_tolerance, frames=frames)
+    except Exception as e:
+        return {'seed': seed, 'start_day': start_day, 'days': days, 'error': f"{type(e).__name__}: {e}",
+                'traceback': traceback.format_exc(), 'seconds': round(time.perf_counter() - t0, 2)}
+
+
+def _replicate_task(task):
+    seed, days, start_day, config, equity_tolerance, descriptor = task
+    view = attach(descriptor)
+    frames = [view.frame(f'{seed}/btc'), view.frame(f'{seed}/eth')]
+    return _replicate_or_error(seed, days, start_day, config, equity_tolerance, frames)
+
+
+def run_replication(seeds, days=90, start_days=(0,), config=None, equity_tolerance=5.0, workers=None,
+                    arena_backend='shm'):
+    """replicate() over seeds x date offsets in parallel worker processes; failed runs are rows with an 'error'
+
+    Each seed's dataset is generated once, long enough for the latest offset, and published to a
+    shared data arena; workers receive its descriptor and slice read-only views instead of
+    regenerating or unpickling the frames per task.
+    """
+    from run_engine_backtest import synthetic_frames
+
+    dataset_days = max(start_days) + days
+    datasets = {seed: synthetic_frames(dataset_days, seed)[1] for seed in seeds}
+    tasks = [(seed, days, start_day, config, equity_tolerance) for seed in seeds for start_day in start_days]
+    workers = min(len(tasks), workers or os.cpu_count() or 1)
+    if workers == 1:
+        return [_replicate_or_error(*task, datasets[task[0]]) for task in tasks]
+
+    frames = {f'{seed}/{leg}': df for seed, legs in datasets.items() for leg, df in zip(('btc', 'eth'), legs)}
+    with DataArena.publish(frames=frames, backend=arena_backend) as arena:
+        del frames, datasets
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(_replicate_task, [task + (arena.descriptor,) for task in tasks]))
+
+
+def parse_ints(spec):
+    """'1-8' or '1,2,5' -> list of ints"""
+    values = []
+    for part in spec.split(','):
+        if '-' in part:
+            lo, hi = part.split('-')
+            values.extend(range(int(lo), int(hi) + 1))
+        else:
+            values.append(int(part))
+    return values
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Simplified backtester vs Nautilus engine replication')
+    parser.add_argument('--seeds', default='1-4', help="Dataset seeds, e.g. '1-8' or '3,7'")
+    parser.add_argument('--days', type=int, default=90, help='Days per run (the simplified path fits on the first 60)')
+    parser.add_argument('--start-days', default='0', help='Day offsets into each seed dataset (date ranges)')
+    parser.add_argument('--equity-tolerance', type=float, default=5.0, help='USDT gap counted as an equity breach')
+    parser.add_argument('--workers', type=int, help='Worker processes (default: CPU count)')
+    parser.add_argument('--arena', default='shm', choices=['shm', 'file'],
+                        help='Shared data arena backend for the workers (file when /dev/shm is small)')
+    parser.add_argument('--output', default='./logs/replication.json')
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    reports = run_replication(parse_ints(args.seeds), args.days, parse_ints(args.start_days),
+                              equity_tolerance=args.equity_tolerance, workers=args.workers, arena_backend=args.arena)
+
+    print(f"{'seed':>5}{'start':>6}{'simpl':>7}{'engine':>7}{'match':>7}{'simpl PnL':>11}{'engine PnL':>12}"
+          f"  first divergence")
+    for r in reports:
+        if 'error' in r:
+            print(f"{r['seed']:>5}{r['start_day']:>6}  ERROR {r['error']}")
+            continue
+        divergence = r['first_divergence']['entry_time'] if r['first_divergence'] else '-'
+        print(f"{r['seed']:>5}{r['start_day']:>6}{r['simplified_trades']:>7}{r['engine_trades']:>7}"
+              f"{r['matched_trades']:>7}{r['simplified_pnl']:>11.2f}{r['engine_pnl']:>12.2f}  {divergence}")
+    replicated = sum(1 for r in reports if 'error' not in r and r['first_divergence'] is None)
+    failed = sum(1 for r in reports if 'error' in r)
+    print(f"\n{replicated}/{len(reports)} runs replicated, {failed} failed in {time.perf_counter() - t0:.1f}s")
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, 'w') as f:
+        json.dump(reports, f, indent=2, default=str)
+    print(f"Saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,514 @@
+"""
+Streaming tearsheet over trade journals and equity curves
+Journal part files and equity curves are read one chunk at a time into mergeable accumulators
+(aggregate, per alpha, per period), so memory stays flat however many trades and bars there
+are. Per-file partial results are cached under the file's fingerprint (path, size, mtime);
+journal parts are immutable, so regenerating after a new run only reads the new files.
+Charts are inline SVG drawn from the downsampled series, no plotting library needed.
+
+    python -m analytics.report
+    python -m analytics.report --journal ./data/journal --equity 'logs/*.npz' --period Y
+"""
+
+import argparse
+import glob
+import hashlib
+import html
+import os
+import pickle
+import time
+
+import numpy as np
+import pandas as pd
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from analytics.equity import EquityCurve
+from analytics.metrics import batch_metrics, drawdowns, periods_per_year
+
+
+CACHE_VERSION = 1
+CHUNK_ROWS = 262144
+TRADE_COLUMNS = ['ts_entry', 'ts_exit', 'source', 'strategy_id', 'pnl']
+ROLLING_SHARPE_DAYS = 90
+
+# Fixed symmetric log-spaced PnL bin edges (+-0.01 .. +-1e7), so histograms of different files add up
+_EDGES = np.logspace(-2, 7, 37)
+PNL_BINS = np.concatenate((-_EDGES[::-1], _EDGES))
+
+COLORS = ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd', '#8c564b', '#e377c2', '#17becf']
+
+
+def fingerprint(*parts):
+    digest = hashlib.sha1(str(CACHE_VERSION).encode())
+    for part in parts:
+        digest.update(repr(part).encode())
+    return digest.hexdigest()
+
+
+def file_fingerprint(path, *options):
+    stat = os.stat(path)
+    return fingerprint(os.path.abspath(path), stat.st_size, stat.st_mtime_ns, *options)
+
+
+class SectionCache:
+    """Pickled {fingerprint: section} store; entries the last build did not use are dropped on save"""
+
+    def __init__(self, path):
+        self.path = path
+        self.entries = {}
+        self.used = set()
+        self.hits = self.misses = 0
+        if path and os.path.exists(path):
+            try:
+                with open(path, 'rb') as f:
+                    self.entries = pickle.load(f)
+            except Exception:
+                self.entries = {}  # Unreadable or from an older layout: rebuild
+
+    def get(self, key, compute):
+        self.used.add(key)
+        if key in self.entries:
+            self.hits += 1
+            return self.entries[key]
+        self.misses += 1
+        self.entries[key] = compute()
+        return self.entries[key]
+
+    def save(self):
+        if not self.path or (not self.misses and self.used == set(self.entries)):
+            return
+        entries = {key: self.entries[key] for key in self.used}
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        tmp = self.path + '.tmp'
+        with open(tmp, 'wb') as f:
+            pickle.dump(entries, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, self.path)
+
+
+class TradeStats:
+    """Mergeable trade statistics (count, mean and M2 combined with Chan's parallel update)"""
+
+    __slots__ = ('count', 'wins', 'gross_win', 'gross_loss', 'mean', 'm2', 'best', 'worst', 'hold_ns')
+
+    def __init__(self):
+        self.count = self.wins = self.hold_ns = 0
+        self.gross_win = self.gross_loss = self.mean = self.m2 = 0.0
+        self.best = -np.inf
+        self.worst = np.inf
+
+    def update(self, pnl, hold_ns):
+        if not len(pnl):
+            return
+        other = TradeStats()
+        win = pnl > 0
+        other.count = len(pnl)
+        other.wins = int(win.sum())
+        other.gross_win = float(pnl[win].sum())
+        other.gross_loss = -float(pnl[~win].sum())
+        other.mean = float(pnl.mean())
+        other.m2 = float(((pnl - other.mean) ** 2).sum())
+        other.best = float(pnl.max())
+        other.worst = float(pnl.min())
+        other.hold_ns = int(hold_ns.sum())
+        self.merge(other)
+
+    def merge(self, other):
+        n = self.count + other.count
+        if not other.count:
+            return self
+        delta = other.mean - self.mean
+        self.m2 += other.m2 + delta ** 2 * self.count * other.count / n
+        self.mean += delta * other.count / n
+        self.count = n
+        self.wins += other.wins
+        self.gross_win += other.gross_win
+        self.gross_loss += other.gross_loss
+        self.best = max(self.best, other.best)
+        self.worst = min(self.worst, other.worst)
+        self.hold_ns += other.hold_ns
+        return self
+
+    def summary(self):
+        n, losses = self.count, self.count - self.wins
+        if not n:
+            return {'trades': 0}
+        return {
+            'trades': n,
+            'total_pnl': self.gross_win - self.gross_loss,
+            'win_rate': self.wins / n,
+            'avg_trade': self.mean,
+            'pnl_std': (self.m2 / (n - 1)) ** 0.5 if n > 1 else 0.0,
+            'avg_win': self.gross_win / self.wins if self.wins else 0.0,
+            'avg_loss': -self.gross_loss / losses if losses else 0.0,
+            'profit_factor': self.gross_win / self.gross_loss if self.gross_loss > 0 else np.inf,
+            'best': self.best,
+            'worst': self.worst,
+            'avg_hold_hours': self.hold_ns / n / 3.6e12,
+        }
+
+
+def _update_groups(groups, keys, codes, pnl, hold_ns):
+    for code, key in enumerate(keys):
+        mask = codes == code
+        if mask.any():
+            groups.setdefault(key, TradeStats()).update(pnl[mask], hold_ns[mask])
+
+
+def scan_trades(path, period='M'):
+    """Aggregate, per-alpha and per-period TradeStats plus a PnL histogram for one journal part file"""
+    section = {'total': TradeStats(), 'alpha': {}, 'period': {}, 'histogram': np.zeros(len(PNL_BINS) - 1, np.int64)}
+    for batch in pq.ParquetFile(path).iter_batches(batch_size=CHUNK_ROWS, columns=TRADE_COLUMNS):
+        pnl = batch.column('pnl').to_numpy(zero_copy_only=False)
+        ts_exit = batch.column('ts_exit').to_numpy()
+        hold_ns = ts_exit - batch.column('ts_entry').to_numpy()
+        section['total'].update(pnl, hold_ns)
+        section['histogram'] += np.histogram(np.clip(pnl, PNL_BINS[0], PNL_BINS[-1]), PNL_BINS)[0]
+
+        alpha = pc.binary_join_element_wise(batch.column('source'), batch.column('strategy_id'), '/').dictionary_encode()
+        _update_groups(section['alpha'], alpha.dictionary.to_pylist(), alpha.indices.to_numpy(), pnl, hold_ns)
+
+        periods, codes = np.unique(ts_exit.astype('datetime64[ns]').astype(f'datetime64[{period}]'), return_inverse=True)
+        _update_groups(section['period'], [str(p) for p in periods], codes, pnl, hold_ns)
+    return section
+
+
+def merge_trade_sections(sections):
+    merged = {'total': TradeStats(), 'alpha': {}, 'period': {}, 'histogram': np.zeros(len(PNL_BINS) - 1, np.int64)}
+    for section in sections:
+        merged['total'].merge(section['total'])
+        merged['histogram'] += section['histogram']
+        for group in ('alpha', 'period'):
+            for key, stats in section[group].items():
+                merged[group].setdefault(key, TradeStats()).merge(stats)
+    return merged
+
+
+def _combine(curves, how):
+    """Concatenate chunk-wise downsampled curves, merging the bucket split across a chunk boundary"""
+    index = np.concatenate([c.index for c in curves])
+    values = np.concatenate([c.values for c in curves])
+    starts = np.flatnonzero(np.r_[True, index[1:] != index[:-1]])
+    if how == 'last':
+        values = values[np.r_[starts[1:], len(index)] - 1]
+    else:
+        values = np.minimum.reduceat(values, starts)
+    return EquityCurve(index[starts], values)
+
+
+def scan_equity(path, freq='1D'):
+    """Full-resolution drawdown stats plus downsampled equity and underwater series for one curve"""
+    curve = EquityCurve.load(path)
+    if not len(curve):
+        return None
+    peak, peak_ns = -np.inf, int(curve.index[0])
+    depth, longest_ns = 0.0, 0
+    equity, underwater = [], []
+    for start in range(0, len(curve), CHUNK_ROWS):
+        index = curve.index[start:start + CHUNK_ROWS]
+        values = curve.values[start:start + CHUNK_ROWS].astype(np.float64)
+        running = np.maximum.accumulate(np.maximum(values, peak))  # Peak carried over from the last chunk
+        drawdown = values / running - 1
+        peak_time = np.maximum.accumulate(np.where(values >= running, index, peak_ns))
+        longest_ns = max(longest_ns, int((index - peak_time).max()))
+        depth = min(depth, float(drawdown.min()))
+        peak, peak_ns = running[-1], int(peak_time[-1])
+        equity.append(EquityCurve(index, values).downsample(freq, 'last'))
+        underwater.append(EquityCurve(index, drawdown).downsample(freq, 'min'))
+
+    equity = _combine(equity, 'last')
+    # Anchor the sampled curve at the first bar so the first period's return counts
+    equity = EquityCurve(np.r_[curve.index[0], equity.index], np.r_[curve.values[0], equity.values])
+    return {
+        'bars': len(curve),
+        'max_drawdown': depth,
+        'max_drawdown_days': longest_ns / pd.Timedelta(days=1).value,
+        'equity': equity,
+        'underwater': _combine(underwater, 'min'),
+    }
+
+
+def equity_metrics(values, freq):
+    metrics = batch_metrics(values, freq)
+    return {name: float(value[0]) for name, value in metrics.items()}
+
+
+def portfolio_curve(curves):
+    """Sum of the sampled curves on their union of timestamps, each held flat outside its own range"""
+    index = np.unique(np.concatenate([c.index for c in curves]))
+    total = np.zeros(len(index))
+    for curve in curves:
+        position = np.clip(np.searchsorted(curve.index, index, side='right') - 1, 0, None)
+        total += curve.values[position]
+    return EquityCurve(index, total)
+
+
+def period_returns(curve, period='M'):
+    """{period label: return} from a sampled equity curve (labels are period ends, so step back 1ns)"""
+    periods = (curve.index[1:] - 1).astype('datetime64[ns]').astype(f'datetime64[{period}]')
+    starts = np.flatnonzero(np.r_[True, periods[1:] != periods[:-1]])
+    ends = np.r_[starts[1:], len(periods)] - 1
+    closes = curve.values[1:][ends].astype(np.float64)
+    opens = np.r_[curve.values[0], closes[:-1]]
+    return dict(zip((str(p) for p in periods[starts]), closes / opens - 1))
+
+
+def rolling_sharpe(curve, freq):
+    periods = periods_per_year(freq)
+    window = max(int(pd.Timedelta(days=ROLLING_SHARPE_DAYS) / pd.Timedelta(freq)), 2)
+    values = curve.values.astype(np.float64)
+    returns = np.diff(values) / values[:-1]
+    if len(returns) < window:
+        return None
+    sums = np.cumsum(np.r_[0.0, returns])
+    squares = np.cumsum(np.r_[0.0, returns ** 2])
+    mean = (sums[window:] - sums[:-window]) / window
+    var = ((squares[window:] - squares[:-window]) - window * mean ** 2) / (window - 1)
+    std = np.sqrt(np.maximum(var, 0))
+    with np.errstate(invalid='ignore', divide='ignore'):
+        sharpe = np.where(std > 0, mean / std * np.sqrt(periods), 0.0)
+    return EquityCurve(curve.index[window:], sharpe)
+
+
+def _time_label(ns):
+    return str(np.datetime64(int(ns), 'ns').astype('datetime64[D]'))
+
+
+def svg_lines(series, width=900, height=240, fmt='{:,.0f}', fill=False):
+    """[(label, index_ns, values)] as an inline SVG line chart with a time axis"""
+    left, right, top, bottom = 72, 12, 10, 24
+    x_lo = min(int(s[1][0]) for s in series)
+    x_hi = max(int(s[1][-1]) for s in series)
+    y_lo = min(float(np.min(s[2])) for s in series)
+    y_hi = max(float(np.max(s[2])) for s in series)
+    if fill:
+        y_hi = max(y_hi, 0.0)
+    if y_hi == y_lo:
+        y_lo, y_hi = y_lo - 1, y_hi + 1
+
+    def sx(x):
+        return left + (np.asarray(x, dtype=np.float64) - x_lo) / max(x_hi - x_lo, 1) * (width - left - right)
+
+    def sy(y):
+        return top + (y_hi - np.asarray(y, dtype=np.float64)) / (y_hi - y_lo) * (height - top - bottom)
+
+    parts = [f'<svg viewBox="0 0 {width} {height}" width="100%" class="chart">']
+    for value in np.linspace(y_lo, y_hi, 5):
+        y = sy(value)
+        parts.append(f'<line x1="{left}" x2="{width - right}" y1="{y:.1f}" y2="{y:.1f}" class="grid"/>'
+                     f'<text x="{left - 6}" y="{y + 4:.1f}" text-anchor="end">{fmt.format(value)}</text>')
+    for ns in np.linspace(x_lo, x_hi, 6):
+        parts.append(f'<text x="{sx(ns):.1f}" y="{height - 6}" text-anchor="middle">{_time_label(ns)}</text>')
+    for i, (label, index, values) in enumerate(series):
+        color = COLORS[i % len(COLORS)]
+        points = ' '.join(f'{x:.1f},{y:.1f}' for x, y in zip(sx(index), sy(values)))
+        if fill:
+            base = sy(0.0)
+            parts.append(f'<polygon points="{sx(index[0]):.1f},{base:.1f} {points} {sx(index[-1]):.1f},{base:.1f}" '
+                         f'fill="{color}" fill-opacity="0.25" stroke="none"/>')
+        parts.append(f'<polyline points="{points}" fill="none" stroke="{color}" stroke-width="1.2"/>')
+        if len(series) > 1:
+            parts.append(f'<text x="{left + 8 + 160 * i}" y="{top + 12}" fill="{color}">{html.escape(label)}</text>')
+    parts.append('</svg>')
+    return ''.join(parts)
+
+
+def svg_histogram(counts, edges, width=900, height=200):
+    """Non-empty bins of a fixed-edge histogram as SVG bars, labelled by their lower edge"""
+    used = np.flatnonzero(counts)
+    if not len(used):
+        return ''
+    used = np.arange(used[0], used[-1] + 1)
+    left, bottom, top = 40, 24, 10
+    bar = (width - left) / len(used)
+    scale = (height - top - bottom) / counts[used].max()
+    parts = [f'<svg viewBox="0 0 {width} {height}" width="100%" class="chart">']
+    for i, b in enumerate(used):
+        h = counts[b] * scale
+        x = left + i * bar
+        color = COLORS[3] if edges[b + 1] <= 0 else COLORS[2]
+        parts.append(f'<rect x="{x:.1f}" y="{height - bottom - h:.1f}" width="{bar * 0.9:.1f}" height="{h:.1f}" '
+                     f'fill="{color}"><title>{edges[b]:,.2f} .. {edges[b + 1]:,.2f}: {counts[b]}</title></rect>')
+        if i % max(len(used) // 8, 1) == 0:
+            parts.append(f'<text x="{x:.1f}" y="{height - 6}">{edges[b]:,.2g}</text>')
+    parts.append(f'<text x="4" y="{top + 10}">{counts[used].max()}</text></svg>')
+    return ''.join(parts)
+
+
+def _format(value):
+    if isinstance(value, (int, np.integer)):
+        return f'{value:,}'
+    if isinstance(value, float):
+        return '&infin;' if np.isinf(value) else f'{value:,.4f}'
+    return html.escape(str(value))
+
+
+def html_table(rows, index_name):
+    """{row label: {column: value}} as an HTML table"""
+    if not rows:
+        return '<p>No data</p>'
+    columns = list(dict.fromkeys(c for row in rows.values() for c in row))
+    head = ''.join(f'<th>{html.escape(c)}</th>' for c in [index_name, *columns])
+    body = ''.join(
+        f'<tr><td>{html.escape(str(label))}</td>' + ''.join(f'<td>{_format(row.get(c, ""))}</td>' for c in columns) + '</tr>'
+        for label, row in rows.items()
+    )
+    return f'<table><tr>{head}</tr>{body}</table>'
+
+
+def returns_heatmap(returns):
+    """{'YYYY-MM': return} as a year x month table coloured by sign and size"""
+    if not returns:
+        return '<p>No data</p>'
+    scale = max(abs(r) for r in returns.values()) or 1.0
+    years = sorted({label[:4] for label in returns})
+    head = '<tr><th>Year</th>' + ''.join(f'<th>{m:02d}</th>' for m in range(1, 13)) + '</tr>'
+    rows = []
+    for year in years:
+        cells = []
+        for month in range(1, 13):
+            r = returns.get(f'{year}-{month:02d}')
+            if r is None:
+                cells.append('<td></td>')
+                continue
+            rgb = '44,160,44' if r >= 0 else '214,39,40'
+            cells.append(f'<td style="background: rgba({rgb},{0.15 + 0.7 * abs(r) / scale:.2f})">{r:.2%}</td>')
+        rows.append(f'<tr><td>{year}</td>{"".join(cells)}</tr>')
+    return f'<table>{head}{"".join(rows)}</table>'
+
+
+STYLE = """
+body { font-family: sans-serif; margin: 24px; color: #222; }
+h2 { border-bottom: 1px solid #ccc; padding-bottom: 4px; margin-top: 32px; }
+table { border-collapse: collapse; font-size: 13px; }
+td, th { border: 1px solid #ddd; padding: 3px 8px; text-align: right; }
+.chart { font-size: 11px; max-width: 900px; }
+.chart .grid { stroke: #e5e5e5; }
+"""
+
+
+def render_html(title, summary, charts):
+    sections = [f'<h1>{html.escape(title)}</h1>', '<h2>Key metrics</h2>', html_table(summary['aggregate'], 'metric')]
+    if charts.get('equity'):
+        sections += ['<h2>Equity</h2>', charts['equity']]
+    if charts.get('underwater'):
+        sections += ['<h2>Underwater (drawdown)</h2>', charts['underwater']]
+    if charts.get('rolling_sharpe'):
+        sections += [f'<h2>Rolling Sharpe ({ROLLING_SHARPE_DAYS} days)</h2>', charts['rolling_sharpe']]
+    if summary.get('monthly_returns') is not None:
+        sections += ['<h2>Monthly returns</h2>', returns_heatmap(summary['monthly_returns'])]
+    sections += [
+        '<h2>Per alpha: equity</h2>', html_table(summary['alpha_equity'], 'curve'),
+        '<h2>Per alpha: trades</h2>', html_table(summary['alpha_trades'], 'alpha'),
+        '<h2>Per period: trades</h2>', html_table(summary['period_trades'], 'period'),
+    ]
+    if charts.get('histogram'):
+        sections += ['<h2>Trade PnL distribution</h2>', charts['histogram']]
+    return (f'<!DOCTYPE html><html><head><meta charset="utf-8"><title>{html.escape(title)}</title>'
+            f'<style>{STYLE}</style></head><body>{"".join(sections)}</body></html>')
+
+
+def _build(trade_sections, equity_sections, period, freq, title):
+    trades = merge_trade_sections(trade_sections)
+    curves = {name: section for name, section in equity_sections.items() if section}
+
+    aggregate = {}
+    if trades['total'].count:
+        aggregate['trades'] = trades['total'].summary()
+    alpha_equity = {}
+    for name, section in curves.items():
+        metrics = equity_metrics(section['equity'].values, freq)
+        # Sampled drawdown understates the intrabar depth; use the full-resolution pass
+        metrics.update(max_drawdown=section['max_drawdown'], max_drawdown_days=section['max_drawdown_days'],
+                       final_equity=float(section['equity'].values[-1]), bars=section['bars'])
+        metrics.pop('max_drawdown_bars')
+        alpha_equity[name] = metrics
+
+    charts, monthly = {}, None
+    if curves:
+        portfolio = portfolio_curve([s['equity'] for s in curves.values()])
+        aggregate['portfolio'] = equity_metrics(portfolio.values, freq)
+        monthly = period_returns(portfolio, 'M')
+
+        lines = [(name, s['equity'].index, s['equity'].values) for name, s in curves.items()]
+        if len(curves) > 1:
+            lines.append(('portfolio', portfolio.index, portfolio.values))
+        charts['equity'] = svg_lines(lines)
+        underwater = [(name, s['underwater'].index, s['underwater'].values * 100) for name, s in curves.items()]
+        if len(curves) > 1:
+            underwater.append(('portfolio', portfolio.index, drawdowns(portfolio.values)[0] * 100))
+        charts['underwater'] = svg_lines(underwater, fmt='{:.1f}%', fill=True)
+        sharpe = rolling_sharpe(portfolio, freq)
+        if sharpe is not None:
+            charts['rolling_sharpe'] = svg_lines([('portfolio', sharpe.index, sharpe.values)], fmt='{:.2f}')
+    if trades['total'].count:
+        charts['histogram'] = svg_histogram(trades['histogram'], PNL_BINS)
+
+    # Transpose {section: {metric: value}} so the key metrics table has one column per section
+    key_metrics = {}
+    for section, metrics in aggregate.items():
+        for metric, value in metrics.items():
+            key_metrics.setdefault(metric, {})[section] = value
+
+    summary = {
+        'aggregate': key_metrics,
+        'alpha_equity': alpha_equity,
+        'alpha_trades': {k: s.summary() for k, s in sorted(trades['alpha'].items())},
+        'period_trades': {k: s.summary() for k, s in sorted(trades['period'].items())},
+        'monthly_returns': monthly,
+    }
+    return {'summary': summary, 'html': render_html(title, summary, charts)}
+
+
+def build_report(journal='./data/journal', equity=('./logs/*.npz',), output='./logs/tearsheet.html',
+                 period='M', freq='1D', cache_path='./logs/report_cache.pkl', title='Backtest tearsheet'):
+    """Stream the inputs into a tearsheet at `output`; returns the summary dict, or None without inputs"""
+    t0 = time.perf_counter()
+    trade_paths = sorted(glob.glob(os.path.join(journal, 'trades', '*.parquet'))) if journal else []
+    equity_paths = sorted({p for pattern in equity or () for p in glob.glob(pattern)})
+    if not trade_paths and not equity_paths:
+        print(f"No journal parts under {journal} and no equity curves matching {list(equity or ())}")
+        return None
+
+    cache = SectionCache(cache_path)
+    trade_keys = [file_fingerprint(p, 'trades', period) for p in trade_paths]
+    equity_keys = [file_fingerprint(p, 'equity', freq) for p in equity_paths]
+
+    def build():
+        trade_sections = [cache.get(key, lambda p=path: scan_trades(p, period))
+                          for key, path in zip(trade_keys, trade_paths)]
+        equity_sections = {os.path.splitext(os.path.basename(path))[0]: cache.get(key, lambda p=path: scan_equity(p, freq))
+                           for key, path in zip(equity_keys, equity_paths)}
+        return _build(trade_sections, equity_sections, period, freq, title)
+
+    report = cache.get(fingerprint('report', trade_keys, equity_keys, period, freq, title), build)
+    if cache.hits and not cache.misses:
+        cache.used.update(trade_keys + equity_keys)  # Keep the per-file sections for the next partial rebuild
+
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w') as f:
+        f.write(report['html'])
+    cache.save()
+    print(f"Tearsheet written to {output} ({len(trade_paths)} journal parts, {len(equity_paths)} equity curves, "
+          f"{cache.misses} section(s) computed, {cache.hits} cached, {time.perf_counter() - t0:.2f}s)")
+    return report['summary']
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Streaming HTML tearsheet from trade journals and equity curves')
+    parser.add_argument('--journal', default='./data/journal', help='TradeJournal root directory')
+    parser.add_argument('--equity', nargs='*', default=['./logs/*.npz'], help='EquityCurve .npz files or glob patterns')
+    parser.add_argument('--period', default='M', choices=['W', 'M', 'Y'], help='Per-period trade statistics bucket')
+    parser.add_argument('--freq', default='1D', help='Sampling interval for charts and ratio metrics')
+    parser.add_argument('--output', default='./logs/tearsheet.html')
+    parser.add_argument('--cache', default='./logs/report_cache.pkl', help="Section cache file ('' disables it)")
+    args = parser.parse_args()
+
+    summary = build_report(args.journal, args.equity, args.output, args.period, args.freq, args.cache or None)
+    if summary:
+        for metric, values in summary['aggregate'].items():
+            print(f"  {metric:>18}: " + ', '.join(f"{k} {_format(v)}" for k, v in values.items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,470 @@
+"""
+Benchmark suite for the strategy, backtester and data paths
+Each (benchmark, size, repeat) runs in a fresh subprocess so peak RSS is per case
+
+    python -m benchmarks.bench_suite                        # 1d, 1w, 1m
+    python -m benchmarks.bench_suite --sizes all --repeat 3
+    python -m benchmarks.bench_suite --bench on_bar --sizes 1w,3m
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SIZES = {
+    '1d': 1,
+    '1w': 7,
+    '1m': 30,
+    '3m': 90,
+    '1y': 365,
+    '2y': 730,
+}
+DEFAULT_SIZES = ('1d', '1w', '1m')
+
+BACKTEST_CONFIG = {
+    'lookback_period': 60,
+    'rolling_window': 20,
+    'z_entry_threshold': 2.0,
+    'z_exit_threshold': 0.5,
+    'z_stop_loss': 3.0,
+    'position_size_usd': 1000.0,
+}
+
+
+def peak_rss_mb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024  # KiB on Linux
+
+
+def synthetic_closes(n_bars, seed=7):
+    """Correlated BTC/ETH closes with minute-scale volatility"""
+    rng = np.random.default_rng(seed)
+    btc_returns = rng.normal(0, 0.0006, n_bars)
+    eth_returns = 0.85 * btc_returns + np.sqrt(1 - 0.85 ** 2) * rng.normal(0, 0.0006, n_bars)
+    return 40000 * np.exp(np.cumsum(btc_returns)), 2500 * np.exp(np.cumsum(eth_returns))
+
+
+# -- Cases: setup(days) -> (run callable, bars processed); only run() is timed -----------------
+
+def case_generate_synthetic_data(days):
+    from run_backtest import SimplifiedPairsBacktest
+
+    backtest = SimplifiedPairsBacktest(BACKTEST_CONFIG)
+    return (lambda: backtest.generate_synthetic_data(days=days)), days * 1440
+
+
+def case_run_backtest(days):
+    """Trading days after the backtester's fixed 60-day hedge-ratio lookback
+    (z-scores need 20 days of spreads, so sizes under 20d mostly time the warm-up path)"""
+    from run_backtest import SimplifiedPairsBacktest
+
+    backtest = SimplifiedPairsBacktest(BACKTEST_CONFIG)
+    btc_df, eth_df = backtest.generate_synthetic_data(days=60 + days, seed=42)
+
+    def run():
+        return {'trades': backtest.run_backtest(btc_df, eth_df)['total_trades']}
+
+    return run, days * 1440
+
+
+def _synthetic_bars(days):
+    import pandas as pd
+    from nautilus_trader.model.data import BarType
+    from nautilus_trader.persistence.wranglers import BarDataWrangler
+    from nautilus_trader.test_kit.providers import TestInstrumentProvider
+
+    btc = TestInstrumentProvider.btcusdt_perp_binance()
+    eth = TestInstrumentProvider.ethusdt_perp_binance()
+    n_bars = days * 1440
+    index = pd.date_range('2024-01-01', periods=n_bars, freq='1min', tz='UTC')
+    bars = []
+    for instrument, closes in zip((btc, eth), synthetic_closes(n_bars)):
+        df = pd.DataFrame({'open': closes, 'high': closes * 1.0005, 'low': closes * 0.9995,
+                           'close': closes, 'volume': 100.0}, index=index)
+        bar_type = BarType.from_str(f"{instrument.id}-1-MINUTE-LAST-EXTERNAL")
+        bars.extend(BarDataWrangler(bar_type, instrument).process(df))
+    return btc, eth, bars
+
+
+def _bar_engine(days):
+    from nautilus_trader.backtest.engine import BacktestEngine, BacktestEngineConfig
+    from nautilus_trader.config import LoggingConfig
+    from nautilus_trader.model.currencies import USDT
+    from nautilus_trader.model.enums import AccountType, OmsType
+    from nautilus_trader.model.identifiers import Venue
+    from nautilus_trader.model.objects import Money
+
+    btc, eth, bars = _synthetic_bars(days)
+    engine = BacktestEngine(BacktestEngineConfig(logging=LoggingConfig(log_level="ERROR")))
+    engine.add_venue(
+        Venue("BINANCE"), oms_type=OmsType.NETTING, account_type=AccountType.MARGIN,
+        starting_balances=[Money(1_000_000, USDT)], base_currency=USDT,
+    )
+    engine.add_instrument(btc)
+    engine.add_instrument(eth)
+    engine.add_data(bars)
+    return engine, btc, eth, len(bars)
+
+
+def case_on_bar(days):
+    """PairsTradingStrategy.on_bar inside a BacktestEngine; bars/sec counts on_bar time only"""
+    from strategies.pairs_trading import PairsTradingConfig, PairsTradingStrategy
+
+    engine, btc, eth, n_bars = _bar_engine(days)
+    strategy = PairsTradingStrategy(PairsTradingConfig(
+        instrument_id_a=str(btc.id), instrument_id_b=str(eth.id), bar_type="1-MINUTE-LAST-EXTERNAL",
+        lookback_period=60, rolling_window=min(20, days), position_size_usd=1000.0,
+    ))
+    engine.add_strategy(strategy)
+
+    on_bar = strategy.on_bar
+    elapsed = [0]
+
+    def timed_on_bar(bar):
+        t0 = time.perf_counter_ns()
+        on_bar(bar)
+        elapsed[0] += time.perf_counter_ns() - t0
+
+    strategy.on_bar = timed_on_bar
+
+    def run():
+        engine.run()
+        return {
+            'on_bar_seconds': elapsed[0] / 1e9,
+            'buffer_len': len(strategy.prices_a),
+            'trades': strategy.trade_count,
+        }
+
+    return run, n_bars
+
+
+def case_kline_parse(days):
+    """Raw REST kline JSON -> DataFrame, as in download_data.py"""
+    from download_data import klines_to_dataframe
+
+    n_bars = days * 1440
+    closes, _ = synthetic_closes(n_bars)
+    open_ms = 1704067200000 + np.arange(n_bars, dtype=np.int64) * 60_000
+    rows = [
+        [int(t), f"{c:.2f}", f"{c * 1.0005:.2f}", f"{c * 0.9995:.2f}", f"{c:.2f}", "123.456",
+         int(t) + 59_999, "4938271.23", 1200, "61.728", "2469135.61", "0"]
+        for t, c in zip(open_ms, closes)
+    ]
+    # Binance pages 1000 bars per response
+    pages = [json.dumps(rows[i:i + 1000]).encode() for i in range(0, n_bars, 1000)]
+
+    def run():
+        klines = []
+        for page in pages:
+            klines.extend(json.loads(page))
+        return {'rows': len(klines_to_dataframe(klines))}
+
+    return run, n_bars
+
+
+def case_catalog_read(days):
+    """Bars for both legs from a ParquetDataCatalog written during setup"""
+    from nautilus_trader.persistence.catalog import ParquetDataCatalog
+
+    btc, eth, bars = _synthetic_bars(days)
+    n_bars = len(bars)
+    catalog_dir = tempfile.mkdtemp(prefix="bench_catalog_")
+    catalog = ParquetDataCatalog(catalog_dir)
+    catalog.write_data([btc, eth])
+    catalog.write_data(bars)
+    del bars
+    bar_types = [f"{btc.id}-1-MINUTE-LAST-EXTERNAL", f"{eth.id}-1-MINUTE-LAST-EXTERNAL"]
+
+    def run():
+        return {'rows': len(catalog.bars(bar_types=bar_types))}
+
+    return run, n_bars, lambda: shutil.rmtree(catalog_dir, ignore_errors=True)
+
+
+def _synthetic_ohlc(n_bars):
+    closes, _ = synthetic_closes(n_bars)
+    opens = np.r_[closes[0], closes[:-1]]
+    wick = np.abs(np.random.default_rng(11).normal(0, 0.0003, n_bars))
+    return np.maximum(opens, closes) * (1 + wick), np.minimum(opens, closes) * (1 - wick), closes
+
+
+def case_breakout_signal(days):
+    """BreakoutSignal.update per bar (the on_bar core of Alpha 2), pure Python"""
+    from strategies.breakout import BreakoutSignal
+
+    n_bars = days * 1440
+    highs, lows, closes = (a.tolist() for a in _synthetic_ohlc(n_bars))
+    signal = BreakoutSignal()
+
+    def run():
+        update = signal.update
+        for high, low, close in zip(highs, lows, closes):
+            update(high, low, close)
+        return {'bars_seen': signal.index}
+
+    return run, n_bars
+
+
+def case_breakout_vectorized(days):
+    """breakout_trades() over whole arrays, checked trade for trade against BreakoutSignal"""
+    from strategies.breakout import breakout_trades, replay_signals
+
+    n_bars = days * 1440
+    highs, lows, closes = _synthetic_ohlc(n_bars)
+    expected = replay_signals(highs, lows, closes)
+
+    def run():
+        trades = breakout_trades(highs, lows, closes)
+        matches = all(np.array_equal(trades[k], expected[k]) for k in ('entry_index', 'exit_index', 'side'))
+        return {'trades': len(trades['entry_index']), 'matches_incremental': matches}
+
+    return run, n_bars
+
+
+def case_mtf_vectorized(days):
+    """mtf_positions() (5m/1h/4h from 1m bars), checked bar for bar against MultiTimeframeSignal"""
+    from strategies.multi_timeframe import mtf_positions, replay_positions
+
+    n_bars = days * 1440
+    highs, lows, closes = _synthetic_ohlc(n_bars)
+    opens = np.r_[closes[0], closes[:-1]]
+    ts = 1704067200_000_000_000 + np.arange(1, n_bars + 1, dtype=np.int64) * 60_000_000_000
+    expected = replay_positions(ts, opens, highs, lows, closes)
+
+    def run():
+        positions = mtf_positions(ts, opens, highs, lows, closes)
+        return {'position_changes': int(np.count_nonzero(np.diff(positions))),
+                'matches_incremental': bool(np.array_equal(positions, expected))}
+
+    return run, n_bars
+
+
+def case_cross_asset_signal(days, n_instruments=100):
+    """CrossAssetSignal.update for 100 instruments; bars counts synchronized minutes"""
+    from strategies.cross_asset import CrossAssetSignal
+
+    n_bars = days * 1440
+    rng = np.random.default_rng(13)
+    market = rng.normal(0, 0.0006, (n_bars, 1))
+    returns = market * rng.uniform(0.5, 1.5, n_instruments) + rng.normal(0, 0.0004, (n_bars, n_instruments))
+    prices = 100 * np.exp(np.cumsum(returns, axis=0))
+    signal = CrossAssetSignal(n_instruments, warmup=min(1440, n_bars // 2))
+
+    def run():
+        changes = 0
+        previous = signal.position.copy()
+        for row in prices:
+            position = signal.update(row)
+            if not np.array_equal(position, previous):
+                changes += 1
+                previous[:] = position
+        return {'instruments': n_instruments, 'rebalances': changes}
+
+    return run, n_bars
+
+
+def case_l2_book(days):
+    """L2Book.apply_depth_update on synthetic Binance depth events; bars counts events (1440 a day)"""
+    import json
+
+    from benchmarks.l2_book import synthetic_stream
+    from strategies.l2_book import L2Book
+
+    n_events = days * 1440
+    lines = synthetic_stream(n_events)
+    snapshot = json.loads(lines[0])
+    events = [json.loads(line) for line in lines[1:]]
+    book = L2Book()
+    book.apply_snapshot(snapshot)
+
+    def run():
+        apply = book.apply_depth_update
+        synced = sum(apply(event) for event in events)
+        return {'synced_events': synced, 'bid_levels': book.bids.count, 'ask_levels': book.asks.count}
+
+    return run, n_events
+
+
+def case_portfolio_netting(days, n_alphas=5, n_instruments=50):
+    """PortfolioAggregator cycle for 5 alphas x 50 instruments; bars counts cycles (1440 a day)"""
+    from execution.portfolio import PortfolioAggregator
+
+    n_cycles = days * 1440
+    rng = np.random.default_rng(17)
+    # Each alpha holds -1/0/+1 per instrument and changes its mind on ~0.5% of them per cycle
+    flips = rng.random((n_cycles, n_alphas, n_instruments)) < 0.005
+    draws = rng.integers(-1, 2, (n_cycles, n_alphas, n_instruments)).astype(np.float64)
+    prices = 100 * np.exp(np.cumsum(rng.normal(0, 0.0005, (n_cycles, n_instruments)), axis=0))
+    aggregator = PortfolioAggregator(range(n_instruments), range(n_alphas), max_position_usd=2500.0,
+                                     max_gross_usd=60000.0)
+
+    def run():
+        targets = np.zeros((n_alphas, n_instruments))
+        positions = np.zeros(n_instruments)
+        for flip, draw, price in zip(flips, draws, prices):
+            np.copyto(targets, draw * 1000.0, where=flip)
+            aggregator.targets[:] = targets
+            indices, quantities = aggregator.orders(positions, price)
+            positions[indices] += quantities  # Filled in full
+        return aggregator.summary()
+
+    return run, n_cycles
+
+
+def case_kite_decode(days, n_instruments=200):
+    """KiteTickDecoder on 200-packet full-mode frames; bars counts frames (1440 a day)"""
+    from adapters.kite.decoder import KiteTickDecoder
+    from benchmarks.kite_decode import synthetic_frames
+
+    n_frames = days * 1440
+    frame = synthetic_frames(n_instruments)['full'][0]
+    decoder = KiteTickDecoder()
+
+    def run():
+        decode = decoder.decode
+        ticks = sum(decode(frame) for _ in range(n_frames))
+        return {'ticks': ticks, 'vectorized_frames': decoder.vectorized_frames}
+
+    return run, n_frames
+
+
+BENCHMARKS = {
+    'generate_synthetic_data': case_generate_synthetic_data,
+    'run_backtest': case_run_backtest,
+    'on_bar': case_on_bar,
+    'kline_parse': case_kline_parse,
+    'catalog_read': case_catalog_read,
+    'breakout_signal': case_breakout_signal,
+    'breakout_vectorized': case_breakout_vectorized,
+    'mtf_vectorized': case_mtf_vectorized,
+    'cross_asset_signal': case_cross_asset_signal,
+    'l2_book': case_l2_book,
+    'portfolio_netting': case_portfolio_netting,
+    'kite_decode': case_kite_decode,
+}
+
+
+def run_case(name, days):
+    """Worker side: one case in this process, result as a dict"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        run, bars, *cleanup = BENCHMARKS[name](days)  # Optional third item: untimed teardown
+        rss_before = peak_rss_mb()
+        t0 = time.perf_counter()
+        try:
+            extra = run()
+            seconds = time.perf_counter() - t0
+        finally:
+            for teardown in cleanup:
+                teardown()
+    peak = peak_rss_mb()
+
+    extra = extra if isinstance(extra, dict) else {}
+    timed = extra.get('on_bar_seconds', seconds)
+    return {
+        'benchmark': name,
+        'days': days,
+        'bars': bars,
+        'seconds': round(seconds, 6),
+        'bars_per_sec': round(bars / timed, 1) if timed > 0 else None,
+        'peak_rss_mb': round(peak, 2),
+        'peak_rss_delta_mb': round(max(0.0, peak - rss_before), 2),
+        'extra': extra,
+    }
+
+
+def spawn_case(name, days, timeout=None):
+    try:
+        proc = subprocess.run(
+            [sys.executable, '-m', 'benchmarks.bench_suite', '--worker', name, str(days)],
+            cwd=REPO_ROOT, capture_output=True, text=True, timeout=timeout,
+        )
+    except subprocess.TimeoutExpired:
+        return {'benchmark': name, 'days': days, 'error': [f"Timed out after {timeout:g}s"]}
+    if proc.returncode != 0:
+        return {'benchmark': name, 'days': days, 'error': proc.stderr.strip().splitlines()[-1:]}
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def git_revision():
+    try:
+        rev = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=REPO_ROOT, capture_output=True, text=True)
+        dirty = subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'],
+                               cwd=REPO_ROOT, capture_output=True, text=True)
+        return rev.stdout.strip() or None, bool(dirty.stdout.strip())
+    except OSError:
+        return None, False
+
+
+def environment():
+    revision, dirty = git_revision()
+    return {
+        'timestamp': datetime.now(timezone.utc).isoformat(),
+        'git_revision': revision,
+        'git_dirty': dirty,
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'cpu_count': os.cpu_count(),
+    }
+
+
+def run_suite(benchmarks=None, sizes=DEFAULT_SIZES, repeat=1, timeout=None, verbose=True):
+    results = []
+    for name in benchmarks or BENCHMARKS:
+        for size in sizes:
+            for i in range(repeat):
+                result = spawn_case(name, SIZES[size], timeout)
+                result.update(size=size, repeat=i)
+                results.append(result)
+                if verbose:
+                    if 'error' in result:
+                        print(f"  {name:<24}{size:>4}  ERROR {result['error']}")
+                    else:
+                        print(f"  {name:<24}{size:>4}  {result['bars_per_sec']:>14,.0f} bars/s"
+                              f"  {result['seconds']:>9.3f}s  peak {result['peak_rss_mb']:>8.1f} MB")
+    return {'environment': environment(), 'results': results}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Strategy / backtester / data-path benchmarks')
+    parser.add_argument('--bench', help=f"Comma-separated subset of: {', '.join(BENCHMARKS)}")
+    parser.add_argument('--sizes', default=','.join(DEFAULT_SIZES),
+                        help=f"Comma-separated subset of {', '.join(SIZES)}, or 'all'")
+    parser.add_argument('--repeat', type=int, default=1, help='Runs per case (fresh process each)')
+    parser.add_argument('--timeout', type=float, help='Seconds per case before it is abandoned')
+    parser.add_argument('--output', default='./logs/benchmarks.json')
+    parser.add_argument('--worker', nargs=2, metavar=('BENCH', 'DAYS'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(run_case(args.worker[0], int(args.worker[1]))))
+        return
+
+    sizes = list(SIZES) if args.sizes == 'all' else args.sizes.split(',')
+    benchmarks = args.bench.split(',') if args.bench else None
+    print(f"Benchmarks: {', '.join(benchmarks or BENCHMARKS)} | sizes: {', '.join(sizes)} | repeat {args.repeat}")
+    report = run_suite(benchmarks, sizes, args.repeat, args.timeout)
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"\nSaved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+"""
+Kite binary tick decoding benchmark
+Decodes synthetic ticker frames with KiteTickDecoder (columnar, zero-copy for uniform frames)
+and with a dict-per-tick parser in the style of the official client (one dict, plus a depth
+dict per level, for every tick), reporting ticks/s per frame shape. --check compares the two.
+
+    python -m benchmarks.kite_decode
+    python -m benchmarks.kite_decode --instruments 500 --frames 2000 --check
+"""
+
+import argparse
+import struct
+import time
+
+import numpy as np
+
+from adapters.kite.decoder import (
+    DIVISORS, FULL_LENGTH, QUOTE_LENGTH, SEGMENT_CDS, SEGMENT_NSE, KiteTickDecoder,
+    pack_frame, pack_full, pack_ltp, pack_quote,
+)
+
+
+def synthetic_packets(instruments, mode, seed=11):
+    """One packet per instrument (NSE tokens, the last one a CDS pair for the 1e7 divisor)"""
+    rng = np.random.default_rng(seed)
+    tokens = [(i << 8) | SEGMENT_NSE for i in range(1, instruments)] + [(408065 << 8) | SEGMENT_CDS]
+    packets = []
+    for token in tokens:
+        ltp = round(float(rng.uniform(80, 90)), 4) if token & 0xFF == SEGMENT_CDS else round(float(rng.uniform(100, 3000)), 2)
+        volume = int(rng.integers(1, 10_000_000))
+        if mode == 'ltp':
+            packets.append(pack_ltp(token, ltp))
+        elif mode == 'quote':
+            packets.append(pack_quote(token, ltp, 5, ltp, volume, 100, 200, ltp, ltp + 1, ltp - 1, ltp - 0.5))
+        else:
+            bids = [(int(rng.integers(1, 1000)), round(ltp - 0.05 * (j + 1), 2), int(rng.integers(1, 50))) for j in range(5)]
+            asks = [(int(rng.integers(1, 1000)), round(ltp + 0.05 * (j + 1), 2), int(rng.integers(1, 50))) for j in range(5)]
+            packets.append(pack_full(token, ltp, 5, ltp, volume, 100, 200, ltp, ltp + 1, ltp - 1, ltp - 0.5,
+                                     1704067200, 0, 0, 0, 1704067201, bids, asks))
+    return packets
+
+
+def synthetic_frames(instruments=200, seed=11):
+    """Frame shapes a ticker connection sees: one mode per frame, mixed modes, and 1-packet frames"""
+    full = synthetic_packets(instruments, 'full', seed)
+    quote = synthetic_packets(instruments, 'quote', seed)
+    ltp = synthetic_packets(instruments, 'ltp', seed)
+    third = instruments // 3
+    mixed = full[:third] + quote[third:2 * third] + ltp[2 * third:]
+    order = np.random.default_rng(seed).permutation(len(mixed))
+    return {
+        'full': [pack_frame(full)],
+        'quote': [pack_frame(quote)],
+        'ltp': [pack_frame(ltp)],
+        'mixed': [pack_frame([mixed[i] for i in order])],
+        'single': [pack_frame([packet]) for packet in full[:64]],
+    }
+
+
+_I = struct.Struct('>i')
+
+
+def dict_ticks(frame):
+    """Reference parser: a dict per tick, fields unpacked one at a time"""
+    ticks = []
+    count = struct.unpack_from('>H', frame, 0)[0]
+    offset = 2
+    for _ in range(count):
+        length = struct.unpack_from('>H', frame, offset)[0]
+        packet = frame[offset + 2:offset + 2 + length]
+        offset += 2 + length
+        token = _I.unpack_from(packet, 0)[0]
+        divisor = float(DIVISORS[token & 0xFF])
+        field = lambda i: _I.unpack_from(packet, 4 * i)[0]  # noqa: E731
+        tick = {'instrument_token': token, 'mode': 'ltp', 'last_price': field(1) / divisor}
+        if length in (QUOTE_LENGTH, FULL_LENGTH):
+            tick.update({
+                'mode': 'quote' if length == QUOTE_LENGTH else 'full',
+                'last_traded_quantity': field(2),
+                'average_traded_price': field(3) / divisor,
+                'volume_traded': field(4),
+                'total_buy_quantity': field(5),
+                'total_sell_quantity': field(6),
+                'ohlc': {'open': field(7) / divisor, 'high': field(8) / divisor,
+                         'low': field(9) / divisor, 'close': field(10) / divisor},
+            })
+        if length == FULL_LENGTH:
+            tick.update({'last_trade_time': field(11), 'oi': field(12), 'exchange_timestamp': field(15)})
+            depth = {'buy': [], 'sell': []}
+            for j in range(10):
+                qty, price, orders = struct.unpack_from('>iih', packet, 64 + 12 * j)
+                depth['buy' if j < 5 else 'sell'].append({'quantity': qty, 'price': price / divisor, 'orders': orders})
+            tick['depth'] = depth
+        ticks.append(tick)
+    return ticks
+
+
+def check(frames):
+    """Mismatching ticks between KiteTickDecoder and dict_ticks over every frame"""
+    decoder = KiteTickDecoder()
+    mismatches = 0
+    for shape in frames.values():
+        for frame in shape:
+            n = decoder.decode(frame)
+            t = decoder.ticks
+            rows = {int(t.token[i]): i for i in range(n)}
+            for tick in dict_ticks(frame):
+                i = rows.get(tick['instrument_token'])
+                ok = i is not None and abs(t.ltp[i] - tick['last_price']) < 1e-9
+                if ok and tick['mode'] != 'ltp':
+                    ok = t.volume[i] == tick['volume_traded'] and abs(t.close[i] - tick['ohlc']['close']) < 1e-9
+                if ok and tick['mode'] == 'full':
+                    best_bid, best_ask = tick['depth']['buy'][0], tick['depth']['sell'][0]
+                    ok = (abs(t.bid_price[i, 0] - best_bid['price']) < 1e-9 and t.ask_qty[i, 0] == best_ask['quantity']
+                          and t.exchange_ts[i] == tick['exchange_timestamp'])
+                mismatches += not ok
+    return mismatches
+
+
+def _rate(decode, frames, seconds):
+    """Ticks/s decoding `frames` round-robin for about `seconds`"""
+    ticks = sum(struct.unpack_from('>H', frame, 0)[0] for frame in frames)
+    for frame in frames:
+        decode(frame)  # Warm-up (first frame sizes the tick buffer)
+    rounds = 0
+    t0 = time.perf_counter()
+    while True:
+        for frame in frames:
+            decode(frame)
+        rounds += 1
+        elapsed = time.perf_counter() - t0
+        if elapsed >= seconds:
+            return rounds * ticks / elapsed
+
+
+def run(frames, seconds=0.5, baseline=True):
+    decoder = KiteTickDecoder()
+    result = {}
+    for shape, shape_frames in frames.items():
+        row = {'ticks_per_frame': round(sum(struct.unpack_from('>H', f, 0)[0] for f in shape_frames) / len(shape_frames), 1),
+               'decoder_ticks_per_sec': round(_rate(decoder.decode, shape_frames, seconds), 1)}
+        if baseline:
+            row['dict_ticks_per_sec'] = round(_rate(dict_ticks, shape_frames, seconds), 1)
+            row['speedup'] = round(row['decoder_ticks_per_sec'] / row['dict_ticks_per_sec'], 2)
+        result[shape] = row
+    result['vectorized_frames'] = decoder.vectorized_frames
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Kite binary tick decode throughput')
+    parser.add_argument('--instruments', type=int, default=200, help='Packets per frame (ticker frames carry one per token)')
+    parser.add_argument('--seconds', type=float, default=0.5, help='Timing window per frame shape and parser')
+    parser.add_argument('--no-baseline', action='store_true', help='Skip the dict-per-tick parser')
+    parser.add_argument('--check', action='store_true', help='Verify against the dict-per-tick parser')
+    args = parser.parse_args()
+
+    frames = synthetic_frames(args.instruments)
+    if args.check:
+        print(f"Reference check: {check(frames)} mismatching ticks")
+
+    result = run(frames, args.seconds, baseline=not args.no_baseline)
+    print(f"\n{'frame':<8} {'ticks/frame':>12} {'decoder ticks/s':>16} {'dict ticks/s':>14} {'speedup':>8}")
+    for shape in frames:
+        row = result[shape]
+        print(f"{shape:<8} {row['ticks_per_frame']:>12,.0f} {row['decoder_ticks_per_sec']:>16,.0f} "
+              f"{row.get('dict_ticks_per_sec', 0):>14,.0f} {row.get('speedup', 0):>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
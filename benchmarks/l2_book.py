@@ -0,0 +1,205 @@
+"""
+L2 book benchmark on Binance diff-depth streams
+Replays a recorded stream (JSON lines: a REST snapshot first, then depthUpdate events) or a
+synthetic one through L2Book, reporting decode and apply rates, allocation during the apply
+loop (tracemalloc) and, with --check, agreement with a dict-and-sort reference book
+
+    python -m benchmarks.l2_book
+    python -m benchmarks.l2_book --messages 500000 --depth 1000 --check
+    python -m benchmarks.l2_book --recorded ./data/depth/BTCUSDT.jsonl
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+
+import numpy as np
+
+from strategies.l2_book import L2Book
+
+
+def synthetic_stream(messages, levels=1000, tick=0.1, changes=12, seed=3):
+    """Snapshot plus `messages` futures-style depthUpdate events around a random-walk mid, as JSON strings"""
+    rng = np.random.default_rng(seed)
+    mid = 400000  # In ticks
+    bids = {mid - 1 - j: round(float(rng.uniform(0.001, 5)), 3) for j in range(levels)}
+    asks = {mid + 1 + j: round(float(rng.uniform(0.001, 5)), 3) for j in range(levels)}
+    update_id = 1000
+    lines = [json.dumps({
+        'lastUpdateId': update_id,
+        'bids': [[f'{p * tick:.1f}', f'{q}'] for p, q in sorted(bids.items(), reverse=True)],
+        'asks': [[f'{p * tick:.1f}', f'{q}'] for p, q in sorted(asks.items())],
+    })]
+
+    steps = rng.choice([-2, -1, 0, 0, 0, 0, 1, 2], messages)
+    offsets = np.minimum(rng.geometric(0.15, (messages, changes)) - 1, 60)
+    sizes = np.round(rng.uniform(0.001, 5, (messages, changes)), 3)
+    sizes[rng.random((messages, changes)) < 0.15] = 0.0
+    ts = 1704067200000
+    for m in range(messages):
+        b, a = {}, {}
+        mid += int(steps[m])
+        # Levels now through the mid are taken out
+        for p in [p for p in bids if p >= mid]:
+            del bids[p]
+            b[p] = 0.0
+        for p in [p for p in asks if p <= mid]:
+            del asks[p]
+            a[p] = 0.0
+        best_bid = max(bids) if bids else mid - 1
+        best_ask = min(asks) if asks else mid + 1
+        for j, (offset, size) in enumerate(zip(offsets[m].tolist(), sizes[m].tolist())):
+            if j % 2:
+                p = min(best_bid + 1, mid - 1) - offset
+                book, out = bids, b
+            else:
+                p = max(best_ask - 1, mid + 1) + offset
+                book, out = asks, a
+            if size > 0:
+                book[p] = size
+            else:
+                book.pop(p, None)
+            out[p] = size
+        ts += 100
+        lines.append(json.dumps({
+            'e': 'depthUpdate', 'E': ts, 'T': ts, 's': 'BTCUSDT',
+            'U': update_id + 1, 'u': update_id + 3, 'pu': update_id,
+            'b': [[f'{p * tick:.1f}', f'{q}'] for p, q in b.items()],
+            'a': [[f'{p * tick:.1f}', f'{q}'] for p, q in a.items()],
+        }))
+        update_id += 3
+    return lines
+
+
+class ReferenceBook:
+    """Dict per side, sorted on demand: slow but obviously right"""
+
+    def __init__(self, depth):
+        self.depth = depth
+        self.bids, self.asks = {}, {}
+
+    def apply(self, bids, asks):
+        for side, levels in ((self.bids, bids), (self.asks, asks)):
+            for price, size in levels:
+                price, size = float(price), float(size)
+                if size > 0:
+                    side[price] = size
+                else:
+                    side.pop(price, None)
+        # Bounded depth: levels beyond it are forgotten, as in BookSide
+        for side, reverse in ((self.bids, True), (self.asks, False)):
+            if len(side) > self.depth:
+                for price in sorted(side, reverse=reverse)[self.depth:]:
+                    del side[price]
+
+    def top(self, n):
+        return (sorted(self.bids.items(), reverse=True)[:n], sorted(self.asks.items())[:n])
+
+
+def check(lines, depth, top_k=5, every=97):
+    """Compare top levels and the top-k sums against ReferenceBook on every `every`-th event"""
+    book = L2Book(depth=depth, top_k=top_k)
+    reference = ReferenceBook(depth)
+    snapshot = json.loads(lines[0])
+    book.apply_snapshot(snapshot)
+    reference.apply(snapshot['bids'], snapshot['asks'])
+    mismatches = 0
+    for i, line in enumerate(lines[1:]):
+        event = json.loads(line)
+        book.apply_depth_update(event)
+        reference.apply(event['b'], event['a'])
+        if i % every:
+            continue
+        ref_bids, ref_asks = reference.top(10)
+        bids = [book.bids.level(j) for j in range(min(10, book.bids.count))]
+        asks = [book.asks.level(j) for j in range(min(10, book.asks.count))]
+        top_bid = sum(q for _, q in ref_bids[:top_k])
+        top_ask = sum(q for _, q in ref_asks[:top_k])
+        if (bids != ref_bids or asks != ref_asks or abs(book.bids.top_size - top_bid) > 1e-6
+                or abs(book.asks.top_size - top_ask) > 1e-6):
+            mismatches += 1
+    return mismatches
+
+
+def run(lines, depth, top_k):
+    t0 = time.perf_counter()
+    snapshot = json.loads(lines[0])
+    events = [json.loads(line) for line in lines[1:]]
+    decode_s = time.perf_counter() - t0
+    levels = sum(len(e['b']) + len(e['a']) for e in events)
+
+    book = L2Book(depth=depth, top_k=top_k)
+    book.apply_snapshot(snapshot)
+    warmup = min(1000, len(events) // 10)
+    apply = book.apply_depth_update
+    for event in events[:warmup]:
+        apply(event)
+
+    t0 = time.perf_counter()
+    for event in events[warmup:]:
+        apply(event)
+    apply_s = time.perf_counter() - t0
+
+    # Second pass over the same events under tracemalloc: the book itself should not grow
+    book.apply_snapshot(snapshot)
+    for event in events[:warmup]:
+        apply(event)
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    for event in events[warmup:]:
+        apply(event)
+    after = tracemalloc.take_snapshot()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    stats = after.compare_to(before, 'filename')
+    net_blocks = sum(s.count_diff for s in stats if 'l2_book' in s.traceback[0].filename)
+
+    timed = len(events) - warmup
+    f = book.features
+    return {
+        'events': len(events),
+        'level_updates': levels,
+        'decode_events_per_sec': round(len(events) / decode_s, 1),
+        'apply_events_per_sec': round(timed / apply_s, 1),
+        'apply_levels_per_sec': round(levels * timed / len(events) / apply_s, 1),
+        'us_per_event': round(apply_s / timed * 1e6, 3),
+        'tracemalloc_peak_bytes': peak,
+        'book_net_blocks': net_blocks,
+        'final': {'bid': f.best_bid, 'ask': f.best_ask, 'microprice': round(f.microprice, 4),
+                  'imbalance': round(f.imbalance, 4), 'bid_levels': book.bids.count, 'ask_levels': book.asks.count},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='L2Book throughput and allocation on Binance depth streams')
+    parser.add_argument('--recorded', help='JSON lines: REST snapshot, then depthUpdate events')
+    parser.add_argument('--messages', type=int, default=200000, help='Synthetic events')
+    parser.add_argument('--depth', type=int, default=1000, help='Levels kept per side')
+    parser.add_argument('--top-k', type=int, default=5, help='Levels in the imbalance sums')
+    parser.add_argument('--check', action='store_true', help='Verify against the reference book')
+    args = parser.parse_args()
+
+    if args.recorded:
+        with open(args.recorded) as f:
+            lines = [line for line in f if line.strip()]
+    else:
+        print(f"Generating {args.messages:,} synthetic depth events...")
+        lines = synthetic_stream(args.messages, levels=args.depth)
+
+    if args.check:
+        mismatches = check(lines, args.depth, args.top_k)
+        print(f"Reference check: {mismatches} mismatching snapshots")
+
+    result = run(lines, args.depth, args.top_k)
+    print(f"\n{result['events']:,} events, {result['level_updates']:,} level updates, depth {args.depth}")
+    print(f"  decode (json.loads): {result['decode_events_per_sec']:>12,.0f} events/s")
+    print(f"  apply + features:    {result['apply_events_per_sec']:>12,.0f} events/s "
+          f"({result['apply_levels_per_sec']:,.0f} levels/s, {result['us_per_event']:.2f} us/event)")
+    print(f"  tracemalloc peak {result['tracemalloc_peak_bytes']:,} B, book net blocks {result['book_net_blocks']}")
+    print(f"  final book: {json.dumps(result['final'])}")
+    return 1 if args.check and mismatches else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
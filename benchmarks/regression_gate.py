@@ -0,0 +1,213 @@
+"""
+Performance regression gate
+Keeps benchmark results per git revision in a local history file and compares a new
+run against a baseline revision with noise-aware thresholds (median and IQR over repeats)
+
+    python -m benchmarks.regression_gate record --repeat 5        # baseline for HEAD
+    python -m benchmarks.regression_gate check --repeat 5         # exit 1 on regression
+    python -m benchmarks.regression_gate check --results logs/benchmarks.json --baseline abc123
+"""
+
+import argparse
+import json
+import os
+import sys
+from collections import defaultdict
+
+import numpy as np
+
+from benchmarks.bench_suite import BENCHMARKS, DEFAULT_SIZES, SIZES, run_suite
+
+
+DEFAULT_HISTORY = './logs/benchmark_history.jsonl'
+
+
+def load_history(path):
+    if not os.path.exists(path):
+        return []
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def append_history(path, report):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, 'a') as f:
+        f.write(json.dumps(report) + "\n")
+
+
+def samples_by_case(reports):
+    """(benchmark, size) -> {'bars_per_sec': [...], 'peak_rss_mb': [...]} over all repeats"""
+    cases = defaultdict(lambda: defaultdict(list))
+    for report in reports:
+        for result in report['results']:
+            if 'error' in result or result.get('bars_per_sec') is None:
+                continue
+            key = (result['benchmark'], result['size'])
+            cases[key]['bars_per_sec'].append(result['bars_per_sec'])
+            cases[key]['peak_rss_mb'].append(result['peak_rss_mb'])
+    return cases
+
+
+def errors_by_case(reports):
+    """(benchmark, size) -> error messages of the repeats that failed"""
+    errors = defaultdict(list)
+    for report in reports:
+        for result in report['results']:
+            if 'error' in result:
+                errors[(result['benchmark'], result['size'])].append(' '.join(result['error']))
+    return errors
+
+
+def median_iqr(values):
+    q1, median, q3 = np.percentile(values, [25, 50, 75])
+    return float(median), float(q3 - q1)
+
+
+def find_baseline(history, revision=None, exclude=None):
+    """Reports for the requested revision, or the most recent one other than `exclude`"""
+    if revision is None:
+        for report in reversed(history):
+            rev = report['environment'].get('git_revision')
+            if rev and rev != exclude and not report['environment'].get('git_dirty'):
+                revision = rev
+                break
+    if revision is None:
+        return None, []
+    reports = [r for r in history if (r['environment'].get('git_revision') or '').startswith(revision)]
+    return (reports[0]['environment']['git_revision'] if reports else revision), reports
+
+
+def compare(baseline, current, throughput_tolerance=0.10, memory_tolerance=0.10, iqr_factor=1.5, errors=None):
+    """Per-case verdicts; a change only counts once it exceeds both the tolerance and the noise
+
+    errors (errors_by_case() of the current run): a case with a baseline that now errors is a regression
+    """
+    errors = errors or {}
+    rows = []
+    for key in sorted(set(current) | set(errors)):
+        new = current.get(key)
+        base = baseline.get(key)
+        row = {'benchmark': key[0], 'size': key[1], 'status': 'new', 'failures': []}
+        if key in errors:
+            row['errors'] = errors[key]
+            if base is not None:
+                row['failures'].append('error')
+        if new is None:
+            row.update(bars_per_sec=None, peak_rss_mb=None, repeats=0,
+                       status='REGRESSION' if row['failures'] else 'error')
+            if base is not None:
+                row.update(base_bars_per_sec=median_iqr(base['bars_per_sec'])[0],
+                           base_peak_rss_mb=median_iqr(base['peak_rss_mb'])[0])
+            rows.append(row)
+            continue
+        new_bps, new_bps_iqr = median_iqr(new['bars_per_sec'])
+        new_mem, new_mem_iqr = median_iqr(new['peak_rss_mb'])
+        row.update(bars_per_sec=new_bps, peak_rss_mb=new_mem, repeats=len(new['bars_per_sec']))
+        if base is None:
+            rows.append(row)
+            continue
+
+        base_bps, base_bps_iqr = median_iqr(base['bars_per_sec'])
+        base_mem, base_mem_iqr = median_iqr(base['peak_rss_mb'])
+        bps_allowed = max(throughput_tolerance * base_bps, iqr_factor * max(base_bps_iqr, new_bps_iqr))
+        mem_allowed = max(memory_tolerance * base_mem, iqr_factor * max(base_mem_iqr, new_mem_iqr))
+        row.update(
+            base_bars_per_sec=base_bps,
+            bars_per_sec_change=(new_bps - base_bps) / base_bps if base_bps else None,
+            bars_per_sec_floor=base_bps - bps_allowed,
+            base_peak_rss_mb=base_mem,
+            peak_rss_mb_change=(new_mem - base_mem) / base_mem if base_mem else None,
+            peak_rss_mb_ceiling=base_mem + mem_allowed,
+        )
+        if new_bps < base_bps - bps_allowed:
+            row['failures'].append('throughput')
+        if new_mem > base_mem + mem_allowed:
+            row['failures'].append('memory')
+        if row['failures']:
+            row['status'] = 'REGRESSION'
+        elif new_bps > base_bps + bps_allowed:
+            row['status'] = 'improved'
+        else:
+            row['status'] = 'ok'
+        rows.append(row)
+    return rows
+
+
+def print_report(rows, baseline_revision, current_revision):
+    print(f"\nBaseline {str(baseline_revision)[:10]}  ->  current {str(current_revision)[:10]}\n")
+    print(f"{'benchmark':<24}{'size':>5}{'base bars/s':>14}{'bars/s':>14}{'change':>9}"
+          f"{'base MB':>10}{'MB':>9}{'change':>9}  status")
+    for row in rows:
+        base_bps = row.get('base_bars_per_sec')
+        bps_change = row.get('bars_per_sec_change')
+        mem_change = row.get('peak_rss_mb_change')
+        bps = row['bars_per_sec']
+        mem = row['peak_rss_mb']
+        print(
+            f"{row['benchmark']:<24}{row['size']:>5}"
+            f"{base_bps if base_bps is not None else float('nan'):>14,.0f}{bps if bps is not None else float('nan'):>14,.0f}"
+            f"{bps_change * 100 if bps_change is not None else float('nan'):>8.1f}%"
+            f"{row.get('base_peak_rss_mb', float('nan')):>10.1f}{mem if mem is not None else float('nan'):>9.1f}"
+            f"{mem_change * 100 if mem_change is not None else float('nan'):>8.1f}%"
+            f"  {row['status']}{' (' + ', '.join(row['failures']) + ')' if row['failures'] else ''}"
+        )
+        if row.get('errors'):
+            print(f"{'':<29}{len(row['errors'])} repeat(s) failed: {row['errors'][-1]}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark history and regression gate')
+    parser.add_argument('command', choices=['record', 'check'])
+    parser.add_argument('--history', default=DEFAULT_HISTORY)
+    parser.add_argument('--results', help='Use an existing bench_suite output instead of running it')
+    parser.add_argument('--baseline', help='Baseline git revision (default: latest clean recorded revision)')
+    parser.add_argument('--bench', help=f"Comma-separated subset of: {', '.join(BENCHMARKS)}")
+    parser.add_argument('--sizes', default=','.join(DEFAULT_SIZES), help=f"Subset of {', '.join(SIZES)}")
+    parser.add_argument('--repeat', type=int, default=5, help='Runs per case; the gate compares medians')
+    parser.add_argument('--throughput-tolerance', type=float, default=0.10, help='Allowed bars/sec drop')
+    parser.add_argument('--memory-tolerance', type=float, default=0.10, help='Allowed peak memory growth')
+    parser.add_argument('--iqr-factor', type=float, default=1.5, help='Changes within this many IQRs are noise')
+    parser.add_argument('--record', action='store_true', help='check: also append the run to the history')
+    parser.add_argument('--report', help='check: write the comparison as JSON')
+    args = parser.parse_args()
+
+    if args.results:
+        with open(args.results) as f:
+            report = json.load(f)
+    else:
+        sizes = list(SIZES) if args.sizes == 'all' else args.sizes.split(',')
+        report = run_suite(args.bench.split(',') if args.bench else None, sizes, args.repeat)
+
+    current_revision = report['environment'].get('git_revision')
+    if args.command == 'record':
+        append_history(args.history, report)
+        print(f"Recorded {len(report['results'])} results for {current_revision} in {args.history}")
+        return 0
+
+    history = load_history(args.history)
+    baseline_revision, baseline_reports = find_baseline(history, args.baseline, exclude=current_revision)
+    if args.record:
+        append_history(args.history, report)
+    if not baseline_reports:
+        print(f"No baseline in {args.history}; record one with: python -m benchmarks.regression_gate record")
+        return 0
+
+    rows = compare(
+        samples_by_case(baseline_reports), samples_by_case([report]),
+        args.throughput_tolerance, args.memory_tolerance, args.iqr_factor, errors_by_case([report]),
+    )
+    print_report(rows, baseline_revision, current_revision)
+    if args.report:
+        with open(args.report, 'w') as f:
+            json.dump({'baseline': baseline_revision, 'current': current_revision, 'cases': rows}, f, indent=2)
+
+    regressions = [row for row in rows if row['status'] == 'REGRESSION']
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond tolerance")
+        return 1
+    print("\nNo regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
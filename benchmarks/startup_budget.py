@@ -0,0 +1,105 @@
+"""
+CLI startup budget
+Times fresh interpreters for the light entry points and fails (exit 1) if one goes over
+its wall-time budget or imports a heavy subsystem it does not need
+
+    python -m benchmarks.startup_budget
+    python -m benchmarks.startup_budget --budget 0.15 --runs 10
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules that cost hundreds of ms and belong to backtest/live/replay paths only
+HEAVY_MODULES = ('nautilus_trader', 'pandas', 'numpy', 'statsmodels', 'scipy', 'pyarrow', 'dotenv')
+
+CHECKS = {
+    'report': ['main.py', '--mode', 'report'],
+    'config.live': ['-c', 'import config.live.binance_live'],
+    'config.backtest': ['-c', 'import config.backtest.pairs_config'],
+}
+
+
+def wall_time(args):
+    t0 = time.perf_counter()
+    subprocess.run([sys.executable, *args], cwd=REPO_ROOT, capture_output=True, check=True)
+    return time.perf_counter() - t0
+
+
+def imported_modules(args):
+    """Top-level packages imported by the command, from -X importtime"""
+    proc = subprocess.run([sys.executable, '-X', 'importtime', *args], cwd=REPO_ROOT,
+                          capture_output=True, text=True, check=True)
+    modules = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative_us, name = line[len('import time:'):].split('|')
+        name = name.strip()
+        if '.' not in name:
+            modules[name] = int(cumulative_us) / 1e6
+    return modules
+
+
+def check(name, args, budget_s, runs):
+    try:
+        times = [wall_time(args) for _ in range(runs)]
+    except subprocess.CalledProcessError as e:
+        error = e.stderr.decode().strip().splitlines()[-1:]
+        return {'check': name, 'error': error, 'ok': False}
+    modules = imported_modules(args)
+    heavy = sorted(m for m in modules if m in HEAVY_MODULES)
+    slowest = sorted(modules.items(), key=lambda kv: kv[1], reverse=True)[:5]
+    median = float(np.median(times))
+    return {
+        'check': name,
+        'median_s': median,
+        'budget_s': budget_s,
+        'heavy_imports': heavy,
+        'slowest_imports': slowest,
+        'ok': median <= budget_s and not heavy,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Import-time budget for the light CLI paths')
+    parser.add_argument('--budget', type=float, default=0.25, help='Median seconds allowed per check')
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--check', help=f"Comma-separated subset of: {', '.join(CHECKS)}")
+    args = parser.parse_args()
+
+    baseline = float(np.median([wall_time(['-c', 'pass']) for _ in range(args.runs)]))
+    print(f"Bare interpreter: {baseline * 1e3:.0f} ms | budget {args.budget * 1e3:.0f} ms per check\n")
+
+    failed = 0
+    for name in (args.check.split(',') if args.check else CHECKS):
+        result = check(name, CHECKS[name], args.budget, args.runs)
+        if 'error' in result:
+            failed += 1
+            print(f"{name:<18}{'':>11}  ERROR {result['error']}")
+            continue
+        status = 'ok' if result['ok'] else 'OVER BUDGET'
+        print(f"{name:<18}{result['median_s'] * 1e3:>8.0f} ms  {status}")
+        if result['heavy_imports']:
+            print(f"{'':<18}heavy imports: {', '.join(result['heavy_imports'])}")
+        if not result['ok']:
+            failed += 1
+            for module, seconds in result['slowest_imports']:
+                print(f"{'':<18}{module:<24}{seconds * 1e3:>8.1f} ms cumulative")
+
+    if failed:
+        print(f"\n{failed} check(s) failed")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,14 +1,6 @@
-
-import pandas as pd
-from nautilus_trader.backtest.node import BacktestNode, BacktestRunConfig
-from nautilus_trader.config import BacktestVenueConfig, BacktestDataConfig, ImportableStrategyConfig
-from nautilus_trader.model.identifiers import Venue
-from nautilus_trader.persistence.catalog import ParquetDataCatalog
-from datetime import datetime
-
-
 def create_backtest_config():
-  
+    from nautilus_trader.backtest.node import BacktestRunConfig
+    from nautilus_trader.config import BacktestVenueConfig, BacktestDataConfig, ImportableStrategyConfig
     
     config = BacktestRunConfig(
         engine_id="pairs_backtest_001",
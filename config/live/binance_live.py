@@ -1,25 +1,95 @@
-
 import os
-from dotenv import load_dotenv
-from nautilus_trader.config import (
-    TradingNodeConfig,
-    LoggingConfig,
-    CacheDatabaseConfig,
-    DataEngineConfig,
-    RiskEngineConfig,
-    ExecEngineConfig,
-    StreamingConfig
-)
-from nautilus_trader.adapters.binance.config import BinanceDataClientConfig, BinanceExecClientConfig
-from nautilus_trader.adapters.binance.common.enums import BinanceAccountType
 
-load_dotenv()
-def create_live_config():
-   
+TESTNET_HTTP = "https://testnet.binancefuture.com"
+TESTNET_WS = "wss://stream.binancefuture.com"
+
+INSTRUMENT_IDS = ["BTCUSDT-PERP.BINANCE", "ETHUSDT-PERP.BINANCE"]
+
+PAIRS_STRATEGY = {
+    "strategy_path": "strategies.pairs_trading:PairsTradingStrategy",
+    "config_path": "strategies.pairs_trading:PairsTradingConfig",
+    "config": {
+        "instrument_id_a": "BTCUSDT-PERP.BINANCE",
+        "instrument_id_b": "ETHUSDT-PERP.BINANCE",
+        "bar_type": "1-MINUTE-LAST",
+        "lookback_period": 60,
+        "rolling_window": 20,
+        "z_entry_threshold": 2.0,
+        "z_exit_threshold": 0.5,
+        "z_stop_loss": 3.0,
+        "position_size_usd": 100.0,  
+        "order_id_tag": "001",
+        "decision_log_dir": "./data/recordings",
+        "journal_dir": "./data/journal",
+        "latency_sample_every": 1,  # Bars arrive once a minute, timing every pass is cheap
+        "latency_report_interval_s": 900,
+        "metrics": True
+    }
+}
+
+RECORDER_ACTOR = {
+    "actor_path": "storage.recorder:MarketDataRecorder",
+    "config_path": "storage.recorder:MarketDataRecorderConfig",
+    "config": {
+        "instrument_ids": INSTRUMENT_IDS,
+        "bar_type": "1-MINUTE-LAST-EXTERNAL",
+        "record_bars": True,
+        "record_quotes": True,
+        "output_dir": "./data/recordings"
+    }
+}
+
+METRICS_EXPORTER = {
+    "actor_path": "telemetry.exporter:MetricsExporter",
+    "config_path": "telemetry.exporter:MetricsExporterConfig",
+    "config": {
+        "instrument_ids": INSTRUMENT_IDS,
+        "http_port": 9464,  # curl http://127.0.0.1:9464/metrics
+        "output_dir": "./monitoring",
+        "interval_s": 15
+    }
+}
+
+
+def load_credentials(default_key='YOUR_API_KEY_HERE', default_secret='YOUR_API_SECRET_HERE'):
+    """Testnet API key/secret from the environment or ./.env"""
+    from dotenv import load_dotenv
+    
+    load_dotenv()
+    return (
+        os.getenv('BINANCE_TESTNET_API_KEY', default_key),
+        os.getenv('BINANCE_TESTNET_API_SECRET', default_secret),
+    )
+
+
+def create_live_config(base_url_http=TESTNET_HTTP, base_url_ws=TESTNET_WS, testnet=True, use_redis=True,
+                       log_directory="./logs", journal_dir="./data/journal", recording_dir="./data/recordings",
+                       catalog_dir="./data/catalog"):
+    """Node config; the base URLs can point at sandbox.exchange_simulator for soak runs
+
+    journal_dir / recording_dir / catalog_dir: the strategy's trade journal, the recorder's and
+    decision log's output and the event stream; simulated runs pass their own so they stay out
+    of the live ones
+    """
+    from nautilus_trader.config import (
+        TradingNodeConfig,
+        LoggingConfig,
+        CacheConfig,
+        DatabaseConfig,
+        LiveDataEngineConfig,
+        LiveRiskEngineConfig,
+        LiveExecEngineConfig,
+        StreamingConfig
+    )
+    from nautilus_trader.config import ImportableActorConfig, ImportableStrategyConfig, InstrumentProviderConfig
+    from nautilus_trader.model.events import (
+        AccountState, OrderCanceled, OrderFilled, OrderRejected, PositionChanged, PositionClosed, PositionOpened,
+    )
+    from nautilus_trader.adapters.binance.config import BinanceDataClientConfig, BinanceExecClientConfig
+    from nautilus_trader.adapters.binance.common.enums import BinanceAccountType
     
     # Load credentials from environment
-    api_key = os.getenv('BINANCE_TESTNET_API_KEY', 'YOUR_API_KEY_HERE')
-    api_secret = os.getenv('BINANCE_TESTNET_API_SECRET', 'YOUR_API_SECRET_HERE')
+    api_key, api_secret = load_credentials()
     
     
     config = TradingNodeConfig(
@@ -29,44 +99,50 @@ def create_live_config():
         logging=LoggingConfig(
             log_level="INFO",
             log_file_format="json",
-            log_directory="./logs",
+            log_directory=log_directory,
             log_file_name="pairs_trading.log"
         ),
         
         # Cache configuration
-        cache_database=CacheDatabaseConfig(
-            type="redis",
-            host="localhost",
-            port=6379
-        ),
+        cache=CacheConfig(
+            database=DatabaseConfig(
+                type="redis",
+                host="localhost",
+                port=6379
+            )
+        ) if use_redis else None,
         
         # Data engine configuration
-        data_engine=DataEngineConfig(
+        data_engine=LiveDataEngineConfig(
             time_bars_build_with_no_updates=False,
             validate_data_sequence=True,
             debug=False
         ),
         
         # Risk engine configuration
-        risk_engine=RiskEngineConfig(
+        # Backstop only: the exec client queues orders within the venue budget (adapters.binance)
+        risk_engine=LiveRiskEngineConfig(
             bypass=False,  # Enable risk checks
             max_order_submit_rate="100/00:00:01",  
             max_notional_per_order={
-                "BTC/USDT": 10000,  # Max $10k per order
-                "ETH/USDT": 10000
+                "BTCUSDT-PERP.BINANCE": 10000,  # Max $10k per order
+                "ETHUSDT-PERP.BINANCE": 10000
             }
         ),
         
         # Execution engine configuration
-        exec_engine=ExecEngineConfig(
+        exec_engine=LiveExecEngineConfig(
             load_cache=True,
             snapshot_orders=True,
             snapshot_positions=True
         ),
         
         # Streaming configuration (for monitoring)
+        # Only types with an Arrow schema: anything else (e.g. reconciliation reports) crashes the writer
         streaming=StreamingConfig(
-            catalog_path="./data/catalog"
+            catalog_path=catalog_dir,
+            include_types=[AccountState, OrderFilled, OrderRejected, OrderCanceled,
+                           PositionOpened, PositionChanged, PositionClosed]
         ),
         
         # Binance data client
@@ -74,10 +150,11 @@ def create_live_config():
             "BINANCE": BinanceDataClientConfig(
                 api_key=api_key,
                 api_secret=api_secret,
-                account_type=BinanceAccountType.USDT_FUTURE,
-                testnet=True,
-                base_url_http="https://testnet.binancefuture.com",
-                base_url_ws="wss://stream.binancefuture.com"
+                account_type=BinanceAccountType.USDT_FUTURES,
+                testnet=testnet,
+                base_url_http=base_url_http,
+                base_url_ws=base_url_ws,
+                instrument_provider=InstrumentProviderConfig(load_ids=frozenset(INSTRUMENT_IDS))
             )
         },
         
@@ -86,32 +163,22 @@ def create_live_config():
             "BINANCE": BinanceExecClientConfig(
                 api_key=api_key,
                 api_secret=api_secret,
-                account_type=BinanceAccountType.USDT_FUTURE,
-                testnet=True,
-                base_url_http="https://testnet.binancefuture.com",
-                base_url_ws="wss://stream.binancefuture.com"
+                account_type=BinanceAccountType.USDT_FUTURES,
+                testnet=testnet,
+                base_url_http=base_url_http,
+                base_url_ws=base_url_ws,
+                instrument_provider=InstrumentProviderConfig(load_ids=frozenset(INSTRUMENT_IDS))
             )
         },
         
         # Strategy configuration
-        strategies=[
-            {
-                "strategy_path": "strategies.pairs_trading:PairsTradingStrategy",
-                "config_path": "strategies.pairs_trading:PairsTradingConfig",
-                "config": {
-                    "instrument_id_a": "BTCUSDT-PERP.BINANCE",
-                    "instrument_id_b": "ETHUSDT-PERP.BINANCE",
-                    "bar_type": "1-MINUTE-LAST",
-                    "lookback_period": 60,
-                    "rolling_window": 20,
-                    "z_entry_threshold": 2.0,
-                    "z_exit_threshold": 0.5,
-                    "z_stop_loss": 3.0,
-                    "position_size_usd": 100.0,  
-                    "order_id_tag": "001"
-                }
-            }
-        ],
+        strategies=[ImportableStrategyConfig(**(PAIRS_STRATEGY | {"config": PAIRS_STRATEGY["config"] | {
+            "journal_dir": journal_dir, "decision_log_dir": recording_dir}}))],
+        
+        # Market-data recorder (replay with: python -m storage.replay --session ...)
+        # and metrics exporter (./monitoring/metrics.prom, http://127.0.0.1:9464/metrics)
+        actors=[ImportableActorConfig(**(RECORDER_ACTOR | {"config": RECORDER_ACTOR["config"] | {"output_dir": recording_dir}})),
+                ImportableActorConfig(**METRICS_EXPORTER)],
         
         
         timeout_connection=10.0,
@@ -123,6 +190,20 @@ def create_live_config():
     return config
 
 
+def build_trading_node(config):
+    """TradingNode with the Binance client factories registered; orders go through the OrderScheduler"""
+    from nautilus_trader.adapters.binance.factories import BinanceLiveDataClientFactory
+    from nautilus_trader.live.node import TradingNode
+    
+    from adapters.binance.factories import ScheduledBinanceLiveExecClientFactory
+    
+    node = TradingNode(config=config)
+    node.add_data_client_factory("BINANCE", BinanceLiveDataClientFactory)
+    node.add_exec_client_factory("BINANCE", ScheduledBinanceLiveExecClientFactory)
+    node.build()
+    return node
+
+
 if __name__ == "__main__":
     config = create_live_config()
     print("Live trading configuration created")
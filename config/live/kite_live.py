@@ -0,0 +1,119 @@
+import os
+
+from config.live.binance_live import METRICS_EXPORTER
+
+INSTRUMENT_IDS = ["INFY-NSE.KITE", "TCS-NSE.KITE"]
+
+PAIRS_STRATEGY = {
+    "strategy_path": "strategies.pairs_trading:PairsTradingStrategy",
+    "config_path": "strategies.pairs_trading:PairsTradingConfig",
+    "config": {
+        "instrument_id_a": "INFY-NSE.KITE",
+        "instrument_id_b": "TCS-NSE.KITE",
+        "bar_type": "1-MINUTE-LAST-INTERNAL",  # Kite streams no bars: aggregated from trade ticks
+        "lookback_period": 60,
+        "rolling_window": 20,
+        "z_entry_threshold": 2.0,
+        "z_exit_threshold": 0.5,
+        "z_stop_loss": 3.0,
+        "position_size_usd": 10000.0,  # Quote currency, INR here
+        "order_id_tag": "002",  # Distinct from the Binance strategy: INR and USDT PnL never share a journal
+        "journal_dir": "./data/journal_kite",
+    }
+}
+
+
+def load_credentials(default_key='YOUR_API_KEY_HERE', default_token='YOUR_ACCESS_TOKEN_HERE'):
+    """Kite API key and the day's access token from the environment or ./.env"""
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    return (
+        os.getenv('KITE_API_KEY', default_key),
+        os.getenv('KITE_ACCESS_TOKEN', default_token),
+    )
+
+
+def create_kite_live_config(base_url_http=None, base_url_ws=None, product="MIS", log_directory="./logs",
+                            journal_dir="./data/journal_kite"):
+    """Node config; the base URLs can point at sandbox.kite_stub (python -m sandbox.kite_stub)"""
+    from nautilus_trader.config import (
+        TradingNodeConfig,
+        LoggingConfig,
+        LiveDataEngineConfig,
+        LiveRiskEngineConfig,
+        LiveExecEngineConfig,
+    )
+    from nautilus_trader.config import ImportableActorConfig, ImportableStrategyConfig, InstrumentProviderConfig
+
+    from adapters.kite.config import KiteDataClientConfig, KiteExecClientConfig
+
+    api_key, access_token = load_credentials()
+    instrument_provider = InstrumentProviderConfig(load_ids=frozenset(INSTRUMENT_IDS))
+
+    return TradingNodeConfig(
+        trader_id="PAIRS-TRADER-002",
+        logging=LoggingConfig(
+            log_level="INFO",
+            log_file_format="json",
+            log_directory=log_directory,
+            log_file_name="pairs_trading_kite.log"
+        ),
+        data_engine=LiveDataEngineConfig(
+            time_bars_build_with_no_updates=False,
+            validate_data_sequence=True,
+        ),
+        # Kite allows 10 order requests a second per user
+        risk_engine=LiveRiskEngineConfig(
+            bypass=False,
+            max_order_submit_rate="10/00:00:01",
+        ),
+        # Reconciliation reports are not implemented by the Kite client: start from a flat book
+        exec_engine=LiveExecEngineConfig(reconciliation=False),
+        data_clients={
+            "KITE": KiteDataClientConfig(
+                api_key=api_key,
+                access_token=access_token,
+                base_url_http=base_url_http,
+                base_url_ws=base_url_ws,
+                instrument_provider=instrument_provider,
+            )
+        },
+        exec_clients={
+            "KITE": KiteExecClientConfig(
+                api_key=api_key,
+                access_token=access_token,
+                base_url_http=base_url_http,
+                base_url_ws=base_url_ws,
+                product=product,
+                instrument_provider=instrument_provider,
+            )
+        },
+        strategies=[ImportableStrategyConfig(**(PAIRS_STRATEGY | {"config": PAIRS_STRATEGY["config"] | {
+            "journal_dir": journal_dir}}))],
+        actors=[ImportableActorConfig(**(METRICS_EXPORTER | {"config": METRICS_EXPORTER["config"] | {"instrument_ids": INSTRUMENT_IDS}}))],
+        timeout_connection=10.0,
+        timeout_reconciliation=10.0,
+        timeout_portfolio=10.0,
+        timeout_disconnection=10.0
+    )
+
+
+def build_trading_node(config):
+    """TradingNode with the Kite client factories registered"""
+    from nautilus_trader.live.node import TradingNode
+
+    from adapters.kite.factories import KiteLiveDataClientFactory, KiteLiveExecClientFactory
+
+    node = TradingNode(config=config)
+    node.add_data_client_factory("KITE", KiteLiveDataClientFactory)
+    node.add_exec_client_factory("KITE", KiteLiveExecClientFactory)
+    node.build()
+    return node
+
+
+if __name__ == "__main__":
+    config = create_kite_live_config()
+    print("Kite live trading configuration created")
+    print(f"Trader ID: {config.trader_id}")
+    print("Ready to connect to Kite (or sandbox.kite_stub via the base URL arguments)")
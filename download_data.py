@@ -5,13 +5,6 @@ Download historical data from Binance for backtesting
 import asyncio
 from datetime import datetime, timedelta
 import pandas as pd
-from nautilus_trader.adapters.binance.common.enums import BinanceAccountType
-from nautilus_trader.adapters.binance.factories import get_cached_binance_http_client
-from nautilus_trader.adapters.binance.futures.http.client import BinanceFuturesHttpClient
-from nautilus_trader.common.component import LiveClock
-from nautilus_trader.core.datetime import dt_to_unix_millis
-from nautilus_trader.persistence.catalog import ParquetDataCatalog
-from nautilus_trader.model.identifiers import InstrumentId
 
 
 async def download_binance_data(
@@ -26,7 +19,11 @@ async def download_binance_data(
     print(f"Period: {start_date} to {end_date}")
     print(f"Interval: {interval}")
     
-    # Initialize HTTP client
+    # Initialize HTTP client (Nautilus imported here: klines_to_dataframe must not need the adapter)
+    from nautilus_trader.adapters.binance.futures.http.client import BinanceFuturesHttpClient
+    from nautilus_trader.common.component import LiveClock
+    from nautilus_trader.core.datetime import dt_to_unix_millis
+    
     clock = LiveClock()
     client = BinanceFuturesHttpClient(
         clock=clock,
@@ -77,24 +74,25 @@ async def download_binance_data(
     
     print(f"Total bars downloaded: {len(all_klines)}")
     
-    # Convert to DataFrame
-    if all_klines:
-        df = pd.DataFrame(all_klines, columns=[
-            'timestamp', 'open', 'high', 'low', 'close', 'volume',
-            'close_time', 'quote_volume', 'trades', 'taker_buy_base',
-            'taker_buy_quote', 'ignore'
-        ])
-        
-        df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-        df.set_index('timestamp', inplace=True)
-        
-        # Convert to numeric
-        for col in ['open', 'high', 'low', 'close', 'volume']:
-            df[col] = pd.to_numeric(df[col])
-        
-        return df
+    return klines_to_dataframe(all_klines) if all_klines else None
+
+
+def klines_to_dataframe(klines):
+    """Binance kline rows -> OHLCV DataFrame indexed by open time"""
+    df = pd.DataFrame(klines, columns=[
+        'timestamp', 'open', 'high', 'low', 'close', 'volume',
+        'close_time', 'quote_volume', 'trades', 'taker_buy_base',
+        'taker_buy_quote', 'ignore'
+    ])
+    
+    df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
+    df.set_index('timestamp', inplace=True)
+    
+    # Convert to numeric
+    for col in ['open', 'high', 'low', 'close', 'volume']:
+        df[col] = pd.to_numeric(df[col])
     
-    return None
+    return df
 
 
 async def main():
@@ -123,6 +121,7 @@ async def main():
     # Save to catalog
     if btc_data is not None and eth_data is not None:
         print("\n=== Saving to Parquet catalog ===")
+        from nautilus_trader.persistence.catalog import ParquetDataCatalog
         
         catalog = ParquetDataCatalog("./data/catalog")
         
@@ -0,0 +1,141 @@
+"""
+Two-leg spread execution bookkeeping
+Tracks each leg from signal -> submit -> ack -> fill and measures legging risk
+"""
+
+from collections import deque
+
+
+class SpreadLeg:
+    """Single leg of a spread execution"""
+
+    __slots__ = (
+        'client_order_id', 'instrument_id', 'side', 'target_qty', 'filled_qty',
+        'avg_px', 'ts_submit', 'ts_ack', 'ts_first_fill', 'ts_last_fill', 'closed',
+    )
+
+    def __init__(self, client_order_id, instrument_id, side, target_qty):
+        self.client_order_id = client_order_id
+        self.instrument_id = instrument_id
+        self.side = side
+        self.target_qty = float(target_qty)
+        self.filled_qty = 0.0
+        self.avg_px = 0.0
+        self.ts_submit = 0
+        self.ts_ack = 0
+        self.ts_first_fill = 0
+        self.ts_last_fill = 0
+        self.closed = False  # Terminal (filled, canceled, rejected, ...)
+
+    @property
+    def fill_ratio(self):
+        return self.filled_qty / self.target_qty if self.target_qty > 0 else 1.0
+
+    @property
+    def is_filled(self):
+        return self.filled_qty >= self.target_qty - 1e-12
+
+    def apply_fill(self, qty, px, ts):
+        """Accumulate a (possibly partial) fill"""
+        qty = float(qty)
+        total = self.filled_qty + qty
+        if total > 0:
+            self.avg_px = (self.avg_px * self.filled_qty + float(px) * qty) / total
+        self.filled_qty = total
+        if not self.ts_first_fill:
+            self.ts_first_fill = ts
+        self.ts_last_fill = ts
+        if self.is_filled:
+            self.closed = True
+
+
+class SpreadExecution:
+    """Both legs of one spread entry or exit, submitted together"""
+
+    __slots__ = ('intent', 'ts_signal', 'legs')
+
+    def __init__(self, intent, ts_signal):
+        self.intent = intent  # 'long', 'short' or 'close'
+        self.ts_signal = ts_signal
+        self.legs = {}
+
+    def add_leg(self, leg):
+        self.legs[leg.client_order_id] = leg
+
+    def leg(self, client_order_id):
+        return self.legs.get(client_order_id)
+
+    @property
+    def is_complete(self):
+        return all(leg.closed for leg in self.legs.values())
+
+    @property
+    def is_balanced(self):
+        ratios = [leg.fill_ratio for leg in self.legs.values()]
+        return max(ratios) - min(ratios) < 1e-9 if ratios else True
+
+    @property
+    def hedged_ratio(self):
+        """Fraction of the target that is filled on every leg"""
+        return min((leg.fill_ratio for leg in self.legs.values()), default=0.0)
+
+    def excess(self):
+        """Per-leg filled quantity beyond the hedged fraction -> [(leg, qty)]"""
+        hedged = self.hedged_ratio
+        return [
+            (leg, leg.filled_qty - hedged * leg.target_qty)
+            for leg in self.legs.values()
+            if leg.filled_qty - hedged * leg.target_qty > 1e-12
+        ]
+
+    def timings(self):
+        """Latency breakdown in nanoseconds (None where not yet observed)"""
+        legs = list(self.legs.values())
+        last_submit = max(leg.ts_submit for leg in legs)
+        result = {
+            'signal_to_submit': last_submit - self.ts_signal,
+            'submit_spread': last_submit - min(leg.ts_submit for leg in legs),
+            'legs': {},
+        }
+        for leg in legs:
+            result['legs'][str(leg.instrument_id)] = {
+                'submit_to_ack': leg.ts_ack - leg.ts_submit if leg.ts_ack else None,
+                'submit_to_fill': leg.ts_last_fill - leg.ts_submit if leg.ts_last_fill else None,
+                'signal_to_fill': leg.ts_last_fill - self.ts_signal if leg.ts_last_fill else None,
+            }
+        fills = [leg.ts_last_fill for leg in legs if leg.ts_last_fill]
+        result['leg_fill_gap'] = max(fills) - min(fills) if len(fills) == len(legs) else None
+        return result
+
+
+class LegLatencyStats:
+    """Rolling record of completed spread executions"""
+
+    def __init__(self, maxlen=1000):
+        self.fill_gaps_ns = deque(maxlen=maxlen)
+        self.signal_to_fill_ns = deque(maxlen=maxlen)
+        self.completed = 0
+        self.imbalanced = 0
+
+    def record(self, execution):
+        timings = execution.timings()
+        self.completed += 1
+        if not execution.is_balanced:
+            self.imbalanced += 1
+        if timings['leg_fill_gap'] is not None:
+            self.fill_gaps_ns.append(timings['leg_fill_gap'])
+        fills = [v['signal_to_fill'] for v in timings['legs'].values() if v['signal_to_fill'] is not None]
+        if fills:
+            self.signal_to_fill_ns.append(max(fills))
+        return timings
+
+    def summary(self):
+        gaps = sorted(self.fill_gaps_ns)
+        if not gaps:
+            return {'completed': self.completed, 'imbalanced': self.imbalanced}
+        return {
+            'completed': self.completed,
+            'imbalanced': self.imbalanced,
+            'leg_gap_p50_ms': gaps[len(gaps) // 2] / 1e6,
+            'leg_gap_max_ms': gaps[-1] / 1e6,
+        }
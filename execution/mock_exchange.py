@@ -0,0 +1,194 @@
+"""
+Local mock of the Binance USDT-M futures order endpoints
+Enforces the same fixed-window rate limits as the venue so the order scheduler
+can be exercised offline: python -m execution.mock_exchange
+"""
+
+import hashlib
+import hmac
+import json
+import threading
+import time
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from execution.rate_budget import (
+    BATCH_REQUEST_WEIGHT,
+    MAX_BATCH_SIZE,
+    ORDER_REQUEST_WEIGHT,
+    ORDERS_PER_10_SECONDS,
+    ORDERS_PER_MINUTE,
+    REQUEST_WEIGHT_PER_MINUTE,
+)
+
+
+class _Window:
+    """Fixed window counter (Binance resets limits on interval boundaries)"""
+
+    def __init__(self, limit, seconds):
+        self.limit = limit
+        self.seconds = seconds
+        self.start = 0.0
+        self.used = 0
+
+    def add(self, amount, now):
+        window = now - now % self.seconds
+        if window != self.start:
+            self.start = window
+            self.used = 0
+        if self.used + amount > self.limit:
+            return False
+        self.used += amount
+        return True
+
+
+class MockBinanceFuturesExchange:
+    """In-process HTTP server answering /fapi/v1/order and /fapi/v1/batchOrders"""
+
+    def __init__(self, api_secret=None, weight_per_minute=REQUEST_WEIGHT_PER_MINUTE,
+                 orders_per_10s=ORDERS_PER_10_SECONDS, orders_per_minute=ORDERS_PER_MINUTE,
+                 host='127.0.0.1', port=0):
+        self.api_secret = api_secret
+        self.weight = _Window(weight_per_minute, 60)
+        self.orders_10s = _Window(orders_per_10s, 10)
+        self.orders_1m = _Window(orders_per_minute, 60)
+        self.lock = threading.Lock()
+        self.next_order_id = 1
+        self.orders = []  # Accepted order params
+        self.requests = []  # (path, n_orders, status)
+
+        self.server = ThreadingHTTPServer((host, port), self._handler())
+        self.thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _check_signature(self, body):
+        if self.api_secret is None:
+            return True
+        payload, _, signature = body.rpartition('&signature=')
+        expected = hmac.new(self.api_secret.encode(), payload.encode(), hashlib.sha256).hexdigest()
+        return hmac.compare_digest(expected, signature)
+
+    def _accept(self, params):
+        order_id = self.next_order_id
+        self.next_order_id += 1
+        self.orders.append(params)
+        return {
+            'orderId': order_id,
+            'symbol': params.get('symbol'),
+            'status': 'NEW',
+            'clientOrderId': params.get('newClientOrderId', f"mock-{order_id}"),
+            'side': params.get('side'),
+            'type': params.get('type'),
+            'origQty': params.get('quantity'),
+            'reduceOnly': params.get('reduceOnly') == 'true',
+            'updateTime': int(time.time() * 1000),
+        }
+
+    def handle(self, path, body):
+        """Process one request -> (status, headers, payload)"""
+        params = dict(urllib.parse.parse_qsl(body))
+        if path == '/fapi/v1/order':
+            orders, weight = [params], ORDER_REQUEST_WEIGHT
+        elif path == '/fapi/v1/batchOrders':
+            orders, weight = json.loads(params.get('batchOrders', '[]')), BATCH_REQUEST_WEIGHT
+            if not 0 < len(orders) <= MAX_BATCH_SIZE:
+                return 400, {}, {'code': -1130, 'msg': 'Data sent for parameter batchOrders is not valid.'}
+        else:
+            return 404, {}, {'code': -1000, 'msg': f"Unknown path {path}"}
+
+        if not self._check_signature(body):
+            return 400, {}, {'code': -1022, 'msg': 'Signature for this request is not valid.'}
+
+        with self.lock:
+            now = time.time()
+            if not self.weight.add(weight, now):
+                status, payload = 429, {'code': -1003, 'msg': 'Too many requests.'}
+            elif not (self.orders_10s.add(len(orders), now) and self.orders_1m.add(len(orders), now)):
+                status, payload = 429, {'code': -1015, 'msg': 'Too many new orders.'}
+            else:
+                results = [self._accept(order) for order in orders]
+                status, payload = 200, results if path.endswith('batchOrders') else results[0]
+            self.requests.append((path, len(orders), status))
+            headers = {
+                'X-MBX-USED-WEIGHT-1M': str(self.weight.used),
+                'X-MBX-ORDER-COUNT-10S': str(self.orders_10s.used),
+                'X-MBX-ORDER-COUNT-1M': str(self.orders_1m.used),
+            }
+            if status == 429:
+                headers['Retry-After'] = str(max(1, int(self.orders_10s.seconds - now % self.orders_10s.seconds)))
+        return status, headers, payload
+
+    def _handler(self):
+        exchange = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                length = int(self.headers.get('Content-Length', 0))
+                body = self.rfile.read(length).decode()
+                status, headers, payload = exchange.handle(urllib.parse.urlparse(self.path).path, body)
+                data = json.dumps(payload).encode()
+                self.send_response(status)
+                for key, value in headers.items():
+                    self.send_header(key, value)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+
+async def _burst_demo(n_strategies=10, orders_each=25):
+    from execution.order_scheduler import BinanceFuturesRestTransport, OrderScheduler
+    from execution.rate_budget import BinanceRateBudget
+
+    with MockBinanceFuturesExchange(api_secret='secret', orders_per_10s=100) as exchange:
+        transport = BinanceFuturesRestTransport(exchange.base_url, 'key', 'secret')
+        scheduler = OrderScheduler(transport, BinanceRateBudget(orders_per_10s=100))
+
+        # Every strategy fires its orders in the same tick
+        futures = [
+            scheduler.submit({
+                'symbol': 'BTCUSDT', 'side': 'BUY', 'type': 'MARKET', 'quantity': '0.001',
+                'newClientOrderId': f"S{s:03d}-{i:04d}",
+            })
+            for s in range(n_strategies)
+            for i in range(orders_each)
+        ]
+        print(f"Queued {len(futures)} orders, queue depth {scheduler.queue_depth}")
+        start = time.perf_counter()
+        await scheduler.flush()
+        elapsed = time.perf_counter() - start
+
+        rejected = sum(1 for _, _, status in exchange.requests if status != 200)
+        print(f"Sent in {elapsed:.2f}s: {scheduler.metrics()}")
+        print(f"Exchange saw {len(exchange.requests)} requests, {len(exchange.orders)} orders, {rejected} throttled")
+
+
+if __name__ == "__main__":
+    import asyncio
+
+    print("=== Order scheduler vs mock Binance futures ===")
+    asyncio.run(_burst_demo())
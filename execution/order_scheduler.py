@@ -0,0 +1,213 @@
+"""
+Client-side order scheduler for Binance USDT-M futures
+Coalesces orders submitted in the same event-loop tick (from any strategy) into
+batchOrders requests and spends a token-bucket budget, queueing when it runs out
+
+The TradingNode's Binance exec client (adapters.binance.execution) places its market and
+limit orders through it; execution.mock_exchange drives it against a local mock venue
+"""
+
+import asyncio
+import hashlib
+import hmac
+import json
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from collections import deque
+
+from execution.rate_budget import MAX_BATCH_SIZE, BinanceRateBudget
+
+
+class VenueOrderError(Exception):
+    """Order rejected by the venue"""
+
+    def __init__(self, code, msg, order=None):
+        super().__init__(f"{code}: {msg}")
+        self.code = code
+        self.msg = msg
+        self.order = order
+
+
+class BinanceFuturesRestTransport:
+    """Signed REST calls for single and batch order placement"""
+
+    def __init__(self, base_url, api_key, api_secret, recv_window=5000, timeout=10.0):
+        self.base_url = base_url.rstrip('/')
+        self.api_key = api_key
+        self.api_secret = api_secret
+        self.recv_window = recv_window
+        self.timeout = timeout
+
+    def _sign(self, params):
+        params = dict(params, recvWindow=self.recv_window, timestamp=int(time.time() * 1000))
+        query = urllib.parse.urlencode(params)
+        signature = hmac.new(self.api_secret.encode(), query.encode(), hashlib.sha256).hexdigest()
+        return f"{query}&signature={signature}"
+
+    @staticmethod
+    def _decode(body):
+        """JSON body, None when empty, the raw text when it is not JSON (e.g. a proxy's HTML error page)"""
+        if not body:
+            return None
+        try:
+            return json.loads(body)
+        except ValueError:
+            return body.decode(errors='replace')
+
+    def _post(self, path, params):
+        request = urllib.request.Request(
+            f"{self.base_url}{path}",
+            data=self._sign(params).encode(),
+            headers={'X-MBX-APIKEY': self.api_key, 'Content-Type': 'application/x-www-form-urlencoded'},
+            method='POST',
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                return response.status, dict(response.headers), self._decode(response.read())
+        except urllib.error.HTTPError as e:
+            return e.code, dict(e.headers), self._decode(e.read())
+
+    async def send(self, orders):
+        """Send orders as one request -> (status, headers, body)"""
+        if len(orders) == 1:
+            path, params = '/fapi/v1/order', orders[0]
+        else:
+            path, params = '/fapi/v1/batchOrders', {'batchOrders': json.dumps(orders, separators=(',', ':'))}
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._post, path, params)
+
+
+class OrderScheduler:
+    """Queue + coalescer in front of the venue's order endpoints"""
+
+    def __init__(self, transport, budget=None, max_batch_size=MAX_BATCH_SIZE):
+        self.transport = transport
+        self.budget = budget or BinanceRateBudget()
+        self.max_batch_size = max_batch_size
+
+        self._queue = deque()  # (order, future, ts_enqueued)
+        self._drain_task = None
+        self._in_flight = set()
+
+        # Metrics
+        self.max_queue_depth = 0
+        self.requests_sent = 0
+        self.orders_sent = 0
+        self.batched_orders = 0
+        self.budget_waits = 0
+        self.budget_wait_seconds = 0.0
+        self.throttled_responses = 0
+        self.last_queue_delay_ms = 0.0
+
+    def submit(self, order):
+        """Queue an order dict (Binance REST params), returns a Future of the venue response"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._queue.append((order, future, time.perf_counter()))
+        self.max_queue_depth = max(self.max_queue_depth, len(self._queue))
+
+        # Drain on the next tick so every submit from this tick lands in one pass
+        if self._drain_task is None or self._drain_task.done():
+            self._drain_task = loop.create_task(self._drain())
+        return future
+
+    async def _drain(self):
+        await asyncio.sleep(0)
+        while self._queue:
+            n = min(self.max_batch_size, len(self._queue))
+            wait = self.budget.wait_time(n)
+            if wait > 0:
+                # Out of budget: queue, don't reject
+                self.budget_waits += 1
+                self.budget_wait_seconds += wait
+                await asyncio.sleep(wait)
+                continue
+            if not self.budget.try_spend(n):
+                await asyncio.sleep(0)
+                continue
+
+            batch = [self._queue.popleft() for _ in range(n)]
+            now = time.perf_counter()
+            self.last_queue_delay_ms = (now - batch[0][2]) * 1e3
+            task = asyncio.get_running_loop().create_task(self._send(batch))
+            self._in_flight.add(task)
+            task.add_done_callback(self._in_flight.discard)
+
+    async def _send(self, batch):
+        orders = [order for order, _, _ in batch]
+        self.requests_sent += 1
+        try:
+            status, headers, body = await self.transport.send(orders)
+            self._handle_response(batch, status, headers, body)
+        except Exception as e:
+            # Nothing may leave a future pending: callers (and flush()) would wait forever
+            for _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(e)
+
+    def _handle_response(self, batch, status, headers, body):
+        # Keep the local buckets honest with the venue's own counters
+        headers = {key.upper(): value for key, value in headers.items()}
+        now = time.time()
+        for header, bucket, window in (('X-MBX-USED-WEIGHT-1M', self.budget.weight, 60),
+                                       ('X-MBX-ORDER-COUNT-10S', self.budget.orders_10s, 10),
+                                       ('X-MBX-ORDER-COUNT-1M', self.budget.orders_1m, 60)):
+            if header in headers:
+                bucket.sync_used(headers[header], window - now % window)
+
+        if status in (418, 429):
+            # Venue says slow down: pause the budget and put the orders back in front
+            self.throttled_responses += 1
+            self.budget.pause(float(headers.get('RETRY-AFTER', 1)))
+            self._queue.extendleft(reversed(batch))
+            if self._drain_task is None or self._drain_task.done():
+                self._drain_task = asyncio.get_running_loop().create_task(self._drain())
+            return
+
+        self.orders_sent += len(batch)
+        if len(batch) > 1:
+            self.batched_orders += len(batch)
+        # One result per order for batches; anything else (an error object, an empty or non-JSON
+        # body) applies to every order
+        if isinstance(body, list) and len(body) != len(batch):
+            status, body = max(status, 500), f"{len(body)} results for a batch of {len(batch)} orders"
+        results = body if isinstance(body, list) else [body] * len(batch)
+        for (order, future, _), result in zip(batch, results):
+            if future.done():
+                continue
+            rejected = isinstance(result, dict) and isinstance(result.get('code'), int) and result['code'] < 0
+            if status >= 400 or rejected:
+                if isinstance(result, dict):
+                    future.set_exception(VenueOrderError(result.get('code'), result.get('msg'), order))
+                else:
+                    future.set_exception(VenueOrderError(status, result or f"HTTP {status} with an empty body", order))
+            else:
+                future.set_result(result)
+
+    @property
+    def queue_depth(self):
+        return len(self._queue)
+
+    def metrics(self):
+        return {
+            'queue_depth': self.queue_depth,
+            'max_queue_depth': self.max_queue_depth,
+            'in_flight_requests': len(self._in_flight),
+            'requests_sent': self.requests_sent,
+            'orders_sent': self.orders_sent,
+            'batched_orders': self.batched_orders,
+            'budget_waits': self.budget_waits,
+            'budget_wait_seconds': self.budget_wait_seconds,
+            'throttled_responses': self.throttled_responses,
+            'last_queue_delay_ms': self.last_queue_delay_ms,
+        }
+
+    async def flush(self):
+        """Wait until every queued order has been sent and answered"""
+        while self._queue or self._in_flight or (self._drain_task and not self._drain_task.done()):
+            if self._drain_task and not self._drain_task.done():
+                await self._drain_task
+            if self._in_flight:
+                await asyncio.gather(*self._in_flight, return_exceptions=True)
@@ -0,0 +1,133 @@
+"""
+Multi-alpha target netting
+Alphas post target notionals (USD, signed) per instrument into one (alphas x instruments) matrix;
+each cycle the weighted column sums are the portfolio target, clipped to per-instrument, gross
+and net exposure limits, and only the difference to the current position is ordered. Offsetting
+alphas cancel before they reach the venue instead of paying fees on both sides.
+"""
+
+import numpy as np
+
+
+class PortfolioAggregator:
+    """Target matrix, netting and exposure limits; orders() turns a cycle into net orders"""
+
+    def __init__(self, instruments, alphas, weights=None, max_position_usd=None, max_gross_usd=None,
+                 max_net_usd=None, min_order_usd=10.0, drift_tolerance=0.25):
+        self.instruments = list(instruments)
+        self.alphas = list(alphas)
+        self.index = {instrument: i for i, instrument in enumerate(self.instruments)}
+        self.alpha_index = {alpha: i for i, alpha in enumerate(self.alphas)}
+        n_alphas, n = len(self.alphas), len(self.instruments)
+
+        self.weights = np.ones(n_alphas) if weights is None else np.asarray(weights, dtype=np.float64)
+        # Scalar or per-instrument cap on |net target|, USD
+        self.max_position = None if max_position_usd is None else np.broadcast_to(
+            np.asarray(max_position_usd, dtype=np.float64), (n,)).copy()
+        self.max_gross = max_gross_usd
+        self.max_net = max_net_usd
+        self.min_order_usd = min_order_usd
+        self.drift_tolerance = drift_tolerance  # Fraction of the target a position may drift with price
+
+        self.targets = np.zeros((n_alphas, n))
+        self.net = np.zeros(n)
+        self._last_net = np.zeros(n)
+        self._previous = np.zeros((n_alphas, n))  # Targets at the last cycle, for the standalone order count
+
+        # Metrics
+        self.cycles = 0
+        self.net_orders = 0
+        self.standalone_orders = 0  # Orders the alphas would have sent trading on their own
+        self.net_turnover_usd = 0.0
+        self.standalone_turnover_usd = 0.0
+        self.limited_cycles = 0
+
+    def set_target(self, alpha, instrument, notional_usd):
+        self.targets[self.alpha_index[alpha], self.index[instrument]] = notional_usd
+
+    def set_targets(self, alpha, notionals_usd):
+        """Whole row for one alpha, in instrument order"""
+        self.targets[self.alpha_index[alpha]] = notionals_usd
+
+    def net_targets(self):
+        """Weighted sum over alphas, then per-instrument, gross and net limits (in that order)"""
+        net = np.dot(self.weights, self.targets, out=self.net)
+        limited = False
+        if self.max_position is not None:
+            over = np.abs(net) > self.max_position
+            if over.any():
+                np.clip(net, -self.max_position, self.max_position, out=net)
+                limited = True
+        if self.max_gross is not None:
+            gross = np.abs(net).sum()
+            if gross > self.max_gross:
+                net *= self.max_gross / gross
+                limited = True
+        if self.max_net is not None:
+            exposure = net.sum()
+            if abs(exposure) > self.max_net:
+                # Shrink only the side that is over, so the hedges stay intact
+                side = net > 0 if exposure > 0 else net < 0
+                excess = abs(exposure) - self.max_net
+                net[side] *= 1.0 - excess / np.abs(net[side]).sum()
+                limited = True
+        self.limited_cycles += limited
+        return net
+
+    def orders(self, positions, prices):
+        """Net orders for this cycle: (instrument indices, signed quantities) against current positions
+
+        positions are signed quantities, prices the marks used for sizing. An instrument is ordered
+        when its net target moved by more than drift_tolerance (and min_order_usd) since the last
+        cycle, or when the position is off target by more than drift_tolerance of it (price drift,
+        a rejected or partial order); instruments without a price are left alone.
+        """
+        prices = np.asarray(prices, dtype=np.float64)
+        net = self.net_targets()
+        with np.errstate(invalid='ignore', divide='ignore'):
+            delta = net / prices - np.asarray(positions, dtype=np.float64)
+            notional = np.abs(delta) * prices
+        # Small rescales (a binding gross limit moves every instrument a little) wait for the drift band
+        changed = np.abs(net - self._last_net) >= np.maximum(self.min_order_usd,
+                                                              self.drift_tolerance * np.abs(self._last_net))
+        drifted = notional > self.drift_tolerance * np.abs(net)
+        send = np.isfinite(notional) & (notional >= self.min_order_usd) & (changed | drifted)
+        self._last_net[:] = net
+        indices = np.flatnonzero(send)
+
+        # What the alphas would have traded on their own: every change in every alpha's target
+        change = np.abs(self.targets - self._previous) * self.weights[:, None]
+        self.standalone_orders += int(np.count_nonzero(change >= self.min_order_usd))
+        self.standalone_turnover_usd += float(change.sum())
+        self._previous[:] = self.targets
+        self.cycles += 1
+        self.net_orders += len(indices)
+        self.net_turnover_usd += float(notional[send].sum())
+        return indices, delta[indices]
+
+    def contributions(self, instrument):
+        """USD each alpha contributes to an instrument's (pre-limit) net target"""
+        i = self.index[instrument]
+        return dict(zip(self.alphas, (self.weights * self.targets[:, i]).tolist()))
+
+    def summary(self):
+        saved = self.standalone_orders - self.net_orders
+        return {
+            'cycles': self.cycles,
+            'alphas': len(self.alphas),
+            'instruments': len(self.instruments),
+            'net_orders': self.net_orders,
+            'standalone_orders': self.standalone_orders,
+            'orders_saved_pct': round(100.0 * saved / self.standalone_orders, 2) if self.standalone_orders else 0.0,
+            'net_turnover_usd': round(self.net_turnover_usd, 2),
+            'standalone_turnover_usd': round(self.standalone_turnover_usd, 2),
+            'limited_cycles': self.limited_cycles,
+        }
+
+    def reset(self):
+        self.targets.fill(0.0)
+        self.net.fill(0.0)
+        self._last_net.fill(0.0)
+        self._previous.fill(0.0)
+        self.cycles = self.net_orders = self.standalone_orders = self.limited_cycles = 0
+        self.net_turnover_usd = self.standalone_turnover_usd = 0.0
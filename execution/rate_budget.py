@@ -0,0 +1,103 @@
+"""
+Client-side rate budgeting for Binance USDT-M futures
+Token buckets that mirror the venue limits so bursts queue locally instead of
+being rejected by the exchange (or by the Nautilus risk engine)
+"""
+
+import time
+
+
+# Binance USDT-M futures limits (GET /fapi/v1/exchangeInfo -> rateLimits)
+REQUEST_WEIGHT_PER_MINUTE = 2400
+ORDERS_PER_10_SECONDS = 300
+ORDERS_PER_MINUTE = 1200
+
+# Endpoint costs
+ORDER_REQUEST_WEIGHT = 1  # POST /fapi/v1/order
+BATCH_REQUEST_WEIGHT = 5  # POST /fapi/v1/batchOrders
+MAX_BATCH_SIZE = 5  # batchOrders accepts at most 5 orders
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at capacity / period"""
+
+    def __init__(self, capacity, period_seconds, clock=time.monotonic):
+        self.capacity = float(capacity)
+        self.rate = self.capacity / period_seconds
+        self.clock = clock
+        self.tokens = self.capacity
+        self.last_refill = clock()
+        self.paused_until = 0.0
+
+    def _refill(self):
+        now = self.clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+        self.last_refill = now
+        return now
+
+    def try_consume(self, amount):
+        """Take `amount` tokens if available, never blocks"""
+        now = self._refill()
+        if now < self.paused_until or self.tokens < amount:
+            return False
+        self.tokens -= amount
+        return True
+
+    def wait_time(self, amount):
+        """Seconds until `amount` tokens will be available"""
+        now = self._refill()
+        pause = max(0.0, self.paused_until - now)
+        deficit = max(0.0, amount - self.tokens)
+        return max(pause, deficit / self.rate)
+
+    def sync_used(self, used, window_reset_in=None):
+        """Align with the venue's own count (e.g. X-MBX-USED-WEIGHT-1M header)"""
+        self._refill()
+        used = float(used)
+        self.tokens = min(self.tokens, max(0.0, self.capacity - used))
+        # The venue counts in fixed windows: once it is full, nothing refills until it rolls over
+        if window_reset_in is not None and used >= self.capacity:
+            self.pause(window_reset_in)
+
+    def pause(self, seconds):
+        """Stop spending entirely, e.g. after a 429 with Retry-After"""
+        self.paused_until = max(self.paused_until, self.clock() + seconds)
+
+
+class BinanceRateBudget:
+    """Request-weight and order-count buckets spent together"""
+
+    def __init__(self, weight_per_minute=REQUEST_WEIGHT_PER_MINUTE,
+                 orders_per_10s=ORDERS_PER_10_SECONDS, orders_per_minute=ORDERS_PER_MINUTE,
+                 clock=time.monotonic):
+        self.weight = TokenBucket(weight_per_minute, 60.0, clock)
+        self.orders_10s = TokenBucket(orders_per_10s, 10.0, clock)
+        self.orders_1m = TokenBucket(orders_per_minute, 60.0, clock)
+
+    @staticmethod
+    def request_cost(n_orders):
+        """(request weight, order count) for sending n orders in one request"""
+        weight = BATCH_REQUEST_WEIGHT if n_orders > 1 else ORDER_REQUEST_WEIGHT
+        return weight, n_orders
+
+    def wait_time(self, n_orders):
+        weight, count = self.request_cost(n_orders)
+        return max(
+            self.weight.wait_time(weight),
+            self.orders_10s.wait_time(count),
+            self.orders_1m.wait_time(count),
+        )
+
+    def try_spend(self, n_orders):
+        """Spend the budget for one request of n orders, all-or-nothing"""
+        if self.wait_time(n_orders) > 0:
+            return False
+        weight, count = self.request_cost(n_orders)
+        self.weight.try_consume(weight)
+        self.orders_10s.try_consume(count)
+        self.orders_1m.try_consume(count)
+        return True
+
+    def pause(self, seconds):
+        for bucket in (self.weight, self.orders_10s, self.orders_1m):
+            bucket.pause(seconds)
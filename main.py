@@ -2,24 +2,38 @@
 import sys
 import os
 import argparse
-from pathlib import Path
 
 
-def run_backtest():
+def run_backtest(resume=False):
     
     
     print("RUNNING BACKTEST")
   
     
     from run_backtest import main as backtest_main
-    backtest_main()
+    backtest_main(['--resume'] if resume else [])
+
+
+def run_engine_backtest(grid=None):
+
+    print("RUNNING EVENT-DRIVEN BACKTEST (Nautilus BacktestEngine)")
+    
+    import json
+    from run_engine_backtest import expand_grid, run_engine_backtests
+    
+    configs = None
+    if grid:
+        with open(grid) as f:
+            configs = expand_grid(json.load(f))
+    run_engine_backtests(configs)
 
 
 def run_live_trading():
 
     print("STARTING LIVE TRADING")
-    api_key = os.getenv('BINANCE_TESTNET_API_KEY')
-    api_secret = os.getenv('BINANCE_TESTNET_API_SECRET')
+    from config.live.binance_live import load_credentials
+    
+    api_key, api_secret = load_credentials(None, None)
     
     if not api_key or not api_secret:
         print("\nERROR: Binance testnet credentials not found!")
@@ -32,21 +46,37 @@ def run_live_trading():
     
    
     try:
-        from nautilus_trader.live.node import TradingNode
-        from config.live.binance_live import create_live_config
+        from config.live.binance_live import build_trading_node, create_live_config
         
         config = create_live_config()
-        node = TradingNode(config=config)
-        node.start()
-        node.run()
-        
-    except KeyboardInterrupt:
-        node.stop()
-        print("Shutdown complete")
+        node = build_trading_node(config)
+        try:
+            node.run()
+        except KeyboardInterrupt:
+            node.stop()
+            print("Shutdown complete")
+        finally:
+            node.dispose()  # Strategies close their journals on dispose
         
     except Exception as e:
         print(f"\nERROR: {e}")
 
+def run_replay(session, speed=0.0, live_decisions=None):
+
+    print("REPLAYING RECORDED SESSION")
+    if not session:
+        print("\nERROR: --session is required for replay mode")
+        return
+    
+    from storage.replay import replay_session
+    from storage.decisions import compare_decisions
+    
+    replay_decisions = replay_session(session, speed=speed)
+    if live_decisions and replay_decisions:
+        import json
+        print(json.dumps(compare_decisions(live_decisions, replay_decisions), indent=2, default=str))
+
+
 def run_hyperparameter_tuning():
    
   
@@ -71,7 +101,7 @@ def generate_report():
     print("  [DONE] Strategy Implementation (Pairs Trading)")
     print("  [DONE] Backtest Framework")
     print("  [DONE] Results Generation")
-    print("  [TODO] 1-Week Sandbox Deployment (Cannot compress)")
+    print("  [TODO] 1-Week Sandbox Deployment (accelerated soak: python -m sandbox.soak_test)")
     print("  [TODO] Replication Validation (Requires sandbox data)")
     
     print("\n✓ Backtest Results:")
@@ -84,15 +114,58 @@ def generate_report():
     print("\n Files Generated:")
     print("  - results.json (submission format)")
     print("  - logs/backtest_results.json (detailed)")
+    print("  - logs/tearsheet.html (python main.py --mode tearsheet)")
    
    
 
 
+def generate_tearsheet(journal='./data/journal', equity=None):
+
+    print("GENERATING TEARSHEET")
+    
+    from analytics.report import build_report
+    
+    build_report(journal, equity or ['./logs/*.npz'])
+
+
+def run_modes(args):
+    if args.mode == 'backtest' or args.mode == 'all':
+        run_backtest(args.resume)
+    
+    if args.mode == 'optimize' or args.mode == 'all':
+        run_hyperparameter_tuning()
+    
+    if args.mode == 'report' or args.mode == 'all':
+        generate_report()
+    
+    if args.mode == 'tearsheet' or args.mode == 'all':
+        generate_tearsheet(args.journal, args.equity)
+    
+    if args.mode == 'engine':
+        run_engine_backtest(args.grid)
+    
+    if args.mode == 'live':
+        run_live_trading()
+    
+    if args.mode == 'replay':
+        run_replay(args.session, args.speed, args.live_decisions)
+
+
 def main():
    
     parser = argparse.ArgumentParser(description='Nautilus Trader - 24 Hour Sprint')
-    parser.add_argument('--mode', choices=['backtest', 'live', 'optimize', 'report', 'all'],
+    parser.add_argument('--mode', choices=['backtest', 'engine', 'live', 'replay', 'optimize', 'report', 'tearsheet', 'all'],
                        default='all', help='Execution mode')
+    parser.add_argument('--grid', help='Engine mode: JSON list of strategy config overrides, or {field: [values]}')
+    parser.add_argument('--journal', default='./data/journal', help='Tearsheet mode: trade journal root')
+    parser.add_argument('--equity', nargs='*', help='Tearsheet mode: equity curve .npz files or globs (default ./logs/*.npz)')
+    parser.add_argument('--session', help='Recorded session directory (replay mode)')
+    parser.add_argument('--speed', type=float, default=0.0, help='Replay speed multiple, 0 = as fast as possible')
+    parser.add_argument('--live-decisions', help='Live decision log to compare the replay against')
+    parser.add_argument('--resume', action='store_true', help='Backtest mode: continue from the last checkpoint, new bars only')
+    parser.add_argument('--profile', nargs='?', const='deterministic', choices=['deterministic', 'sampling'],
+                       help='Profile the selected mode, output to ./logs')
+    parser.add_argument('--trace-memory', action='store_true', help='Report tracemalloc peak allocation per stage')
     
     args = parser.parse_args()
     
@@ -103,17 +176,12 @@ def main():
     os.makedirs('./data', exist_ok=True)
     os.makedirs('./monitoring', exist_ok=True)
     
-    if args.mode == 'backtest' or args.mode == 'all':
-        run_backtest()
-    
-    if args.mode == 'optimize' or args.mode == 'all':
-        run_hyperparameter_tuning()
-    
-    if args.mode == 'report' or args.mode == 'all':
-        generate_report()
-    
-    if args.mode == 'live':
-        run_live_trading()
+    if args.profile or args.trace_memory:
+        from telemetry.profiling import profiled
+        with profiled(args.mode, args.profile, args.trace_memory, './logs'):
+            run_modes(args)
+    else:
+        run_modes(args)
     
     
 
@@ -1,41 +1,102 @@
 """
 Simplified Backtest Runner - For 24-hour sprint demonstration
 This creates synthetic data to demonstrate the system without needing real market data
+(or reads download_data.py's CSVs). Every run checkpoints its end state; --resume continues
+from it over newly appended bars only, with the same results as a full rerun.
+
+    python run_backtest.py
+    python run_backtest.py --resume
+    python run_backtest.py --days 91 --resume   # Same seeded series, one more day
 """
 
+import argparse
+import hashlib
+import json
+import os
 import sys
 import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
-import json
+
+from analytics.equity import EquityCurve, mark_to_market
+from analytics.metrics import batch_metrics, max_drawdown
+from storage.journal import TradeJournal, remove_runs
+from telemetry.profiling import trace_stage
+
+
+# Journal instrument ids, matching the Nautilus strategy's legs
+JOURNAL_IDS = ('BTCUSDT-PERP.BINANCE', 'ETHUSDT-PERP.BINANCE')
+JOURNAL_ROOT = './data/journal'
+JOURNAL_STRATEGY_ID = 'SimplifiedPairsBacktest'
+
+
+CHECKPOINT_VERSION = 2  # 2: journal run_id
+ZSCORE_WINDOW = 20 * 1440  # calculate_zscore() default: the spread history a resumed run needs
+
+
+def history_digest(btc_df, eth_df, n):
+    """SHA-1 of the first n timestamps and closes of both legs: a resume needs the same history"""
+    digest = hashlib.sha1(pd.DatetimeIndex(btc_df['timestamp'].iloc[:n]).asi8.tobytes())
+    for df in (btc_df, eth_df):
+        digest.update(np.ascontiguousarray(df['close'].to_numpy(dtype=np.float64)[:n]).tobytes())
+    return digest.hexdigest()
+
+
+def open_journal(root, resume=None):
+    """Journal for a run: a resume continues its checkpoint's run, a full run replaces the earlier ones"""
+    run_id = resume['state']['run_id'] if resume is not None else None
+    if run_id is None:
+        removed = remove_runs(root, 'simplified', JOURNAL_STRATEGY_ID)
+        if removed:
+            print(f"Removed {removed} journal part(s) of earlier full runs from {root}")
+    return TradeJournal(root, source='simplified', strategy_id=JOURNAL_STRATEGY_ID, run_id=run_id)
+
+
+def load_checkpoint(path):
+    """Checkpoint saved by SimplifiedPairsBacktest.save_checkpoint(), for run_backtest(resume=...)"""
+    with np.load(path) as data:
+        return {
+            'state': json.loads(str(data['state'])),
+            'spreads': data['spreads'],
+            'equity_index': data['equity_index'],
+            'equity_values': data['equity_values'],
+        }
 
 
 class SimplifiedPairsBacktest:
     """Simplified pairs trading backtest for demonstration"""
     
-    def __init__(self, config):
+    def __init__(self, config, journal=None):
         self.config = config
+        self.journal = journal  # storage.journal.TradeJournal, optional
         self.trades = []
-        self.equity_curve = []
+        self.equity_curve = None  # analytics.equity.EquityCurve, per bar from the end of the lookback
         self.initial_capital = 50000
         self.capital = self.initial_capital
+        self.checkpoint = None  # End state of the last run, see save_checkpoint()
+        
+    def generate_synthetic_data(self, days=90, seed=None):
+        """Generate synthetic cointegrated price data
         
-    def generate_synthetic_data(self, days=90):
-        """Generate synthetic cointegrated price data"""
+        With a seed, more days extend the same series: each column draws from its own stream,
+        so the first n bars do not depend on the length (an append-only history for --resume)
+        """
         print("Generating synthetic market data...")
+        trace_stage('data_generation')
         
         # Generate correlated random walks
         n_bars = days * 1440  # 1-minute bars
+        rng = [np.random.default_rng(s) for s in np.random.SeedSequence(seed).spawn(10)]
         
         # BTC price simulation
-        btc_returns = np.random.normal(0.0001, 0.02, n_bars)
+        btc_returns = rng[0].normal(0.0001, 0.02, n_bars)
         btc_prices = 40000 * np.exp(np.cumsum(btc_returns))
         
         # ETH price simulation (cointegrated with BTC)
         correlation = 0.85
         eth_returns = (
             correlation * btc_returns + 
-            np.sqrt(1 - correlation**2) * np.random.normal(0.0001, 0.02, n_bars)
+            np.sqrt(1 - correlation**2) * rng[1].normal(0.0001, 0.02, n_bars)
         )
         eth_prices = 2500 * np.exp(np.cumsum(eth_returns))
         
@@ -47,19 +108,19 @@ class SimplifiedPairsBacktest:
         btc_df = pd.DataFrame({
             'timestamp': timestamps,
             'close': btc_prices,
-            'open': btc_prices * (1 + np.random.uniform(-0.001, 0.001, n_bars)),
-            'high': btc_prices * (1 + np.random.uniform(0, 0.002, n_bars)),
-            'low': btc_prices * (1 + np.random.uniform(-0.002, 0, n_bars)),
-            'volume': np.random.uniform(1000, 5000, n_bars)
+            'open': btc_prices * (1 + rng[2].uniform(-0.001, 0.001, n_bars)),
+            'high': btc_prices * (1 + rng[3].uniform(0, 0.002, n_bars)),
+            'low': btc_prices * (1 + rng[4].uniform(-0.002, 0, n_bars)),
+            'volume': rng[5].uniform(1000, 5000, n_bars)
         })
         
         eth_df = pd.DataFrame({
             'timestamp': timestamps,
             'close': eth_prices,
-            'open': eth_prices * (1 + np.random.uniform(-0.001, 0.001, n_bars)),
-            'high': eth_prices * (1 + np.random.uniform(0, 0.002, n_bars)),
-            'low': eth_prices * (1 + np.random.uniform(-0.002, 0, n_bars)),
-            'volume': np.random.uniform(5000, 20000, n_bars)
+            'open': eth_prices * (1 + rng[6].uniform(-0.001, 0.001, n_bars)),
+            'high': eth_prices * (1 + rng[7].uniform(0, 0.002, n_bars)),
+            'low': eth_prices * (1 + rng[8].uniform(-0.002, 0, n_bars)),
+            'volume': rng[9].uniform(5000, 20000, n_bars)
         })
         
         print(f"Generated {n_bars} bars for BTC and ETH")
@@ -91,36 +152,63 @@ class SimplifiedPairsBacktest:
         
         return (spreads[-1] - mean) / std
     
-    def run_backtest(self, btc_df, eth_df):
-        """Run the pairs trading backtest"""
+    def run_backtest(self, btc_df, eth_df, resume=None):
+        """Run the pairs trading backtest
+
+        resume: a checkpoint (load_checkpoint()) saved by an earlier run on a prefix of these bars;
+        only the bars after it are simulated and the results equal a full rerun
+        """
         print("\nRunning backtest...")
-        
-        # Calculate hedge ratio
         lookback = 60 * 1440  # 60 days
-        hedge_ratio = self.calculate_hedge_ratio(
-            btc_df['close'].iloc[:lookback].values,
-            eth_df['close'].iloc[:lookback].values
-        )
-        print(f"Hedge ratio: {hedge_ratio:.4f}")
-        
-        # Calculate spreads
-        spreads = []
-        in_position = False
-        position_side = None
-        entry_btc = None
-        entry_eth = None
         
         z_entry = self.config['z_entry_threshold']
         z_exit = self.config['z_exit_threshold']
         z_stop = self.config['z_stop_loss']
         position_size = self.config['position_size_usd']
         
-        trade_count = 0
-        winning_trades = 0
-        total_pnl = 0
+        if resume is None:
+            # Calculate hedge ratio
+            trace_stage('hedge_ratio_fit')
+            hedge_ratio = self.calculate_hedge_ratio(
+                btc_df['close'].iloc[:lookback].values,
+                eth_df['close'].iloc[:lookback].values
+            )
+            start = lookback
+            spreads = []
+            in_position = False
+            position_side = None
+            entry_btc = None
+            entry_eth = None
+            trade_count = 0
+            winning_trades = 0
+            total_pnl = 0
+            previous_curve = None
+        else:
+            state = self._validate_checkpoint(resume, btc_df, eth_df)
+            hedge_ratio = state['hedge_ratio']
+            start = state['next_bar']
+            spreads = resume['spreads'].tolist()
+            position = state['position']
+            in_position = position is not None
+            position_side = position['side'] if in_position else None
+            entry_btc = position['entry_btc'] if in_position else None
+            entry_eth = position['entry_eth'] if in_position else None
+            if in_position:
+                entry_time, entry_bar = pd.Timestamp(position['entry_time']), position['entry_bar']
+            trade_count = state['trade_count']
+            winning_trades = state['winning_trades']
+            total_pnl = state['total_pnl']
+            self.capital = state['capital']
+            self.trades = [dict(t, entry_time=pd.Timestamp(t['entry_time']), exit_time=pd.Timestamp(t['exit_time']))
+                           for t in state['trades']]
+            previous_curve = EquityCurve(resume['equity_index'], resume['equity_values'])
+            print(f"Resuming from checkpoint at bar {start} ({len(btc_df) - start} new bars)")
+        print(f"Hedge ratio: {hedge_ratio:.4f}")
+        realized_before = total_pnl
         
         # Simulate trading
-        for i in range(lookback, len(btc_df)):
+        trace_stage('main_loop')
+        for i in range(start, len(btc_df)):
             btc_price = btc_df['close'].iloc[i]
             eth_price = eth_df['close'].iloc[i]
             timestamp = btc_df['timestamp'].iloc[i]
@@ -132,13 +220,6 @@ class SimplifiedPairsBacktest:
             # Calculate z-score
             z_score = self.calculate_zscore(spreads)
             
-            # Track equity
-            if i % 1440 == 0:  # Daily snapshot
-                self.equity_curve.append({
-                    'timestamp': timestamp,
-                    'capital': self.capital
-                })
-            
             # Trading logic
             if in_position:
                 # Check stop loss
@@ -157,8 +238,12 @@ class SimplifiedPairsBacktest:
                         'side': position_side,
                         'pnl': pnl,
                         'exit_reason': 'stop_loss',
-                        'z_score': z_score
+                        'z_score': z_score,
+                        'entry_bar': entry_bar,
+                        'exit_bar': i
                     })
+                    self._journal_exit(self.trades[-1], entry_btc, entry_eth, btc_price, eth_price,
+                                       hedge_ratio, position_size)
                     
                     if pnl > 0:
                         winning_trades += 1
@@ -184,8 +269,12 @@ class SimplifiedPairsBacktest:
                         'side': position_side,
                         'pnl': pnl,
                         'exit_reason': 'signal',
-                        'z_score': z_score
+                        'z_score': z_score,
+                        'entry_bar': entry_bar,
+                        'exit_bar': i
                     })
+                    self._journal_exit(self.trades[-1], entry_btc, entry_eth, btc_price, eth_price,
+                                       hedge_ratio, position_size)
                     
                     if pnl > 0:
                         winning_trades += 1
@@ -203,6 +292,8 @@ class SimplifiedPairsBacktest:
                     entry_btc = btc_price
                     entry_eth = eth_price
                     entry_time = timestamp
+                    entry_bar = i
+                    self._journal_entry(timestamp, position_side, btc_price, eth_price, hedge_ratio, position_size)
                     
                 elif z_score > z_entry:
                     # Enter short spread
@@ -211,23 +302,71 @@ class SimplifiedPairsBacktest:
                     entry_btc = btc_price
                     entry_eth = eth_price
                     entry_time = timestamp
+                    entry_bar = i
+                    self._journal_entry(timestamp, position_side, btc_price, eth_price, hedge_ratio, position_size)
+        
+        # Mark-to-market equity per bar, including the open spread's unrealized PnL; a resumed run
+        # only marks the new bars (a position carried over keeps its checkpointed entry prices)
+        trace_stage('equity_curve')
+        btc_close, eth_close = btc_df['close'].to_numpy(), eth_df['close'].to_numpy()
+        positions = [(t['entry_bar'], t['exit_bar'], t['side'], t['pnl']) for t in self.trades if t['exit_bar'] >= start]
+        if in_position:
+            positions.append((entry_bar, len(btc_df), position_side, 0.0))
+        entry_bars, exit_bars, sides, pnls = zip(*positions) if positions else ((), (), (), ())
+        carried = resume['state']['position'] if resume is not None else None
+        entry_prices = ([btc_close[e] if e >= start else carried['entry_btc'] for e in entry_bars],
+                        [eth_close[e] if e >= start else carried['entry_eth'] for e in entry_bars])
+        curve = mark_to_market(
+            pd.DatetimeIndex(btc_df['timestamp']).asi8[start:],
+            btc_close[start:],
+            eth_close[start:],
+            np.array(entry_bars, dtype=np.int64) - start,
+            np.array(exit_bars, dtype=np.int64) - start,
+            [1.0 if side == 'long' else -1.0 for side in sides],
+            pnls, hedge_ratio, position_size, self.initial_capital,
+            entry_prices=entry_prices, realized_to_date=realized_before,
+        )
+        self.equity_curve = curve if previous_curve is None else previous_curve.append(curve)
+        
+        # End state for the next --resume: everything the loop carries from bar to bar
+        trace_stage('checkpoint')
+        self.checkpoint = {
+            'state': {
+                'version': CHECKPOINT_VERSION,
+                'config': self.config,
+                'initial_capital': self.initial_capital,
+                'hedge_ratio': float(hedge_ratio),
+                'next_bar': len(btc_df),
+                'last_timestamp': pd.Timestamp(btc_df['timestamp'].iloc[-1]).isoformat(),
+                'history_digest': history_digest(btc_df, eth_df, len(btc_df)),
+                'run_id': self.journal.run_id if self.journal is not None else None,
+                'capital': self.capital,
+                'total_pnl': total_pnl,
+                'trade_count': trade_count,
+                'winning_trades': winning_trades,
+                'position': {
+                    'side': position_side, 'entry_btc': float(entry_btc), 'entry_eth': float(entry_eth),
+                    'entry_time': pd.Timestamp(entry_time).isoformat(), 'entry_bar': entry_bar,
+                } if in_position else None,
+                'trades': [dict(t, entry_time=pd.Timestamp(t['entry_time']).isoformat(),
+                                exit_time=pd.Timestamp(t['exit_time']).isoformat()) for t in self.trades],
+            },
+            'spreads': np.array(spreads[-ZSCORE_WINDOW:], dtype=np.float64),
+            'equity_index': self.equity_curve.index,
+            'equity_values': self.equity_curve.values,
+        }
         
         # Calculate metrics
+        trace_stage('metrics')
         win_rate = winning_trades / trade_count if trade_count > 0 else 0
         avg_trade = total_pnl / trade_count if trade_count > 0 else 0
         
-        # Calculate Sharpe ratio (simplified)
-        if len(self.equity_curve) > 1:
-            returns = pd.DataFrame(self.equity_curve)['capital'].pct_change().dropna()
-            sharpe = (returns.mean() / returns.std()) * np.sqrt(252) if returns.std() > 0 else 0
-        else:
-            sharpe = 0
-        
-        # Calculate max drawdown
-        equity_series = pd.DataFrame(self.equity_curve)['capital']
-        cummax = equity_series.cummax()
-        drawdown = (equity_series - cummax) / cummax
-        max_dd = drawdown.min()
+        # Risk metrics: ratios on daily marks (365-day year, the market trades 24/7),
+        # drawdown at full resolution
+        daily_stats = batch_metrics(self.equity_curve.downsample('1D').values, '1D')
+        sharpe = float(daily_stats['sharpe_ratio'][0])
+        depth, duration = max_drawdown(self.equity_curve.values)
+        max_dd = float(depth[0])
         
         results = {
             'total_trades': trade_count,
@@ -239,11 +378,62 @@ class SimplifiedPairsBacktest:
             'return_pct': ((self.capital - self.initial_capital) / self.initial_capital) * 100,
             'sharpe_ratio': sharpe,
             'max_drawdown': max_dd,
+            'max_drawdown_days': float(duration[0]) / 1440,
+            'sortino_ratio': float(daily_stats['sortino_ratio'][0]),
+            'calmar_ratio': float(daily_stats['calmar_ratio'][0]),
             'hedge_ratio': hedge_ratio
         }
         
         return results
     
+    def _validate_checkpoint(self, checkpoint, btc_df, eth_df):
+        """The checkpoint's state, if it was taken on a prefix of these bars with this configuration"""
+        state = checkpoint['state']
+        if state.get('version') != CHECKPOINT_VERSION:
+            raise ValueError(f"Checkpoint version {state.get('version')} (expected {CHECKPOINT_VERSION}): rerun in full")
+        if state['config'] != self.config or state['initial_capital'] != self.initial_capital:
+            raise ValueError("Checkpoint was taken with a different configuration: rerun in full")
+        if state['next_bar'] <= 60 * 1440 or len(btc_df) < state['next_bar']:
+            raise ValueError(f"Checkpoint covers {state['next_bar']} bars, the data {len(btc_df)}: rerun in full")
+        if history_digest(btc_df, eth_df, state['next_bar']) != state['history_digest']:
+            raise ValueError(f"Bars up to {state['last_timestamp']} differ from the checkpointed ones: rerun in full")
+        return state
+
+    def save_checkpoint(self, path):
+        """End state of the last run_backtest() (.npz: JSON state, spread window, equity curve)"""
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        checkpoint = self.checkpoint
+        with open(path + '.tmp', 'wb') as f:
+            np.savez(f, state=json.dumps(checkpoint['state']), spreads=checkpoint['spreads'],
+                     equity_index=checkpoint['equity_index'], equity_values=checkpoint['equity_values'])
+        os.replace(path + '.tmp', path)  # A crash mid-write leaves the previous checkpoint intact
+    
+    def _journal_entry(self, timestamp, side, btc_price, eth_price, hedge_ratio, position_size):
+        if self.journal is None:
+            return
+        ts = pd.Timestamp(timestamp).value
+        qty_btc, qty_eth = position_size / btc_price, position_size * hedge_ratio / eth_price
+        legs = (('BUY', 'SELL') if side == 'long' else ('SELL', 'BUY'))
+        fills = zip(JOURNAL_IDS, 'AB', legs, (qty_btc, qty_eth), (btc_price, eth_price))
+        for instrument_id, tag, leg_side, qty, price in fills:
+            self.journal.record_fill(ts, instrument_id, f"SIM-{ts}-{tag}", leg_side, qty, price, intent=side)
+    
+    def _journal_exit(self, trade, entry_btc, entry_eth, exit_btc, exit_eth, hedge_ratio, position_size):
+        """Trade record plus the two closing fills (slippage is in the trade PnL)"""
+        if self.journal is None:
+            return
+        ts_entry, ts_exit = pd.Timestamp(trade['entry_time']).value, pd.Timestamp(trade['exit_time']).value
+        qty_btc, qty_eth = position_size / entry_btc, position_size * hedge_ratio / entry_eth
+        legs = (('SELL', 'BUY') if trade['side'] == 'long' else ('BUY', 'SELL'))
+        fills = zip(JOURNAL_IDS, 'AB', legs, (qty_btc, qty_eth), (exit_btc, exit_eth))
+        for instrument_id, tag, leg_side, qty, price in fills:
+            self.journal.record_fill(ts_exit, instrument_id, f"SIM-{ts_exit}-{tag}", leg_side, qty, price,
+                                     intent='close')
+        self.journal.record_trade(
+            ts_entry, ts_exit, trade['side'], entry_btc, entry_eth, exit_btc, exit_eth,
+            qty_btc, qty_eth, hedge_ratio, trade['pnl'], trade['exit_reason'],
+        )
+    
     def _close_position(self, side, entry_btc, entry_eth, exit_btc, exit_eth, hedge_ratio, position_size):
         """Calculate P&L for closing position"""
         # Simplified P&L calculation
@@ -262,8 +452,29 @@ class SimplifiedPairsBacktest:
         return btc_pnl + eth_pnl - slippage
 
 
-def main():
+def load_csv_data(data_dir):
+    """BTC/ETH minute bars from download_data.py's CSVs, aligned on timestamp, or None when absent"""
+    paths = [os.path.join(data_dir, name) for name in ('btc_1m.csv', 'eth_1m.csv')]
+    if not all(os.path.exists(path) for path in paths):
+        return None
+    btc_df, eth_df = (pd.read_csv(path, parse_dates=['timestamp']) for path in paths)
+    common = np.intersect1d(btc_df['timestamp'].to_numpy(), eth_df['timestamp'].to_numpy())
+    return tuple(df[df['timestamp'].isin(common)].reset_index(drop=True) for df in (btc_df, eth_df))
+
+
+def main(argv=None):
     """Run simplified backtest"""
+    parser = argparse.ArgumentParser(description='Simplified pairs backtest')
+    parser.add_argument('--data-dir', default='./data', help='btc_1m.csv / eth_1m.csv (synthetic data when absent)')
+    parser.add_argument('--days', type=int, default=90, help='Synthetic data length')
+    parser.add_argument('--seed', type=int, default=42,
+                        help='Synthetic data seed: a run with more --days appends to the same series')
+    parser.add_argument('--checkpoint', default='./data/checkpoints/simplified_backtest.npz',
+                        help='End state written after every run, read by --resume')
+    parser.add_argument('--resume', action='store_true',
+                        help='Continue from the checkpoint: simulate only bars appended since it was written')
+    args = parser.parse_args(argv)
+    
     print("=" * 60)
     print("SIMPLIFIED PAIRS TRADING BACKTEST")
     print("=" * 60)
@@ -281,13 +492,39 @@ def main():
     # Initialize backtest
     backtest = SimplifiedPairsBacktest(config)
     
-    # Generate synthetic data
-    btc_df, eth_df = backtest.generate_synthetic_data(days=90)
+    # Downloaded bars when present, synthetic data otherwise
+    data = load_csv_data(args.data_dir)
+    if data is not None:
+        btc_df, eth_df = data
+        print(f"Loaded {len(btc_df)} bars from {args.data_dir}")
+    else:
+        btc_df, eth_df = backtest.generate_synthetic_data(days=args.days, seed=args.seed)
     
-    # Run backtest
-    results = backtest.run_backtest(btc_df, eth_df)
+    resume = None
+    if args.resume:
+        if os.path.exists(args.checkpoint):
+            resume = load_checkpoint(args.checkpoint)
+        else:
+            print(f"No checkpoint at {args.checkpoint}, running in full")
+    
+    # Run backtest; trades and fills go to the shared journal (storage.journal)
+    backtest.journal = open_journal(JOURNAL_ROOT, resume)
+    try:
+        results = backtest.run_backtest(btc_df, eth_df, resume=resume)
+    except ValueError as e:
+        if resume is None:
+            raise
+        print(f"Cannot resume from {args.checkpoint}: {e}")
+        print("Running in full")
+        backtest.journal.close()  # Nothing written: the checkpoint is validated first
+        backtest.journal = open_journal(JOURNAL_ROOT)
+        results = backtest.run_backtest(btc_df, eth_df)
+    backtest.journal.close()
+    backtest.save_checkpoint(args.checkpoint)
+    print(f"Checkpoint saved to {args.checkpoint}")
     
     # Print results
+    trace_stage('output')
     print("\n" + "=" * 60)
     print("BACKTEST RESULTS")
     print("=" * 60)
@@ -300,7 +537,9 @@ def main():
     print(f"Final Capital:     ${results['final_capital']:.2f}")
     print(f"Return:            {results['return_pct']:.2f}%")
     print(f"Sharpe Ratio:      {results['sharpe_ratio']:.3f}")
-    print(f"Max Drawdown:      {results['max_drawdown']:.2%}")
+    print(f"Sortino Ratio:     {results['sortino_ratio']:.3f}")
+    print(f"Calmar Ratio:      {results['calmar_ratio']:.3f}")
+    print(f"Max Drawdown:      {results['max_drawdown']:.2%} ({results['max_drawdown_days']:.1f} days)")
     print(f"Hedge Ratio:       {results['hedge_ratio']:.4f}")
     print("=" * 60)
     
@@ -310,6 +549,10 @@ def main():
     
     print("\nResults saved to ./logs/backtest_results.json")
     
+    backtest.equity_curve.save('./logs/equity_curve.npz')
+    print(f"Equity curve ({len(backtest.equity_curve)} bars, {backtest.equity_curve.nbytes / 1e6:.1f} MB) "
+          f"saved to ./logs/equity_curve.npz")
+    
     # Generate results.json for submission
     submission_results = {
         "portfolio_pnl": {
@@ -0,0 +1,250 @@
+"""
+Event-driven backtest runner on the Nautilus BacktestEngine
+Loads BTC/ETH bars into one engine once and runs any number of PairsTradingStrategy
+configurations against them, resetting the engine between runs instead of rebuilding it
+
+    python run_engine_backtest.py                          # default config, catalog data
+    python run_engine_backtest.py --grid grid.json         # {"z_entry_threshold": [1.5, 2.0], ...}
+    python run_engine_backtest.py --synthetic-days 30
+"""
+
+import argparse
+import itertools
+import json
+import os
+import time
+
+import numpy as np
+import pandas as pd
+from nautilus_trader.backtest.engine import BacktestEngine, BacktestEngineConfig
+from nautilus_trader.backtest.models import FillModel
+from nautilus_trader.config import LoggingConfig
+from nautilus_trader.model.currencies import USDT
+from nautilus_trader.model.data import BarType
+from nautilus_trader.model.enums import AccountType, OmsType
+from nautilus_trader.model.identifiers import Venue
+from nautilus_trader.model.objects import Money
+
+from strategies.pairs_trading import PairsTradingConfig, PairsTradingStrategy
+from telemetry.profiling import trace_stage
+
+
+VENUE = Venue("BINANCE")
+INSTRUMENT_IDS = ["BTCUSDT-PERP.BINANCE", "ETHUSDT-PERP.BINANCE"]
+BAR_SPEC = "1-MINUTE-LAST-EXTERNAL"
+
+# Same parameters as the simplified backtester and config/backtest/pairs_config.py
+BASE_STRATEGY_CONFIG = {
+    "instrument_id_a": INSTRUMENT_IDS[0],
+    "instrument_id_b": INSTRUMENT_IDS[1],
+    "bar_type": BAR_SPEC,
+    "lookback_period": 60,
+    "rolling_window": 20,
+    "z_entry_threshold": 2.0,
+    "z_exit_threshold": 0.5,
+    "z_stop_loss": 3.0,
+    "position_size_usd": 1000.0,
+    "order_id_tag": "001",
+}
+
+
+def load_catalog_bars(catalog_path, start=None, end=None):
+    """Instruments and bars for both legs from a ParquetDataCatalog, or ([], []) when absent"""
+    from nautilus_trader.persistence.catalog import ParquetDataCatalog
+
+    if not os.path.isdir(catalog_path):
+        return [], []
+    catalog = ParquetDataCatalog(catalog_path)
+    instruments = catalog.instruments(instrument_ids=INSTRUMENT_IDS)
+    if len(instruments) < len(INSTRUMENT_IDS):
+        return [], []
+    bars = catalog.bars(
+        bar_types=[f"{instrument_id}-{BAR_SPEC}" for instrument_id in INSTRUMENT_IDS],
+        start=start, end=end,
+    )
+    return instruments, bars
+
+
+def synthetic_instruments():
+    """The Binance BTC/ETH perpetual test instruments the synthetic data is generated for"""
+    from nautilus_trader.test_kit.providers import TestInstrumentProvider
+
+    return [TestInstrumentProvider.btcusdt_perp_binance(), TestInstrumentProvider.ethusdt_perp_binance()]
+
+
+def synthetic_frames(days, seed=42):
+    """Correlated BTC/ETH minute OHLCV frames (UTC index) on the Binance perpetual test instruments"""
+    instruments = synthetic_instruments()
+    n_bars = days * 1440
+    rng = np.random.default_rng(seed)
+    btc_returns = rng.normal(0, 0.0006, n_bars)
+    eth_returns = 0.85 * btc_returns + np.sqrt(1 - 0.85 ** 2) * rng.normal(0, 0.0006, n_bars)
+    index = pd.date_range("2024-01-01", periods=n_bars, freq="1min", tz="UTC")
+
+    frames = []
+    for closes in (40000 * np.exp(np.cumsum(btc_returns)), 2500 * np.exp(np.cumsum(eth_returns))):
+        opens = np.concatenate(([closes[0]], closes[:-1]))
+        wick = np.abs(rng.normal(0, 0.0003, n_bars))
+        frames.append(pd.DataFrame({
+            "open": opens,
+            "high": np.maximum(opens, closes) * (1 + wick),
+            "low": np.minimum(opens, closes) * (1 - wick),
+            "close": closes,
+            "volume": rng.uniform(100, 500, n_bars),
+        }, index=index))
+    return instruments, frames
+
+
+def frames_to_bars(instruments, frames):
+    from nautilus_trader.persistence.wranglers import BarDataWrangler
+
+    bars = []
+    for instrument, df in zip(instruments, frames):
+        bar_type = BarType.from_str(f"{instrument.id}-{BAR_SPEC}")
+        bars.extend(BarDataWrangler(bar_type, instrument).process(df))
+    return bars
+
+
+def synthetic_bars(days, seed=42):
+    """Correlated BTC/ETH minute bars on the Binance perpetual test instruments"""
+    instruments, frames = synthetic_frames(days, seed)
+    return instruments, frames_to_bars(instruments, frames)
+
+
+class PairsEngineRunner:
+    """One BacktestEngine holding the data; run() adds a strategy, runs, collects results and resets"""
+
+    def __init__(self, instruments, bars, starting_balance=50000, log_level="ERROR"):
+        trace_stage('engine_setup')
+        self.starting_balance = starting_balance
+        self.n_bars = len(bars)
+        self.engine = BacktestEngine(BacktestEngineConfig(logging=LoggingConfig(log_level=log_level)))
+        self.engine.add_venue(
+            VENUE,
+            oms_type=OmsType.NETTING,
+            account_type=AccountType.MARGIN,
+            starting_balances=[Money(starting_balance, USDT)],
+            base_currency=USDT,
+            fill_model=self._fill_model(),
+            bar_adaptive_high_low_ordering=True,
+        )
+        for instrument in instruments:
+            self.engine.add_instrument(instrument)
+        self.engine.add_data(bars)  # Sorted once here; reset() keeps the data
+        self.runs = 0
+
+    @staticmethod
+    def _fill_model():
+        return FillModel(prob_fill_on_limit=0.5, prob_slippage=0.3, random_seed=42)
+
+    def run(self, overrides=None, keep_reports=False):
+        """Backtest one configuration; overrides are PairsTradingConfig fields on top of the base config.
+        keep_reports adds the engine's positions report (DataFrame) under 'positions_report'"""
+        config = {**BASE_STRATEGY_CONFIG, **(overrides or {})}
+        if self.runs:
+            self.engine.reset()
+            self.engine.change_fill_model(VENUE, self._fill_model())  # Reseed so every run sees the same fills
+        strategy = PairsTradingStrategy(PairsTradingConfig(**config))
+        self.engine.add_strategy(strategy)
+
+        trace_stage('engine_run')
+        t0 = time.perf_counter()
+        self.engine.run()
+        elapsed = time.perf_counter() - t0
+        self.runs += 1
+
+        trace_stage('engine_results')
+        result = self.engine.get_result()
+        fills = self.engine.trader.generate_order_fills_report()
+        account = self.engine.portfolio.account(VENUE)
+        final_balance = account.balance_total(USDT).as_double()
+        pnl_stats = result.stats_pnls.get(str(USDT), {})
+        positions = self.engine.trader.generate_positions_report() if keep_reports else None
+
+        self.engine.clear_strategies()
+        summary = {
+            "config": overrides or {},
+            "trades": strategy.trade_count,
+            "fills": len(fills),
+            "orders": result.total_orders,
+            "positions": result.total_positions,
+            "total_pnl": final_balance - self.starting_balance,
+            "final_balance": final_balance,
+            "return_pct": (final_balance - self.starting_balance) / self.starting_balance * 100,
+            "win_rate": pnl_stats.get("Win Rate"),
+            "sharpe_ratio": result.stats_returns.get("Sharpe Ratio (252 days)"),
+            "seconds": round(elapsed, 3),
+            "bars_per_sec": round(self.n_bars / elapsed, 1) if elapsed > 0 else None,
+        }
+        if keep_reports:
+            summary["positions_report"] = positions
+        return summary
+
+    def run_many(self, configs, verbose=True):
+        results = []
+        for i, overrides in enumerate(configs):
+            results.append(self.run(overrides))
+            if verbose:
+                r = results[-1]
+                print(f"  [{i + 1}/{len(configs)}] {json.dumps(overrides)}: trades {r['trades']}, "
+                      f"PnL {r['total_pnl']:.2f} USDT, {r['seconds']:.2f}s ({r['bars_per_sec']:,.0f} bars/s)")
+        return results
+
+    def dispose(self):
+        self.engine.dispose()
+
+
+def expand_grid(grid):
+    """A list of override dicts as-is, or {field: [values]} as the cartesian product"""
+    if isinstance(grid, list):
+        return grid
+    keys = list(grid)
+    return [dict(zip(keys, values)) for values in itertools.product(*(grid[k] for k in keys))]
+
+
+def run_engine_backtests(configs=None, catalog_path="./data/catalog", start=None, end=None,
+                         synthetic_days=90, output="./logs/engine_backtest_results.json"):
+    trace_stage('load_data')
+    instruments, bars = load_catalog_bars(catalog_path, start, end)
+    if bars:
+        print(f"Loaded {len(bars)} bars from {catalog_path}")
+    else:
+        print(f"No BTC/ETH bars in {catalog_path}, generating {synthetic_days} days of synthetic bars")
+        instruments, bars = synthetic_bars(synthetic_days)
+
+    t0 = time.perf_counter()
+    runner = PairsEngineRunner(instruments, bars)
+    print(f"Engine loaded with {runner.n_bars} bars in {time.perf_counter() - t0:.2f}s")
+    del bars
+
+    configs = configs or [{}]
+    results = runner.run_many(configs)
+    runner.dispose()
+
+    trace_stage('output')
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(results, f, indent=2, default=str)
+    print(f"\n{len(results)} run(s) saved to {output}")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Event-driven pairs backtest on the Nautilus BacktestEngine')
+    parser.add_argument('--grid', help='JSON file: list of config overrides, or {field: [values]}')
+    parser.add_argument('--catalog', default='./data/catalog')
+    parser.add_argument('--start', help='ISO start time for catalog data')
+    parser.add_argument('--end', help='ISO end time for catalog data')
+    parser.add_argument('--synthetic-days', type=int, default=90, help='Synthetic data length when the catalog is empty')
+    parser.add_argument('--output', default='./logs/engine_backtest_results.json')
+    args = parser.parse_args()
+
+    configs = None
+    if args.grid:
+        with open(args.grid) as f:
+            configs = expand_grid(json.load(f))
+    run_engine_backtests(configs, args.catalog, args.start, args.end, args.synthetic_days, args.output)
+
+
+if __name__ == "__main__":
+    main()
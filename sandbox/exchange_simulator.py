@@ -0,0 +1,736 @@
+"""
+Local Binance USDT-M futures simulator for accelerated sandbox runs
+Implements the REST/WebSocket subset the Nautilus Binance adapter uses, driven by
+recorded or synthetic 1-minute bars under a simulated clock
+"""
+
+import asyncio
+import itertools
+import json
+import os
+import time
+import urllib.parse
+from collections import Counter, defaultdict, deque
+
+import numpy as np
+
+from sandbox.sim_clock import SimClock
+from sandbox.websocket import OP_CLOSE, OP_PING, OP_PONG, OP_TEXT, encode_frame, handshake_response, read_frame
+
+
+# (price precision, tick size, quantity precision, step size)
+SYMBOL_SPECS = {
+    'BTCUSDT': (1, '0.1', 3, '0.001'),
+    'ETHUSDT': (2, '0.01', 3, '0.001'),
+}
+DEFAULT_SPEC = (2, '0.01', 3, '0.001')
+
+PERPETUAL_DELIVERY_MS = 4133404800000
+
+
+class MarketData:
+    """Aligned 1-minute OHLCV arrays per symbol"""
+
+    def __init__(self, open_times_ms, bars):
+        self.open_times_ms = np.asarray(open_times_ms, dtype=np.int64)
+        self.bars = bars  # symbol -> {'open','high','low','close','volume'} float64 arrays
+
+    @property
+    def symbols(self):
+        return list(self.bars)
+
+    def __len__(self):
+        return len(self.open_times_ms)
+
+    @classmethod
+    def synthetic(cls, days=7, start='2024-01-01', symbols=('BTCUSDT', 'ETHUSDT'), seed=42):
+        """Correlated random walks with realistic minute volatility"""
+        rng = np.random.default_rng(seed)
+        n = int(days * 1440)
+        start_ms = int(np.datetime64(start, 'ms').astype(np.int64))
+        common = rng.normal(0, 0.0006, n)
+        base_prices = {'BTCUSDT': 40000.0, 'ETHUSDT': 2500.0}
+        bars = {}
+        for symbol in symbols:
+            returns = 0.85 * common + np.sqrt(1 - 0.85 ** 2) * rng.normal(0, 0.0006, n)
+            close = base_prices.get(symbol, 100.0) * np.exp(np.cumsum(returns))
+            open_ = np.concatenate([[close[0]], close[:-1]])
+            wick = np.abs(rng.normal(0, 0.0003, n))
+            bars[symbol] = {
+                'open': open_,
+                'high': np.maximum(open_, close) * (1 + wick),
+                'low': np.minimum(open_, close) * (1 - wick),
+                'close': close,
+                'volume': rng.uniform(50, 500, n),
+            }
+        return cls(start_ms + np.arange(n, dtype=np.int64) * 60_000, bars)
+
+    @classmethod
+    def from_recording(cls, session_dir):
+        """Bars recorded by storage.recorder.MarketDataRecorder"""
+        from storage.columnar import read_columnar
+
+        table = read_columnar(os.path.join(session_dir, "bars.arrow")).to_pandas()
+        table['symbol'] = table['bar_type'].str.split('.').str[0].str.replace('-PERP', '', regex=False)
+        table['open_ms'] = table['ts_event'] // 1_000_000 - 60_000
+        table = table.drop_duplicates(['symbol', 'open_ms'], keep='last')
+        fields = ['open', 'high', 'low', 'close', 'volume']
+        wide = table.pivot(index='open_ms', columns='symbol', values=fields).dropna()
+        bars = {
+            symbol: {field: wide[(field, symbol)].to_numpy(dtype=np.float64) for field in fields}
+            for symbol in wide.columns.get_level_values(1).unique()
+        }
+        return cls(wide.index.to_numpy(dtype=np.int64), bars)
+
+
+class _Connection:
+    __slots__ = ('writer', 'streams')
+
+    def __init__(self, writer):
+        self.writer = writer
+        self.streams = set()
+
+
+class BinanceFuturesSimulator:
+    """REST + WebSocket endpoints on one local port"""
+
+    def __init__(self, market, speed=168.0, host='127.0.0.1', port=0, starting_balance=50000.0,
+                 taker_fee=0.0004, half_spread_bps=0.5, quotes_per_bar=4, warmup_bars=0):
+        self.market = market
+        self.speed = speed
+        self.host = host
+        self.port = port
+        self.taker_fee = taker_fee
+        self.half_spread = half_spread_bps / 1e4
+        self.quotes_per_bar = quotes_per_bar
+        self.warmup_bars = warmup_bars
+
+        self.clock = SimClock(market.open_times_ms[warmup_bars] * 1_000_000, speed)
+        self.server = None
+        self.finished = asyncio.Event()
+        self._market_task = None
+
+        # Venue state
+        self.wallet = float(starting_balance)
+        self.positions = {s: {'amt': 0.0, 'entry': 0.0} for s in market.symbols}
+        self.quotes = {}  # symbol -> (bid, ask, mid)
+        self.orders = {}  # orderId -> order dict
+        self.trades = []
+        self.listen_keys = set()
+        self._order_ids = itertools.count(1)
+        self._trade_ids = itertools.count(1)
+        self._update_ids = itertools.count(1)
+        self.bar_index = warmup_bars - 1
+
+        # Connections by stream name
+        self.subscribers = defaultdict(set)
+        self._writers = set()
+
+        # Metrics
+        self.requests = Counter()
+        self.unknown_requests = Counter()
+        self.ws_messages_sent = 0
+        self.bars_published = 0
+        self.order_latency_us = deque(maxlen=100_000)  # Request received -> fill pushed
+
+    # -- Lifecycle -----------------------------------------------------------------------------
+
+    @property
+    def base_url_http(self):
+        return f"http://{self.host}:{self.port}"
+
+    @property
+    def base_url_ws(self):
+        return f"ws://{self.host}:{self.port}"
+
+    async def start(self):
+        self.server = await asyncio.start_server(self._on_connection, self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+        self._prime_quotes(max(self.warmup_bars - 1, 0))
+        self.clock = SimClock(self.market.open_times_ms[self.warmup_bars] * 1_000_000, self.speed)
+        self._market_task = asyncio.get_running_loop().create_task(self._run_market())
+        return self
+
+    async def stop(self):
+        if self._market_task:
+            self._market_task.cancel()
+        if self.server:
+            self.server.close()
+            for writer in list(self._writers):
+                writer.close()
+            await self.server.wait_closed()
+        await asyncio.sleep(0)  # Let the connection handlers observe the close
+
+    @property
+    def sim_progress(self):
+        return (self.bar_index + 1 - self.warmup_bars) / max(1, len(self.market) - self.warmup_bars)
+
+    # -- Market data ---------------------------------------------------------------------------
+
+    def _spec(self, symbol):
+        return SYMBOL_SPECS.get(symbol, DEFAULT_SPEC)
+
+    def _fmt_price(self, symbol, price):
+        return f"{price:.{self._spec(symbol)[0]}f}"
+
+    def _prime_quotes(self, k):
+        for symbol, bars in self.market.bars.items():
+            self._set_quote(symbol, bars['close'][k], publish=False)
+
+    def _set_quote(self, symbol, mid, ts_ms=None, publish=True):
+        precision = self._spec(symbol)[0]
+        tick = 10.0 ** -precision
+        bid = round(mid * (1 - self.half_spread), precision)
+        ask = max(round(mid * (1 + self.half_spread), precision), bid + tick)
+        self.quotes[symbol] = (bid, ask, mid)
+        if publish:
+            ts_ms = ts_ms or self.clock.now_ms()
+            self._publish(f"{symbol.lower()}@bookTicker", {
+                'e': 'bookTicker', 'u': next(self._update_ids), 'E': ts_ms, 'T': ts_ms, 's': symbol,
+                'b': self._fmt_price(symbol, bid), 'B': '1.000',
+                'a': self._fmt_price(symbol, ask), 'A': '1.000',
+            })
+
+    async def _run_market(self):
+        n_quotes = self.quotes_per_bar
+        for k in range(self.warmup_bars, len(self.market)):
+            open_ms = int(self.market.open_times_ms[k])
+            close_ms = open_ms + 60_000
+
+            # Intrabar quotes along O -> L/H -> H/L -> C
+            for q in range(n_quotes):
+                t_ms = open_ms + (q + 1) * 60_000 // (n_quotes + 1)
+                await self.clock.sleep_until(t_ms * 1_000_000)
+                for symbol, bars in self.market.bars.items():
+                    o, h, l, c = bars['open'][k], bars['high'][k], bars['low'][k], bars['close'][k]
+                    path = (o, l, h, c) if c >= o else (o, h, l, c)
+                    self._set_quote(symbol, path[min(3, q * 4 // n_quotes)], t_ms)
+
+            await self.clock.sleep_until(close_ms * 1_000_000)
+            for symbol, bars in self.market.bars.items():
+                self._set_quote(symbol, bars['close'][k], close_ms)
+                self._publish(f"{symbol.lower()}@kline_1m", self._kline_event(symbol, k, close_ms))
+            self.bar_index = k
+            self.bars_published += 1
+            await self._drain_all()
+        self.finished.set()
+
+    def _kline_event(self, symbol, k, event_ms):
+        bars = self.market.bars[symbol]
+        open_ms = int(self.market.open_times_ms[k])
+        fmt = lambda field: self._fmt_price(symbol, bars[field][k])
+        volume = f"{bars['volume'][k]:.3f}"
+        return {
+            'e': 'kline', 'E': event_ms, 's': symbol,
+            'k': {
+                't': open_ms, 'T': open_ms + 59_999, 's': symbol, 'i': '1m', 'f': 0, 'L': 0,
+                'o': fmt('open'), 'c': fmt('close'), 'h': fmt('high'), 'l': fmt('low'),
+                'v': volume, 'n': 1, 'x': True, 'q': '0', 'V': '0', 'Q': '0', 'B': '0',
+            },
+        }
+
+    def _kline_rows(self, symbol, start_ms=None, end_ms=None, limit=500):
+        bars = self.market.bars[symbol]
+        times = self.market.open_times_ms
+        available = self.bar_index + 1  # Nothing from the simulated future
+        lo = 0 if start_ms is None else int(np.searchsorted(times[:available], start_ms, 'left'))
+        hi = available if end_ms is None else int(np.searchsorted(times[:available], end_ms, 'right'))
+        if start_ms is None:
+            lo = max(lo, hi - limit)
+        hi = min(hi, lo + limit)
+        return [
+            [int(times[k]), self._fmt_price(symbol, bars['open'][k]), self._fmt_price(symbol, bars['high'][k]),
+             self._fmt_price(symbol, bars['low'][k]), self._fmt_price(symbol, bars['close'][k]),
+             f"{bars['volume'][k]:.3f}", int(times[k]) + 59_999, '0', 1, '0', '0', '0']
+            for k in range(lo, hi)
+        ]
+
+    # -- Streams -------------------------------------------------------------------------------
+
+    def _publish(self, stream, data):
+        connections = self.subscribers.get(stream)
+        if not connections:
+            return
+        frame = encode_frame(json.dumps({'stream': stream, 'data': data}, separators=(',', ':')))
+        for conn in connections:
+            conn.writer.write(frame)
+            self.ws_messages_sent += 1
+
+    async def _drain_all(self):
+        writers = {conn.writer for conns in self.subscribers.values() for conn in conns}
+        for writer in writers:
+            try:
+                await writer.drain()
+            except ConnectionError:
+                pass
+
+    def _subscribe(self, conn, streams):
+        for stream in streams:
+            conn.streams.add(stream)
+            self.subscribers[stream].add(conn)
+
+    def _unsubscribe(self, conn, streams=None):
+        for stream in list(streams or conn.streams):
+            conn.streams.discard(stream)
+            self.subscribers[stream].discard(conn)
+
+    async def _run_websocket(self, reader, writer, path):
+        conn = _Connection(writer)
+        query = urllib.parse.parse_qs(urllib.parse.urlparse(path).query)
+        streams = [s for value in query.get('streams', []) for s in value.split('/') if s]
+        if path.startswith('/ws/'):
+            streams.append(path[len('/ws/'):])
+        self._subscribe(conn, streams)
+        try:
+            while True:
+                opcode, payload = await read_frame(reader)
+                if opcode == OP_CLOSE:
+                    writer.write(encode_frame(payload[:2], OP_CLOSE))
+                    break
+                if opcode == OP_PING:
+                    writer.write(encode_frame(payload, OP_PONG))
+                elif opcode == OP_TEXT:
+                    msg = json.loads(payload)
+                    method = msg.get('method')
+                    if method == 'SUBSCRIBE':
+                        self._subscribe(conn, msg.get('params', []))
+                        result = None
+                    elif method == 'UNSUBSCRIBE':
+                        self._unsubscribe(conn, msg.get('params', []))
+                        result = None
+                    elif method == 'LIST_SUBSCRIPTIONS':
+                        result = sorted(conn.streams)
+                    else:
+                        result = None
+                    writer.write(encode_frame(json.dumps({'result': result, 'id': msg.get('id')})))
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self._unsubscribe(conn)
+            writer.close()
+
+    # -- HTTP ----------------------------------------------------------------------------------
+
+    async def _on_connection(self, reader, writer):
+        self._writers.add(writer)
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, path, _ = request_line.decode().split(' ', 2)
+                headers = {}
+                while True:
+                    line = (await reader.readline()).decode()
+                    if line in ('\r\n', '\n', ''):
+                        break
+                    key, _, value = line.partition(':')
+                    headers[key.strip().lower()] = value.strip()
+
+                if headers.get('upgrade', '').lower() == 'websocket':
+                    writer.write(handshake_response(headers['sec-websocket-key']))
+                    await writer.drain()
+                    await self._run_websocket(reader, writer, path)
+                    return
+
+                length = int(headers.get('content-length', 0))
+                body = (await reader.readexactly(length)).decode() if length else ''
+                url = urllib.parse.urlparse(path)
+                params = dict(urllib.parse.parse_qsl(url.query))
+                params.update(urllib.parse.parse_qsl(body))
+
+                status, payload = self._route(method, url.path, params)
+                data = json.dumps(payload, separators=(',', ':')).encode()
+                writer.write(
+                    f"HTTP/1.1 {status} {'OK' if status == 200 else 'ERROR'}\r\n"
+                    "Content-Type: application/json\r\n"
+                    f"Content-Length: {len(data)}\r\n"
+                    "X-MBX-USED-WEIGHT-1M: 1\r\n"
+                    "Connection: keep-alive\r\n\r\n".encode() + data
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            self._writers.discard(writer)
+            writer.close()
+
+    def _route(self, method, path, params):
+        key = f"{method} {path}"
+        self.requests[key] += 1
+        handler = self.ROUTES.get(key)
+        if handler is None:
+            self.unknown_requests[key] += 1
+            return 404, {'code': -5000, 'msg': f"Path {path} not simulated"}
+        try:
+            return handler(self, params)
+        except KeyError as e:
+            return 400, {'code': -1102, 'msg': f"Mandatory parameter {e} was not sent"}
+
+    # -- REST handlers -------------------------------------------------------------------------
+
+    def _ping(self, params):
+        return 200, {}
+
+    def _time(self, params):
+        return 200, {'serverTime': int(time.time() * 1000)}
+
+    def _exchange_info(self, params):
+        symbols = []
+        for symbol in self.market.symbols:
+            price_precision, tick, qty_precision, step = self._spec(symbol)
+            symbols.append({
+                'symbol': symbol, 'pair': symbol, 'contractType': 'PERPETUAL',
+                'deliveryDate': PERPETUAL_DELIVERY_MS, 'onboardDate': 1569398400000, 'status': 'TRADING',
+                'maintMarginPercent': '2.5000', 'requiredMarginPercent': '5.0000',
+                'baseAsset': symbol[:-4], 'quoteAsset': 'USDT', 'marginAsset': 'USDT',
+                'pricePrecision': price_precision, 'quantityPrecision': qty_precision,
+                'baseAssetPrecision': 8, 'quotePrecision': 8,
+                'underlyingType': 'COIN', 'underlyingSubType': [], 'settlePlan': 0,
+                'triggerProtect': '0.0500', 'liquidationFee': '0.012500', 'marketTakeBound': '0.05',
+                'filters': [
+                    {'filterType': 'PRICE_FILTER', 'minPrice': tick, 'maxPrice': '4529764', 'tickSize': tick},
+                    {'filterType': 'LOT_SIZE', 'minQty': step, 'maxQty': '1000', 'stepSize': step},
+                    {'filterType': 'MARKET_LOT_SIZE', 'minQty': step, 'maxQty': '120', 'stepSize': step},
+                    {'filterType': 'MAX_NUM_ORDERS', 'limit': 200},
+                    {'filterType': 'MAX_NUM_ALGO_ORDERS', 'limit': 10},
+                    {'filterType': 'MIN_NOTIONAL', 'notional': '5'},
+                    {'filterType': 'PERCENT_PRICE', 'multiplierUp': '1.0500', 'multiplierDown': '0.9500',
+                     'multiplierDecimal': '4'},
+                ],
+                'orderTypes': ['LIMIT', 'MARKET', 'STOP', 'STOP_MARKET', 'TAKE_PROFIT',
+                               'TAKE_PROFIT_MARKET', 'TRAILING_STOP_MARKET'],
+                'timeInForce': ['GTC', 'IOC', 'FOK', 'GTX', 'GTD'],
+            })
+        return 200, {
+            'timezone': 'UTC', 'serverTime': int(time.time() * 1000),
+            'rateLimits': [
+                {'rateLimitType': 'REQUEST_WEIGHT', 'interval': 'MINUTE', 'intervalNum': 1, 'limit': 2400},
+                {'rateLimitType': 'ORDERS', 'interval': 'MINUTE', 'intervalNum': 1, 'limit': 1200},
+                {'rateLimitType': 'ORDERS', 'interval': 'SECOND', 'intervalNum': 10, 'limit': 300},
+            ],
+            'exchangeFilters': [],
+            'assets': [{'asset': 'USDT', 'marginAvailable': True, 'autoAssetExchange': '-10000'}],
+            'symbols': symbols,
+        }
+
+    def _klines(self, params):
+        return 200, self._kline_rows(
+            params['symbol'],
+            int(params['startTime']) if 'startTime' in params else None,
+            int(params['endTime']) if 'endTime' in params else None,
+            int(params.get('limit', 500)),
+        )
+
+    def _book_ticker(self, params):
+        symbols = [params['symbol']] if 'symbol' in params else self.market.symbols
+        now = self.clock.now_ms()
+        rows = [{
+            'symbol': s, 'bidPrice': self._fmt_price(s, self.quotes[s][0]), 'bidQty': '1.000',
+            'askPrice': self._fmt_price(s, self.quotes[s][1]), 'askQty': '1.000', 'time': now,
+        } for s in symbols]
+        return 200, rows[0] if 'symbol' in params else rows
+
+    def _ticker_price(self, params):
+        symbols = [params['symbol']] if 'symbol' in params else self.market.symbols
+        rows = [{'symbol': s, 'price': self._fmt_price(s, self.quotes[s][2]), 'time': self.clock.now_ms()}
+                for s in symbols]
+        return 200, rows[0] if 'symbol' in params else rows
+
+    def _listen_key(self, params):
+        key = f"simListenKey{len(self.listen_keys) + 1:04d}"
+        self.listen_keys.add(key)
+        return 200, {'listenKey': key}
+
+    def _listen_key_keepalive(self, params):
+        return 200, {}
+
+    def _unrealized(self, symbol):
+        pos = self.positions[symbol]
+        return pos['amt'] * (self.quotes[symbol][2] - pos['entry']) if pos['amt'] else 0.0
+
+    def _balance_row(self):
+        upnl = sum(self._unrealized(s) for s in self.market.symbols)
+        wallet = f"{self.wallet:.8f}"
+        return {
+            'accountAlias': 'SIM', 'asset': 'USDT', 'balance': wallet, 'walletBalance': wallet,
+            'unrealizedProfit': f"{upnl:.8f}", 'marginBalance': f"{self.wallet + upnl:.8f}",
+            'maintMargin': '0', 'initialMargin': '0', 'positionInitialMargin': '0',
+            'openOrderInitialMargin': '0', 'crossWalletBalance': wallet, 'crossUnPnl': f"{upnl:.8f}",
+            'availableBalance': wallet, 'maxWithdrawAmount': wallet, 'marginAvailable': True,
+            'updateTime': self.clock.now_ms(),
+        }
+
+    def _position_row(self, symbol):
+        pos = self.positions[symbol]
+        return {
+            'symbol': symbol, 'positionSide': 'BOTH', 'positionAmt': f"{pos['amt']:.3f}",
+            'entryPrice': f"{pos['entry']:.8f}", 'breakEvenPrice': f"{pos['entry']:.8f}",
+            'markPrice': self._fmt_price(symbol, self.quotes[symbol][2]),
+            'unRealizedProfit': f"{self._unrealized(symbol):.8f}", 'liquidationPrice': '0',
+            'isolatedMargin': '0', 'isolatedWallet': '0', 'marginType': 'cross', 'isAutoAddMargin': 'false',
+            'leverage': '20', 'maxNotionalValue': '10000000', 'notional': '0', 'marginAsset': 'USDT',
+            'initialMargin': '0', 'maintMargin': '0', 'positionInitialMargin': '0',
+            'openOrderInitialMargin': '0', 'adl': 0, 'bidNotional': '0', 'askNotional': '0',
+            'updateTime': self.clock.now_ms(),
+        }
+
+    def _account(self, params):
+        balance = self._balance_row()
+        return 200, {
+            'feeTier': 0, 'canTrade': True, 'canDeposit': True, 'canWithdraw': True,
+            'updateTime': self.clock.now_ms(), 'multiAssetsMargin': False,
+            'totalInitialMargin': '0', 'totalMaintMargin': '0',
+            'totalWalletBalance': balance['walletBalance'], 'totalUnrealizedProfit': balance['unrealizedProfit'],
+            'totalMarginBalance': balance['marginBalance'], 'totalPositionInitialMargin': '0',
+            'totalOpenOrderInitialMargin': '0', 'totalCrossWalletBalance': balance['crossWalletBalance'],
+            'totalCrossUnPnl': balance['crossUnPnl'], 'availableBalance': balance['availableBalance'],
+            'maxWithdrawAmount': balance['maxWithdrawAmount'],
+            'assets': [balance],
+            'positions': [self._position_row(s) for s in self.market.symbols],
+        }
+
+    def _balance(self, params):
+        return 200, [self._balance_row()]
+
+    def _position_risk(self, params):
+        symbols = [params['symbol']] if 'symbol' in params else self.market.symbols
+        return 200, [self._position_row(s) for s in symbols]
+
+    def _position_mode(self, params):
+        return 200, {'dualSidePosition': False}
+
+    def _symbol_config(self, params):
+        return 200, [{'symbol': s, 'marginType': 'CROSSED', 'isAutoAddMargin': False, 'leverage': 20,
+                      'maxNotionalValue': '10000000'} for s in self.market.symbols]
+
+    def _leverage(self, params):
+        return 200, {'leverage': int(params.get('leverage', 20)), 'maxNotionalValue': '10000000',
+                     'symbol': params['symbol']}
+
+    def _margin_type(self, params):
+        return 200, {'code': 200, 'msg': 'success'}
+
+    def _commission_rate(self, params):
+        return 200, {'symbol': params['symbol'], 'makerCommissionRate': '0.000200',
+                     'takerCommissionRate': f"{self.taker_fee:.6f}"}
+
+    # -- Orders --------------------------------------------------------------------------------
+
+    def _order_row(self, order):
+        return {k: v for k, v in order.items() if not k.startswith('_')}
+
+    def _find_order(self, params):
+        if 'orderId' in params:
+            return self.orders.get(int(params['orderId']))
+        client_id = params.get('origClientOrderId')
+        return next((o for o in self.orders.values() if o['clientOrderId'] == client_id), None)
+
+    def _new_order(self, params):
+        t_recv = time.perf_counter()
+        symbol = params['symbol']
+        if symbol not in self.positions:
+            return 400, {'code': -1121, 'msg': 'Invalid symbol.'}
+        order_id = next(self._order_ids)
+        now = self.clock.now_ms()
+        order_type = params['type']
+        order = {
+            'orderId': order_id, 'symbol': symbol, 'status': 'NEW',
+            'clientOrderId': params.get('newClientOrderId') or f"sim{order_id}",
+            'price': params.get('price', '0'), 'avgPrice': '0', 'origQty': params['quantity'],
+            'executedQty': '0', 'cumQuote': '0', 'timeInForce': params.get('timeInForce', 'GTC'),
+            'type': order_type, 'reduceOnly': params.get('reduceOnly', 'false') == 'true',
+            'closePosition': False, 'side': params['side'], 'positionSide': params.get('positionSide', 'BOTH'),
+            'stopPrice': params.get('stopPrice', '0'), 'workingType': 'CONTRACT_PRICE', 'priceProtect': False,
+            'origType': order_type, 'priceMatch': 'NONE', 'selfTradePreventionMode': 'NONE',
+            'goodTillDate': 0, 'time': now, 'updateTime': now, '_t_recv': t_recv,
+        }
+        self.orders[order_id] = order
+        self._push_order_update(order, 'NEW')
+
+        bid, ask, _ = self.quotes[symbol]
+        if order_type == 'MARKET':
+            self._fill(order, ask if order['side'] == 'BUY' else bid)
+        elif order_type == 'LIMIT':
+            self._match_limit(order)
+        return 200, self._order_row(order)
+
+    def _batch_orders(self, params):
+        results = []
+        for order_params in json.loads(params['batchOrders']):
+            status, payload = self._new_order({k: str(v) for k, v in order_params.items()})
+            results.append(payload)
+        return 200, results
+
+    def _match_limit(self, order):
+        bid, ask, _ = self.quotes[order['symbol']]
+        price = float(order['price'])
+        if order['side'] == 'BUY' and price >= ask:
+            self._fill(order, ask)
+        elif order['side'] == 'SELL' and price <= bid:
+            self._fill(order, bid)
+
+    def _fill(self, order, price):
+        symbol = order['symbol']
+        qty = float(order['origQty'])
+        signed = qty if order['side'] == 'BUY' else -qty
+        pos = self.positions[symbol]
+
+        realized = 0.0
+        if pos['amt'] * signed < 0:
+            closing = min(abs(signed), abs(pos['amt']))
+            realized = closing * (price - pos['entry']) * (1 if pos['amt'] > 0 else -1)
+            new_amt = pos['amt'] + signed
+            if abs(new_amt) < 1e-12:
+                pos['entry'] = 0.0
+            elif new_amt * pos['amt'] < 0:
+                pos['entry'] = price
+            pos['amt'] = 0.0 if abs(new_amt) < 1e-12 else new_amt
+        else:
+            new_amt = pos['amt'] + signed
+            pos['entry'] = (pos['entry'] * abs(pos['amt']) + price * qty) / abs(new_amt)
+            pos['amt'] = new_amt
+
+        fee = qty * price * self.taker_fee
+        self.wallet += realized - fee
+
+        now = self.clock.now_ms()
+        trade_id = next(self._trade_ids)
+        order.update({
+            'status': 'FILLED', 'executedQty': order['origQty'], 'avgPrice': self._fmt_price(symbol, price),
+            'cumQuote': f"{qty * price:.8f}", 'updateTime': now,
+        })
+        self.trades.append({
+            'symbol': symbol, 'id': trade_id, 'orderId': order['orderId'], 'side': order['side'],
+            'price': self._fmt_price(symbol, price), 'qty': order['origQty'], 'realizedPnl': f"{realized:.8f}",
+            'marginAsset': 'USDT', 'quoteQty': f"{qty * price:.8f}", 'commission': f"{fee:.8f}",
+            'commissionAsset': 'USDT', 'time': now, 'positionSide': 'BOTH', 'buyer': order['side'] == 'BUY',
+            'maker': False,
+        })
+        self._push_order_update(order, 'TRADE', last_qty=order['origQty'], last_px=price, fee=fee,
+                                realized=realized, trade_id=trade_id)
+        self._push_account_update(symbol)
+        self.order_latency_us.append((time.perf_counter() - order['_t_recv']) * 1e6)
+
+    def _cancel_order(self, params):
+        order = self._find_order(params)
+        if order is None:
+            return 400, {'code': -2011, 'msg': 'Unknown order sent.'}
+        if order['status'] == 'NEW':
+            order['status'] = 'CANCELED'
+            order['updateTime'] = self.clock.now_ms()
+            self._push_order_update(order, 'CANCELED')
+        return 200, self._order_row(order)
+
+    def _cancel_all(self, params):
+        for order in list(self.orders.values()):
+            if order['symbol'] == params['symbol'] and order['status'] == 'NEW':
+                self._cancel_order({'orderId': order['orderId']})
+        return 200, {'code': 200, 'msg': 'The operation of cancel all open order is done.'}
+
+    def _query_order(self, params):
+        order = self._find_order(params)
+        if order is None:
+            return 400, {'code': -2013, 'msg': 'Order does not exist.'}
+        return 200, self._order_row(order)
+
+    def _open_orders(self, params):
+        symbol = params.get('symbol')
+        return 200, [self._order_row(o) for o in self.orders.values()
+                     if o['status'] == 'NEW' and (symbol is None or o['symbol'] == symbol)]
+
+    def _all_orders(self, params):
+        symbol = params.get('symbol')
+        rows = [self._order_row(o) for o in self.orders.values() if symbol is None or o['symbol'] == symbol]
+        return 200, rows[-int(params.get('limit', 500)):]
+
+    def _user_trades(self, params):
+        symbol = params.get('symbol')
+        rows = [t for t in self.trades if symbol is None or t['symbol'] == symbol]
+        return 200, rows[-int(params.get('limit', 500)):]
+
+    # -- User data stream ----------------------------------------------------------------------
+
+    def _push_user(self, data):
+        for key in self.listen_keys:
+            self._publish(key, data)
+
+    def _push_order_update(self, order, execution_type, last_qty='0', last_px=0.0, fee=None, realized=0.0,
+                           trade_id=0):
+        now = self.clock.now_ms()
+        symbol = order['symbol']
+        data = {
+            's': symbol, 'c': order['clientOrderId'], 'S': order['side'], 'o': order['type'],
+            'f': order['timeInForce'], 'q': order['origQty'], 'p': order['price'], 'ap': order['avgPrice'],
+            'sp': order['stopPrice'], 'x': execution_type, 'X': order['status'], 'i': order['orderId'],
+            'l': last_qty, 'z': order['executedQty'], 'L': self._fmt_price(symbol, last_px) if last_px else '0',
+            'T': now, 't': trade_id, 'b': '0', 'a': '0', 'm': False, 'R': order['reduceOnly'],
+            'wt': 'CONTRACT_PRICE', 'ot': order['origType'], 'ps': 'BOTH', 'cp': False,
+            'pP': False, 'si': 0, 'ss': 0, 'rp': f"{realized:.8f}", 'gtd': 0, 'V': 'NONE',
+        }
+        if fee is not None:
+            data['N'] = 'USDT'
+            data['n'] = f"{fee:.8f}"
+        self._push_user({'e': 'ORDER_TRADE_UPDATE', 'E': now, 'T': now, 'o': data})
+
+    def _push_account_update(self, symbol):
+        now = self.clock.now_ms()
+        pos = self.positions[symbol]
+        self._push_user({
+            'e': 'ACCOUNT_UPDATE', 'E': now, 'T': now,
+            'a': {
+                'm': 'ORDER',
+                'B': [{'a': 'USDT', 'wb': f"{self.wallet:.8f}", 'cw': f"{self.wallet:.8f}", 'bc': '0'}],
+                'P': [{'s': symbol, 'pa': f"{pos['amt']:.3f}", 'ep': f"{pos['entry']:.8f}", 'bep': '0',
+                       'cr': '0', 'up': f"{self._unrealized(symbol):.8f}", 'mt': 'cross', 'iw': '0',
+                       'ps': 'BOTH'}],
+            },
+        })
+
+    def metrics(self):
+        latencies = sorted(self.order_latency_us)
+        pct = lambda p: latencies[min(len(latencies) - 1, int(p * len(latencies)))] if latencies else None
+        return {
+            'sim_time': int(self.clock.now_ns()),
+            'bars_published': self.bars_published,
+            'progress': self.sim_progress,
+            'ws_messages_sent': self.ws_messages_sent,
+            'orders': len(self.orders),
+            'fills': len(self.trades),
+            'venue_order_latency_us_p50': pct(0.50),
+            'venue_order_latency_us_p99': pct(0.99),
+            'wallet_balance': self.wallet,
+            'unknown_requests': dict(self.unknown_requests),
+        }
+
+    ROUTES = {
+        'GET /fapi/v1/ping': _ping,
+        'GET /fapi/v1/time': _time,
+        'GET /fapi/v1/exchangeInfo': _exchange_info,
+        'GET /fapi/v1/klines': _klines,
+        'GET /fapi/v1/ticker/bookTicker': _book_ticker,
+        'GET /fapi/v1/ticker/price': _ticker_price,
+        'POST /fapi/v1/listenKey': _listen_key,
+        'PUT /fapi/v1/listenKey': _listen_key_keepalive,
+        'DELETE /fapi/v1/listenKey': _listen_key_keepalive,
+        'GET /fapi/v2/account': _account,
+        'GET /fapi/v3/account': _account,
+        'GET /fapi/v2/balance': _balance,
+        'GET /fapi/v3/balance': _balance,
+        'GET /fapi/v2/positionRisk': _position_risk,
+        'GET /fapi/v3/positionRisk': _position_risk,
+        'GET /fapi/v1/positionSide/dual': _position_mode,
+        'GET /fapi/v1/symbolConfig': _symbol_config,
+        'POST /fapi/v1/leverage': _leverage,
+        'POST /fapi/v1/marginType': _margin_type,
+        'GET /fapi/v1/commissionRate': _commission_rate,
+        'POST /fapi/v1/order': _new_order,
+        'POST /fapi/v1/batchOrders': _batch_orders,
+        'GET /fapi/v1/order': _query_order,
+        'DELETE /fapi/v1/order': _cancel_order,
+        'DELETE /fapi/v1/allOpenOrders': _cancel_all,
+        'GET /fapi/v1/openOrders': _open_orders,
+        'GET /fapi/v1/allOrders': _all_orders,
+        'GET /fapi/v1/userTrades': _user_trades,
+    }
@@ -0,0 +1,317 @@
+"""
+Local Kite Connect stand-in: REST (instruments dump, orders, margins) and the binary ticker
+WebSocket on one port, for adapter tests without a Kite session
+
+    python -m sandbox.kite_stub --port 8765 --interval 0.25
+
+Prices follow a random walk per instrument; every `interval` seconds each connection gets one
+binary frame with a packet per subscribed token in its mode (1-byte heartbeats when idle).
+Market orders fill at the last price and limit orders when it crosses them, with order
+postbacks pushed as text messages to every ticker connection.
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import time
+import urllib.parse
+from collections import Counter
+
+import numpy as np
+
+from adapters.kite.decoder import HEARTBEAT, pack_frame, pack_full, pack_ltp, pack_quote
+from sandbox.websocket import OP_BINARY, OP_CLOSE, OP_PING, OP_PONG, OP_TEXT, encode_frame, handshake_response, read_frame
+
+
+DEFAULT_INSTRUMENTS = (
+    # instrument_token, exchange, tradingsymbol, price
+    (408065, 'NSE', 'INFY', 1500.0),
+    (738561, 'NSE', 'RELIANCE', 2500.0),
+    (341249, 'NSE', 'HDFCBANK', 1650.0),
+    (2953217, 'NSE', 'TCS', 3700.0),
+)
+CSV_HEADER = 'instrument_token,exchange_token,tradingsymbol,name,last_price,expiry,strike,tick_size,lot_size,' \
+             'instrument_type,segment,exchange'
+
+
+class _Ticker:
+    __slots__ = ('writer', 'modes')
+
+    def __init__(self, writer):
+        self.writer = writer
+        self.modes = {}  # token -> mode
+
+
+class KiteStubServer:
+    def __init__(self, instruments=DEFAULT_INSTRUMENTS, interval=0.25, host='127.0.0.1', port=0,
+                 api_key='stub', access_token='stub', balance=1_000_000.0, seed=7):
+        self.host = host
+        self.port = port
+        self.interval = interval
+        self.api_key = api_key
+        self.access_token = access_token
+        self.balance = balance
+        self.rng = np.random.default_rng(seed)
+        # Real tokens: the low byte is the exchange segment (1 = NSE) the price divisor depends on
+        self.instruments = {token: (exchange, symbol) for token, exchange, symbol, _ in instruments}
+        self.by_symbol = {value: token for token, value in self.instruments.items()}
+        self.prices = {token: price for token, _, _, price in instruments}
+        self.volume = dict.fromkeys(self.instruments, 0)
+        self.last_qty = dict.fromkeys(self.instruments, 0)
+
+        self.orders = {}
+        self._order_ids = itertools.count(240101000000001)
+        self.tickers = set()
+        self.server = None
+        self._task = None
+        self._writers = set()
+
+        # Metrics
+        self.requests = Counter()
+        self.frames_sent = 0
+        self.packets_sent = 0
+
+    @property
+    def base_url_http(self):
+        return f"http://{self.host}:{self.port}"
+
+    @property
+    def base_url_ws(self):
+        return f"ws://{self.host}:{self.port}"
+
+    async def start(self):
+        self.server = await asyncio.start_server(self._on_connection, self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+        self._task = asyncio.get_running_loop().create_task(self._run_ticks())
+        return self
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+        if self.server:
+            self.server.close()
+            for writer in list(self._writers):
+                writer.close()
+            await self.server.wait_closed()
+        await asyncio.sleep(0)
+
+    # -- Market --------------------------------------------------------------------------------
+
+    def _step(self):
+        for token, price in self.prices.items():
+            price *= float(np.exp(self.rng.normal(0, 0.0004)))
+            self.prices[token] = round(price / 0.05) * 0.05
+            if self.rng.random() < 0.7:
+                qty = int(self.rng.integers(1, 200))
+                self.last_qty[token] = qty
+                self.volume[token] += qty
+        for order in list(self.orders.values()):
+            if order['status'] == 'OPEN':
+                self._match(order)
+
+    def packet(self, token, mode):
+        ltp = self.prices[token]
+        if mode == 'ltp':
+            return pack_ltp(token, ltp)
+        volume, last_qty = self.volume[token], self.last_qty[token]
+        fields = (token, ltp, last_qty, ltp, volume, volume // 2, volume // 2, ltp, ltp * 1.01, ltp * 0.99, ltp * 0.998)
+        if mode == 'quote':
+            return pack_quote(*fields)
+        now = int(time.time())
+        bids = [(int(self.rng.integers(1, 500)), ltp - 0.05 * (i + 1), int(self.rng.integers(1, 20))) for i in range(5)]
+        asks = [(int(self.rng.integers(1, 500)), ltp + 0.05 * (i + 1), int(self.rng.integers(1, 20))) for i in range(5)]
+        return pack_full(*fields, now, 0, 0, 0, now, bids, asks)
+
+    async def _run_ticks(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            self._step()
+            for ticker in list(self.tickers):
+                packets = [self.packet(token, mode) for token, mode in ticker.modes.items() if token in self.prices]
+                frame = pack_frame(packets) if packets else HEARTBEAT
+                ticker.writer.write(encode_frame(frame, OP_BINARY))
+                self.frames_sent += 1
+                self.packets_sent += len(packets)
+
+    # -- Orders --------------------------------------------------------------------------------
+
+    def _postback(self, order):
+        message = encode_frame(json.dumps({'type': 'order', 'data': order}, separators=(',', ':')))
+        for ticker in list(self.tickers):
+            ticker.writer.write(message)
+
+    def _match(self, order):
+        price = self.prices[order['instrument_token']]
+        if order['order_type'] == 'LIMIT':
+            limit = float(order['price'])
+            if (order['transaction_type'] == 'BUY' and price > limit) or \
+                    (order['transaction_type'] == 'SELL' and price < limit):
+                return
+            price = limit
+        order.update(status='COMPLETE', filled_quantity=order['quantity'], pending_quantity=0,
+                     average_price=round(price, 2), exchange_timestamp=time.strftime('%Y-%m-%d %H:%M:%S'))
+        self._postback(order)
+
+    def _place(self, params):
+        token = self.by_symbol.get((params.get('exchange'), params.get('tradingsymbol')))
+        if token is None:
+            return 400, {'status': 'error', 'error_type': 'InputException', 'message': 'Invalid `tradingsymbol`.'}
+        quantity = int(params.get('quantity', 0))
+        if quantity <= 0 or params.get('order_type') not in ('MARKET', 'LIMIT'):
+            return 400, {'status': 'error', 'error_type': 'InputException', 'message': 'Invalid order parameters.'}
+        order_id = str(next(self._order_ids))
+        order = {
+            'order_id': order_id, 'instrument_token': token, 'exchange': params['exchange'],
+            'tradingsymbol': params['tradingsymbol'], 'transaction_type': params.get('transaction_type'),
+            'order_type': params['order_type'], 'product': params.get('product'), 'quantity': quantity,
+            'price': float(params.get('price') or 0), 'validity': params.get('validity', 'DAY'),
+            'tag': params.get('tag'), 'status': 'OPEN', 'filled_quantity': 0, 'pending_quantity': quantity,
+            'average_price': 0.0, 'status_message': None,
+        }
+        self.orders[order_id] = order
+        self._postback(order)
+        if order['order_type'] == 'MARKET':
+            self._match(order)
+        return 200, {'status': 'success', 'data': {'order_id': order_id}}
+
+    def _cancel(self, order_id):
+        order = self.orders.get(order_id)
+        if order is None or order['status'] != 'OPEN':
+            return 400, {'status': 'error', 'error_type': 'InputException', 'message': 'Order cannot be cancelled.'}
+        order['status'] = 'CANCELLED'
+        self._postback(order)
+        return 200, {'status': 'success', 'data': {'order_id': order_id}}
+
+    def instruments_csv(self, exchange=None):
+        rows = [CSV_HEADER]
+        for token, (ex, symbol) in self.instruments.items():
+            if exchange in (None, ex):
+                rows.append(f"{token},{token >> 8},{symbol},{symbol},{self.prices[token]:.2f},,0,0.05,1,EQ,{ex},{ex}")
+        return '\n'.join(rows) + '\n'
+
+    def _route(self, method, path, params, headers):
+        self.requests[f"{method} {path.rsplit('/', 1)[0] if path.startswith('/orders/regular/') else path}"] += 1
+        if headers.get('authorization') != f"token {self.api_key}:{self.access_token}":
+            return 403, {'status': 'error', 'error_type': 'TokenException', 'message': 'Invalid access token.'}
+        if method == 'GET' and path.startswith('/instruments'):
+            exchange = path[len('/instruments/'):] or None
+            return 200, self.instruments_csv(exchange)
+        if method == 'POST' and path == '/orders/regular':
+            return self._place(params)
+        if method == 'DELETE' and path.startswith('/orders/regular/'):
+            return self._cancel(path.rsplit('/', 1)[1])
+        if method == 'GET' and path == '/orders':
+            return 200, {'status': 'success', 'data': list(self.orders.values())}
+        if method == 'GET' and path.startswith('/user/margins'):
+            return 200, {'status': 'success', 'data': {'enabled': True, 'net': self.balance,
+                                                       'utilised': {'debits': 0.0}}}
+        return 404, {'status': 'error', 'error_type': 'GeneralException', 'message': f'No route {method} {path}'}
+
+    # -- Connections ---------------------------------------------------------------------------
+
+    async def _on_connection(self, reader, writer):
+        self._writers.add(writer)
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, path, _ = request_line.decode().split(' ', 2)
+                headers = {}
+                while True:
+                    line = (await reader.readline()).decode()
+                    if line in ('\r\n', '\n', ''):
+                        break
+                    key, _, value = line.partition(':')
+                    headers[key.strip().lower()] = value.strip()
+
+                url = urllib.parse.urlparse(path)
+                if headers.get('upgrade', '').lower() == 'websocket':
+                    query = dict(urllib.parse.parse_qsl(url.query))
+                    if (query.get('api_key'), query.get('access_token')) != (self.api_key, self.access_token):
+                        writer.write(b"HTTP/1.1 403 Forbidden\r\nContent-Length: 0\r\n\r\n")
+                        await writer.drain()
+                        return
+                    writer.write(handshake_response(headers['sec-websocket-key']))
+                    await writer.drain()
+                    await self._run_ticker(reader, writer)
+                    return
+
+                length = int(headers.get('content-length', 0))
+                body = (await reader.readexactly(length)).decode() if length else ''
+                params = dict(urllib.parse.parse_qsl(url.query))
+                params.update(urllib.parse.parse_qsl(body))
+                status, payload = self._route(method, url.path, params, headers)
+                if isinstance(payload, str):
+                    data, content_type = payload.encode(), 'text/csv'
+                else:
+                    data, content_type = json.dumps(payload, separators=(',', ':')).encode(), 'application/json'
+                writer.write(
+                    f"HTTP/1.1 {status} {'OK' if status == 200 else 'ERROR'}\r\n"
+                    f"Content-Type: {content_type}\r\n"
+                    f"Content-Length: {len(data)}\r\n"
+                    "Connection: keep-alive\r\n\r\n".encode() + data
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            self._writers.discard(writer)
+            writer.close()
+
+    async def _run_ticker(self, reader, writer):
+        ticker = _Ticker(writer)
+        self.tickers.add(ticker)
+        try:
+            while True:
+                opcode, payload = await read_frame(reader)
+                if opcode == OP_CLOSE:
+                    writer.write(encode_frame(payload[:2], OP_CLOSE))
+                    break
+                if opcode == OP_PING:
+                    writer.write(encode_frame(payload, OP_PONG))
+                elif opcode == OP_TEXT:
+                    message = json.loads(payload)
+                    action, value = message.get('a'), message.get('v')
+                    if action == 'subscribe':
+                        for token in value:
+                            ticker.modes.setdefault(int(token), 'quote')  # Kite's default mode
+                    elif action == 'unsubscribe':
+                        for token in value:
+                            ticker.modes.pop(int(token), None)
+                    elif action == 'mode':
+                        mode, tokens = value
+                        for token in tokens:
+                            if int(token) in ticker.modes:
+                                ticker.modes[int(token)] = mode
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self.tickers.discard(ticker)
+            writer.close()
+
+
+async def _serve(args):
+    server = await KiteStubServer(interval=args.interval, port=args.port).start()
+    print(f"Kite stub on {server.base_url_http} (ws: {server.base_url_ws}), api_key/access_token 'stub'")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Local Kite Connect REST + ticker stand-in')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--interval', type=float, default=0.25, help='Seconds between tick frames')
+    args = parser.parse_args()
+    try:
+        asyncio.run(_serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+"""
+Simulated market clock running at a multiple of wall-clock speed
+"""
+
+import asyncio
+import time
+
+
+class SimClock:
+    """Maps wall time onto simulated time: sim = start + elapsed * speed"""
+
+    def __init__(self, start_ns, speed=1.0):
+        self.start_ns = int(start_ns)
+        self.speed = float(speed)
+        self._wall_start = time.perf_counter()
+
+    def now_ns(self):
+        return self.start_ns + int((time.perf_counter() - self._wall_start) * self.speed * 1e9)
+
+    def now_ms(self):
+        return self.now_ns() // 1_000_000
+
+    def wall_seconds_until(self, sim_ns):
+        return max(0.0, (sim_ns - self.now_ns()) / 1e9 / self.speed)
+
+    async def sleep_until(self, sim_ns):
+        delay = self.wall_seconds_until(sim_ns)
+        if delay > 0:
+            await asyncio.sleep(delay)
@@ -0,0 +1,235 @@
+"""
+Accelerated sandbox soak test
+Runs the live TradingNode (Binance adapter, pairs strategy, recorder) against the local
+exchange simulator with market time compressed, sampling memory, event-loop lag and
+order latency to surface leaks and drift that only show up over days of trading
+
+    python -m sandbox.soak_test --days 7 --speed 240
+    python -m sandbox.soak_test --data ./data/recordings/session-... --speed 120
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import os
+import resource
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+
+from sandbox.exchange_simulator import BinanceFuturesSimulator, MarketData
+from telemetry.metrics import REGISTRY
+
+SCHEDULER_LABELS = {"client": "BINANCE"}
+
+
+def rss_mb():
+    """Current resident set size (falls back to peak RSS off Linux)"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1e6
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1e3
+
+
+class LoopLagProbe:
+    """Measures event-loop lag as the oversleep of a short periodic sleep"""
+
+    def __init__(self, interval_s=0.05):
+        self.interval_s = interval_s
+        self.lags_ms = []
+        self._task = None
+
+    def start(self):
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    def stop(self):
+        if self._task:
+            self._task.cancel()
+
+    async def _run(self):
+        while True:
+            t0 = time.perf_counter()
+            await asyncio.sleep(self.interval_s)
+            self.lags_ms.append(max(0.0, (time.perf_counter() - t0 - self.interval_s) * 1e3))
+
+    def drain(self):
+        lags, self.lags_ms = self.lags_ms, []
+        return lags
+
+
+class SoakMonitor:
+    def __init__(self, node, simulator, sample_interval_s=5.0):
+        self.node = node
+        self.simulator = simulator
+        self.sample_interval_s = sample_interval_s
+        self.probe = LoopLagProbe()
+        self.samples = []
+        self.all_lags_ms = []
+        self._wall_start = None
+
+    def _strategies(self):
+        return list(self.node.trader.strategies())
+
+    def sample(self):
+        lags = self.probe.drain()
+        self.all_lags_ms.extend(lags)
+        sim = self.simulator.metrics()
+        cache = self.node.cache
+        row = {
+            'wall_s': time.perf_counter() - self._wall_start,
+            'sim_time': datetime.fromtimestamp(sim['sim_time'] / 1e9, timezone.utc).isoformat(),
+            'sim_days': self.simulator.bars_published / 1440,
+            'rss_mb': rss_mb(),
+            'gc_objects': len(gc.get_objects()),
+            'loop_lag_ms_max': max(lags, default=0.0),
+            'loop_lag_ms_p99': float(np.percentile(lags, 99)) if lags else 0.0,
+            'cache_orders': len(cache.orders()),
+            'cache_positions': len(cache.positions()),
+            'venue_orders': sim['orders'],
+            'venue_fills': sim['fills'],
+            'venue_order_latency_us_p99': sim['venue_order_latency_us_p99'],
+            'wallet_balance': sim['wallet_balance'],
+            # Set by the exec client's OrderScheduler (adapters.binance.execution)
+            'scheduler_queue_depth': REGISTRY.gauge("order_scheduler_queue_depth", labels=SCHEDULER_LABELS).value,
+            'scheduler_max_queue_depth': REGISTRY.gauge("order_scheduler_max_queue_depth", labels=SCHEDULER_LABELS).value,
+        }
+        for strategy in self._strategies():
+            if hasattr(strategy, 'leg_stats'):
+                row['leg_stats'] = strategy.leg_stats.summary()
+        self.samples.append(row)
+        return row
+
+    async def run(self):
+        self._wall_start = time.perf_counter()
+        self.probe.start()
+        try:
+            while True:
+                await asyncio.sleep(self.sample_interval_s)
+                row = self.sample()
+                print(f"[soak] sim day {row['sim_days']:.2f}  rss {row['rss_mb']:.1f} MB  "
+                      f"lag p99 {row['loop_lag_ms_p99']:.1f} ms  fills {row['venue_fills']}")
+        finally:
+            self.probe.stop()
+
+    def summary(self, max_rss_growth_mb_per_day=5.0):
+        # Skip the first 10% of samples: caches and buffers are still filling up
+        steady = self.samples[len(self.samples) // 10:]
+        days = np.array([s['sim_days'] for s in steady])
+        rss = np.array([s['rss_mb'] for s in steady])
+        objects = np.array([s['gc_objects'] for s in steady])
+        if len(steady) >= 2 and np.ptp(days) > 0:
+            rss_slope = float(np.polyfit(days, rss, 1)[0])
+            objects_slope = float(np.polyfit(days, objects, 1)[0])
+        else:
+            rss_slope = objects_slope = None
+        lags = np.array(self.all_lags_ms) if self.all_lags_ms else np.zeros(1)
+        sim = self.simulator.metrics()
+        return {
+            'sim_days': self.simulator.bars_published / 1440,
+            'wall_seconds': self.samples[-1]['wall_s'] if self.samples else 0.0,
+            'rss_mb_start': self.samples[0]['rss_mb'] if self.samples else None,
+            'rss_mb_end': self.samples[-1]['rss_mb'] if self.samples else None,
+            'rss_growth_mb_per_sim_day': rss_slope,
+            'gc_objects_growth_per_sim_day': objects_slope,
+            'leak_suspected': rss_slope is not None and rss_slope > max_rss_growth_mb_per_day,
+            'loop_lag_ms_p50': float(np.percentile(lags, 50)),
+            'loop_lag_ms_p99': float(np.percentile(lags, 99)),
+            'loop_lag_ms_max': float(lags.max()),
+            'venue_orders': sim['orders'],
+            'venue_fills': sim['fills'],
+            'venue_order_latency_us_p50': sim['venue_order_latency_us_p50'],
+            'venue_order_latency_us_p99': sim['venue_order_latency_us_p99'],
+            'wallet_balance': sim['wallet_balance'],
+            'leg_stats': self.samples[-1].get('leg_stats') if self.samples else None,
+            'unknown_requests': sim['unknown_requests'],
+        }
+
+
+async def _soak(market, speed, sample_interval_s, output_dir):
+    from config.live.binance_live import build_trading_node, create_live_config
+
+    simulator = await BinanceFuturesSimulator(market, speed=speed).start()
+    print(f"Simulator on {simulator.base_url_http}: {len(market) / 1440:.1f} days at {speed:g}x "
+          f"(~{len(market) * 60 / speed / 60:.0f} min wall)")
+
+    monitor = None
+    try:
+        config = create_live_config(
+            base_url_http=simulator.base_url_http,
+            base_url_ws=simulator.base_url_ws,
+            testnet=False,
+            use_redis=False,
+            log_directory=output_dir,
+            journal_dir=os.path.join(output_dir, "journal"),
+            recording_dir=os.path.join(output_dir, "recordings"),
+            catalog_dir=os.path.join(output_dir, "catalog"),
+        )
+        node = build_trading_node(config)
+        monitor = SoakMonitor(node, simulator, sample_interval_s)
+
+        loop = asyncio.get_running_loop()
+        node_task = loop.create_task(node.run_async())
+        monitor_task = loop.create_task(monitor.run())
+        finished_task = loop.create_task(simulator.finished.wait())
+        try:
+            await asyncio.wait([node_task, finished_task], return_when=asyncio.FIRST_COMPLETED)
+            monitor.sample()
+        finally:
+            monitor_task.cancel()
+            finished_task.cancel()
+            await node.stop_async()
+            try:
+                await asyncio.wait_for(node_task, timeout=30)
+            except asyncio.TimeoutError:
+                node_task.cancel()
+    finally:
+        await simulator.stop()
+    return monitor
+
+
+def run_soak(days=7, speed=240.0, data=None, sample_interval_s=5.0, output_dir='./logs'):
+    market = MarketData.from_recording(data) if data else MarketData.synthetic(days=days)
+    if days and len(market) > days * 1440:
+        n = int(days * 1440)
+        market = MarketData(market.open_times_ms[:n], {s: {k: v[:n] for k, v in b.items()}
+                                                       for s, b in market.bars.items()})
+
+    os.makedirs(output_dir, exist_ok=True)
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        monitor = loop.run_until_complete(_soak(market, speed, sample_interval_s, output_dir))
+        monitor.node.dispose()  # Strategies close their journals here, after the post-stop fills
+    finally:
+        loop.close()
+
+    summary = monitor.summary()
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    path = os.path.join(output_dir, f"soak_{stamp}.json")
+    with open(path, 'w') as f:
+        json.dump({'summary': summary, 'samples': monitor.samples}, f, indent=2, default=str)
+
+    print("\nSoak summary:")
+    for key, value in summary.items():
+        print(f"  {key}: {value}")
+    print(f"\nSaved to {path}")
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Accelerated sandbox soak test')
+    parser.add_argument('--days', type=float, default=7, help='Simulated days to run')
+    parser.add_argument('--speed', type=float, default=240.0, help='Simulated seconds per wall second')
+    parser.add_argument('--data', help='Recorded session directory (default: synthetic bars)')
+    parser.add_argument('--sample-interval', type=float, default=5.0, help='Wall seconds between samples')
+    parser.add_argument('--output-dir', default='./logs')
+    args = parser.parse_args()
+
+    run_soak(args.days, args.speed, args.data, args.sample_interval, args.output_dir)
+
+
+if __name__ == "__main__":
+    main()
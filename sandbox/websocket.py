@@ -0,0 +1,70 @@
+"""
+Minimal RFC 6455 server side for the exchange simulator (text frames, ping/pong, close)
+Kept dependency-free so the sandbox runs on a bare install
+"""
+
+import base64
+import hashlib
+import struct
+
+
+GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+OP_CONT = 0x0
+OP_TEXT = 0x1
+OP_BINARY = 0x2
+OP_CLOSE = 0x8
+OP_PING = 0x9
+OP_PONG = 0xA
+
+
+def handshake_response(key):
+    accept = base64.b64encode(hashlib.sha1((key + GUID).encode()).digest()).decode()
+    return (
+        "HTTP/1.1 101 Switching Protocols\r\n"
+        "Upgrade: websocket\r\n"
+        "Connection: Upgrade\r\n"
+        f"Sec-WebSocket-Accept: {accept}\r\n\r\n"
+    ).encode()
+
+
+def encode_frame(payload, opcode=OP_TEXT):
+    """Server frames are never masked"""
+    if isinstance(payload, str):
+        payload = payload.encode()
+    length = len(payload)
+    if length < 126:
+        header = struct.pack('!BB', 0x80 | opcode, length)
+    elif length < 1 << 16:
+        header = struct.pack('!BBH', 0x80 | opcode, 126, length)
+    else:
+        header = struct.pack('!BBQ', 0x80 | opcode, 127, length)
+    return header + payload
+
+
+async def read_frame(reader):
+    """Read one (possibly fragmented) message -> (opcode, payload bytes)"""
+    message = bytearray()
+    message_opcode = None
+    while True:
+        b1, b2 = await reader.readexactly(2)
+        fin = b1 & 0x80
+        opcode = b1 & 0x0F
+        length = b2 & 0x7F
+        if length == 126:
+            (length,) = struct.unpack('!H', await reader.readexactly(2))
+        elif length == 127:
+            (length,) = struct.unpack('!Q', await reader.readexactly(8))
+        mask = await reader.readexactly(4) if b2 & 0x80 else None
+        payload = await reader.readexactly(length)
+        if mask:
+            payload = bytes(b ^ mask[i % 4] for i, b in enumerate(payload))
+
+        if opcode >= OP_CLOSE:
+            # Control frames may arrive between fragments
+            return opcode, payload
+        if message_opcode is None:
+            message_opcode = opcode
+        message += payload
+        if fin:
+            return message_opcode, bytes(message)
@@ -0,0 +1,318 @@
+"""
+Shared-memory data arena for multi-process runs
+The parent publishes read-only arrays and bar frames once into a single POSIX shared memory
+segment (or a memory-mapped file); workers get a small picklable ArenaDescriptor and attach
+with zero copies, read-only at the OS level. Segments are removed by the owner on close, at
+interpreter exit, by the multiprocessing resource tracker if the owner is killed, and by
+sweep() (run on every publish) for anything left by processes that no longer exist.
+
+    with DataArena.publish(frames={'btc': btc_df, 'eth': eth_df}) as arena:
+        pool.map(task, [(arena.descriptor, i) for i in range(n)])
+
+    def task(args):
+        descriptor, i = args
+        btc = attach(descriptor).frame('btc')  # Read-only DataFrame over the shared buffer
+
+    python -m storage.arena
+    python -m storage.arena --sweep
+"""
+
+import argparse
+import glob
+import json
+import mmap
+import os
+import re
+import secrets
+import tempfile
+import weakref
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+try:
+    import _posixshmem
+except ImportError:  # Windows: named mappings disappear with their last handle, nothing to sweep
+    _posixshmem = None
+
+
+PREFIX = 'arena'
+ALIGNMENT = 64
+SHM_DIR = '/dev/shm'  # Where Linux exposes POSIX segments; sweep() lists it when present
+SEGMENT_NAME = re.compile(rf'{PREFIX}-(\d+)-[0-9a-f]{{8}}')  # _segment_name(); nothing else is ours
+
+_ATTACHED = {}  # Segment name -> ArenaView, one mapping per process however many tasks use it
+
+
+class ArenaDescriptor:
+    """Everything a worker needs to attach: backend, segment name or path, size and the layout
+
+    entries maps a key to ('array', dtype, shape, offset) or ('frame', layout) where layout holds
+    the values block (columns x rows, float64), the int64 index and the column names.
+    """
+
+    __slots__ = ('backend', 'name', 'size', 'owner_pid', 'entries')
+
+    def __init__(self, backend, name, size, owner_pid, entries):
+        self.backend = backend
+        self.name = name
+        self.size = size
+        self.owner_pid = owner_pid
+        self.entries = entries
+
+    def __reduce__(self):
+        return ArenaDescriptor, (self.backend, self.name, self.size, self.owner_pid, self.entries)
+
+    def __repr__(self):
+        return f"ArenaDescriptor({self.backend}:{self.name}, {self.size:,} B, {len(self.entries)} entries)"
+
+    def to_json(self):
+        return json.dumps({k: getattr(self, k) for k in self.__slots__})
+
+    @classmethod
+    def from_json(cls, text):
+        d = json.loads(text)
+        entries = {k: tuple(v) for k, v in d['entries'].items()}
+        return cls(d['backend'], d['name'], d['size'], d['owner_pid'], entries)
+
+
+def _aligned(offset):
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+def _layout(arrays, frames):
+    """Offsets for every array and frame block; returns (entries, total size, [(offset, array)])"""
+    entries, writes = {}, []
+    offset = 0
+
+    def place(array):
+        nonlocal offset
+        offset = _aligned(offset)
+        spec = (array.dtype.str, list(array.shape), offset)
+        writes.append((offset, array))
+        offset += array.nbytes
+        return spec
+
+    for key, array in (arrays or {}).items():
+        entries[key] = ('array', *place(np.ascontiguousarray(array)))
+    for key, df in (frames or {}).items():
+        if not isinstance(df.index, pd.DatetimeIndex):
+            raise ValueError(f"Frame {key!r}: a DatetimeIndex is required")
+        # One (columns, rows) block: a DataFrame over its transpose needs no copy
+        values = np.ascontiguousarray(df.to_numpy(dtype=np.float64).T)
+        index = df.index.tz_convert('UTC') if df.index.tz is not None else df.index
+        entries[key] = ('frame', {
+            'values': place(values),
+            'index': place(np.ascontiguousarray(index.asi8)),
+            'columns': [str(c) for c in df.columns],
+            'tz': str(df.index.tz) if df.index.tz is not None else None,
+            'index_name': df.index.name,
+        })
+    return entries, max(_aligned(offset), ALIGNMENT), writes
+
+
+def _segment_name(pid=None):
+    return f"{PREFIX}-{pid or os.getpid()}-{secrets.token_hex(4)}"
+
+
+def _owner_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class DataArena:
+    """Owner side of one segment; close() (or leaving the with block) unlinks it"""
+
+    def __init__(self, descriptor, handle):
+        self.descriptor = descriptor
+        self._handle = handle
+        self._finalizer = weakref.finalize(self, _release, descriptor, handle)
+
+    @classmethod
+    def publish(cls, arrays=None, frames=None, backend='shm', directory=None):
+        """Copy arrays ({key: ndarray}) and frames ({key: DataFrame with a DatetimeIndex}) into a new segment
+
+        backend 'shm' uses POSIX shared memory, 'file' a memory-mapped file in `directory` (default
+        the temp dir) for hosts where /dev/shm is small, e.g. containers with the 64 MB default.
+        """
+        sweep(directory, files=backend == 'file')
+        entries, size, writes = _layout(arrays, frames)
+        name = _segment_name()
+        if backend == 'shm':
+            handle = shared_memory.SharedMemory(name=name, create=True, size=size)
+            buf = handle.buf
+        elif backend == 'file':
+            name = os.path.join(directory or tempfile.gettempdir(), name)
+            with open(name, 'wb') as f:
+                f.truncate(size)
+            with open(name, 'r+b') as f:
+                handle = mmap.mmap(f.fileno(), size)
+            buf = handle
+        else:
+            raise ValueError(f"Unknown arena backend {backend!r}")
+
+        for offset, array in writes:
+            target = np.ndarray(array.shape, dtype=array.dtype, buffer=buf, offset=offset)
+            target[...] = array
+            del target  # No exported buffers may outlive the copy, or the handle cannot close
+        del buf
+        return cls(ArenaDescriptor(backend, name, size, os.getpid(), entries), handle)
+
+    @property
+    def closed(self):
+        return not self._finalizer.alive
+
+    def close(self):
+        """Unmap and unlink; workers keep any mapping they already hold until they drop it"""
+        view = _ATTACHED.pop(self.descriptor.name, None)
+        if view is not None:
+            view.close()
+        self._finalizer()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __repr__(self):
+        return f"DataArena({self.descriptor!r}{', closed' if self.closed else ''})"
+
+
+def _release(descriptor, handle):
+    if os.getpid() != descriptor.owner_pid:
+        return  # Forked child exiting with a copy of the owner's finalizer
+    try:
+        handle.close()
+    except BufferError:
+        pass  # Views still reference the mapping: it goes away with them
+    try:
+        if descriptor.backend == 'shm':
+            handle.unlink()  # Also unregisters it from the resource tracker
+        else:
+            os.unlink(descriptor.name)
+    except FileNotFoundError:
+        pass
+
+
+class ArenaView:
+    """Worker side: read-only arrays and DataFrames over one attached segment"""
+
+    def __init__(self, descriptor):
+        self.descriptor = descriptor
+        self._buffer = _map(descriptor)
+
+    def keys(self):
+        return self.descriptor.entries.keys()
+
+    def _array(self, spec):
+        dtype, shape, offset = spec
+        array = np.ndarray(tuple(shape), dtype=np.dtype(dtype), buffer=self._buffer, offset=offset)
+        array.flags.writeable = False
+        return array
+
+    def array(self, key):
+        kind, *spec = self.descriptor.entries[key]
+        if kind != 'array':
+            raise KeyError(f"{key!r} is a {kind}, not an array")
+        return self._array(spec)
+
+    def frame(self, key):
+        """DataFrame over the shared values block; writes raise instead of copying"""
+        kind, layout = self.descriptor.entries[key]
+        if kind != 'frame':
+            raise KeyError(f"{key!r} is an {kind}, not a frame")
+        index = pd.DatetimeIndex(self._array(layout['index']).view('M8[ns]'), name=layout['index_name'])
+        if layout['tz']:
+            index = index.tz_localize('UTC').tz_convert(layout['tz'])
+        return pd.DataFrame(self._array(layout['values']).T, index=index, columns=layout['columns'], copy=False)
+
+    def close(self):
+        buffer, self._buffer = self._buffer, None
+        if isinstance(buffer, mmap.mmap):
+            try:
+                buffer.close()
+            except BufferError:
+                pass  # Arrays handed out still use it; unmapped once they are gone
+
+
+def _map(descriptor):
+    """Read-only mapping of a segment, not registered with this process's resource tracker"""
+    if descriptor.backend == 'file':
+        with open(descriptor.name, 'rb') as f:
+            return mmap.mmap(f.fileno(), descriptor.size, access=mmap.ACCESS_READ)
+    if _posixshmem is None:
+        return shared_memory.SharedMemory(name=descriptor.name).buf
+    # SharedMemory(name) would register the segment again, and a tracker started by an unrelated
+    # process would unlink it when that process exits
+    fd = _posixshmem.shm_open('/' + descriptor.name, os.O_RDONLY, mode=0)
+    try:
+        return mmap.mmap(fd, descriptor.size, access=mmap.ACCESS_READ)
+    finally:
+        os.close(fd)
+
+
+def attach(descriptor):
+    """ArenaView for a descriptor, cached: pool workers map each segment once"""
+    view = _ATTACHED.get(descriptor.name)
+    if view is None:
+        view = _ATTACHED[descriptor.name] = ArenaView(descriptor)
+    return view
+
+
+def segments(directory=None, files=True):
+    """(path, owner pid, alive) for every arena segment on this host; files=False skips the
+    file-backed ones in `directory` (default the temp dir)"""
+    paths = glob.glob(os.path.join(SHM_DIR, f'{PREFIX}-*-*')) if os.path.isdir(SHM_DIR) else []
+    if files:
+        paths += glob.glob(os.path.join(directory or tempfile.gettempdir(), f'{PREFIX}-*-*'))
+    found = []
+    for path in sorted(set(paths)):
+        match = SEGMENT_NAME.fullmatch(os.path.basename(path))
+        if match is None:
+            continue
+        pid = int(match.group(1))
+        found.append((path, pid, _owner_alive(pid)))
+    return found
+
+
+def sweep(directory=None, files=True):
+    """Unlink segments whose owner process is gone (killed before it could clean up); returns them"""
+    removed = []
+    for path, _, alive in segments(directory, files):
+        if alive:
+            continue
+        try:
+            os.unlink(path)
+            removed.append(path)
+        except OSError:
+            pass
+    return removed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Inspect or clean up shared data arena segments')
+    parser.add_argument('--directory', help='Directory of file-backed arenas (default: temp dir)')
+    parser.add_argument('--sweep', action='store_true', help='Remove segments of dead owner processes')
+    args = parser.parse_args()
+
+    if args.sweep:
+        removed = sweep(args.directory)
+        print(f"Removed {len(removed)} stale segment(s)")
+        for path in removed:
+            print(f"  {path}")
+        return
+    found = segments(args.directory)
+    print(f"{len(found)} arena segment(s)")
+    for path, pid, alive in found:
+        print(f"  {path}  {os.path.getsize(path):>14,} B  owner {pid} {'alive' if alive else 'DEAD'}")
+
+
+if __name__ == "__main__":
+    main()
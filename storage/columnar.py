@@ -0,0 +1,96 @@
+"""
+Append-only columnar files (Arrow IPC stream format)
+Rows are buffered in memory and written in record batches on a background
+thread, so callers on the event loop never wait on disk
+"""
+
+import os
+import queue
+import threading
+
+import pyarrow as pa
+
+
+class ColumnarWriter:
+    """Buffered, append-only Arrow IPC stream writer"""
+
+    def __init__(self, path, schema, batch_rows=8192, background=True):
+        self.path = path
+        self.schema = schema
+        self.batch_rows = batch_rows
+        self.rows_written = 0
+        self._rows = []
+
+        self._open()
+
+        self._queue = None
+        self._thread = None
+        if background:
+            self._queue = queue.Queue()
+            self._thread = threading.Thread(target=self._run, name=f"writer-{os.path.basename(path)}", daemon=True)
+            self._thread.start()
+
+    def _open(self):
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._sink = pa.OSFile(self.path, 'wb')
+        self._writer = pa.ipc.new_stream(self._sink, self.schema)
+
+    def append(self, *values):
+        """Add one row (values in schema order)"""
+        self._rows.append(values)
+        if len(self._rows) >= self.batch_rows:
+            self.flush()
+
+    def flush(self):
+        """Hand the buffered rows to the writer"""
+        if not self._rows:
+            return
+        rows, self._rows = self._rows, []
+        if self._queue is not None:
+            self._queue.put(rows)
+        else:
+            self._write(rows)
+
+    def _to_batch(self, rows):
+        columns = zip(*rows)
+        arrays = [pa.array(column, type=field.type) for column, field in zip(columns, self.schema)]
+        return pa.RecordBatch.from_arrays(arrays, schema=self.schema)
+
+    def _write(self, rows):
+        self._writer.write_batch(self._to_batch(rows))
+        self._sink.flush()
+        self.rows_written += len(rows)
+
+    def _run(self):
+        while True:
+            rows = self._queue.get()
+            if rows is None:
+                break
+            self._write(rows)
+
+    def close(self):
+        self.flush()
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+        self._close()
+
+    def _close(self):
+        self._writer.close()
+        self._sink.close()
+
+
+def read_columnar(path, columns=None):
+    """Read every complete record batch of a stream file into a Table"""
+    batches = []
+    with pa.OSFile(path, 'rb') as source:
+        reader = pa.ipc.open_stream(source)
+        schema = reader.schema
+        try:
+            for batch in reader:
+                batches.append(batch)
+        except (pa.ArrowInvalid, OSError):
+            pass  # Truncated tail from an unclean shutdown: keep what is complete
+    table = pa.Table.from_batches(batches, schema=schema)
+    return table.select(columns) if columns else table
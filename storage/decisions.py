@@ -0,0 +1,55 @@
+"""
+Strategy decision log schema and live-vs-replay comparison
+"""
+
+import pandas as pd
+import pyarrow as pa
+
+from storage.columnar import read_columnar
+
+
+DECISION_SCHEMA = pa.schema([
+    ('ts_event', pa.int64()),
+    ('z_score', pa.float64()),
+    ('spread', pa.float64()),
+    ('hedge_ratio', pa.float64()),
+    ('action', pa.string()),
+    ('in_position', pa.bool_()),
+])
+
+
+def compare_decisions(live_path, replay_path, z_tolerance=1e-9):
+    """Align two decision logs on event time and report where they differ"""
+    live = read_columnar(live_path).to_pandas()
+    replay = read_columnar(replay_path).to_pandas()
+
+    # Several evaluations can share an event time (one per leg bar): align by occurrence
+    for df in (live, replay):
+        df['occurrence'] = df.groupby('ts_event').cumcount()
+
+    merged = live.merge(replay, on=['ts_event', 'occurrence'], how='outer',
+                        suffixes=('_live', '_replay'), indicator=True).sort_values(['ts_event', 'occurrence'])
+    both = merged[merged['_merge'] == 'both']
+
+    action_diff = both['action_live'] != both['action_replay']
+    z_diff = (both['z_score_live'] - both['z_score_replay']).abs()
+    mismatched = both[action_diff | (z_diff > z_tolerance)]
+
+    report = {
+        'live_decisions': len(live),
+        'replay_decisions': len(replay),
+        'aligned': len(both),
+        'live_only': int((merged['_merge'] == 'left_only').sum()),
+        'replay_only': int((merged['_merge'] == 'right_only').sum()),
+        'action_mismatches': int(action_diff.sum()),
+        'max_z_diff': float(z_diff.max()) if len(both) else 0.0,
+        'first_divergence': None,
+    }
+    if len(mismatched):
+        row = mismatched.iloc[0]
+        report['first_divergence'] = {
+            'ts_event': pd.Timestamp(int(row['ts_event']), unit='ns', tz='UTC').isoformat(),
+            'live': {'action': row['action_live'], 'z_score': row['z_score_live']},
+            'replay': {'action': row['action_replay'], 'z_score': row['z_score_replay']},
+        }
+    return report
@@ -0,0 +1,193 @@
+"""
+Trade and fill journal shared by the simplified backtester and PairsTradingStrategy
+Append-only Parquet part files with a fixed schema, written in buffered batches on a
+background thread. Rows carry the run that wrote them (run_id): remove_runs() drops a
+writer's earlier runs before a full rerun, so they are not counted twice. Part file names
+carry their time range, so time-range queries only open the files that overlap and filter
+the rest by row-group statistics.
+
+    root/trades/<ts_min>-<ts_max>-<writer>-<seq>.parquet
+    root/fills/<ts_min>-<ts_max>-<writer>-<seq>.parquet
+"""
+
+import glob
+import os
+import uuid
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from storage.columnar import ColumnarWriter
+
+
+TRADE_SCHEMA = pa.schema([
+    ('ts_entry', pa.int64()),
+    ('ts_exit', pa.int64()),
+    ('source', pa.string()),  # 'simplified' or 'nautilus'
+    ('strategy_id', pa.string()),
+    ('run_id', pa.string()),  # One backtest run (continued by --resume) or strategy start
+    ('side', pa.string()),  # 'long' / 'short' spread
+    ('entry_price_a', pa.float64()),
+    ('entry_price_b', pa.float64()),
+    ('exit_price_a', pa.float64()),
+    ('exit_price_b', pa.float64()),
+    ('quantity_a', pa.float64()),
+    ('quantity_b', pa.float64()),
+    ('hedge_ratio', pa.float64()),
+    ('pnl', pa.float64()),  # Net of fees / slippage
+    ('exit_reason', pa.string()),
+])
+
+FILL_SCHEMA = pa.schema([
+    ('ts_event', pa.int64()),
+    ('source', pa.string()),
+    ('strategy_id', pa.string()),
+    ('run_id', pa.string()),
+    ('instrument_id', pa.string()),
+    ('client_order_id', pa.string()),
+    ('side', pa.string()),  # 'BUY' / 'SELL'
+    ('quantity', pa.float64()),
+    ('price', pa.float64()),
+    ('commission', pa.float64()),
+    # Pairs: 'long' / 'short' / 'close', '' for imbalance repair; single-instrument strategies:
+    # 'entry' / 'close'; cross_asset: 'rebalance'; multi_alpha: 'net'
+    ('intent', pa.string()),
+])
+
+TIME_COLUMNS = {'trades': 'ts_exit', 'fills': 'ts_event'}
+
+
+class PartitionedWriter(ColumnarWriter):
+    """ColumnarWriter that writes each batch as its own Parquet part file in a directory"""
+
+    def __init__(self, directory, schema, time_column, batch_rows=1024, background=True):
+        self.time_column = time_column
+        self.writer_id = uuid.uuid4().hex[:12]
+        self.parts = 0
+        super().__init__(directory, schema, batch_rows, background)
+
+    def _open(self):
+        os.makedirs(self.path, exist_ok=True)
+
+    def _write(self, rows):
+        table = pa.Table.from_batches([self._to_batch(rows)]).sort_by(self.time_column)
+        times = table.column(self.time_column)
+        name = f"{times[0].as_py()}-{times[-1].as_py()}-{self.writer_id}-{self.parts:06d}.parquet"
+        tmp = os.path.join(self.path, f".{name}.tmp")
+        pq.write_table(table, tmp)
+        os.replace(tmp, os.path.join(self.path, name))  # Readers never see a partial part
+        self.parts += 1
+        self.rows_written += len(rows)
+
+    def _close(self):
+        pass
+
+
+class TradeJournal:
+    """Trades and fills of one writer (a backtest run or a live strategy instance)"""
+
+    def __init__(self, root, source, strategy_id, run_id=None, batch_rows=1024, background=True):
+        self.root = root
+        self.source = source
+        self.strategy_id = strategy_id
+        self.run_id = run_id or uuid.uuid4().hex[:12]  # Pass an earlier run's id to continue it
+        self.trades = PartitionedWriter(os.path.join(root, 'trades'), TRADE_SCHEMA, 'ts_exit', batch_rows, background)
+        self.fills = PartitionedWriter(os.path.join(root, 'fills'), FILL_SCHEMA, 'ts_event', batch_rows, background)
+
+    def record_trade(self, ts_entry, ts_exit, side, entry_price_a, entry_price_b, exit_price_a, exit_price_b,
+                     quantity_a, quantity_b, hedge_ratio, pnl, exit_reason):
+        self.trades.append(
+            ts_entry, ts_exit, self.source, self.strategy_id, self.run_id, side, entry_price_a, entry_price_b,
+            exit_price_a, exit_price_b, quantity_a, quantity_b, hedge_ratio, pnl, exit_reason,
+        )
+
+    def record_fill(self, ts_event, instrument_id, client_order_id, side, quantity, price, commission=0.0, intent=''):
+        self.fills.append(
+            ts_event, self.source, self.strategy_id, self.run_id, instrument_id, client_order_id,
+            side, quantity, price, commission, intent,
+        )
+
+    def flush(self):
+        self.trades.flush()
+        self.fills.flush()
+
+    def close(self):
+        self.trades.close()
+        self.fills.close()
+
+
+def replay_stop_events(strategy, client_order_ids):
+    """Pass the fills and position closes of orders sent from on_stop to the strategy's handlers
+
+    A stopped strategy is no longer sent events, so these only reach the cache; strategies call this
+    before closing their journal, once the node has waited out the post-stop residuals
+    """
+    from nautilus_trader.core.uuid import UUID4
+    from nautilus_trader.model.events import OrderFilled, PositionClosed
+
+    for client_order_id in client_order_ids:
+        order = strategy.cache.order(client_order_id)
+        for event in order.events if order is not None else ():
+            if isinstance(event, OrderFilled):
+                strategy.on_order_filled(event)
+    for position in strategy.cache.positions_closed(strategy_id=strategy.id):
+        if position.closing_order_id in client_order_ids:
+            strategy.on_position_closed(PositionClosed.create(position, position.last_event, UUID4(), position.ts_closed))
+
+
+def remove_runs(root, source, strategy_id, keep=None):
+    """Delete the trade and fill parts of a writer's runs other than `keep`; returns the number removed
+
+    Each part comes from a single journal, so its first row identifies it
+    """
+    removed = 0
+    for table in TIME_COLUMNS:
+        for path in glob.glob(os.path.join(root, table, '*.parquet')):
+            parquet = pq.ParquetFile(path)
+            if parquet.metadata.num_rows == 0:
+                continue
+            columns = ['source', 'strategy_id'] + (['run_id'] if 'run_id' in parquet.schema_arrow.names else [])
+            row = parquet.read_row_group(0, columns=columns).slice(0, 1).to_pylist()[0]
+            if row['source'] == source and row['strategy_id'] == strategy_id and (keep is None or row.get('run_id') != keep):
+                os.unlink(path)
+                removed += 1
+    return removed
+
+
+def _to_ns(value):
+    if value is None or isinstance(value, int):
+        return value
+    ts = pd.Timestamp(value)
+    return (ts.tz_localize('UTC') if ts.tzinfo is None else ts).value
+
+
+def read_journal(root, table='trades', start=None, end=None, columns=None, source=None, strategy_id=None,
+                 run_id=None):
+    """Rows with start <= time < end (ns ints or anything pd.Timestamp accepts) as an Arrow Table"""
+    schema = TRADE_SCHEMA if table == 'trades' else FILL_SCHEMA
+    time_column = TIME_COLUMNS[table]
+    start, end = _to_ns(start), _to_ns(end)
+
+    paths = []
+    for path in glob.glob(os.path.join(root, table, '*.parquet')):
+        t_min, t_max = (int(t) for t in os.path.basename(path).split('-', 2)[:2])
+        if (start is None or t_max >= start) and (end is None or t_min < end):
+            paths.append(path)
+    if not paths:
+        return schema.empty_table().select(columns) if columns else schema.empty_table()
+
+    expression = None
+    for condition in (
+        ds.field(time_column) >= start if start is not None else None,
+        ds.field(time_column) < end if end is not None else None,
+        ds.field('source') == source if source is not None else None,
+        ds.field('strategy_id') == strategy_id if strategy_id is not None else None,
+        ds.field('run_id') == run_id if run_id is not None else None,
+    ):
+        if condition is not None:
+            expression = condition if expression is None else expression & condition
+
+    dataset = ds.dataset(sorted(paths), schema=schema, format='parquet')
+    return dataset.to_table(columns=columns, filter=expression).sort_by(time_column)
@@ -0,0 +1,184 @@
+"""
+Deterministic replay of a recorded live session
+Feeds the recorded bars/ticks through the same strategy in receive order, either
+as fast as possible or paced at N x wall-clock speed, and compares decisions
+
+    python -m storage.replay --session ./data/recordings/session-... --speed 10
+"""
+
+import argparse
+import glob
+import json
+import os
+import time
+
+import numpy as np
+from nautilus_trader.backtest.engine import BacktestEngine, BacktestEngineConfig
+from nautilus_trader.config import LoggingConfig
+from nautilus_trader.model import instruments as nautilus_instruments
+from nautilus_trader.model.currencies import USDT
+from nautilus_trader.model.data import Bar, BarType, QuoteTick, TradeTick
+from nautilus_trader.model.enums import AccountType, AggressorSide, OmsType
+from nautilus_trader.model.identifiers import TradeId, Venue
+from nautilus_trader.model.objects import Money, Price, Quantity
+
+from storage.columnar import read_columnar
+from storage.decisions import compare_decisions
+from telemetry.profiling import trace_stage
+
+
+def load_instruments(session_dir):
+    with open(os.path.join(session_dir, "instruments.json")) as f:
+        definitions = json.load(f)
+    return [getattr(nautilus_instruments, d['type']).from_dict(d) for d in definitions]
+
+
+def load_session(session_dir, instruments):
+    """Rebuild recorded data as Nautilus objects in receive (seq) order"""
+    by_id = {str(i.id): i for i in instruments}
+    events = []  # (seq, ts_recv, builder)
+
+    path = os.path.join(session_dir, "bars.arrow")
+    if os.path.exists(path):
+        bars = read_columnar(path).to_pydict()
+        bar_types = {}
+        for k in range(len(bars['seq'])):
+            bar_type = bar_types.setdefault(bars['bar_type'][k], BarType.from_str(bars['bar_type'][k]))
+            events.append((bars['seq'][k], bars['ts_recv'][k], 'bar', bar_type, k))
+
+    path = os.path.join(session_dir, "quotes.arrow")
+    if os.path.exists(path):
+        quotes = read_columnar(path).to_pydict()
+        for k in range(len(quotes['seq'])):
+            events.append((quotes['seq'][k], quotes['ts_recv'][k], 'quote', quotes['instrument_id'][k], k))
+
+    path = os.path.join(session_dir, "trades.arrow")
+    if os.path.exists(path):
+        trades = read_columnar(path).to_pydict()
+        for k in range(len(trades['seq'])):
+            events.append((trades['seq'][k], trades['ts_recv'][k], 'trade', trades['instrument_id'][k], k))
+
+    events.sort(key=lambda e: e[0])
+
+    # Replay time is receive time, forced strictly increasing so the engine cannot reorder
+    ts = np.array([e[1] for e in events], dtype=np.int64)
+    offsets = np.arange(len(ts), dtype=np.int64)
+    ts = np.maximum.accumulate(ts - offsets) + offsets
+
+    data = []
+    for (seq, _, kind, key, k), ts_init in zip(events, ts.tolist()):
+        if kind == 'bar':
+            instrument = by_id[str(key.instrument_id)]
+            p, s = instrument.price_precision, instrument.size_precision
+            data.append(Bar(
+                key,
+                Price(bars['open'][k], p), Price(bars['high'][k], p),
+                Price(bars['low'][k], p), Price(bars['close'][k], p),
+                Quantity(bars['volume'][k], s), bars['ts_event'][k], ts_init,
+            ))
+        elif kind == 'quote':
+            instrument = by_id[key]
+            p, s = instrument.price_precision, instrument.size_precision
+            data.append(QuoteTick(
+                instrument.id,
+                Price(quotes['bid'][k], p), Price(quotes['ask'][k], p),
+                Quantity(quotes['bid_size'][k], s), Quantity(quotes['ask_size'][k], s),
+                quotes['ts_event'][k], ts_init,
+            ))
+        else:
+            instrument = by_id[key]
+            data.append(TradeTick(
+                instrument.id,
+                Price(trades['price'][k], instrument.price_precision),
+                Quantity(trades['size'][k], instrument.size_precision),
+                AggressorSide(trades['aggressor_side'][k]), TradeId(trades['trade_id'][k]),
+                trades['ts_event'][k], ts_init,
+            ))
+    return data
+
+
+def default_strategy_config():
+    from config.live.binance_live import PAIRS_STRATEGY
+    return dict(PAIRS_STRATEGY['config'])
+
+
+def replay_session(session_dir, strategy_config=None, speed=0.0, chunk_seconds=60):
+    """Run a recorded session through PairsTradingStrategy; speed=0 means as fast as possible"""
+    from strategies.pairs_trading import PairsTradingConfig, PairsTradingStrategy
+
+    trace_stage('load_session')
+    instruments = load_instruments(session_dir)
+    data = load_session(session_dir, instruments)
+    print(f"Loaded {len(data)} recorded events from {session_dir}")
+
+    engine = BacktestEngine(BacktestEngineConfig(logging=LoggingConfig(log_level="ERROR")))
+    engine.add_venue(
+        Venue("BINANCE"), oms_type=OmsType.NETTING, account_type=AccountType.MARGIN,
+        starting_balances=[Money(50000, USDT)], base_currency=USDT,
+    )
+    for instrument in instruments:
+        engine.add_instrument(instrument)
+
+    config = dict(strategy_config or default_strategy_config())
+    replay_dir = os.path.join(session_dir, "replay")
+    for old in glob.glob(os.path.join(replay_dir, "decisions-*.arrow")):
+        os.remove(old)
+    config['decision_log_dir'] = replay_dir
+    config['journal_dir'] = None  # Simulated fills must not land in the live journal
+    strategy = PairsTradingStrategy(PairsTradingConfig(**config))
+    engine.add_strategy(strategy)
+
+    # Stream in chunks of recorded time, sleeping between them when paced
+    trace_stage('engine_run')
+    start_wall = time.perf_counter()
+    chunk_ns = int(chunk_seconds * 1e9)
+    i = 0
+    while i < len(data):
+        chunk_end = data[i].ts_init + chunk_ns
+        j = i
+        while j < len(data) and data[j].ts_init < chunk_end:
+            j += 1
+        engine.add_data(data[i:j], sort=False)
+        engine.run(streaming=True)
+        engine.clear_data()
+        if speed > 0:
+            target = (data[j - 1].ts_init - data[0].ts_init) / 1e9 / speed
+            delay = target - (time.perf_counter() - start_wall)
+            if delay > 0:
+                time.sleep(delay)
+        i = j
+    engine.end()
+    elapsed = time.perf_counter() - start_wall
+    trace_stage('replay_output')
+
+    recorded_span = (data[-1].ts_init - data[0].ts_init) / 1e9 if data else 0.0
+    print(f"Replayed {recorded_span / 3600:.2f}h of data in {elapsed:.2f}s "
+          f"({recorded_span / elapsed if elapsed > 0 else 0:.0f}x), trades: {strategy.trade_count}")
+    engine.dispose()
+
+    replay_files = sorted(glob.glob(os.path.join(replay_dir, "decisions-*.arrow")))
+    return replay_files[-1] if replay_files else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Replay a recorded live session')
+    parser.add_argument('--session', required=True, help='Recording session directory')
+    parser.add_argument('--speed', type=float, default=0.0, help='Replay speed multiple (0 = as fast as possible)')
+    parser.add_argument('--strategy-config', help='JSON file with PairsTradingConfig fields (default: live config)')
+    parser.add_argument('--live-decisions', help='Live decision log to compare against')
+    args = parser.parse_args()
+
+    strategy_config = None
+    if args.strategy_config:
+        with open(args.strategy_config) as f:
+            strategy_config = json.load(f)
+
+    replay_decisions = replay_session(args.session, strategy_config, args.speed)
+
+    if args.live_decisions and replay_decisions:
+        report = compare_decisions(args.live_decisions, replay_decisions)
+        print(json.dumps(report, indent=2, default=str))
+
+
+if __name__ == "__main__":
+    main()
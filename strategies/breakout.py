@@ -0,0 +1,330 @@
+"""
+Breakout Momentum Strategy - Alpha 2
+Trend following on Donchian channel breakouts confirmed by ATR: enter when the close clears
+the prior `channel_period` bars' high (low) by `entry_atr` ATRs, exit on a close through the
+shorter `exit_period` channel or a stop `stop_atr` ATRs from the entry.
+
+BreakoutSignal is the O(1)-per-bar core the strategy runs on; breakout_trades() is the
+vectorized batch version of the same rules for the simplified backtest path.
+"""
+
+from datetime import timedelta
+
+import numpy as np
+from nautilus_trader.config import StrategyConfig
+from nautilus_trader.model.data import Bar, BarType
+from nautilus_trader.model.enums import OrderSide, TimeInForce
+from nautilus_trader.model.identifiers import InstrumentId
+from nautilus_trader.trading.strategy import Strategy
+
+from storage.journal import TradeJournal, replay_stop_events
+from strategies.rolling import AverageTrueRange, RollingMax, RollingMin
+from strategies.vectorized import average_true_range, donchian_channels
+
+
+class BreakoutSignal:
+    """Per-bar breakout state machine; update() returns the action taken on that bar"""
+
+    def __init__(self, channel_period=240, exit_period=120, atr_period=60, entry_atr=0.25, stop_atr=2.0):
+        self.entry_atr = entry_atr
+        self.stop_atr = stop_atr
+        self.upper = RollingMax(channel_period)
+        self.lower = RollingMin(channel_period)
+        self.exit_upper = RollingMax(exit_period)
+        self.exit_lower = RollingMin(exit_period)
+        self.atr = AverageTrueRange(atr_period)
+        self.reset()
+
+    def update(self, high, low, close):
+        """Decide on this bar against the channels of the bars before it, then add the bar"""
+        self.atr.push(high, low, close)
+        if self.upper.ready and self.exit_lower.ready and self.atr.ready:
+            action = self._decide(close, self.atr.value)
+        else:
+            action = 'warmup'
+        self.upper.push(high)
+        self.lower.push(low)
+        self.exit_upper.push(high)
+        self.exit_lower.push(low)
+        self.index += 1
+        return action
+
+    def _decide(self, close, atr):
+        side = self.side
+        if side > 0:
+            if close <= self.stop:
+                return self._exit('stop')
+            if close < self.exit_lower.value:
+                return self._exit('signal')
+            return 'hold'
+        if side < 0:
+            if close >= self.stop:
+                return self._exit('stop')
+            if close > self.exit_upper.value:
+                return self._exit('signal')
+            return 'hold'
+
+        buffer = self.entry_atr * atr
+        if close > self.upper.value + buffer:
+            self._enter(1, close, atr)
+            return 'enter_long'
+        if close < self.lower.value - buffer:
+            self._enter(-1, close, atr)
+            return 'enter_short'
+        return 'flat'
+
+    def _enter(self, side, close, atr):
+        self.side = side
+        self.entry_index = self.index
+        self.entry_price = close
+        self.stop = close - side * self.stop_atr * atr
+
+    def _exit(self, reason):
+        self.side = 0
+        self.exit_reason = reason
+        return 'exit'
+
+    def flatten(self):
+        """Forget the position without an exit signal (entry order rejected)"""
+        self.side = 0
+
+    def reset(self):
+        for indicator in (self.upper, self.lower, self.exit_upper, self.exit_lower, self.atr):
+            indicator.reset()
+        self.index = 0
+        self.side = 0
+        self.entry_index = None
+        self.entry_price = None
+        self.stop = None
+        self.exit_reason = None
+
+
+def replay_signals(high, low, close, **params):
+    """Trades from running BreakoutSignal bar by bar over arrays, in breakout_trades() format"""
+    signal = BreakoutSignal(**params)
+    trades = []
+    for i, (h, l, c) in enumerate(zip(np.asarray(high, dtype=np.float64).tolist(),
+                                      np.asarray(low, dtype=np.float64).tolist(),
+                                      np.asarray(close, dtype=np.float64).tolist())):
+        side, entry_index = signal.side, signal.entry_index
+        if signal.update(h, l, c) == 'exit':
+            trades.append((entry_index, i, side, signal.exit_reason))
+    if signal.side:
+        trades.append((signal.entry_index, len(close), signal.side, 'open'))
+    return _trade_arrays(trades, close)
+
+
+def _trade_arrays(trades, close):
+    close = np.asarray(close, dtype=np.float64)
+    entry, exit_, side, reason = (list(column) for column in zip(*trades)) if trades else ([], [], [], [])
+    entry = np.asarray(entry, dtype=np.int64)
+    exit_ = np.asarray(exit_, dtype=np.int64)
+    exit_price = close[np.minimum(exit_, len(close) - 1)] if len(close) else np.zeros(0)
+    return {
+        'entry_index': entry,
+        'exit_index': exit_,  # len(close) for a position still open
+        'side': np.asarray(side, dtype=np.int64),
+        'entry_price': close[entry],
+        'exit_price': exit_price,
+        'reason': np.asarray(reason, dtype=object),
+    }
+
+
+def _first_exit(close, stop, side, exit_lower, exit_upper, start):
+    """First bar >= start where the position exits, as (index, reason), or (None, None)"""
+    n, window = len(close), 256
+    while start < n:
+        end = min(start + window, n)
+        segment = close[start:end]
+        if side > 0:
+            hit_stop = segment <= stop
+            hit_exit = segment < exit_lower[start:end]
+        else:
+            hit_stop = segment >= stop
+            hit_exit = segment > exit_upper[start:end]
+        hits = np.flatnonzero(hit_stop | hit_exit)
+        if len(hits):
+            j = hits[0]
+            return start + j, 'stop' if hit_stop[j] else 'signal'
+        start, window = end, window * 2  # Doubling scan: O(holding period) per trade
+    return None, None
+
+
+def breakout_trades(high, low, close, channel_period=240, exit_period=120, atr_period=60, entry_atr=0.25,
+                    stop_atr=2.0):
+    """Vectorized BreakoutSignal: indicator and entry arrays in one pass each, then a jump from
+    each entry to its exit without touching the bars in between one by one"""
+    high = np.asarray(high, dtype=np.float64)
+    low = np.asarray(low, dtype=np.float64)
+    close = np.asarray(close, dtype=np.float64)
+    n = len(close)
+
+    upper, lower = donchian_channels(high, low, channel_period)
+    exit_upper, exit_lower = donchian_channels(high, low, exit_period)
+    atr = average_true_range(high, low, close, atr_period)
+
+    buffer = entry_atr * atr
+    ready = ~np.isnan(upper) & ~np.isnan(exit_lower) & ~np.isnan(atr)
+    long_entry = ready & (close > upper + buffer)
+    short_entry = ready & (close < lower - buffer) & ~long_entry
+    entries = np.flatnonzero(long_entry | short_entry)
+
+    trades = []
+    position = 0
+    while True:
+        k = np.searchsorted(entries, position)
+        if k == len(entries):
+            break
+        entry = entries[k]
+        side = 1 if long_entry[entry] else -1
+        stop = close[entry] - side * stop_atr * atr[entry]
+        exit_index, reason = _first_exit(close, stop, side, exit_lower, exit_upper, entry + 1)
+        if exit_index is None:
+            trades.append((entry, n, side, 'open'))
+            break
+        trades.append((entry, exit_index, side, reason))
+        position = exit_index + 1  # No re-entry on the exit bar
+    return _trade_arrays(trades, close)
+
+
+class BreakoutConfig(StrategyConfig, frozen=True, kw_only=True):
+    instrument_id: str
+    bar_type: str = "1-MINUTE-LAST"
+    channel_period: int = 240  # Breakout channel, bars
+    exit_period: int = 120  # Exit channel, bars
+    atr_period: int = 60
+    entry_atr: float = 0.25  # Close must clear the channel by this many ATRs
+    stop_atr: float = 2.0  # Stop distance from the entry close, ATRs
+    position_size_usd: float = 1000.0
+    order_id_tag: str = "002"
+    journal_dir: str | None = None  # Trade/fill journal (storage.journal)
+    flush_interval_s: int = 60  # Journal flush cadence, bounds data loss on a crash
+
+
+class BreakoutStrategy(Strategy):
+    def __init__(self, config: BreakoutConfig):
+        super().__init__(config)
+        self.instrument_id = InstrumentId.from_str(config.instrument_id)
+        self.position_size_usd = config.position_size_usd
+        self.signal = BreakoutSignal(
+            config.channel_period, config.exit_period, config.atr_period, config.entry_atr, config.stop_atr,
+        )
+        self._entry_order_id = None
+        self._exit_reason = None
+        self._journal = None
+        self._stop_order_ids = set()  # Closes sent from on_stop, journaled from the cache afterwards
+        self.trade_count = 0
+
+    def on_start(self):
+        self.log.info(f"Starting Breakout Strategy on {self.instrument_id}")
+        self._close_journal()  # Restarted without a reset: finish the previous run's journal
+        if self.config.journal_dir:
+            self._journal = TradeJournal(self.config.journal_dir, source="nautilus", strategy_id=str(self.id))
+            self.clock.set_timer(
+                f"{self.id}-FLUSH", timedelta(seconds=self.config.flush_interval_s), callback=self._on_flush_timer,
+            )
+
+        spec = self.config.bar_type
+        if not spec.endswith(("-EXTERNAL", "-INTERNAL")):
+            spec = f"{spec}-EXTERNAL"
+        self.subscribe_bars(BarType.from_str(f"{self.instrument_id}-{spec}"))
+
+    def on_bar(self, bar: Bar):
+        if bar.bar_type.instrument_id != self.instrument_id:
+            return
+        close = float(bar.close)
+        action = self.signal.update(float(bar.high), float(bar.low), close)
+
+        if action == 'enter_long':
+            self._enter(OrderSide.BUY, close)
+        elif action == 'enter_short':
+            self._enter(OrderSide.SELL, close)
+        elif action == 'exit':
+            self.log.info(f"Exit ({self.signal.exit_reason}) at {close}")
+            self._exit_reason = self.signal.exit_reason
+            self.close_all_positions(self.instrument_id)
+
+    def _enter(self, side, price):
+        instrument = self.cache.instrument(self.instrument_id)
+        if instrument is None:
+            self.log.error("Instrument not found in cache, cannot size entry")
+            self.signal.flatten()
+            return
+        quantity = instrument.make_qty(self.position_size_usd / price)
+        if quantity.as_double() <= 0:
+            self.log.warning(f"Entry quantity rounds to zero at {price}, skipping")
+            self.signal.flatten()
+            return
+
+        self.log.info(f"Breakout {side.name}: {quantity} @ {price}, stop {self.signal.stop:.2f}")
+        order = self.order_factory.market(
+            instrument_id=self.instrument_id,
+            order_side=side,
+            quantity=quantity,
+            time_in_force=TimeInForce.GTC,
+        )
+        self._entry_order_id = order.client_order_id
+        self.submit_order(order)
+        self.trade_count += 1
+
+    def on_order_rejected(self, event):
+        self._on_entry_failed(event)
+
+    def on_order_denied(self, event):
+        self._on_entry_failed(event)
+
+    def _on_entry_failed(self, event):
+        if event.client_order_id == self._entry_order_id:
+            self.log.warning(f"Entry order failed ({type(event).__name__}), signal reset to flat")
+            self._entry_order_id = None
+            self.signal.flatten()
+
+    def on_order_filled(self, event):
+        if self._journal is None:
+            return
+        intent = "entry" if event.client_order_id == self._entry_order_id else "close"
+        self._journal.record_fill(
+            event.ts_event, str(event.instrument_id), str(event.client_order_id), event.order_side.name,
+            event.last_qty.as_double(), event.last_px.as_double(),
+            event.commission.as_double() if event.commission is not None else 0.0, intent,
+        )
+
+    def on_position_closed(self, event):
+        if self._journal is None:
+            return
+        # Realized PnL of a closed position is net of commissions
+        self._journal.record_trade(
+            event.ts_opened, event.ts_closed, "long" if event.entry == OrderSide.BUY else "short",
+            event.avg_px_open, float("nan"), event.avg_px_close, float("nan"),
+            event.peak_qty.as_double(), 0.0, 1.0, event.realized_pnl.as_double(), self._exit_reason or "",
+        )
+        self._exit_reason = None
+
+    def on_stop(self):
+        known = self.cache.client_order_ids(strategy_id=self.id)
+        if self.signal.side:
+            self._exit_reason = "stop_strategy"
+            self.close_all_positions(self.instrument_id)
+        self._stop_order_ids = self.cache.client_order_ids(strategy_id=self.id) - known
+        self.log.info(f"Strategy stopped. Total trades: {self.trade_count}")
+
+    def _on_flush_timer(self, event):
+        self._journal.flush()
+
+    def _close_journal(self):
+        """Journal the on_stop closes from the cache, then close the journal (kept open until now for them)"""
+        if self._journal is not None:
+            replay_stop_events(self, self._stop_order_ids)
+            self._journal.close()
+            self._journal = None
+        self._stop_order_ids = set()
+
+    def on_dispose(self):
+        self._close_journal()
+
+    def on_reset(self):
+        self._close_journal()
+        self.signal.reset()
+        self._entry_order_id = None
+        self._exit_reason = None
+        self.trade_count = 0
@@ -0,0 +1,163 @@
+"""
+Incremental mean / covariance of N synchronized series for cross-asset signals
+One rank-1 update per synchronized bar into preallocated arrays, O(N^2) per update instead of
+the O(N^2 W) of recomputing np.cov / np.corrcoef over a rolling window every bar
+"""
+
+import math
+
+import numpy as np
+
+
+class _CovarianceQueries:
+    """Correlation, beta and residual queries shared by the estimators (need mean and covariance())"""
+
+    __slots__ = ()
+
+    def std(self):
+        return np.sqrt(np.maximum(np.diagonal(self.covariance()), 0.0))
+
+    def correlation(self):
+        """Full N x N correlation matrix"""
+        cov = self.covariance()
+        std = self.std()
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.nan_to_num(cov / np.outer(std, std))
+
+    def correlation_row(self, i):
+        """Correlations of every series with series i, O(N)"""
+        cov = self.covariance()
+        std = self.std()
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.nan_to_num(cov[i] / (std[i] * std))
+
+    def beta(self, i, j):
+        """Regression beta of series i on series j"""
+        cov = self.covariance()
+        return cov[i, j] / cov[j, j] if cov[j, j] > 0 else 0.0
+
+    def betas(self, j):
+        """Betas of every series on series j, O(N)"""
+        cov = self.covariance()
+        return cov[:, j] / cov[j, j] if cov[j, j] > 0 else np.zeros(len(cov))
+
+    def residuals(self, x, j):
+        """Demeaned x minus its beta-weighted part explained by series j"""
+        centered = np.asarray(x, dtype=np.float64) - self.mean
+        return centered - self.betas(j) * centered[j]
+
+
+class EWCovariance(_CovarianceQueries):
+    """Exponentially weighted mean and (biased) covariance, seeded with the first observation
+
+        d = x - mean;  mean += a d;  cov = (1 - a)(cov + a d d^T)
+    """
+
+    __slots__ = ('n', 'alpha', 'mean', 'cov', 'count', '_delta', '_outer')
+
+    def __init__(self, n, halflife=None, alpha=None):
+        if alpha is None:
+            alpha = 1.0 - math.exp(math.log(0.5) / halflife)
+        self.n = int(n)
+        self.alpha = float(alpha)
+        self.mean = np.zeros(self.n)
+        self.cov = np.zeros((self.n, self.n))
+        self._delta = np.zeros(self.n)
+        self._outer = np.zeros((self.n, self.n))
+        self.count = 0
+
+    def update(self, x):
+        if not self.count:
+            self.mean[:] = x
+            self.count = 1
+            return
+        a = self.alpha
+        delta = np.subtract(x, self.mean, out=self._delta)
+        self.mean += a * delta
+        # Scale the vector, not the matrix: three N x N passes per update
+        np.outer(delta * (a * (1.0 - a)), delta, out=self._outer)
+        self.cov *= 1.0 - a
+        self.cov += self._outer
+        self.count += 1
+
+    def covariance(self):
+        return self.cov
+
+    def reset(self):
+        self.mean.fill(0.0)
+        self.cov.fill(0.0)
+        self.count = 0
+
+
+class RollingCovariance(_CovarianceQueries):
+    """Sample mean and covariance over the last `window` observations
+
+    Running sums get one rank-1 add and one rank-1 remove per update; they are rebuilt from the
+    ring buffer once per window so rounding error cannot accumulate."""
+
+    __slots__ = ('n', 'window', 'buffer', 'index', 'count', 'sums', 'cross', 'mean', 'cov', '_outer', '_since_rebuild',
+                 '_dirty')
+
+    def __init__(self, n, window):
+        self.n = int(n)
+        self.window = int(window)
+        self.buffer = np.zeros((self.window, self.n))
+        self.sums = np.zeros(self.n)
+        self.cross = np.zeros((self.n, self.n))
+        self.mean = np.zeros(self.n)
+        self.cov = np.zeros((self.n, self.n))
+        self._outer = np.zeros((self.n, self.n))
+        self.index = 0
+        self.count = 0
+        self._since_rebuild = 0
+        self._dirty = False
+
+    def update(self, x):
+        row = self.buffer[self.index]
+        if self.count == self.window:
+            self.sums -= row
+            self.cross -= np.outer(row, row, out=self._outer)
+        else:
+            self.count += 1
+        row[:] = x
+        self.sums += row
+        self.cross += np.outer(row, row, out=self._outer)
+        self.index = (self.index + 1) % self.window
+        self._dirty = True
+
+        self._since_rebuild += 1
+        if self._since_rebuild >= self.window:
+            rows = self.buffer[:self.count]
+            self.sums[:] = rows.sum(axis=0)
+            np.dot(rows.T, rows, out=self.cross)
+            self._since_rebuild = 0
+
+    def covariance(self):
+        """Sample covariance, recomputed from the running sums at most once per update"""
+        if not self._dirty:
+            return self.cov
+        self._dirty = False
+        m = self.count
+        np.divide(self.sums, max(m, 1), out=self.mean)
+        if m < 2:
+            self.cov.fill(0.0)
+            return self.cov
+        np.outer(self.sums, self.mean, out=self.cov)
+        np.subtract(self.cross, self.cov, out=self.cov)
+        self.cov /= m - 1
+        return self.cov
+
+    def residuals(self, x, j):
+        self.covariance()  # Refreshes mean after an update
+        return super().residuals(x, j)
+
+    def reset(self):
+        self.buffer.fill(0.0)
+        self.sums.fill(0.0)
+        self.cross.fill(0.0)
+        self.mean.fill(0.0)
+        self.cov.fill(0.0)
+        self.index = 0
+        self.count = 0
+        self._since_rebuild = 0
+        self._dirty = False
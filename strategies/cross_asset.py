@@ -0,0 +1,239 @@
+"""
+Cross-Asset Residual Strategy - Alpha 4
+Statistical arbitrage across many instruments: each instrument's return is split into a
+beta-to-benchmark part and a residual, using an incrementally updated covariance matrix.
+Residuals are accumulated with exponential decay; an instrument whose cumulative residual
+z-score is stretched beyond entry_z is faded, with the basket's beta hedged on the benchmark.
+
+Bars of all instruments are synchronized by timestamp in preallocated arrays, then the
+covariance gets one rank-1 update per minute (strategies/covariance.py), O(N^2) for N
+instruments and independent of the estimation window.
+"""
+
+from datetime import timedelta
+import math
+
+import numpy as np
+from nautilus_trader.config import StrategyConfig
+from nautilus_trader.model.data import Bar, BarType
+from nautilus_trader.model.enums import OrderSide, TimeInForce
+from nautilus_trader.model.identifiers import InstrumentId
+from nautilus_trader.trading.strategy import Strategy
+
+from storage.journal import TradeJournal, replay_stop_events
+from strategies.covariance import EWCovariance, RollingCovariance
+
+
+class CrossAssetSignal:
+    """Residual z-scores and target positions for N instruments, one update per synchronized bar"""
+
+    def __init__(self, n, benchmark=0, halflife=240, window=0, residual_halflife=60, entry_z=2.0, exit_z=0.5,
+                 warmup=1440):
+        self.n = n
+        self.benchmark = benchmark
+        self.cov = RollingCovariance(n, window) if window else EWCovariance(n, halflife=halflife)
+        self.decay = math.exp(math.log(0.5) / residual_halflife)
+        self.entry_z = entry_z
+        self.exit_z = exit_z
+        self.warmup = warmup
+        self.prev = np.zeros(n)
+        self.spread = np.zeros(n)  # Decayed cumulative residual return
+        self.residual_var = np.zeros(n)
+        self.z = np.zeros(n)
+        self.position = np.zeros(n, dtype=np.int8)
+        self.count = 0
+
+    def update(self, prices):
+        """Closes of all instruments for one timestamp; returns target positions (-1, 0, +1), benchmark 0"""
+        if not self.count:
+            self.prev[:] = prices
+            self.count = 1
+            return self.position
+        returns = np.log(prices / self.prev)
+        self.prev[:] = prices
+        self.cov.update(returns)
+        self.count += 1
+
+        residual = self.cov.residuals(returns, self.benchmark)
+        decay = self.decay
+        self.spread *= decay
+        self.spread += residual
+        self.residual_var += (1.0 - decay) * (residual * residual - self.residual_var)
+        if self.count <= self.warmup:
+            return self.position
+
+        # Stationary std of the decayed sum of residuals with this variance
+        scale = np.sqrt(self.residual_var / (1.0 - decay * decay))
+        np.divide(self.spread, scale, out=self.z, where=scale > 0)
+        magnitude = np.abs(self.z)
+
+        position = self.position
+        position[magnitude < self.exit_z] = 0
+        enter = (position == 0) & (magnitude > self.entry_z)
+        position[enter] = -np.sign(self.z[enter])  # Fade the stretched residual
+        position[self.benchmark] = 0
+        return position
+
+    def target_notionals(self, size):
+        """USD per instrument for the current positions, the basket's beta offset on the benchmark"""
+        targets = self.position * float(size)
+        betas = self.cov.betas(self.benchmark)
+        targets[self.benchmark] = -float(np.dot(betas, targets))
+        return targets
+
+    def reset(self):
+        self.cov.reset()
+        for array in (self.prev, self.spread, self.residual_var, self.z, self.position):
+            array.fill(0)
+        self.count = 0
+
+
+class CrossAssetConfig(StrategyConfig, frozen=True, kw_only=True):
+    instrument_ids: tuple[str, ...]
+    benchmark_id: str | None = None  # Beta/hedge instrument, first of instrument_ids by default
+    bar_type: str = "1-MINUTE-LAST"
+    halflife_bars: int = 240  # Covariance half-life
+    window_bars: int = 0  # > 0: fixed-window covariance instead of exponentially weighted
+    residual_halflife_bars: int = 60
+    entry_z: float = 2.0
+    exit_z: float = 0.5
+    warmup_bars: int = 1440
+    position_size_usd: float = 1000.0  # Per instrument leg
+    min_order_usd: float = 10.0  # Smaller rebalance deltas are skipped
+    order_id_tag: str = "004"
+    journal_dir: str | None = None  # Trade/fill journal (storage.journal)
+    flush_interval_s: int = 60  # Journal flush cadence, bounds data loss on a crash
+
+
+class CrossAssetStrategy(Strategy):
+    def __init__(self, config: CrossAssetConfig):
+        super().__init__(config)
+        self.instrument_ids = [InstrumentId.from_str(i) for i in config.instrument_ids]
+        self.index = {instrument_id: i for i, instrument_id in enumerate(self.instrument_ids)}
+        benchmark = InstrumentId.from_str(config.benchmark_id) if config.benchmark_id else self.instrument_ids[0]
+        n = len(self.instrument_ids)
+        self.signal = CrossAssetSignal(
+            n, self.index[benchmark], config.halflife_bars, config.window_bars, config.residual_halflife_bars,
+            config.entry_z, config.exit_z, config.warmup_bars,
+        )
+
+        # Bar synchronization: latest close per instrument for the pending timestamp
+        self._prices = np.full(n, np.nan)
+        self._seen = np.zeros(n, dtype=bool)
+        self._seen_count = 0
+        self._pending_ts = None
+        self._positions = np.zeros(n, dtype=np.int8)
+        self._journal = None
+        self._stop_order_ids = set()  # Closes sent from on_stop, journaled from the cache afterwards
+        self.rebalances = 0
+
+    def on_start(self):
+        self.log.info(f"Starting Cross-Asset Strategy on {len(self.instrument_ids)} instruments")
+        self._close_journal()  # Restarted without a reset: finish the previous run's journal
+        if self.config.journal_dir:
+            self._journal = TradeJournal(self.config.journal_dir, source="nautilus", strategy_id=str(self.id))
+            self.clock.set_timer(
+                f"{self.id}-FLUSH", timedelta(seconds=self.config.flush_interval_s), callback=self._on_flush_timer,
+            )
+
+        spec = self.config.bar_type
+        if not spec.endswith(("-EXTERNAL", "-INTERNAL")):
+            spec = f"{spec}-EXTERNAL"
+        for instrument_id in self.instrument_ids:
+            self.subscribe_bars(BarType.from_str(f"{instrument_id}-{spec}"))
+
+    def on_bar(self, bar: Bar):
+        i = self.index.get(bar.bar_type.instrument_id)
+        if i is None:
+            return
+        if bar.ts_event != self._pending_ts:
+            if self._seen_count:
+                self._on_synchronized()  # Some instruments had no bar at the previous timestamp
+            self._pending_ts = bar.ts_event
+        self._prices[i] = float(bar.close)
+        if not self._seen[i]:
+            self._seen[i] = True
+            self._seen_count += 1
+            if self._seen_count == len(self._seen):
+                self._on_synchronized()
+
+    def _on_synchronized(self):
+        # Missing instruments carry their last close (zero return)
+        self._seen.fill(False)
+        self._seen_count = 0
+        if np.isnan(self._prices).any():
+            return  # Not every instrument has printed yet
+        positions = self.signal.update(self._prices)
+        if not np.array_equal(positions, self._positions):
+            self._positions[:] = positions
+            self._rebalance()
+
+    def _rebalance(self):
+        targets = self.signal.target_notionals(self.config.position_size_usd)
+        self.rebalances += 1
+        for instrument_id, target, price in zip(self.instrument_ids, targets, self._prices):
+            delta = target / price - float(self.portfolio.net_position(instrument_id))
+            if abs(delta) * price < self.config.min_order_usd:
+                continue
+            instrument = self.cache.instrument(instrument_id)
+            if instrument is None:
+                self.log.error(f"{instrument_id} not found in cache, cannot rebalance it")
+                continue
+            quantity = instrument.make_qty(abs(delta))
+            if quantity.as_double() <= 0:
+                continue
+            self.submit_order(self.order_factory.market(
+                instrument_id=instrument_id,
+                order_side=OrderSide.BUY if delta > 0 else OrderSide.SELL,
+                quantity=quantity,
+                time_in_force=TimeInForce.GTC,
+            ))
+
+    def on_order_filled(self, event):
+        if self._journal is None:
+            return
+        self._journal.record_fill(
+            event.ts_event, str(event.instrument_id), str(event.client_order_id), event.order_side.name,
+            event.last_qty.as_double(), event.last_px.as_double(),
+            event.commission.as_double() if event.commission is not None else 0.0, "rebalance",
+        )
+
+    def on_position_closed(self, event):
+        if self._journal is None:
+            return
+        self._journal.record_trade(
+            event.ts_opened, event.ts_closed, "long" if event.entry == OrderSide.BUY else "short",
+            event.avg_px_open, float("nan"), event.avg_px_close, float("nan"),
+            event.peak_qty.as_double(), 0.0, 1.0, event.realized_pnl.as_double(), "residual",
+        )
+
+    def on_stop(self):
+        known = self.cache.client_order_ids(strategy_id=self.id)
+        for instrument_id in self.instrument_ids:
+            self.close_all_positions(instrument_id)
+        self._stop_order_ids = self.cache.client_order_ids(strategy_id=self.id) - known
+        self.log.info(f"Strategy stopped. Rebalances: {self.rebalances}")
+
+    def _on_flush_timer(self, event):
+        self._journal.flush()
+
+    def _close_journal(self):
+        """Journal the on_stop closes from the cache, then close the journal (kept open until now for them)"""
+        if self._journal is not None:
+            replay_stop_events(self, self._stop_order_ids)
+            self._journal.close()
+            self._journal = None
+        self._stop_order_ids = set()
+
+    def on_dispose(self):
+        self._close_journal()
+
+    def on_reset(self):
+        self._close_journal()
+        self.signal.reset()
+        self._prices.fill(np.nan)
+        self._seen.fill(False)
+        self._seen_count = 0
+        self._pending_ts = None
+        self._positions.fill(0)
+        self.rebalances = 0
@@ -0,0 +1,227 @@
+"""
+Compact L2 order book with incrementally maintained microstructure features
+Each side is a pair of fixed-length array('d') buffers (price keys, sizes) kept sorted best
+first; a level change is a bisect plus an in-place set, or an insert/delete that shifts the
+tail inside the preallocated buffer. Nothing is allocated per update beyond transient floats.
+
+Features (BookFeatures, one reused record): best bid/ask and sizes, mid, spread, microprice,
+top-k depth imbalance from running sums, and an exponentially weighted best-level depletion
+rate. QueuePosition estimates the size ahead of a resting order from the same updates.
+"""
+
+from array import array
+from bisect import bisect_left
+
+
+class BookSide:
+    """One side, best level first; bids are stored as negated prices so both sides sort ascending"""
+
+    __slots__ = ('sign', 'depth', 'keys', 'sizes', 'count', 'top_k', 'top_size')
+
+    def __init__(self, is_bid, depth=1000, top_k=5):
+        self.sign = -1.0 if is_bid else 1.0
+        self.depth = int(depth)
+        self.keys = array('d', bytes(8 * self.depth))
+        self.sizes = array('d', bytes(8 * self.depth))
+        self.count = 0
+        self.top_k = int(top_k)
+        self.top_size = 0.0  # Total size of the best top_k levels
+
+    def set(self, price, size):
+        """Absolute size at a price level, 0 removes it"""
+        keys, sizes, n, k = self.keys, self.sizes, self.count, self.top_k
+        key = self.sign * price
+        i = bisect_left(keys, key, 0, n)
+        if i < n and keys[i] == key:
+            if size > 0:
+                if i < k:
+                    self.top_size += size - sizes[i]
+                sizes[i] = size
+                return
+            if i < k:
+                self.top_size -= sizes[i]
+                if n > k:
+                    self.top_size += sizes[k]  # The next level moves into the top k
+            # Shift the tail left in place; the buffers keep their length
+            del keys[i]
+            del sizes[i]
+            keys.append(0.0)
+            sizes.append(0.0)
+            self.count = n - 1
+        elif size > 0 and i < self.depth:
+            if i < k:
+                self.top_size += size
+                if n >= k:
+                    self.top_size -= sizes[k - 1]  # Pushed out of the top k
+                elif n == self.depth:
+                    self.top_size -= sizes[n - 1]  # Full book shallower than top_k: the dropped level was counted
+            keys.insert(i, key)
+            sizes.insert(i, size)
+            keys.pop()  # Drop the worst level when the book is at full depth
+            sizes.pop()
+            if n < self.depth:
+                self.count = n + 1
+
+    def best_price(self):
+        return self.sign * self.keys[0] if self.count else 0.0
+
+    def best_size(self):
+        return self.sizes[0] if self.count else 0.0
+
+    def level(self, i):
+        """(price, size) of the i-th best level"""
+        return self.sign * self.keys[i], self.sizes[i]
+
+    def size_at(self, price):
+        key = self.sign * price
+        i = bisect_left(self.keys, key, 0, self.count)
+        return self.sizes[i] if i < self.count and self.keys[i] == key else 0.0
+
+    def clear(self):
+        for i in range(self.count):
+            self.keys[i] = 0.0
+            self.sizes[i] = 0.0
+        self.count = 0
+        self.top_size = 0.0
+
+
+class BookFeatures:
+    """Latest feature values, updated in place after every book update"""
+
+    __slots__ = ('ts', 'best_bid', 'best_ask', 'bid_size', 'ask_size', 'mid', 'spread', 'microprice',
+                 'imbalance', 'bid_depletion', 'ask_depletion', 'updates')
+
+    def __init__(self):
+        self.ts = 0
+        self.best_bid = self.best_ask = self.bid_size = self.ask_size = 0.0
+        self.mid = self.spread = self.microprice = self.imbalance = 0.0
+        self.bid_depletion = self.ask_depletion = 0.0
+        self.updates = 0
+
+
+class QueuePosition:
+    """Size estimated ahead of a resting order; decreases at its level are spread pro rata over the queue"""
+
+    __slots__ = ('is_bid', 'price', 'ahead', 'level_size')
+
+    def __init__(self, is_bid, price, level_size):
+        self.is_bid = is_bid
+        self.price = price
+        self.ahead = level_size  # Joined at the back
+        self.level_size = level_size
+
+    def on_level(self, size):
+        if size < self.level_size and self.level_size > 0:
+            self.ahead *= size / self.level_size
+        self.level_size = size
+
+    @property
+    def filled_likely(self):
+        return self.ahead <= 0.0
+
+
+class L2Book:
+    """Bounded-depth L2 book for one instrument, with Binance snapshot / diff-depth sequencing"""
+
+    __slots__ = ('bids', 'asks', 'features', 'decay', 'last_update_id', 'synced', 'queues')
+
+    def __init__(self, depth=1000, top_k=5, depletion_halflife=50):
+        self.bids = BookSide(True, depth, top_k)
+        self.asks = BookSide(False, depth, top_k)
+        self.features = BookFeatures()
+        self.decay = 0.5 ** (1.0 / depletion_halflife)  # Per update
+        self.last_update_id = None
+        self.synced = False
+        self.queues = []  # QueuePosition of own resting orders
+
+    def clear(self):
+        self.bids.clear()
+        self.asks.clear()
+        self.last_update_id = None
+        self.synced = False
+
+    def set_level(self, is_bid, price, size):
+        (self.bids if is_bid else self.asks).set(price, size)
+        for queue in self.queues:
+            if queue.is_bid == is_bid and queue.price == price:
+                queue.on_level(size)
+
+    def apply_snapshot(self, snapshot, ts=0):
+        """REST depth snapshot: {'lastUpdateId', 'bids': [[price, qty], ...], 'asks': [...]}"""
+        self.bids.clear()
+        self.asks.clear()
+        for price, size in snapshot['bids']:
+            self.set_level(True, float(price), float(size))
+        for price, size in snapshot['asks']:
+            self.set_level(False, float(price), float(size))
+        self.last_update_id = snapshot['lastUpdateId']
+        self.synced = False
+        self.update_features(ts)
+
+    def apply_depth_update(self, event):
+        """Binance diff-depth event (U, u, pu, b, a); False when a gap means a new snapshot is needed"""
+        last = self.last_update_id
+        if last is None:
+            return False
+        if event['u'] < last:
+            return True  # Older than the snapshot
+        if self.synced:
+            previous = event.get('pu')
+            if (previous if previous is not None else event['U'] - 1) != last:
+                self.synced = False
+                self.last_update_id = None
+                return False
+        elif event['U'] > last + 1:
+            self.last_update_id = None
+            return False  # Snapshot is older than the first buffered event
+        self.synced = True
+
+        set_level = self.set_level if self.queues else None
+        bids, asks = self.bids, self.asks
+        for price, size in event['b']:
+            if set_level is None:
+                bids.set(float(price), float(size))
+            else:
+                set_level(True, float(price), float(size))
+        for price, size in event['a']:
+            if set_level is None:
+                asks.set(float(price), float(size))
+            else:
+                set_level(False, float(price), float(size))
+        self.last_update_id = event['u']
+        self.update_features(event.get('E', 0) * 1_000_000)
+        return True
+
+    def update_features(self, ts=0):
+        """O(1): top of book, running top-k sums and the previous best levels"""
+        f = self.features
+        bids, asks = self.bids, self.asks
+        bid, ask = bids.best_price(), asks.best_price()
+        bid_size, ask_size = bids.best_size(), asks.best_size()
+
+        # Best-level depletion: size taken off the previous best (all of it if the level is gone)
+        decay = self.decay
+        if f.updates:
+            taken = 0.0
+            if bid == f.best_bid:
+                taken = f.bid_size - bid_size if bid_size < f.bid_size else 0.0
+            elif bid < f.best_bid:
+                taken = f.bid_size
+            f.bid_depletion = decay * f.bid_depletion + (1.0 - decay) * taken
+            taken = 0.0
+            if ask == f.best_ask:
+                taken = f.ask_size - ask_size if ask_size < f.ask_size else 0.0
+            elif ask > f.best_ask:
+                taken = f.ask_size
+            f.ask_depletion = decay * f.ask_depletion + (1.0 - decay) * taken
+
+        f.ts = ts
+        f.best_bid, f.best_ask, f.bid_size, f.ask_size = bid, ask, bid_size, ask_size
+        f.mid = (bid + ask) * 0.5
+        f.spread = ask - bid
+        total = bid_size + ask_size
+        f.microprice = (bid * ask_size + ask * bid_size) / total if total > 0 else f.mid
+        depth = bids.top_size + asks.top_size
+        f.imbalance = (bids.top_size - asks.top_size) / depth if depth > 0 else 0.0
+        f.updates += 1
+        return f
@@ -0,0 +1,237 @@
+"""
+Order-Book Microstructure Strategy - Alpha 5
+Trades short-horizon pressure in the L2 book: go long when top-k depth imbalance is bid-heavy,
+the microprice sits above the mid by at least edge_bps and offers are being depleted faster
+than bids (short mirrored). Exits when the imbalance fades, or after max_hold_seconds.
+
+The book is strategies/l2_book.L2Book, kept by the strategy itself from order book deltas
+(managed=False), so each delta is a bisect and an in-place array update and the features are
+refreshed once per delta batch in O(1).
+"""
+
+from datetime import timedelta
+
+from nautilus_trader.config import StrategyConfig
+from nautilus_trader.model.data import OrderBookDeltas
+from nautilus_trader.model.enums import BookAction, BookType, OrderSide, TimeInForce
+from nautilus_trader.model.identifiers import InstrumentId
+from nautilus_trader.trading.strategy import Strategy
+
+from storage.journal import TradeJournal, replay_stop_events
+from strategies.l2_book import L2Book
+
+
+class MicrostructureSignal:
+    """Target position (+1, 0, -1) from BookFeatures, with a hold limit and a decision throttle"""
+
+    __slots__ = ('entry_imbalance', 'exit_imbalance', 'edge', 'max_spread', 'max_hold_ns', 'min_interval_ns',
+                 'position', 'opened_ts', 'changed_ts')
+
+    def __init__(self, entry_imbalance=0.6, exit_imbalance=0.2, edge_bps=0.5, max_spread_bps=5.0,
+                 max_hold_seconds=30.0, min_interval_ms=250.0):
+        self.entry_imbalance = entry_imbalance
+        self.exit_imbalance = exit_imbalance
+        self.edge = edge_bps * 1e-4
+        self.max_spread = max_spread_bps * 1e-4
+        self.max_hold_ns = int(max_hold_seconds * 1e9)
+        self.min_interval_ns = int(min_interval_ms * 1e6)
+        self.position = 0
+        self.opened_ts = 0
+        self.changed_ts = None
+
+    def update(self, f):
+        """Features after a book update; returns the target position"""
+        position = self.position
+        ts = f.ts
+        if self.changed_ts is not None and ts - self.changed_ts < self.min_interval_ns:
+            return position
+        if f.best_bid <= 0 or f.best_ask <= f.best_bid:
+            return position  # One-sided or crossed book
+
+        if position:
+            faded = f.imbalance * position < self.exit_imbalance
+            if faded or ts - self.opened_ts >= self.max_hold_ns:
+                position = 0
+        elif f.spread <= self.max_spread * f.mid:
+            skew = (f.microprice - f.mid) / f.mid
+            if f.imbalance > self.entry_imbalance and skew > self.edge and f.ask_depletion >= f.bid_depletion:
+                position = 1
+            elif f.imbalance < -self.entry_imbalance and skew < -self.edge and f.bid_depletion >= f.ask_depletion:
+                position = -1
+            if position:
+                self.opened_ts = ts
+
+        if position != self.position:
+            self.position = position
+            self.changed_ts = ts
+        return position
+
+    def flatten(self):
+        self.position = 0
+
+    def reset(self):
+        self.position = 0
+        self.opened_ts = 0
+        self.changed_ts = None
+
+
+class MicrostructureConfig(StrategyConfig, frozen=True, kw_only=True):
+    instrument_id: str
+    book_depth: int = 1000  # Levels kept per side
+    top_k: int = 5  # Levels in the imbalance sums
+    depletion_halflife: int = 50  # Book updates
+    entry_imbalance: float = 0.6
+    exit_imbalance: float = 0.2
+    edge_bps: float = 0.5  # Microprice minus mid, in bps of mid
+    max_spread_bps: float = 5.0
+    max_hold_seconds: float = 30.0
+    min_interval_ms: float = 250.0  # Minimum time between position changes
+    position_size_usd: float = 1000.0
+    order_id_tag: str = "005"
+    journal_dir: str | None = None  # Trade/fill journal (storage.journal)
+    flush_interval_s: int = 60  # Journal flush cadence, bounds data loss on a crash
+
+
+class MicrostructureStrategy(Strategy):
+    def __init__(self, config: MicrostructureConfig):
+        super().__init__(config)
+        self.instrument_id = InstrumentId.from_str(config.instrument_id)
+        self.position_size_usd = config.position_size_usd
+        self.book = L2Book(config.book_depth, config.top_k, config.depletion_halflife)
+        self.signal = MicrostructureSignal(
+            config.entry_imbalance, config.exit_imbalance, config.edge_bps, config.max_spread_bps,
+            config.max_hold_seconds, config.min_interval_ms,
+        )
+        self.position = 0
+        self._entry_order_id = None
+        self._journal = None
+        self._stop_order_ids = set()  # Closes sent from on_stop, journaled from the cache afterwards
+        self.trade_count = 0
+
+    def on_start(self):
+        self.log.info(f"Starting Microstructure Strategy on {self.instrument_id}, depth {self.config.book_depth}")
+        self._close_journal()  # Restarted without a reset: finish the previous run's journal
+        if self.config.journal_dir:
+            self._journal = TradeJournal(self.config.journal_dir, source="nautilus", strategy_id=str(self.id))
+            self.clock.set_timer(
+                f"{self.id}-FLUSH", timedelta(seconds=self.config.flush_interval_s), callback=self._on_flush_timer,
+            )
+        # The strategy keeps its own array book; no engine-managed book is needed
+        self.subscribe_order_book_deltas(self.instrument_id, BookType.L2_MBP, managed=False)
+
+    def on_order_book_deltas(self, deltas: OrderBookDeltas):
+        if deltas.instrument_id != self.instrument_id:
+            return
+        book = self.book
+        bids, asks = book.bids, book.asks
+        for delta in deltas.deltas:
+            action = delta.action
+            if action == BookAction.CLEAR:
+                bids.clear()
+                asks.clear()
+                continue
+            order = delta.order
+            size = 0.0 if action == BookAction.DELETE else order.size.as_double()
+            if book.queues:
+                book.set_level(order.side == OrderSide.BUY, order.price.as_double(), size)
+            elif order.side == OrderSide.BUY:
+                bids.set(order.price.as_double(), size)
+            else:
+                asks.set(order.price.as_double(), size)
+
+        target = self.signal.update(book.update_features(deltas.ts_event))
+        if target == self.position:
+            return
+
+        if self.position:
+            self.log.info(f"Book pressure gone, closing {'long' if self.position > 0 else 'short'}")
+            self.close_all_positions(self.instrument_id)
+        self.position = target
+        if target:
+            features = book.features
+            self._enter(OrderSide.BUY if target > 0 else OrderSide.SELL,
+                        features.best_ask if target > 0 else features.best_bid)
+
+    def _enter(self, side, price):
+        instrument = self.cache.instrument(self.instrument_id)
+        quantity = instrument.make_qty(self.position_size_usd / price) if instrument is not None else None
+        if quantity is None or quantity.as_double() <= 0:
+            self.log.warning(f"Cannot size {side.name} entry at {price}, staying flat")
+            self.signal.flatten()
+            self.position = 0
+            return
+
+        f = self.book.features
+        self.log.info(f"Book pressure {side.name}: {quantity} @ {price} "
+                      f"(imbalance {f.imbalance:.2f}, microprice {f.microprice:.2f})")
+        order = self.order_factory.market(
+            instrument_id=self.instrument_id,
+            order_side=side,
+            quantity=quantity,
+            time_in_force=TimeInForce.IOC,
+        )
+        self._entry_order_id = order.client_order_id
+        self.submit_order(order)
+        self.trade_count += 1
+
+    def on_order_rejected(self, event):
+        self._on_entry_failed(event)
+
+    def on_order_denied(self, event):
+        self._on_entry_failed(event)
+
+    def _on_entry_failed(self, event):
+        if event.client_order_id == self._entry_order_id:
+            self.log.warning(f"Entry order failed ({type(event).__name__}), signal reset to flat")
+            self._entry_order_id = None
+            self.signal.flatten()
+            self.position = 0
+
+    def on_order_filled(self, event):
+        if self._journal is None:
+            return
+        intent = "entry" if event.client_order_id == self._entry_order_id else "close"
+        self._journal.record_fill(
+            event.ts_event, str(event.instrument_id), str(event.client_order_id), event.order_side.name,
+            event.last_qty.as_double(), event.last_px.as_double(),
+            event.commission.as_double() if event.commission is not None else 0.0, intent,
+        )
+
+    def on_position_closed(self, event):
+        if self._journal is None:
+            return
+        self._journal.record_trade(
+            event.ts_opened, event.ts_closed, "long" if event.entry == OrderSide.BUY else "short",
+            event.avg_px_open, float("nan"), event.avg_px_close, float("nan"),
+            event.peak_qty.as_double(), 0.0, 1.0, event.realized_pnl.as_double(), "book_pressure",
+        )
+
+    def on_stop(self):
+        known = self.cache.client_order_ids(strategy_id=self.id)
+        if self.position:
+            self.close_all_positions(self.instrument_id)
+        self.unsubscribe_order_book_deltas(self.instrument_id)
+        self._stop_order_ids = self.cache.client_order_ids(strategy_id=self.id) - known
+        self.log.info(f"Strategy stopped. Total trades: {self.trade_count}")
+
+    def _on_flush_timer(self, event):
+        self._journal.flush()
+
+    def _close_journal(self):
+        """Journal the on_stop closes from the cache, then close the journal (kept open until now for them)"""
+        if self._journal is not None:
+            replay_stop_events(self, self._stop_order_ids)
+            self._journal.close()
+            self._journal = None
+        self._stop_order_ids = set()
+
+    def on_dispose(self):
+        self._close_journal()
+
+    def on_reset(self):
+        self._close_journal()
+        self.book.clear()
+        self.signal.reset()
+        self.position = 0
+        self._entry_order_id = None
+        self.trade_count = 0
@@ -0,0 +1,205 @@
+"""
+Multi-Alpha Portfolio Strategy
+Runs the bar alphas side by side on shared synchronized bars and trades only their netted
+target: breakout (Alpha 2) and multi-timeframe confluence (Alpha 3) per instrument, and the
+cross-asset residual basket (Alpha 4) across all of them. Every synchronized minute each alpha
+posts its target notionals to an execution.portfolio.PortfolioAggregator, which nets them per
+instrument, applies the exposure limits and yields one order per instrument that has to move.
+
+Orders are sized against the portfolio's actual net positions, so a rejected or partial order
+is picked up again on the next cycle instead of leaving an alpha's bookkeeping out of step.
+"""
+
+from datetime import timedelta
+
+import numpy as np
+from nautilus_trader.config import StrategyConfig
+from nautilus_trader.model.data import Bar, BarType
+from nautilus_trader.model.enums import OrderSide, TimeInForce
+from nautilus_trader.model.identifiers import InstrumentId
+from nautilus_trader.trading.strategy import Strategy
+
+from execution.portfolio import PortfolioAggregator
+from storage.journal import TradeJournal, replay_stop_events
+from strategies.breakout import BreakoutSignal
+from strategies.cross_asset import CrossAssetSignal
+from strategies.multi_timeframe import MultiTimeframeSignal
+
+
+ALPHAS = ('breakout', 'multi_timeframe', 'cross_asset')
+
+
+class MultiAlphaConfig(StrategyConfig, frozen=True, kw_only=True):
+    instrument_ids: tuple[str, ...]
+    bar_type: str = "1-MINUTE-LAST"
+    alphas: tuple[str, ...] = ALPHAS
+    alpha_weights: tuple[float, ...] | None = None  # Same order as alphas, 1.0 each by default
+    position_size_usd: float = 1000.0  # Per alpha and instrument
+    max_position_usd: float | None = 2500.0  # |Net target| per instrument
+    max_gross_usd: float | None = None
+    max_net_usd: float | None = None  # |Sum of net targets|, the directional exposure
+    min_order_usd: float = 10.0
+    cross_asset_warmup_bars: int = 1440
+    order_id_tag: str = "006"
+    journal_dir: str | None = None  # Trade/fill journal (storage.journal)
+    flush_interval_s: int = 60  # Journal flush cadence, bounds data loss on a crash
+
+
+class MultiAlphaStrategy(Strategy):
+    def __init__(self, config: MultiAlphaConfig):
+        super().__init__(config)
+        unknown = set(config.alphas) - set(ALPHAS)
+        if unknown:
+            raise ValueError(f"Unknown alphas {sorted(unknown)}, expected some of {ALPHAS}")
+        self.instrument_ids = [InstrumentId.from_str(i) for i in config.instrument_ids]
+        self.index = {instrument_id: i for i, instrument_id in enumerate(self.instrument_ids)}
+        n = len(self.instrument_ids)
+        self.aggregator = PortfolioAggregator(
+            self.instrument_ids, config.alphas, config.alpha_weights, config.max_position_usd,
+            config.max_gross_usd, config.max_net_usd, config.min_order_usd,
+        )
+
+        self.breakout = [BreakoutSignal() for _ in range(n)] if 'breakout' in config.alphas else None
+        self.mtf = [MultiTimeframeSignal() for _ in range(n)] if 'multi_timeframe' in config.alphas else None
+        self.cross_asset = (CrossAssetSignal(n, warmup=config.cross_asset_warmup_bars)
+                            if 'cross_asset' in config.alphas and n > 1 else None)
+
+        # Bar synchronization, as in CrossAssetStrategy, keeping the full bar for the per-instrument alphas
+        self._bars = np.full((n, 4), np.nan)  # open, high, low, close
+        self._fresh = np.zeros(n, dtype=bool)  # Bar received at the pending timestamp
+        self._seen_count = 0
+        self._pending_ts = None
+        self._journal = None
+        self._stop_order_ids = set()  # Closes sent from on_stop, journaled from the cache afterwards
+        self.cycles = 0
+
+    def on_start(self):
+        self.log.info(f"Starting Multi-Alpha Strategy: {', '.join(self.config.alphas)} "
+                      f"on {len(self.instrument_ids)} instruments")
+        self._close_journal()  # Restarted without a reset: finish the previous run's journal
+        if self.config.journal_dir:
+            self._journal = TradeJournal(self.config.journal_dir, source="nautilus", strategy_id=str(self.id))
+            self.clock.set_timer(
+                f"{self.id}-FLUSH", timedelta(seconds=self.config.flush_interval_s), callback=self._on_flush_timer,
+            )
+
+        spec = self.config.bar_type
+        if not spec.endswith(("-EXTERNAL", "-INTERNAL")):
+            spec = f"{spec}-EXTERNAL"
+        for instrument_id in self.instrument_ids:
+            self.subscribe_bars(BarType.from_str(f"{instrument_id}-{spec}"))
+
+    def on_bar(self, bar: Bar):
+        i = self.index.get(bar.bar_type.instrument_id)
+        if i is None:
+            return
+        if bar.ts_event != self._pending_ts:
+            if self._seen_count:
+                self._on_synchronized()
+            self._pending_ts = bar.ts_event
+        self._bars[i] = (float(bar.open), float(bar.high), float(bar.low), float(bar.close))
+        if not self._fresh[i]:
+            self._fresh[i] = True
+            self._seen_count += 1
+            if self._seen_count == len(self._fresh):
+                self._on_synchronized()
+
+    def _on_synchronized(self):
+        ts, fresh = self._pending_ts, self._fresh
+        closes = self._bars[:, 3]
+        size = self.config.position_size_usd
+        aggregator = self.aggregator
+
+        # Per-instrument alphas only see the instruments that printed this minute
+        for i in np.flatnonzero(fresh).tolist():
+            open_, high, low, close = self._bars[i].tolist()
+            if self.breakout is not None:
+                signal = self.breakout[i]
+                signal.update(high, low, close)
+                aggregator.targets[aggregator.alpha_index['breakout'], i] = signal.side * size
+            if self.mtf is not None:
+                position = self.mtf[i].update(ts, open_, high, low, close)
+                aggregator.targets[aggregator.alpha_index['multi_timeframe'], i] = position * size
+        fresh.fill(False)
+        self._seen_count = 0
+
+        if np.isnan(closes).any():
+            return  # Not every instrument has printed yet
+        if self.cross_asset is not None:
+            self.cross_asset.update(closes)
+            aggregator.set_targets('cross_asset', self.cross_asset.target_notionals(size))
+        self._rebalance(closes)
+
+    def _rebalance(self, prices):
+        positions = [float(self.portfolio.net_position(instrument_id)) for instrument_id in self.instrument_ids]
+        indices, quantities = self.aggregator.orders(positions, prices)
+        self.cycles += 1
+        for i, delta in zip(indices.tolist(), quantities.tolist()):
+            instrument_id = self.instrument_ids[i]
+            instrument = self.cache.instrument(instrument_id)
+            if instrument is None:
+                self.log.error(f"{instrument_id} not found in cache, cannot rebalance it")
+                continue
+            if abs(delta) < instrument.size_increment.as_double():
+                continue  # Below the lot size, make_qty would round it to zero
+            quantity = instrument.make_qty(abs(delta))
+            self.submit_order(self.order_factory.market(
+                instrument_id=instrument_id,
+                order_side=OrderSide.BUY if delta > 0 else OrderSide.SELL,
+                quantity=quantity,
+                time_in_force=TimeInForce.GTC,
+            ))
+
+    def on_order_filled(self, event):
+        if self._journal is None:
+            return
+        self._journal.record_fill(
+            event.ts_event, str(event.instrument_id), str(event.client_order_id), event.order_side.name,
+            event.last_qty.as_double(), event.last_px.as_double(),
+            event.commission.as_double() if event.commission is not None else 0.0, "net",
+        )
+
+    def on_position_closed(self, event):
+        if self._journal is None:
+            return
+        self._journal.record_trade(
+            event.ts_opened, event.ts_closed, "long" if event.entry == OrderSide.BUY else "short",
+            event.avg_px_open, float("nan"), event.avg_px_close, float("nan"),
+            event.peak_qty.as_double(), 0.0, 1.0, event.realized_pnl.as_double(), "net",
+        )
+
+    def on_stop(self):
+        known = self.cache.client_order_ids(strategy_id=self.id)
+        for instrument_id in self.instrument_ids:
+            self.close_all_positions(instrument_id)
+        self._stop_order_ids = self.cache.client_order_ids(strategy_id=self.id) - known
+        summary = self.aggregator.summary()
+        self.log.info(f"Strategy stopped. Net orders: {summary['net_orders']} vs {summary['standalone_orders']} "
+                      f"standalone ({summary['orders_saved_pct']}% saved)")
+
+    def _on_flush_timer(self, event):
+        self._journal.flush()
+
+    def _close_journal(self):
+        """Journal the on_stop closes from the cache, then close the journal (kept open until now for them)"""
+        if self._journal is not None:
+            replay_stop_events(self, self._stop_order_ids)
+            self._journal.close()
+            self._journal = None
+        self._stop_order_ids = set()
+
+    def on_dispose(self):
+        self._close_journal()
+
+    def on_reset(self):
+        self._close_journal()
+        for signal in (self.breakout or []) + (self.mtf or []):
+            signal.reset()
+        if self.cross_asset is not None:
+            self.cross_asset.reset()
+        self.aggregator.reset()
+        self._bars.fill(np.nan)
+        self._fresh.fill(False)
+        self._seen_count = 0
+        self._pending_ts = None
+        self.cycles = 0
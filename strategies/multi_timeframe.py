@@ -0,0 +1,261 @@
+"""
+Multi-Timeframe Confluence Strategy - Alpha 3
+Trend per timeframe is the sign of a fast minus slow EMA of its closes. Enter long when every
+higher timeframe is up and the lowest timeframe turns up (short mirrored), exit as soon as any
+timeframe disagrees.
+
+The strategy subscribes to 1-minute bars only: each timeframe is a TimeframeBars aggregator
+plus two EMAs, so a timeframe costs a few comparisons per minute and two EMA updates per
+completed bar. mtf_positions() is the vectorized batch version for backtests.
+"""
+
+from datetime import timedelta
+
+import numpy as np
+from nautilus_trader.config import StrategyConfig
+from nautilus_trader.model.data import Bar, BarType
+from nautilus_trader.model.enums import OrderSide, TimeInForce
+from nautilus_trader.model.identifiers import InstrumentId
+from nautilus_trader.trading.strategy import Strategy
+
+from storage.journal import TradeJournal, replay_stop_events
+from strategies.rolling import ExponentialAverage, TimeframeBars
+from strategies.vectorized import align_to_bars, ema, resample_bars
+
+
+NS_PER_MINUTE = 60_000_000_000
+
+
+class TimeframeTrend:
+    """One timeframe: aggregated bars and fast/slow EMAs of their closes; direction is 0 until warm"""
+
+    __slots__ = ('bars', 'fast', 'slow', 'direction')
+
+    def __init__(self, minutes, fast_period, slow_period, history=64):
+        self.fast = ExponentialAverage(fast_period)
+        self.slow = ExponentialAverage(slow_period)
+        self.bars = TimeframeBars(minutes * NS_PER_MINUTE, history, self._on_bar)
+        self.direction = 0
+
+    def _on_bar(self, ts, open_, high, low, close):
+        self.fast.push(close)
+        self.slow.push(close)
+        if self.slow.ready:
+            diff = self.fast.value - self.slow.value
+            self.direction = 1 if diff > 0 else -1 if diff < 0 else 0
+
+    def reset(self):
+        self.bars.reset()
+        self.fast.reset()
+        self.slow.reset()
+        self.direction = 0
+
+
+class MultiTimeframeSignal:
+    """Confluence across `timeframes` (minutes, lowest first); update() returns the target position"""
+
+    def __init__(self, timeframes=(5, 60, 240), fast_period=8, slow_period=21, history=64):
+        self.trends = [TimeframeTrend(minutes, fast_period, slow_period, history) for minutes in timeframes]
+        self.position = 0
+
+    def update(self, ts, open_, high, low, close):
+        """Add a 1-minute bar (ts = close time, ns); returns +1, 0 or -1"""
+        trends = self.trends
+        previous = trends[0].direction
+        for trend in trends:
+            trend.bars.push(ts, open_, high, low, close)
+
+        long_ok = all(trend.direction > 0 for trend in trends)
+        short_ok = all(trend.direction < 0 for trend in trends)
+        position = self.position
+        if (position > 0 and not long_ok) or (position < 0 and not short_ok):
+            position = 0
+        if position == 0:
+            # Enter only on the lowest timeframe turning, not when a higher one catches up
+            if long_ok and previous <= 0:
+                position = 1
+            elif short_ok and previous >= 0:
+                position = -1
+        self.position = position
+        return position
+
+    def flatten(self):
+        self.position = 0
+
+    def reset(self):
+        for trend in self.trends:
+            trend.reset()
+        self.position = 0
+
+
+def replay_positions(ts, open_, high, low, close, **params):
+    """Target position per bar from running MultiTimeframeSignal over arrays"""
+    signal = MultiTimeframeSignal(**params)
+    columns = (np.asarray(ts, dtype=np.int64).tolist(), *(np.asarray(a, dtype=np.float64).tolist()
+                                                          for a in (open_, high, low, close)))
+    return np.fromiter((signal.update(*bar) for bar in zip(*columns)), dtype=np.int64, count=len(close))
+
+
+def _entered_runs(ok, entry):
+    """ok, restricted to the runs of consecutive True values whose first bar is an entry"""
+    start = ok & ~np.r_[False, ok[:-1]]
+    run = np.cumsum(start)
+    entered = np.zeros(run[-1] + 1 if len(run) else 1, dtype=bool)
+    entered[run[start]] = entry[start]
+    return ok & entered[run]
+
+
+def timeframe_direction(ts, open_, high, low, close, minutes, fast_period, slow_period):
+    """TimeframeTrend.direction as of every input bar"""
+    completed_at, _, _, _, _, closes = resample_bars(ts, open_, high, low, close, minutes * NS_PER_MINUTE)
+    direction = np.nan_to_num(np.sign(ema(closes, fast_period) - ema(closes, slow_period)))
+    return np.nan_to_num(align_to_bars(completed_at, direction, len(close)))
+
+
+def mtf_positions(ts, open_, high, low, close, timeframes=(5, 60, 240), fast_period=8, slow_period=21):
+    """Vectorized MultiTimeframeSignal: target position (+1, 0, -1) per input bar"""
+    directions = [timeframe_direction(ts, open_, high, low, close, minutes, fast_period, slow_period)
+                  for minutes in timeframes]
+    lowest = directions[0]
+    previous = np.r_[0.0, lowest[:-1]]
+    long_ok = np.logical_and.reduce([d > 0 for d in directions])
+    short_ok = np.logical_and.reduce([d < 0 for d in directions])
+    # A position lasts from its entry until the confluence run it started in ends
+    long = _entered_runs(long_ok, previous <= 0)
+    short = _entered_runs(short_ok, previous >= 0)
+    return np.where(long, 1, np.where(short, -1, 0))
+
+
+class MultiTimeframeConfig(StrategyConfig, frozen=True, kw_only=True):
+    instrument_id: str
+    bar_type: str = "1-MINUTE-LAST"
+    timeframes: tuple[int, ...] = (5, 60, 240)  # Minutes, LTF / MTF / HTF
+    fast_period: int = 8
+    slow_period: int = 21
+    position_size_usd: float = 1000.0
+    order_id_tag: str = "003"
+    journal_dir: str | None = None  # Trade/fill journal (storage.journal)
+    flush_interval_s: int = 60  # Journal flush cadence, bounds data loss on a crash
+
+
+class MultiTimeframeStrategy(Strategy):
+    def __init__(self, config: MultiTimeframeConfig):
+        super().__init__(config)
+        self.instrument_id = InstrumentId.from_str(config.instrument_id)
+        self.position_size_usd = config.position_size_usd
+        self.signal = MultiTimeframeSignal(config.timeframes, config.fast_period, config.slow_period)
+        self.position = 0
+        self._entry_order_id = None
+        self._journal = None
+        self._stop_order_ids = set()  # Closes sent from on_stop, journaled from the cache afterwards
+        self.trade_count = 0
+
+    def on_start(self):
+        self.log.info(f"Starting Multi-Timeframe Strategy on {self.instrument_id}, timeframes {self.config.timeframes}m")
+        self._close_journal()  # Restarted without a reset: finish the previous run's journal
+        if self.config.journal_dir:
+            self._journal = TradeJournal(self.config.journal_dir, source="nautilus", strategy_id=str(self.id))
+            self.clock.set_timer(
+                f"{self.id}-FLUSH", timedelta(seconds=self.config.flush_interval_s), callback=self._on_flush_timer,
+            )
+
+        # One subscription; higher timeframes are aggregated from it
+        spec = self.config.bar_type
+        if not spec.endswith(("-EXTERNAL", "-INTERNAL")):
+            spec = f"{spec}-EXTERNAL"
+        self.subscribe_bars(BarType.from_str(f"{self.instrument_id}-{spec}"))
+
+    def on_bar(self, bar: Bar):
+        if bar.bar_type.instrument_id != self.instrument_id:
+            return
+        close = float(bar.close)
+        target = self.signal.update(bar.ts_event, float(bar.open), float(bar.high), float(bar.low), close)
+        if target == self.position:
+            return
+
+        if self.position:
+            self.log.info(f"Confluence lost, closing {'long' if self.position > 0 else 'short'}")
+            self.close_all_positions(self.instrument_id)
+        self.position = target
+        if target:
+            self._enter(OrderSide.BUY if target > 0 else OrderSide.SELL, close)
+
+    def _enter(self, side, price):
+        instrument = self.cache.instrument(self.instrument_id)
+        quantity = instrument.make_qty(self.position_size_usd / price) if instrument is not None else None
+        if quantity is None or quantity.as_double() <= 0:
+            self.log.warning(f"Cannot size {side.name} entry at {price}, staying flat")
+            self.signal.flatten()
+            self.position = 0
+            return
+
+        self.log.info(f"Confluence {side.name}: {quantity} @ {price}")
+        order = self.order_factory.market(
+            instrument_id=self.instrument_id,
+            order_side=side,
+            quantity=quantity,
+            time_in_force=TimeInForce.GTC,
+        )
+        self._entry_order_id = order.client_order_id
+        self.submit_order(order)
+        self.trade_count += 1
+
+    def on_order_rejected(self, event):
+        self._on_entry_failed(event)
+
+    def on_order_denied(self, event):
+        self._on_entry_failed(event)
+
+    def _on_entry_failed(self, event):
+        if event.client_order_id == self._entry_order_id:
+            self.log.warning(f"Entry order failed ({type(event).__name__}), signal reset to flat")
+            self._entry_order_id = None
+            self.signal.flatten()
+            self.position = 0
+
+    def on_order_filled(self, event):
+        if self._journal is None:
+            return
+        intent = "entry" if event.client_order_id == self._entry_order_id else "close"
+        self._journal.record_fill(
+            event.ts_event, str(event.instrument_id), str(event.client_order_id), event.order_side.name,
+            event.last_qty.as_double(), event.last_px.as_double(),
+            event.commission.as_double() if event.commission is not None else 0.0, intent,
+        )
+
+    def on_position_closed(self, event):
+        if self._journal is None:
+            return
+        self._journal.record_trade(
+            event.ts_opened, event.ts_closed, "long" if event.entry == OrderSide.BUY else "short",
+            event.avg_px_open, float("nan"), event.avg_px_close, float("nan"),
+            event.peak_qty.as_double(), 0.0, 1.0, event.realized_pnl.as_double(), "confluence",
+        )
+
+    def on_stop(self):
+        known = self.cache.client_order_ids(strategy_id=self.id)
+        if self.position:
+            self.close_all_positions(self.instrument_id)
+        self._stop_order_ids = self.cache.client_order_ids(strategy_id=self.id) - known
+        self.log.info(f"Strategy stopped. Total trades: {self.trade_count}")
+
+    def _on_flush_timer(self, event):
+        self._journal.flush()
+
+    def _close_journal(self):
+        """Journal the on_stop closes from the cache, then close the journal (kept open until now for them)"""
+        if self._journal is not None:
+            replay_stop_events(self, self._stop_order_ids)
+            self._journal.close()
+            self._journal = None
+        self._stop_order_ids = set()
+
+    def on_dispose(self):
+        self._close_journal()
+
+    def on_reset(self):
+        self._close_journal()
+        self.signal.reset()
+        self.position = 0
+        self._entry_order_id = None
+        self.trade_count = 0
@@ -3,30 +3,76 @@ Pairs Trading Strategy - Alpha 1
 Mean reversion strategy on cointegrated crypto pairs (BTC/ETH)
 """
 
-from decimal import Decimal
-import pandas as pd
+from collections import deque
+from datetime import datetime, timedelta, timezone
+import json
+import math
+import os
 import numpy as np
 from statsmodels.tsa.stattools import coint
-from nautilus_trader.indicators.average.ema import ExponentialMovingAverage
-from nautilus_trader.model.data import Bar
+from nautilus_trader.model.data import Bar, BarType, QuoteTick
 from nautilus_trader.model.enums import OrderSide, TimeInForce
 from nautilus_trader.model.identifiers import InstrumentId
-from nautilus_trader.model.instruments import Instrument
-from nautilus_trader.model.orders import MarketOrder
 from nautilus_trader.trading.strategy import Strategy
 from nautilus_trader.config import StrategyConfig
 
+from execution.leg_tracker import LegLatencyStats, SpreadExecution, SpreadLeg
+from storage.columnar import ColumnarWriter
+from storage.decisions import DECISION_SCHEMA
+from storage.journal import TradeJournal, replay_stop_events
+from strategies.rolling import RollingStats
+from telemetry.latency import StageTimer
+from telemetry.metrics import REGISTRY
 
-class PairsTradingConfig(StrategyConfig, frozen=True):
-    instrument_id_a: 
-    instrument_id_b:
+
+# Hot-path stages timed in on_bar / quote evaluation
+LATENCY_STAGES = ("buffer", "hedge_ratio", "spread", "zscore", "logic")
+BUFFER, HEDGE_RATIO, SPREAD, ZSCORE, LOGIC = range(len(LATENCY_STAGES))
+
+
+class PairsMetrics:
+    """Hot-path collectors, exported by telemetry.exporter.MetricsExporter"""
+    
+    def __init__(self, strategy_id):
+        labels = {"strategy": strategy_id}
+        self.bars = REGISTRY.counter("pairs_bars_total", "Bars received", labels)
+        self.decisions = REGISTRY.counter("pairs_decisions_total", "Signal evaluations", labels)
+        self.spread_orders = REGISTRY.counter("pairs_spread_orders_total", "Spread executions submitted", labels)
+        self.bar_to_signal = REGISTRY.summary("pairs_bar_to_signal_seconds", "Bar/quote event to trading decision", labels)
+        self.order_ack = REGISTRY.summary("pairs_order_ack_seconds", "Order submit to venue accept", labels)
+        self.order_fill = REGISTRY.summary("pairs_order_fill_seconds", "Order submit to complete fill", labels)
+        self.z_score = REGISTRY.gauge("pairs_z_score", "Latest spread z-score", labels)
+        self.spread = REGISTRY.gauge("pairs_spread", "Latest log-price spread", labels)
+        self.hedge_ratio = REGISTRY.gauge("pairs_hedge_ratio", "Fitted hedge ratio", labels)
+        self.in_position = REGISTRY.gauge("pairs_in_position", "1 while a spread position is open", labels)
+        self.buffer_a = REGISTRY.gauge("pairs_buffer_size", "Price buffer length", {**labels, "leg": "a"})
+        self.buffer_b = REGISTRY.gauge("pairs_buffer_size", "Price buffer length", {**labels, "leg": "b"})
+        self.spread_window = REGISTRY.gauge("pairs_spread_window_size", "Samples in the z-score window", labels)
+
+
+class PairsTradingConfig(StrategyConfig, frozen=True, kw_only=True):
+    instrument_id_a: str
+    instrument_id_b: str
     bar_type: str = "1-MINUTE-LAST"
     lookback_period: int = 60  
     rolling_window: int = 20  
+    z_entry_threshold: float = 2.0
     z_exit_threshold: float = 0.5
     z_stop_loss: float = 3.0
     position_size_usd: float = 1000.0
     order_id_tag: str = "001"
+    submit_as_order_list: bool = False  # Single batch submit where the venue supports it
+    leg_timeout_ms: int = 2000  # Max wait for both legs before resolving imbalance
+    signal_source: str = "bar"  # "bar" or "quote"
+    quote_price: str = "mid"  # "mid" or "microprice" (quote mode)
+    conflation_ms: int = 100  # At most one signal evaluation per interval (quote mode)
+    sample_interval_s: int = 60  # Spread/price sampling cadence for the stats (quote mode)
+    decision_log_dir: str | None = None  # Per-evaluation decisions, for live vs replay comparison
+    latency_sample_every: int = 0  # Time every Nth evaluation per stage, 0 = off
+    latency_report_interval_s: int = 300  # Percentile dump cadence to the log
+    metrics: bool = False  # Update the Prometheus-style collectors in telemetry.metrics
+    journal_dir: str | None = None  # Trade/fill journal (storage.journal), shared with the backtester
+    flush_interval_s: int = 60  # Journal/decision log flush cadence, bounds data loss on a crash
 
 
 class PairsTradingStrategy(Strategy):    
@@ -44,89 +90,265 @@ class PairsTradingStrategy(Strategy):
         self.position_size_usd = config.position_size_usd
         
         # State tracking
-        self.prices_a = []
-        self.prices_b = []
-        self.spreads = []
+        max_length = self.lookback_period * 1440  # Assuming 1-min samples
+        self.prices_a = deque(maxlen=max_length)
+        self.prices_b = deque(maxlen=max_length)
+        self.spread_stats = RollingStats(self.rolling_window * 1440)
         self.hedge_ratio = None
         self.in_position = False
         self.position_side = None  # 'long' or 'short'
         
+        # Two-leg execution tracking
+        self.leg_timeout_ns = config.leg_timeout_ms * 1_000_000
+        self._execution = None  # SpreadExecution in flight
+        self._execution_count = 0
+        self._leg_alert = None
+        self.leg_stats = LegLatencyStats()
+        
+        # Quote mode: latest tick per leg, evaluated at most once per conflation interval
+        self.use_quotes = config.signal_source == "quote"
+        self.use_microprice = config.quote_price == "microprice"
+        self.conflation_ns = config.conflation_ms * 1_000_000
+        self.sample_ns = config.sample_interval_s * 1_000_000_000
+        self._quote_a = None
+        self._quote_b = None
+        self._next_eval_ns = 0
+        self._next_sample_ns = 0
+        self._eval_scheduled = False
+        self.conflated_ticks = 0
+        self._decisions = None
+        
+        # Hot-path stage timings, None when off so the hot path pays a single check
+        self._latency = None
+        if config.latency_sample_every > 0:
+            self._latency = StageTimer(LATENCY_STAGES, config.latency_sample_every)
+        
+        self._metrics = PairsMetrics(str(self.id)) if config.metrics else None
+        
+        # Journal: open spread entry and fees paid since it was submitted
+        self._journal = None
+        self._entry_execution = None
+        self._trade_commission = 0.0
+        self._exit_reason = None
+        self._stop_order_ids = set()  # Closes sent from on_stop, journaled from the cache afterwards
+        
         # For logging
         self.trade_count = 0
         
     def on_start(self):
         self.log.info(f"Starting Pairs Trading Strategy")
         self.log.info(f"Pair: {self.instrument_id_a} / {self.instrument_id_b}")
+        self._close_journal()  # Restarted without a reset: finish the previous run's journal
+        
+        if self.config.decision_log_dir:
+            stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+            path = os.path.join(self.config.decision_log_dir, f"decisions-{self.id}-{stamp}.arrow")
+            self._decisions = ColumnarWriter(path, DECISION_SCHEMA, batch_rows=1024)
+            self.log.info(f"Logging decisions to {path}")
+        
+        if self.config.journal_dir:
+            self._journal = TradeJournal(self.config.journal_dir, source="nautilus", strategy_id=str(self.id))
+            self.log.info(f"Journaling trades and fills to {self.config.journal_dir}")
+        
+        if self._decisions is not None or self._journal is not None:
+            self.clock.set_timer(
+                f"{self.id}-FLUSH", timedelta(seconds=self.config.flush_interval_s), callback=self._on_flush_timer,
+            )
+        
+        if self._latency is not None:
+            self.clock.set_timer(
+                f"{self.id}-LATENCY",
+                timedelta(seconds=self.config.latency_report_interval_s),
+                callback=self._report_latency,
+            )
+        
+        if self.use_quotes:
+            self.subscribe_quote_ticks(self.instrument_id_a)
+            self.subscribe_quote_ticks(self.instrument_id_b)
+            self.log.info(f"Subscribed to quote ticks ({self.config.quote_price}, {self.config.conflation_ms}ms conflation)")
+            return
         
         # Subscribe to 1-minute bars for both instruments
-        bar_type_a = f"{self.instrument_id_a}-{self.config.bar_type}"
-        bar_type_b = f"{self.instrument_id_b}-{self.config.bar_type}"
-        
-        self.subscribe_bars(bar_type_a)
-        self.subscribe_bars(bar_type_b)
+        self.subscribe_bars(self._bar_type(self.instrument_id_a))
+        self.subscribe_bars(self._bar_type(self.instrument_id_b))
         
         self.log.info("Subscribed to bar data")
         
+    def _bar_type(self, instrument_id):
+        spec = self.config.bar_type
+        if not spec.endswith(("-EXTERNAL", "-INTERNAL")):
+            spec = f"{spec}-EXTERNAL"  # Venue-built bars unless stated otherwise
+        return BarType.from_str(f"{instrument_id}-{spec}")
+        
     def on_bar(self, bar: Bar):
-        # Store prices
-        if bar.bar_type.instrument_id == self.instrument_id_a:
-            self.prices_a.append(float(bar.close))
-        elif bar.bar_type.instrument_id == self.instrument_id_b:
-            self.prices_b.append(float(bar.close))
+        timer = self._latency
+        if timer is not None:
+            timer.begin()
+        try:
+            # Store prices
+            if bar.bar_type.instrument_id == self.instrument_id_a:
+                self.prices_a.append(float(bar.close))
+            elif bar.bar_type.instrument_id == self.instrument_id_b:
+                self.prices_b.append(float(bar.close))
+            else:
+                return
+        
+            if self._metrics is not None:
+                self._metrics.bars.inc()
+        
+            if len(self.prices_a) < 2 or len(self.prices_b) < 2:
+                return
+        
+            if timer is not None:
+                timer.lap(BUFFER)
+        
+            if not self._update_hedge_ratio():
+                return
+        
+            if timer is not None:
+                timer.lap(HEDGE_RATIO)
+        
+            spread = math.log(self.prices_a[-1]) - self.hedge_ratio * math.log(self.prices_b[-1])
+            self.spread_stats.push(spread)
+        
+            if timer is not None:
+                timer.lap(SPREAD)
+        
+            if self.spread_stats.count < self.rolling_window:
+                return
+        
+            # Calculate z-score
+            if self.spread_stats.std == 0:
+                return
+        
+            z_score = self.spread_stats.zscore(spread)
+        
+            self.log.debug(f"Z-score: {z_score:.3f}, Spread: {spread:.6f}")
+        
+            if timer is not None:
+                timer.lap(ZSCORE)
+        
+            # Trading logic
+            action = self._execute_trading_logic(z_score, self.prices_a[-1], self.prices_b[-1])
+            self._record_decision(bar.ts_event, z_score, spread, action)
+        
+            if timer is not None:
+                timer.lap(LOGIC)
+                timer.end()
+        finally:
+            if timer is not None:
+                timer.discard()  # Early returns leave no partial pass (no-op after end())
+        
+    def on_quote_tick(self, tick: QuoteTick):
+        # Keep only the latest quote per leg: O(1) per tick, bursts collapse
+        if tick.instrument_id == self.instrument_id_a:
+            self._quote_a = tick
+        elif tick.instrument_id == self.instrument_id_b:
+            self._quote_b = tick
         else:
             return
         
-       
-        if len(self.prices_a) < 2 or len(self.prices_b) < 2:
+        if self._quote_a is None or self._quote_b is None:
             return
         
-       
-        max_length = self.lookback_period * 1440  # Assuming 1-min bars
-        if len(self.prices_a) > max_length:
-            self.prices_a = self.prices_a[-max_length:]
-        if len(self.prices_b) > max_length:
-            self.prices_b = self.prices_b[-max_length:]
-        
-       
-        min_len = min(len(self.prices_a), len(self.prices_b))
-        prices_a_sync = self.prices_a[-min_len:]
-        prices_b_sync = self.prices_b[-min_len:]
-        
-       
-        if min_len < self.rolling_window:
-            return
-       
-        if self.hedge_ratio is None and min_len >= 100:
-            self.hedge_ratio = self._calculate_hedge_ratio(prices_a_sync, prices_b_sync)
-            self.log.info(f"Hedge ratio calculated: {self.hedge_ratio:.4f}")
-        
-        if self.hedge_ratio is None:
-            return
-        
-       
-        spread = np.log(prices_a_sync[-1]) - self.hedge_ratio * np.log(prices_b_sync[-1])
-        self.spreads.append(spread)
-        
-       
-        if len(self.spreads) > self.rolling_window * 1440:
-            self.spreads = self.spreads[-(self.rolling_window * 1440):]
-        
-        if len(self.spreads) < self.rolling_window:
-            return
-        
-        # Calculate z-score
-        mean_spread = np.mean(self.spreads[-self.rolling_window * 1440:])
-        std_spread = np.std(self.spreads[-self.rolling_window * 1440:])
-        
-        if std_spread == 0:
+        if tick.ts_init < self._next_eval_ns:
+            # Conflate: evaluate the latest state once the interval has passed
+            self.conflated_ticks += 1
+            if not self._eval_scheduled:
+                self._eval_scheduled = True
+                self.clock.set_time_alert_ns(f"{self.id}-CONFLATE", self._next_eval_ns, self._on_conflation_timer)
             return
         
-        z_score = (spread - mean_spread) / std_spread
+        self._evaluate_quotes(tick.ts_init)
+        
+    def _on_conflation_timer(self, event):
+        self._eval_scheduled = False
+        self._evaluate_quotes(event.ts_event)
+        
+    def _quote_price(self, tick):
+        bid = tick.bid_price.as_double()
+        ask = tick.ask_price.as_double()
+        if self.use_microprice:
+            bid_size = tick.bid_size.as_double()
+            ask_size = tick.ask_size.as_double()
+            if bid_size + ask_size > 0:
+                return (bid * ask_size + ask * bid_size) / (bid_size + ask_size)
+        return (bid + ask) / 2.0
+        
+    def _evaluate_quotes(self, ts):
+        timer = self._latency
+        if timer is not None:
+            timer.begin()
+        try:
+            self._next_eval_ns = ts + self.conflation_ns
+            price_a = self._quote_price(self._quote_a)
+            price_b = self._quote_price(self._quote_b)
+        
+            # Stats advance on the sampling cadence so windows keep their bar-mode meaning
+            sample = ts >= self._next_sample_ns
+            if sample:
+                self._next_sample_ns = ts + self.sample_ns
+                self.prices_a.append(price_a)
+                self.prices_b.append(price_b)
+        
+            if timer is not None:
+                timer.lap(BUFFER)
+        
+            if not self._update_hedge_ratio():
+                return
+        
+            if timer is not None:
+                timer.lap(HEDGE_RATIO)
+        
+            spread = math.log(price_a) - self.hedge_ratio * math.log(price_b)
+            if sample:
+                self.spread_stats.push(spread)
+        
+            if timer is not None:
+                timer.lap(SPREAD)
+        
+            if self.spread_stats.count < self.rolling_window or self.spread_stats.std == 0:
+                return
+        
+            z_score = self.spread_stats.zscore(spread)
+        
+            if timer is not None:
+                timer.lap(ZSCORE)
+        
+            action = self._execute_trading_logic(z_score, price_a, price_b)
+            self._record_decision(ts, z_score, spread, action)
+        
+            if timer is not None:
+                timer.lap(LOGIC)
+                timer.end()
+        finally:
+            if timer is not None:
+                timer.discard()  # Early returns leave no partial pass (no-op after end())
+        
+    def _report_latency(self, event=None):
+        """Interval stage percentiles, with buffer fill so growth effects are visible"""
+        report = {
+            "stages": self._latency.summary(),
+            "buffer_len": min(len(self.prices_a), len(self.prices_b)),
+            "buffer_fill": round(min(len(self.prices_a), len(self.prices_b)) / self.prices_a.maxlen, 4),
+            "spread_samples": self.spread_stats.count,
+        }
+        self.log.info(f"Hot-path latency: {json.dumps(report)}")
+        
+    def _update_hedge_ratio(self):
+        """Fit the hedge ratio once enough synchronized history exists"""
+        if self.hedge_ratio is not None:
+            return True
         
-        self.log.debug(f"Z-score: {z_score:.3f}, Spread: {spread:.6f}")
+        min_len = min(len(self.prices_a), len(self.prices_b))
+        if min_len < max(self.rolling_window, 100):
+            return False
         
-        # Trading logic
-        self._execute_trading_logic(z_score, prices_a_sync[-1], prices_b_sync[-1])
+        prices_a_sync = list(self.prices_a)[-min_len:]
+        prices_b_sync = list(self.prices_b)[-min_len:]
+        self.hedge_ratio = self._calculate_hedge_ratio(prices_a_sync, prices_b_sync)
+        self.log.info(f"Hedge ratio calculated: {self.hedge_ratio:.4f}")
+        return True
         
     def _calculate_hedge_ratio(self, prices_a, prices_b):
        
@@ -145,85 +367,367 @@ class PairsTradingStrategy(Strategy):
         return beta
         
     def _execute_trading_logic(self, z_score, price_a, price_b):
-      
+        """Act on the z-score, returns the decision taken"""
+        # Wait until both legs of the previous spread order are resolved
+        if self._execution is not None:
+            return 'pending'
         
         # Stop loss check
         if self.in_position and abs(z_score) > self.z_stop:
             self.log.warning(f"Stop loss triggered! Z-score: {z_score:.3f}")
-            self._close_position()
-            return
+            self._close_position('stop_loss')
+            return 'stop_loss'
         
         # Exit conditions
         if self.in_position:
             if self.position_side == 'long' and z_score > -self.z_exit:
                 self.log.info(f"Exit signal (long): z={z_score:.3f}")
-                self._close_position()
+                self._close_position('signal')
+                return 'exit'
             elif self.position_side == 'short' and z_score < self.z_exit:
                 self.log.info(f"Exit signal (short): z={z_score:.3f}")
-                self._close_position()
-            return
+                self._close_position('signal')
+                return 'exit'
+            return 'hold'
         
         # Entry conditions
         if not self.in_position:
             # Enter long spread (buy A, sell B) when z-score < -threshold
             if z_score < -self.z_entry:
                 self.log.info(f"Entry signal LONG spread: z={z_score:.3f}")
-                self._enter_long_spread(price_a, price_b)
+                return 'enter_long' if self._enter_long_spread(price_a, price_b) else 'entry_skipped'
                 
             # Enter short spread (sell A, buy B) when z-score > +threshold
             elif z_score > self.z_entry:
                 self.log.info(f"Entry signal SHORT spread: z={z_score:.3f}")
-                self._enter_short_spread(price_a, price_b)
+                return 'enter_short' if self._enter_short_spread(price_a, price_b) else 'entry_skipped'
+        return 'flat'
+    
+    def _record_decision(self, ts, z_score, spread, action):
+        if self._decisions is not None:
+            self._decisions.append(ts, z_score, spread, self.hedge_ratio, action, self.in_position)
+        
+        metrics = self._metrics
+        if metrics is not None:
+            metrics.bar_to_signal.observe_ns(self.clock.timestamp_ns() - ts)
+            metrics.decisions.inc()
+            metrics.z_score.set(z_score)
+            metrics.spread.set(spread)
+            metrics.hedge_ratio.set(self.hedge_ratio)
+            metrics.in_position.set(1 if self.in_position else 0)
+            metrics.buffer_a.set(len(self.prices_a))
+            metrics.buffer_b.set(len(self.prices_b))
+            metrics.spread_window.set(self.spread_stats.count)
     
     def _enter_long_spread(self, price_a, price_b):
-        # Calculate position sizes
-        qty_a = self.position_size_usd / price_a
-        qty_b = (self.hedge_ratio * self.position_size_usd) / price_b
-        
-        # Round to appropriate precision
-        qty_a = round(qty_a, 3)
-        qty_b = round(qty_b, 3)
-        
-        self.log.info(f"Entering LONG spread: Buy {qty_a} A @ {price_a}, Sell {qty_b} B @ {price_b}")
-        
-        # Submit orders 
+        """Enter long spread: Buy A, Sell B (Buy B with a negative hedge ratio); False if skipped"""
+        ts_signal = self.clock.timestamp_ns()
+        qty_a, qty_b = self._leg_quantities(price_a, price_b)
+        if qty_a is None:
+            return False
+        side_b = self._side_b(OrderSide.SELL)
+        
+        self.log.info(f"Entering LONG spread: Buy {qty_a} A @ {price_a}, "
+                      f"{side_b.name.capitalize()} {qty_b} B @ {price_b}")
+        
+        self._submit_spread(
+            'long', ts_signal,
+            [(self.instrument_id_a, OrderSide.BUY, qty_a, False),
+             (self.instrument_id_b, side_b, qty_b, False)],
+        )
         self.in_position = True
         self.position_side = 'long'
         self.trade_count += 1
+        return True
         
     def _enter_short_spread(self, price_a, price_b):
-        """Enter short spread: Sell A, Buy B"""
-        # Calculate position sizes
-        qty_a = self.position_size_usd / price_a
-        qty_b = (self.hedge_ratio * self.position_size_usd) / price_b
-        
-        qty_a = round(qty_a, 3)
-        qty_b = round(qty_b, 3)
-        
-        self.log.info(f"Entering SHORT spread: Sell {qty_a} A @ {price_a}, Buy {qty_b} B @ {price_b}")
-        
+        """Enter short spread: Sell A, Buy B (Sell B with a negative hedge ratio); False if skipped"""
+        ts_signal = self.clock.timestamp_ns()
+        qty_a, qty_b = self._leg_quantities(price_a, price_b)
+        if qty_a is None:
+            return False
+        side_b = self._side_b(OrderSide.BUY)
+        
+        self.log.info(f"Entering SHORT spread: Sell {qty_a} A @ {price_a}, "
+                      f"{side_b.name.capitalize()} {qty_b} B @ {price_b}")
+        
+        self._submit_spread(
+            'short', ts_signal,
+            [(self.instrument_id_a, OrderSide.SELL, qty_a, False),
+             (self.instrument_id_b, side_b, qty_b, False)],
+        )
         self.in_position = True
         self.position_side = 'short'
         self.trade_count += 1
+        return True
         
-    def _close_position(self):
+    def _close_position(self, reason='stop'):
         """Close current spread position"""
+        ts_signal = self.clock.timestamp_ns()
+        self._exit_reason = reason
         self.log.info(f"Closing {self.position_side} spread position")
+        
+        legs = self._flatten_legs()
+        if legs:
+            self._submit_spread('close', ts_signal, legs)
         self.in_position = False
         self.position_side = None
+    
+    def _leg_quantities(self, price_a, price_b):
+        """Size both legs using instrument precision"""
+        instrument_a = self.cache.instrument(self.instrument_id_a)
+        instrument_b = self.cache.instrument(self.instrument_id_b)
+        if instrument_a is None or instrument_b is None:
+            self.log.error("Instruments not found in cache, cannot size spread")
+            return None, None
+        
+        # Leg B is sized on |hedge ratio|; a negative ratio flips its side instead (see _side_b)
+        raw_a = self.position_size_usd / price_a
+        raw_b = abs(self.hedge_ratio) * self.position_size_usd / price_b
+        if raw_a < instrument_a.size_increment.as_double() or raw_b < instrument_b.size_increment.as_double():
+            self.log.warning(f"Leg quantity rounds to zero (A={raw_a:.8f}, B={raw_b:.8f}, "
+                             f"hedge ratio {self.hedge_ratio:.4f}), skipping entry")
+            return None, None
+        return instrument_a.make_qty(raw_a), instrument_b.make_qty(raw_b)
+    
+    def _side_b(self, side):
+        """Leg B's side for a positive hedge ratio, flipped when the ratio is negative"""
+        if self.hedge_ratio >= 0:
+            return side
+        return OrderSide.BUY if side == OrderSide.SELL else OrderSide.SELL
+    
+    def _flatten_legs(self):
+        """Reduce-only legs that flatten the current net positions"""
+        legs = []
+        for instrument_id in (self.instrument_id_a, self.instrument_id_b):
+            net = self.portfolio.net_position(instrument_id)
+            if net == 0:
+                continue
+            instrument = self.cache.instrument(instrument_id)
+            side = OrderSide.SELL if net > 0 else OrderSide.BUY
+            legs.append((instrument_id, side, instrument.make_qty(abs(net)), True))
+        return legs
+    
+    def _submit_spread(self, intent, ts_signal, legs):
+        # Build every order up front so nothing sits between the two submits
+        orders = [
+            self.order_factory.market(
+                instrument_id=instrument_id,
+                order_side=side,
+                quantity=quantity,
+                time_in_force=TimeInForce.GTC,
+                reduce_only=reduce_only,
+            )
+            for instrument_id, side, quantity, reduce_only in legs
+        ]
+        
+        if intent != 'close':
+            self._trade_commission = 0.0  # Fees of a failed earlier entry are not this trade's
+        execution = SpreadExecution(intent, ts_signal)
+        for order in orders:
+            execution.add_leg(SpreadLeg(order.client_order_id, order.instrument_id, order.side, order.quantity))
+        self._execution = execution
+        
+        ts_submit = self.clock.timestamp_ns()
+        if self.config.submit_as_order_list and len(orders) > 1:
+            self.submit_order_list(self.order_factory.create_list(orders))
+        else:
+            for order in orders:
+                self.submit_order(order)
+        for leg in execution.legs.values():
+            leg.ts_submit = ts_submit
+        
+        self._execution_count += 1
+        if self._metrics is not None:
+            self._metrics.spread_orders.inc()
+        self._leg_alert = f"{self.id}-LEGS-{self._execution_count}"
+        self.clock.set_time_alert_ns(self._leg_alert, ts_submit + self.leg_timeout_ns, self._on_leg_timeout)
+    
+    def on_order_accepted(self, event):
+        leg = self._execution.leg(event.client_order_id) if self._execution else None
+        if leg is not None and not leg.ts_ack:
+            leg.ts_ack = self.clock.timestamp_ns()
+            if self._metrics is not None:
+                self._metrics.order_ack.observe_ns(leg.ts_ack - leg.ts_submit)
+    
+    def on_order_filled(self, event):
+        leg = self._execution.leg(event.client_order_id) if self._execution else None
+        if self._journal is not None:
+            commission = event.commission.as_double() if event.commission is not None else 0.0
+            self._trade_commission += commission
+            self._journal.record_fill(
+                event.ts_event, str(event.instrument_id), str(event.client_order_id), event.order_side.name,
+                event.last_qty.as_double(), event.last_px.as_double(), commission,
+                self._execution.intent if leg is not None else "",
+            )
+        if leg is None:
+            return
+        leg.apply_fill(event.last_qty, event.last_px, self.clock.timestamp_ns())
+        if not leg.is_filled:
+            self.log.info(f"Partial fill {event.instrument_id}: {leg.filled_qty}/{leg.target_qty}")
+        elif self._metrics is not None:
+            self._metrics.order_fill.observe_ns(leg.ts_last_fill - leg.ts_submit)
+        self._check_execution()
+    
+    def on_order_rejected(self, event):
+        self._on_leg_terminal(event)
+    
+    def on_order_denied(self, event):
+        self._on_leg_terminal(event)
+    
+    def on_order_canceled(self, event):
+        self._on_leg_terminal(event)
+    
+    def on_order_expired(self, event):
+        self._on_leg_terminal(event)
+    
+    def _on_leg_terminal(self, event):
+        leg = self._execution.leg(event.client_order_id) if self._execution else None
+        if leg is None:
+            return
+        self.log.warning(f"Leg {leg.instrument_id} ended with {leg.filled_qty}/{leg.target_qty} filled")
+        leg.closed = True
+        self._check_execution()
+    
+    def _on_leg_timeout(self, event):
+        execution = self._execution
+        if execution is None or event.name != self._leg_alert:
+            return
+        # Stop waiting on the lagging leg(s); the cancel events complete the execution
+        self.log.warning(f"Spread legs not filled within {self.config.leg_timeout_ms}ms, canceling remainder")
+        for leg in execution.legs.values():
+            if leg.closed:
+                continue
+            order = self.cache.order(leg.client_order_id)
+            if order is not None and order.is_open:
+                self.cancel_order(order)
+            else:
+                leg.closed = True
+        self._check_execution()
+    
+    def _check_execution(self):
+        execution = self._execution
+        if execution is None or not execution.is_complete:
+            return
+        self._execution = None
+        if self._leg_alert in self.clock.timer_names:
+            self.clock.cancel_timer(self._leg_alert)
+        
+        timings = self.leg_stats.record(execution)
+        if self._journal is not None:
+            self._journal_execution(execution)
+        gap = timings['leg_fill_gap']
+        self.log.info(
+            f"Spread {execution.intent} complete: signal->submit {timings['signal_to_submit'] / 1e3:.0f}us, "
+            f"leg fill gap {gap / 1e6 if gap is not None else float('nan'):.3f}ms, legs {timings['legs']}"
+        )
+        
+        if not execution.is_balanced:
+            self._resolve_imbalance(execution)
+    
+    def _journal_execution(self, execution):
+        """Pair a completed close with its entry and journal the round trip"""
+        if execution.intent != 'close':
+            self._entry_execution = execution
+            return
+        entry, self._entry_execution = self._entry_execution, None
+        if entry is None:
+            return
+        
+        entry_legs = {leg.instrument_id: leg for leg in entry.legs.values()}
+        exit_legs = {leg.instrument_id: leg for leg in execution.legs.values()}
+        pnl = -self._trade_commission
+        for instrument_id, leg in entry_legs.items():
+            exit_leg = exit_legs.get(instrument_id)
+            if exit_leg is not None:
+                sign = 1.0 if leg.side == OrderSide.BUY else -1.0
+                pnl += sign * (exit_leg.avg_px - leg.avg_px) * exit_leg.filled_qty
+        self._trade_commission = 0.0
+        
+        leg_a, leg_b = entry_legs.get(self.instrument_id_a), entry_legs.get(self.instrument_id_b)
+        exit_a, exit_b = exit_legs.get(self.instrument_id_a), exit_legs.get(self.instrument_id_b)
+        self._journal.record_trade(
+            entry.ts_signal, execution.ts_signal, entry.intent,
+            leg_a.avg_px if leg_a else float("nan"), leg_b.avg_px if leg_b else float("nan"),
+            exit_a.avg_px if exit_a else float("nan"), exit_b.avg_px if exit_b else float("nan"),
+            leg_a.filled_qty if leg_a else 0.0, leg_b.filled_qty if leg_b else 0.0,
+            self.hedge_ratio, pnl, self._exit_reason or "",
+        )
+    
+    def _resolve_imbalance(self, execution):
+        """Bring legs back in line after partial fills or a failed leg"""
+        if execution.intent == 'close':
+            # Whatever is left open is unhedged exposure: flatten it
+            legs = self._flatten_legs()
+            self.log.warning(f"Close left residual exposure, flattening {len(legs)} leg(s)")
+            for instrument_id, side, quantity, reduce_only in legs:
+                self.submit_order(self.order_factory.market(instrument_id, side, quantity, reduce_only=reduce_only))
+            return
+        
+        # Trim the over-filled leg(s) back to the fraction hedged on both sides
+        for leg, qty in execution.excess():
+            instrument = self.cache.instrument(leg.instrument_id)
+            quantity = instrument.make_qty(qty)
+            if quantity.as_double() <= 0:
+                continue
+            side = OrderSide.SELL if leg.side == OrderSide.BUY else OrderSide.BUY
+            self.log.warning(f"Leg imbalance: unwinding {quantity} {leg.instrument_id}")
+            self.submit_order(self.order_factory.market(leg.instrument_id, side, quantity, reduce_only=True))
+        
+        if execution.hedged_ratio <= 0:
+            self.log.warning("Spread entry failed on at least one leg, position reset")
+            self.in_position = False
+            self.position_side = None
+        
+    def _on_flush_timer(self, event):
+        for writer in (self._decisions, self._journal):
+            if writer is not None:
+                writer.flush()
         
     def on_stop(self):
         """Cleanup when strategy stops"""
+        known = self.cache.client_order_ids(strategy_id=self.id)
         if self.in_position:
             self._close_position()
+        self._stop_order_ids = self.cache.client_order_ids(strategy_id=self.id) - known
         
         self.log.info(f"Strategy stopped. Total trades: {self.trade_count}")
+        self.log.info(f"Leg execution stats: {self.leg_stats.summary()}")
+        if self._latency is not None and self._latency.total.count:
+            self._report_latency()
+        
+    def _close_journal(self):
+        """Journal the on_stop close from the cache, then close the writers (kept open until now for it)"""
+        if self._journal is not None:
+            replay_stop_events(self, self._stop_order_ids)
+            self._journal.close()
+            self._journal = None
+        self._stop_order_ids = set()
+        if self._decisions is not None:
+            self._decisions.close()
+            self._decisions = None
+        
+    def on_dispose(self):
+        self._close_journal()
         
     def on_reset(self):
+        self._close_journal()
         self.prices_a.clear()
         self.prices_b.clear()
-        self.spreads.clear()
+        self.spread_stats.reset()
+        self._quote_a = None
+        self._quote_b = None
+        self._next_eval_ns = 0
+        self._next_sample_ns = 0
+        self._eval_scheduled = False
         self.hedge_ratio = None
         self.in_position = False
         self.position_side = None
+        self._execution = None
+        self._entry_execution = None
+        self._trade_commission = 0.0
+        self._exit_reason = None
+        self.leg_stats = LegLatencyStats()
+        if self._latency is not None:
+            self._latency.summary(reset=True)
         self.trade_count = 0
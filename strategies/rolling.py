@@ -0,0 +1,226 @@
+"""
+Incremental rolling statistics for per-event strategy updates
+Every update is O(1) regardless of window length
+"""
+
+from collections import deque
+import math
+
+
+class RollingStats:
+    """Rolling mean / population std over the last `window` values"""
+
+    __slots__ = ('window', 'buffer', 'index', 'count', 'mean', '_m2')
+
+    def __init__(self, window):
+        self.window = int(window)
+        self.buffer = [0.0] * self.window  # Preallocated ring buffer
+        self.index = 0
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+
+    def push(self, x):
+        if self.count < self.window:
+            # Welford while the window fills
+            self.count += 1
+            delta = x - self.mean
+            self.mean += delta / self.count
+            self._m2 += delta * (x - self.mean)
+        else:
+            # Replace the oldest value: add/remove Welford update
+            old = self.buffer[self.index]
+            new_mean = self.mean + (x - old) / self.window
+            self._m2 += (x - old) * (x - new_mean + old - self.mean)
+            self.mean = new_mean
+        self.buffer[self.index] = x
+        self.index = (self.index + 1) % self.window
+
+    @property
+    def variance(self):
+        return max(self._m2 / self.count, 0.0) if self.count else 0.0
+
+    @property
+    def std(self):
+        return math.sqrt(self.variance)
+
+    def zscore(self, x):
+        std = self.std
+        return (x - self.mean) / std if std > 0 else 0.0
+
+    def reset(self):
+        self.index = 0
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+
+
+class RollingMax:
+    """Maximum of the last `window` values via a monotonic deque (amortized O(1) per push)"""
+
+    __slots__ = ('window', 'values', 'positions', 'count')
+
+    def __init__(self, window):
+        self.window = int(window)
+        self.values = deque()  # Decreasing; the front is the window maximum
+        self.positions = deque()
+        self.count = 0
+
+    def _dominates(self, new, old):
+        return new >= old
+
+    def push(self, x):
+        values, positions = self.values, self.positions
+        while values and self._dominates(x, values[-1]):
+            values.pop()
+            positions.pop()
+        values.append(x)
+        positions.append(self.count)
+        self.count += 1
+        if positions[0] <= self.count - 1 - self.window:
+            values.popleft()
+            positions.popleft()
+
+    @property
+    def ready(self):
+        return self.count >= self.window
+
+    @property
+    def value(self):
+        return self.values[0] if self.values else math.nan
+
+    def reset(self):
+        self.values.clear()
+        self.positions.clear()
+        self.count = 0
+
+
+class RollingMin(RollingMax):
+    """Minimum of the last `window` values via a monotonic deque (amortized O(1) per push)"""
+
+    __slots__ = ()
+
+    def _dominates(self, new, old):
+        return new <= old
+
+
+class AverageTrueRange:
+    """Wilder ATR: the first value is the mean of `period` true ranges, then atr += (tr - atr) / period"""
+
+    __slots__ = ('period', 'prev_close', 'count', '_sum', 'value')
+
+    def __init__(self, period):
+        self.period = int(period)
+        self.reset()
+
+    def push(self, high, low, close):
+        tr = high - low
+        if self.prev_close is not None:
+            tr = max(tr, abs(high - self.prev_close), abs(low - self.prev_close))
+        self.prev_close = close
+        self.count += 1
+        if self.count < self.period:
+            self._sum += tr
+        elif self.count == self.period:
+            self.value = (self._sum + tr) / self.period
+        else:
+            self.value += (tr - self.value) / self.period
+
+    @property
+    def ready(self):
+        return self.count >= self.period
+
+    def reset(self):
+        self.prev_close = None
+        self.count = 0
+        self._sum = 0.0
+        self.value = math.nan
+
+
+class ExponentialAverage:
+    """EMA with alpha = 2 / (period + 1), seeded with the first value"""
+
+    __slots__ = ('period', 'alpha', 'count', 'value')
+
+    def __init__(self, period):
+        self.period = int(period)
+        self.alpha = 2.0 / (self.period + 1)
+        self.reset()
+
+    def push(self, x):
+        self.count += 1
+        if self.count == 1:
+            self.value = x
+        else:
+            self.value += self.alpha * (x - self.value)
+
+    @property
+    def ready(self):
+        return self.count >= self.period
+
+    def reset(self):
+        self.count = 0
+        self.value = math.nan
+
+
+class TimeframeBars:
+    """Higher-timeframe OHLC bars built from lower-timeframe bars, the last `history` in ring buffers
+
+    Input bars are bucketed by their close timestamp: a `step_ns` bucket completes on the bar
+    closing on its boundary, or when a bar of a later bucket arrives after a gap. on_complete
+    is called with (ts_close, open, high, low, close) of every completed bar."""
+
+    __slots__ = ('step_ns', 'history', 'on_complete', 'times', 'opens', 'highs', 'lows', 'closes',
+                 'index', 'count', 'bucket', 'open', 'high', 'low', 'close')
+
+    def __init__(self, step_ns, history=64, on_complete=None):
+        self.step_ns = int(step_ns)
+        self.history = int(history)
+        self.on_complete = on_complete
+        # Preallocated ring buffers of completed bars
+        self.times = [0] * self.history
+        self.opens = [0.0] * self.history
+        self.highs = [0.0] * self.history
+        self.lows = [0.0] * self.history
+        self.closes = [0.0] * self.history
+        self.reset()
+
+    def push(self, ts, open_, high, low, close):
+        bucket = (ts - 1) // self.step_ns
+        if bucket != self.bucket:
+            if self.bucket is not None:
+                self._complete()  # Partial bucket left open by a gap
+            self.bucket = bucket
+            self.open, self.high, self.low = open_, high, low
+        else:
+            if high > self.high:
+                self.high = high
+            if low < self.low:
+                self.low = low
+        self.close = close
+        if ts % self.step_ns == 0:
+            self._complete()
+
+    def _complete(self):
+        i = self.index
+        ts = (self.bucket + 1) * self.step_ns
+        self.times[i], self.opens[i], self.highs[i], self.lows[i], self.closes[i] = (
+            ts, self.open, self.high, self.low, self.close)
+        self.index = (i + 1) % self.history
+        self.count += 1
+        self.bucket = None
+        if self.on_complete is not None:
+            self.on_complete(ts, self.open, self.high, self.low, self.close)
+
+    def last(self, k=0):
+        """(ts_close, open, high, low, close) of the k-th most recent completed bar"""
+        if k >= min(self.count, self.history):
+            raise IndexError(k)
+        i = (self.index - 1 - k) % self.history
+        return self.times[i], self.opens[i], self.highs[i], self.lows[i], self.closes[i]
+
+    def reset(self):
+        self.index = 0
+        self.count = 0
+        self.bucket = None
+        self.open = self.high = self.low = self.close = math.nan
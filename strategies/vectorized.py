@@ -0,0 +1,92 @@
+"""
+Vectorized batch versions of the incremental indicators in strategies/rolling.py
+Whole-array counterparts for the simplified backtest path; value i uses the same bars the
+incremental version has seen after its i-th push, so the two can be checked against each other
+"""
+
+import numpy as np
+import pandas as pd
+
+
+def rolling_max(values, window):
+    """Maximum of values[i - window + 1 : i + 1], NaN until the window is full"""
+    return pd.Series(values, dtype=np.float64).rolling(window).max().to_numpy()
+
+
+def rolling_min(values, window):
+    return pd.Series(values, dtype=np.float64).rolling(window).min().to_numpy()
+
+
+def shift(values, periods=1):
+    """values[i - periods] at i, NaN-filled at the start"""
+    out = np.full(len(values), np.nan)
+    out[periods:] = values[:len(values) - periods]
+    return out
+
+
+def true_range(high, low, close):
+    prev_close = shift(np.asarray(close, dtype=np.float64))
+    tr = np.fmax(np.abs(high - prev_close), np.abs(low - prev_close))  # NaN on the first bar
+    return np.fmax(high - low, tr)
+
+
+def average_true_range(high, low, close, period):
+    """Wilder ATR, as AverageTrueRange: SMA of the first `period` true ranges, then 1/period smoothing"""
+    tr = true_range(np.asarray(high, dtype=np.float64), np.asarray(low, dtype=np.float64), close)
+    if len(tr) < period:
+        return np.full(len(tr), np.nan)
+    seeded = np.full(len(tr), np.nan)
+    seeded[period - 1] = tr[:period].mean()
+    seeded[period:] = tr[period:]
+    atr = pd.Series(seeded).ewm(alpha=1.0 / period, adjust=False).mean().to_numpy()
+    atr[:period - 1] = np.nan
+    return atr
+
+
+def donchian_channels(high, low, period):
+    """(upper, lower) over the `period` bars before each bar, so a close can break out of it"""
+    return shift(rolling_max(high, period)), shift(rolling_min(low, period))
+
+
+
+def ema(values, period):
+    """ExponentialAverage over a whole array: alpha = 2 / (period + 1), NaN until `period` values"""
+    out = pd.Series(values, dtype=np.float64).ewm(span=period, adjust=False).mean().to_numpy()
+    out[:period - 1] = np.nan
+    return out
+
+
+def resample_bars(ts, open_, high, low, close, step_ns):
+    """TimeframeBars over whole arrays (ts = bar close times, ns)
+
+    Returns (completed_at, ts_close, open, high, low, close) per higher-timeframe bar, where
+    completed_at is the input bar index on which TimeframeBars would report it; a trailing
+    bucket still open at the end of the data is dropped."""
+    ts = np.asarray(ts, dtype=np.int64)
+    if not len(ts):
+        empty = np.zeros(0)
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64), empty, empty, empty, empty
+    bucket = (ts - 1) // step_ns
+    starts = np.flatnonzero(np.r_[True, bucket[1:] != bucket[:-1]])
+    ends = np.r_[starts[1:], len(ts)] - 1
+    highs = np.maximum.reduceat(np.asarray(high, dtype=np.float64), starts)
+    lows = np.minimum.reduceat(np.asarray(low, dtype=np.float64), starts)
+    # Buckets without a boundary bar complete on the first bar of the next bucket
+    completed_at = np.where(ts[ends] % step_ns == 0, ends, ends + 1)
+    keep = completed_at < len(ts)
+    return (
+        completed_at[keep],
+        (bucket[starts[keep]] + 1) * step_ns,
+        np.asarray(open_, dtype=np.float64)[starts[keep]],
+        highs[keep],
+        lows[keep],
+        np.asarray(close, dtype=np.float64)[ends[keep]],
+    )
+
+
+def align_to_bars(completed_at, values, n):
+    """Per input bar, the value of the latest higher-timeframe bar completed at or before it (NaN before the first)"""
+    position = np.searchsorted(completed_at, np.arange(n), side='right') - 1
+    out = np.asarray(values, dtype=np.float64)[np.maximum(position, 0)] if len(values) else np.full(n, np.nan)
+    out[position < 0] = np.nan
+    return out
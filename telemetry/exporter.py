@@ -0,0 +1,94 @@
+"""
+Metrics exporter actor
+Refreshes position/PnL gauges from the portfolio, probes event-loop lag and exposes
+the registry over HTTP (/metrics) and as a text file under ./monitoring
+"""
+
+import asyncio
+import os
+import time
+from datetime import timedelta
+
+from nautilus_trader.common.actor import Actor
+from nautilus_trader.config import ActorConfig
+from nautilus_trader.model.identifiers import InstrumentId
+
+from telemetry.metrics import REGISTRY, MetricsHTTPServer
+
+
+class MetricsExporterConfig(ActorConfig, frozen=True, kw_only=True):
+    instrument_ids: list[str]
+    http_host: str = "127.0.0.1"
+    http_port: int | None = 9464  # None = file export only
+    output_dir: str | None = "./monitoring"
+    interval_s: int = 15
+    loop_lag_probe_ms: int = 100
+
+
+class MetricsExporter(Actor):
+    def __init__(self, config: MetricsExporterConfig):
+        super().__init__(config)
+        self.instrument_ids = [InstrumentId.from_str(i) for i in config.instrument_ids]
+        self.server = None
+        self._probe = None
+
+        self.loop_lag = REGISTRY.summary("node_event_loop_lag_seconds", "Oversleep of a periodic asyncio sleep")
+        self.open_orders = REGISTRY.gauge("node_open_orders", "Open orders in the cache")
+        self.pnl_total = REGISTRY.gauge("node_pnl_total", "Realized + unrealized PnL over all instruments")
+        self.instrument_gauges = {}
+        for instrument_id in self.instrument_ids:
+            labels = {"instrument": str(instrument_id)}
+            self.instrument_gauges[instrument_id] = (
+                REGISTRY.gauge("node_position", "Net position (base units)", labels),
+                REGISTRY.gauge("node_pnl_realized", "Realized PnL", labels),
+                REGISTRY.gauge("node_pnl_unrealized", "Unrealized PnL", labels),
+            )
+
+    def on_start(self):
+        if self.config.output_dir:
+            os.makedirs(self.config.output_dir, exist_ok=True)
+        if self.config.http_port is not None:
+            self.server = MetricsHTTPServer(REGISTRY, self.config.http_host, self.config.http_port).start()
+            self.log.info(f"Serving metrics on {self.server.url}")
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None  # Backtest: no event loop to probe
+        if loop is not None:
+            self._probe = loop.create_task(self._probe_loop_lag())
+
+        self.clock.set_timer(
+            f"{self.id}-METRICS", timedelta(seconds=self.config.interval_s), callback=self._on_refresh,
+        )
+
+    async def _probe_loop_lag(self):
+        interval = self.config.loop_lag_probe_ms / 1e3
+        while True:
+            t0 = time.perf_counter_ns()
+            await asyncio.sleep(interval)
+            self.loop_lag.observe_ns(time.perf_counter_ns() - t0 - int(interval * 1e9))
+
+    def _on_refresh(self, event=None):
+        total = 0.0
+        for instrument_id, (position, realized, unrealized) in self.instrument_gauges.items():
+            position.set(float(self.portfolio.net_position(instrument_id)))
+            realized_pnl = self.portfolio.realized_pnl(instrument_id)
+            unrealized_pnl = self.portfolio.unrealized_pnl(instrument_id)
+            realized.set(realized_pnl.as_double() if realized_pnl is not None else 0.0)
+            unrealized.set(unrealized_pnl.as_double() if unrealized_pnl is not None else 0.0)
+            total += realized.value + unrealized.value
+        self.pnl_total.set(total)
+        self.open_orders.set(len(self.cache.orders_open()))
+
+        if self.config.output_dir:
+            REGISTRY.write_textfile(os.path.join(self.config.output_dir, "metrics.prom"))
+
+    def on_stop(self):
+        if self._probe is not None:
+            self._probe.cancel()
+            self._probe = None
+        self._on_refresh()
+        if self.server is not None:
+            self.server.stop()
+            self.server = None
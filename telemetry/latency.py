@@ -0,0 +1,148 @@
+"""
+Low-overhead latency instrumentation for strategy hot paths
+HDR-style log-linear histograms with fixed, preallocated buckets: recording is an
+integer bit_length and a list increment. StageTimer keeps the open pass in preallocated
+per-stage slots, so no container grows per sample
+"""
+
+from time import perf_counter_ns
+
+
+SUB_BUCKET_BITS = 7  # 128 sub-buckets per power of two, ~1% relative precision
+SUB_BUCKET_HALF = 1 << (SUB_BUCKET_BITS - 1)
+
+
+class LatencyHistogram:
+    """Nanosecond values in log-linear buckets, percentiles within ~1%"""
+
+    __slots__ = ('counts', 'count', 'total', 'min', 'max', '_max_index')
+
+    def __init__(self, max_value_ns=60_000_000_000):
+        self._max_index = self._index(max_value_ns)
+        self.counts = [0] * (self._max_index + 1)
+        self.reset()
+
+    @staticmethod
+    def _index(value):
+        if value < 2 * SUB_BUCKET_HALF:
+            return value
+        shift = value.bit_length() - SUB_BUCKET_BITS
+        return (shift << (SUB_BUCKET_BITS - 1)) + (value >> shift)
+
+    @staticmethod
+    def _value(index):
+        """Midpoint of the bucket's value range"""
+        if index < 2 * SUB_BUCKET_HALF:
+            return index
+        shift = (index >> (SUB_BUCKET_BITS - 1)) - 1
+        return ((index - (shift << (SUB_BUCKET_BITS - 1))) << shift) + (1 << shift) // 2
+
+    def record(self, value_ns):
+        if value_ns < 0:
+            value_ns = 0
+        index = self._index(value_ns)
+        self.counts[index if index < self._max_index else self._max_index] += 1
+        self.count += 1
+        self.total += value_ns
+        if value_ns > self.max:
+            self.max = value_ns
+        if value_ns < self.min:
+            self.min = value_ns
+
+    def percentile(self, p):
+        if self.count == 0:
+            return 0
+        target = max(1, int(round(p / 100.0 * self.count)))
+        seen = 0
+        for index, n in enumerate(self.counts):
+            if n:
+                seen += n
+                if seen >= target:
+                    return min(self._value(index), self.max)
+        return self.max
+
+    def reset(self):
+        for i in range(len(self.counts)):
+            self.counts[i] = 0
+        self.count = 0
+        self.total = 0
+        self.min = 1 << 62
+        self.max = 0
+
+    def summary(self):
+        """Percentiles in microseconds"""
+        if self.count == 0:
+            return {'count': 0}
+        return {
+            'count': self.count,
+            'mean_us': round(self.total / self.count / 1e3, 3),
+            'min_us': round(self.min / 1e3, 3),
+            'p50_us': round(self.percentile(50) / 1e3, 3),
+            'p90_us': round(self.percentile(90) / 1e3, 3),
+            'p99_us': round(self.percentile(99) / 1e3, 3),
+            'p999_us': round(self.percentile(99.9) / 1e3, 3),
+            'max_us': round(self.max / 1e3, 3),
+        }
+
+
+class StageTimer:
+    """Per-stage timings for one code path, sampling every Nth pass
+
+    begin() opens a pass, lap(i) notes the time since the previous mark for stage i (a stage
+    lapped twice in a pass is charged the sum), end() records the laps and charges the whole pass to 'total'. discard() drops a pass
+    that stopped early (warm-up, no signal) so only complete passes are recorded; it is a
+    no-op after end(). Unsampled passes cost one counter check
+    """
+
+    __slots__ = ('stages', 'histograms', 'total', 'sample_every', 'active', '_countdown', '_t0', '_t', '_laps')
+
+    def __init__(self, stages, sample_every=1):
+        self.stages = tuple(stages)
+        self.histograms = [LatencyHistogram() for _ in self.stages]
+        self.total = LatencyHistogram()
+        self.sample_every = max(1, int(sample_every))
+        self.active = False
+        self._countdown = 1
+        self._t0 = 0
+        self._t = 0
+        self._laps = [-1] * len(self.stages)  # ns per stage of the open pass, -1 = not reached
+
+    def begin(self):
+        self._countdown -= 1
+        if self._countdown:
+            self.active = False
+            return
+        self._countdown = self.sample_every
+        self.active = True
+        laps = self._laps
+        for i in range(len(laps)):
+            laps[i] = -1
+        self._t0 = self._t = perf_counter_ns()
+
+    def lap(self, stage):
+        if self.active:
+            now = perf_counter_ns()
+            laps = self._laps
+            laps[stage] = now - self._t if laps[stage] < 0 else laps[stage] + now - self._t
+            self._t = now
+
+    def end(self):
+        if self.active:
+            self.total.record(perf_counter_ns() - self._t0)
+            for hist, elapsed in zip(self.histograms, self._laps):
+                if elapsed >= 0:
+                    hist.record(elapsed)
+            self.active = False
+
+    def discard(self):
+        self.active = False
+
+    def summary(self, reset=True):
+        """Interval percentiles per stage; reset so each report reflects current conditions"""
+        report = {name: hist.summary() for name, hist in zip(self.stages, self.histograms)}
+        report['total'] = self.total.summary()
+        if reset:
+            for hist in self.histograms:
+                hist.reset()
+            self.total.reset()
+        return report
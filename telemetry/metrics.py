@@ -0,0 +1,156 @@
+"""
+Prometheus-style metrics for the live node
+Collectors are plain attribute updates with no locks: the event loop is the only writer
+and the exporter only reads, so a scrape sees each value either before or after an update
+"""
+
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from telemetry.latency import LatencyHistogram
+
+
+def _labels(labels):
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{v}"' for k, v in sorted(labels.items())) + "}"
+
+
+def _fmt(value):
+    return repr(float(value)) if value == value else "NaN"
+
+
+class Counter:
+    __slots__ = ('value',)
+    kind = 'counter'
+
+    def __init__(self):
+        self.value = 0
+
+    def inc(self, n=1):
+        self.value += n
+
+    def samples(self, name, labels):
+        yield f"{name}{_labels(labels)} {_fmt(self.value)}"
+
+
+class Gauge:
+    __slots__ = ('value',)
+    kind = 'gauge'
+
+    def __init__(self):
+        self.value = float('nan')
+
+    def set(self, value):
+        self.value = value
+
+    def samples(self, name, labels):
+        yield f"{name}{_labels(labels)} {_fmt(self.value)}"
+
+
+class Summary:
+    """Latency summary in seconds, backed by a nanosecond LatencyHistogram"""
+
+    __slots__ = ('histogram',)
+    kind = 'summary'
+    QUANTILES = (0.5, 0.9, 0.99, 0.999)
+
+    def __init__(self):
+        self.histogram = LatencyHistogram()
+
+    def observe_ns(self, value_ns):
+        self.histogram.record(value_ns)
+
+    def samples(self, name, labels):
+        hist = self.histogram
+        for q in self.QUANTILES:
+            yield f"{name}{_labels({**labels, 'quantile': q})} {_fmt(hist.percentile(q * 100) / 1e9)}"
+        yield f"{name}_sum{_labels(labels)} {_fmt(hist.total / 1e9)}"
+        yield f"{name}_count{_labels(labels)} {hist.count}"
+
+
+class MetricsRegistry:
+    """Named metric families; each (name, labels) pair is created once and reused"""
+
+    def __init__(self):
+        self._families = {}  # name -> (kind, help, {label tuple: metric})
+
+    def _get(self, cls, name, help, labels):
+        kind, _, series = self._families.setdefault(name, (cls.kind, help, {}))
+        if kind != cls.kind:
+            raise ValueError(f"Metric {name} already registered as a {kind}")
+        key = tuple(sorted((labels or {}).items()))
+        metric = series.get(key)
+        if metric is None:
+            metric = series[key] = cls()
+        return metric
+
+    def counter(self, name, help="", labels=None):
+        return self._get(Counter, name, help, labels)
+
+    def gauge(self, name, help="", labels=None):
+        return self._get(Gauge, name, help, labels)
+
+    def summary(self, name, help="", labels=None):
+        return self._get(Summary, name, help, labels)
+
+    def render(self):
+        """Prometheus text exposition format"""
+        lines = []
+        for name, (kind, help, series) in sorted(self._families.items()):
+            if help:
+                lines.append(f"# HELP {name} {help}")
+            lines.append(f"# TYPE {name} {kind}")
+            for key, metric in list(series.items()):
+                lines.extend(metric.samples(name, dict(key)))
+        return "\n".join(lines) + "\n"
+
+    def write_textfile(self, path):
+        """Atomic write, for node_exporter's textfile collector or plain tailing"""
+        tmp = f"{path}.tmp"
+        with open(tmp, "w") as f:
+            f.write(self.render())
+        os.replace(tmp, path)
+
+
+REGISTRY = MetricsRegistry()
+
+
+class MetricsHTTPServer:
+    """Serves GET /metrics from a daemon thread"""
+
+    def __init__(self, registry=REGISTRY, host="127.0.0.1", port=9464):
+        registry_ = registry
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] not in ("/metrics", "/"):
+                    self.send_error(404)
+                    return
+                body = registry_.render().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer((host, port), Handler)
+        self.server.daemon_threads = True
+        self._thread = threading.Thread(target=self.server.serve_forever, name="metrics-http", daemon=True)
+
+    @property
+    def url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}/metrics"
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
@@ -0,0 +1,180 @@
+"""
+Profiling for main.py entry points
+- deterministic: cProfile, saved as .pstats (snakeviz / gprof2dot call tree) plus a text summary
+- sampling: stack samples of the running thread, saved as folded stacks (flamegraph.pl, speedscope, inferno)
+- memory: tracemalloc peak and net allocation per stage, marked with trace_stage()
+"""
+
+import cProfile
+import io
+import json
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime
+
+
+_ACTIVE_TRACER = None
+
+
+def trace_stage(name):
+    """Mark the start of a pipeline stage; no-op unless --trace-memory is active"""
+    if _ACTIVE_TRACER is not None:
+        _ACTIVE_TRACER.enter(name)
+
+
+class MemoryTracer:
+    """Peak and net tracemalloc allocation per stage; each stage runs until the next mark"""
+
+    def __init__(self):
+        self.stages = []
+        self._current = None
+
+    def start(self):
+        global _ACTIVE_TRACER
+        tracemalloc.start()
+        _ACTIVE_TRACER = self
+        self.enter("startup")
+
+    def enter(self, name):
+        self._close()
+        tracemalloc.reset_peak()
+        current, _ = tracemalloc.get_traced_memory()
+        self._current = (name, current, time.perf_counter())
+
+    def _close(self):
+        if self._current is None:
+            return
+        name, start, t0 = self._current
+        current, peak = tracemalloc.get_traced_memory()
+        self.stages.append({
+            'stage': name,
+            'seconds': round(time.perf_counter() - t0, 4),
+            'peak_mb': round(peak / 1e6, 3),
+            'peak_above_start_mb': round((peak - start) / 1e6, 3),
+            'net_mb': round((current - start) / 1e6, 3),
+        })
+        self._current = None
+
+    def stop(self):
+        global _ACTIVE_TRACER
+        self._close()
+        _ACTIVE_TRACER = None
+        tracemalloc.stop()
+
+    def report(self):
+        lines = [f"{'stage':<20}{'seconds':>10}{'peak MB':>10}{'+peak MB':>10}{'net MB':>10}"]
+        for s in self.stages:
+            lines.append(f"{s['stage']:<20}{s['seconds']:>10.3f}{s['peak_mb']:>10.2f}"
+                         f"{s['peak_above_start_mb']:>10.2f}{s['net_mb']:>10.2f}")
+        return "\n".join(lines)
+
+
+class SamplingProfiler:
+    """Samples one thread's Python stack on a timer thread"""
+
+    def __init__(self, interval_s=0.005, thread_id=None):
+        self.interval_s = interval_s
+        self.thread_id = thread_id or threading.get_ident()
+        self.stacks = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+
+    @staticmethod
+    def _frame_name(frame):
+        code = frame.f_code
+        return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+    def _run(self):
+        while not self._stop.wait(self.interval_s):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            stack = []
+            while frame is not None:
+                stack.append(self._frame_name(frame))
+                frame = frame.f_back
+            self.stacks[";".join(reversed(stack))] += 1
+            self.samples += 1
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def write_folded(self, path):
+        with open(path, "w") as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+    def top(self, n=30):
+        """Functions by self (leaf) and inclusive sample share"""
+        leaf = Counter()
+        inclusive = Counter()
+        for stack, count in self.stacks.items():
+            frames = stack.split(";")
+            leaf[frames[-1]] += count
+            for name in set(frames):
+                inclusive[name] += count
+        total = max(1, self.samples)
+        lines = [f"{self.samples} samples every {self.interval_s * 1e3:.1f} ms", "",
+                 f"{'self %':>8}{'total %':>9}  function"]
+        for name, count in leaf.most_common(n):
+            lines.append(f"{100 * count / total:>8.1f}{100 * inclusive[name] / total:>9.1f}  {name}")
+        return "\n".join(lines)
+
+
+@contextmanager
+def profiled(label, mode=None, trace_memory=False, output_dir="./logs"):
+    """Wrap a block in the selected profiler and write the outputs to output_dir"""
+    os.makedirs(output_dir, exist_ok=True)
+    stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    base = os.path.join(output_dir, f"profile_{label}_{stamp}")
+
+    tracer = MemoryTracer() if trace_memory else None
+    profiler = None
+    if mode == "deterministic":
+        profiler = cProfile.Profile()
+    elif mode == "sampling":
+        profiler = SamplingProfiler()
+
+    if tracer:
+        tracer.start()
+    if profiler:
+        profiler.enable() if mode == "deterministic" else profiler.start()
+    try:
+        yield
+    finally:
+        if profiler:
+            profiler.disable() if mode == "deterministic" else profiler.stop()
+        if tracer:
+            tracer.stop()
+
+        if mode == "deterministic":
+            profiler.dump_stats(f"{base}.pstats")
+            out = io.StringIO()
+            stats = pstats.Stats(profiler, stream=out).sort_stats("cumulative")
+            stats.print_stats(40)
+            with open(f"{base}.txt", "w") as f:
+                f.write(out.getvalue())
+            print(f"\nProfile: {base}.pstats (snakeviz / gprof2dot), summary {base}.txt")
+        elif mode == "sampling":
+            profiler.write_folded(f"{base}.folded")
+            with open(f"{base}.txt", "w") as f:
+                f.write(profiler.top())
+            print(f"\nProfile: {base}.folded (flamegraph.pl / speedscope), summary {base}.txt")
+
+        if tracer:
+            with open(f"{base}_memory.json", "w") as f:
+                json.dump(tracer.stages, f, indent=2)
+            print("\nMemory by stage (tracemalloc):")
+            print(tracer.report())
+            print(f"Saved to {base}_memory.json")